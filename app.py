@@ -1,7 +1,10 @@
 import streamlit as st
 
+from core.logging import logger
 # Модули управления приложением
-from ui.app_modules.state_controller import render_save_manager_sidebar, load_initial_state, update_and_save_state
+from ui.app_modules.state_controller import (
+    render_save_manager_sidebar, load_initial_state, update_and_save_state, session_log_storage
+)
 from ui.app_modules.team_builder import render_team_builder_sidebar
 from ui.cheat_sheet import render_cheat_sheet_page
 from ui.checks import render_checks_page
@@ -19,6 +22,9 @@ from ui.tree_view import render_skill_tree_page
 # 1. Применяем CSS
 apply_styles()
 
+# Логи движка пишутся в буфер сессии пользователя
+logger.set_storage_provider(session_log_storage)
+
 # 2. Сайдбар: Менеджер сохранений
 render_save_manager_sidebar()
 
@@ -9,40 +9,75 @@ from logic.calculations.formulas import calculate_totals, finalize_state
 from logic.calculations.modifiers import init_modifiers, init_bonuses
 from logic.calculations.pools import calculate_speed_dice, calculate_pools
 from logic.calculations.skills import apply_skill_effects
+from logic.calculations.stats_cache import (
+    get_stats_cache, invalidate_stats_cache, build_key, status_key, base_key
+)
 from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
 from logic.character_changing.passives import PASSIVE_REGISTRY
 from logic.character_changing.talents import TALENT_REGISTRY
 
 
-def recalculate_unit_stats(unit):
+def recalculate_unit_stats(unit, explain: bool = False):
     """
-    Полный пересчет всех характеристик персонажа.
+    Пересчет всех характеристик персонажа.
+
+    Этапы, входы которых не изменились с прошлого пересчета, берутся из кэша (StatsCache):
+    - бонусы чистых источников (BaseEffect.pure_stats) — по отпечатку сборки и статусов;
+    - атрибуты, навыки, скорость и пулы — по отпечатку собранных бонусов и характеристик юнита.
+    Хуки, зависящие от состояния юнита (HP, память, колода...), вызываются всегда.
+
+    explain=True — пересчет без кэша: все этапы выполняются и пишут свои строки в лог "Stats"
+    (лог расчета характеристик в профиле). Результат снова кладется в кэш.
     """
+    if explain:
+        invalidate_stats_cache(unit)
+
     # [LOG] Начало пересчета (Verbose, так как это частое событие)
-    logger.log(f"🔄 Recalculating stats for {unit.name}", LogLevel.VERBOSE, "Stats")
+    logger.log("🔄 Recalculating stats for %s", LogLevel.VERBOSE, "Stats", unit.name)
+
+    cache = get_stats_cache(unit)
+    build = build_key(unit)
 
     # 1. Инициализация
     mods = init_modifiers()
     bonuses = init_bonuses(unit)
 
-    # 2. Сбор бонусов
+    # 2. Сбор бонусов (порядок как раньше: способности -> оружие -> статусы)
     # Мы убрали аргумент logs, подразумевая, что collectors.py теперь пишут в logger сами
-    collect_ability_bonuses(unit, unit.passives, PASSIVE_REGISTRY, "🛡️", mods, bonuses)
-    collect_ability_bonuses(unit, unit.talents, TALENT_REGISTRY, "🌟", mods, bonuses)
-    collect_ability_bonuses(unit, unit.augmentations, AUGMENTATION_REGISTRY, "🧬", mods, bonuses)
-    collect_weapon_bonuses(unit, mods, bonuses)
-    collect_status_bonuses(unit, mods, bonuses)
+    def collect_abilities(m, b, pure):
+        collect_ability_bonuses(unit, unit.passives, PASSIVE_REGISTRY, "🛡️", m, b, pure)
+        collect_ability_bonuses(unit, unit.talents, TALENT_REGISTRY, "🌟", m, b, pure)
+        collect_ability_bonuses(unit, unit.augmentations, AUGMENTATION_REGISTRY, "🧬", m, b, pure)
+        collect_weapon_bonuses(unit, m, b, pure)
+
+    cache.merge_stage("abilities", build, mods, bonuses, lambda m, b: collect_abilities(m, b, True))
+    collect_abilities(mods, bonuses, False)
+
+    # Статусы читаем после способностей: их хуки могли наложить новые
+    statuses = status_key(unit)
+    cache.merge_stage("statuses", (build, statuses), mods, bonuses,
+                      lambda m, b: collect_status_bonuses(unit, m, b, True))
+    collect_status_bonuses(unit, mods, bonuses, False)
+
+    derived_key = (mods.freeze(), tuple(bonuses.items()), base_key(unit), build, statuses)
+    cached_mods = cache.restore_derived(unit, derived_key)
+
+    if cached_mods is not None:
+        mods = cached_mods
+        logger.log("♻️ Derived stats for %s taken from cache", LogLevel.VERBOSE, "Stats", unit.name)
+    else:
+        # 3. Расчет атрибутов
+        attrs, skills = calculate_totals(unit, bonuses, mods)
 
-    # 3. Расчет атрибутов
-    attrs, skills = calculate_totals(unit, bonuses, mods)
+        # 4. Эффекты статов
+        apply_attribute_effects(attrs, mods)
+        apply_skill_effects(skills, mods)
 
-    # 4. Эффекты статов
-    apply_attribute_effects(attrs, mods)
-    apply_skill_effects(skills, mods)
+        # 5. Производные (Скорость, Пулы)
+        calculate_speed_dice(unit, skills["speed"], mods)
+        calculate_pools(unit, attrs, skills, mods)
 
-    # 5. Производные (Скорость, Пулы)
-    calculate_speed_dice(unit, skills["speed"], mods)
-    calculate_pools(unit, attrs, skills, mods)
+        cache.store_derived(unit, derived_key, mods)
 
     # 6. Финализация
     finalize_state(unit, mods)
@@ -51,8 +86,8 @@ def recalculate_unit_stats(unit):
 
     # [LOG] Завершение
     logger.log(
-        f"✅ Stats updated for {unit.name}. HP: {unit.max_hp}, SP: {unit.max_sp}, Speed: {unit.computed_speed_dice}",
+        lambda: f"✅ Stats updated for {unit.name}. HP: {unit.max_hp}, SP: {unit.max_sp}, Speed: {unit.computed_speed_dice}",
         LogLevel.VERBOSE, "Stats")
 
     # Больше не возвращаем список logs, так как всё уходит в BattleLogger
-    return []
\ No newline at end of file
+    return []
@@ -15,6 +15,17 @@ class Card:
     flags: List[str] = field(default_factory=list)
     scripts: Dict[str, List[Dict]] = field(default_factory=dict)
 
+    def instance(self) -> "Card":
+        """
+        Экземпляр карты из шаблона библиотеки (copy-on-write).
+        Свои объект, список и кубики (их тип/поломку меняют пассивки прямо в бою),
+        а скрипты, флаги и описание общие с шаблоном и не копируются.
+        """
+        clone = object.__new__(Card)
+        clone.__dict__.update(self.__dict__)
+        clone.dice_list = [d.copy() for d in self.dice_list]
+        return clone
+
     def to_dict(self):
         return {
             "id": self.id,
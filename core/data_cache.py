@@ -0,0 +1,120 @@
+import os
+import pickle
+
+from core.logging import logger, LogLevel
+
+CACHE_DIR = "data/.cache"
+# Меняется при несовместимых правках формата кэша
+CACHE_VERSION = 1
+
+
+def file_stamp(path) -> tuple:
+    """Отпечаток файла: (mtime в наносекундах, размер)."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def code_stamp(paths, suffix: str = ".py") -> tuple:
+    """
+    Отпечаток исходников (файлы и папки с .py): объекты из кэша устаревают вместе с кодом, который их собрал.
+    С другим suffix — отпечаток папок с данными (например, паков карт .json).
+    """
+    stamps = []
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, files in os.walk(path):
+                for name in files:
+                    if name.endswith(suffix):
+                        full = os.path.join(folder, name)
+                        stamps.append((full,) + file_stamp(full))
+        elif os.path.exists(path):
+            stamps.append((path,) + file_stamp(path))
+    return tuple(sorted(stamps))
+
+
+class CompiledCache:
+    """
+    Кэш разобранных файлов данных (карт, персонажей) в data/.cache/<name>.pickle.
+
+    Запись: путь -> (mtime, размер, pickle результата разбора). Файл с тем же отпечатком
+    берется из кэша без JSON и from_dict, остальные разбираются заново.
+    Весь кэш сбрасывается при смене кода из code_paths или JSON-данных из data_paths
+    (файлов, которые parse читает помимо самого файла, например паков карт для персонажей).
+    Каждый get отдает новые объекты (pickle.loads), так что правки загруженных данных кэш не портят.
+    """
+
+    def __init__(self, name: str, code_paths=(), cache_dir: str = CACHE_DIR, data_paths=()):
+        self.name = name
+        self.code_paths = tuple(code_paths)
+        self.data_paths = tuple(data_paths)
+        self.path = os.path.join(cache_dir, f"{name}.pickle")
+        self._entries = None
+        self._code = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def open(self):
+        """Проверяет код и при необходимости читает кэш с диска. Вызывается перед серией get."""
+        code = code_stamp(self.code_paths) + code_stamp(self.data_paths, suffix=".json")
+        if self._entries is not None and code == self._code:
+            return
+
+        self._code = code
+        self._entries = {}
+        self._dirty = False
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                blob = pickle.load(f)
+            if blob.get("version") == CACHE_VERSION and blob.get("code") == code:
+                self._entries = blob["entries"]
+        except Exception as e:
+            logger.log(f"⚠️ Compiled cache '{self.name}' is unreadable, rebuilding: {e}", LogLevel.VERBOSE, "System")
+
+    def get(self, path, parse):
+        """Результат parse(path) — из кэша, если файл не менялся."""
+        if self._entries is None:
+            self.open()
+
+        key = os.path.abspath(path)
+        stamp = file_stamp(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            return pickle.loads(entry[1])
+
+        value = parse(path)
+        self.misses += 1
+        self._entries[key] = (stamp, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        self._dirty = True
+        return value
+
+    def save(self):
+        """Записывает кэш на диск (атомарно), если были промахи. Записи удаленных файлов выбрасываются."""
+        if self._entries is None:
+            return
+        stale = [key for key in self._entries if not os.path.exists(key)]
+        for key in stale:
+            del self._entries[key]
+        if not (self._dirty or stale):
+            return
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"version": CACHE_VERSION, "code": self._code, "entries": self._entries}, f,
+                            pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.log(f"⚠️ Failed to write compiled cache '{self.name}': {e}", LogLevel.VERBOSE, "System")
+
+    def clear(self):
+        """Забывает все записи (в памяти и на диске)."""
+        self._entries = None
+        self._code = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -21,6 +21,17 @@ class Dice:
         if self.min_val > self.max_val:
             self.min_val, self.max_val = self.max_val, self.min_val
 
+    def copy(self) -> "Dice":
+        """
+        Дешевая копия кубика (экземпляр из шаблона библиотеки).
+        Скаляры свои, словарь скриптов общий с шаблоном — он только читается.
+        """
+        clone = object.__new__(Dice)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
+    __copy__ = copy
+
     def to_dict(self):
         return {
             "type": self.dtype.value.lower(),
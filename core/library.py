@@ -1,39 +1,123 @@
-import copy
 import glob
 import json
 import os
+from contextlib import contextmanager
 from typing import List, Dict
 
 from core.card import Card
+from core.data_cache import CompiledCache, file_stamp
 from core.logging import logger, LogLevel
 
 CARDS_DIR = "data/cards"
 
+# Разобранные паки карт (списки Card) по отпечатку файла
+CARD_PACK_CACHE = CompiledCache("cards", code_paths=("core/card.py", "core/dice.py", "core/enums.py"))
+
+
+class _PackDoc:
+    """Пак карт в памяти: корень JSON, список словарей карт и позиция каждой карты по id."""
+    __slots__ = ("root", "cards", "pos", "stamp")
+
+    def __init__(self, root, stamp):
+        cards = root.get("cards", []) if isinstance(root, dict) else root
+        if not isinstance(cards, list):
+            root, cards = {"cards": []}, []
+        self.root = root
+        self.cards = cards
+        self.stamp = stamp
+        self._reindex()
+
+    def _reindex(self):
+        # Первое вхождение id, как при прежнем поиске по списку
+        self.pos = {}
+        for i, data in enumerate(self.cards):
+            self.pos.setdefault(data.get("id"), i)
+
+    def put(self, card_dict: dict):
+        idx = self.pos.get(card_dict["id"])
+        if idx is None:
+            self.pos[card_dict["id"]] = len(self.cards)
+            self.cards.append(card_dict)
+        else:
+            self.cards[idx] = card_dict
+        if not isinstance(self.root, dict):
+            # Сохранение всегда пишет пак в формате {"cards": [...]}
+            self.root = {"cards": self.cards}
+
+    def remove(self, card_id) -> bool:
+        before = len(self.cards)
+        self.cards[:] = [c for c in self.cards if c.get("id") != card_id]
+        if len(self.cards) == before:
+            return False
+        self._reindex()
+        return True
+
 
 class Library:
+    """
+    Реестр карт. Зарегистрированные карты — общие шаблоны, их не меняют;
+    get_card отдает дешевый экземпляр (Card.instance), а не глубокую копию.
+    """
     _cards = {}  # {id: Card}
     _sources = {}  # {id: filename}
+    _by_name = {}  # {name: id} — первая карта с таким именем, как при линейном поиске
+    _packs = {}  # {filename: _PackDoc} — паки, которые правили через save_card/delete_card
+    _dirty_packs = set()
+    _batch_depth = 0
+
+    @classmethod
+    def _store(cls, key, card: Card):
+        old = cls._cards.get(key)
+        cls._cards[key] = card
+        if old is not None and old.name != card.name:
+            cls._rebuild_name_index()
+        else:
+            cls._by_name.setdefault(card.name, key)
+
+    @classmethod
+    def _rebuild_name_index(cls):
+        cls._by_name = {}
+        for key, card in cls._cards.items():
+            cls._by_name.setdefault(card.name, key)
 
     @classmethod
     def register(cls, card: Card):
         key = card.id if card.id and card.id != "unknown" else card.name
-        cls._cards[key] = card
+        cls._store(key, card)
 
     @classmethod
     def register_temp_card(cls, new_id, card_obj):
         """Регистрирует модифицированную временную карту под новым ID."""
         card_obj.id = new_id
-        cls._cards[new_id] = card_obj
+        cls._store(new_id, card_obj)
+
+    @classmethod
+    def get_template(cls, key: str):
+        """
+        Общий шаблон карты по ID или имени (None, если карты нет).
+        Только для чтения: для боя и слотов берите экземпляр через get_card.
+        """
+        card = cls._cards.get(key)
+        if card is not None:
+            return card
+
+        name_key = cls._by_name.get(key)
+        if name_key is None:
+            return None
+        card = cls._cards.get(name_key)
+        if card is None or card.name != key:
+            # Словарь карт поменяли в обход register (например, get_cards_dict().pop)
+            cls._rebuild_name_index()
+            card = cls._cards.get(cls._by_name.get(key))
+        return card
 
     # === [FIX] ВОЗВРАЩЕНЫ ПРОПАВШИЕ МЕТОДЫ ===
     @classmethod
     def get_card(cls, key: str) -> Card:
-        """Возвращает копию карты по ID или имени."""
-        if key in cls._cards:
-            return copy.deepcopy(cls._cards[key])
-        for card in cls._cards.values():
-            if card.name == key:
-                return copy.deepcopy(card)
+        """Возвращает экземпляр карты по ID или имени."""
+        card = cls.get_template(key)
+        if card is not None:
+            return card.instance()
 
         # Если карты нет, возвращаем заглушку, чтобы не крашить UI
         return Card(name=str(key), dice_list=[], description="Unknown Card", id="unknown")
@@ -66,34 +150,40 @@ class Library:
         """Полная перезагрузка всех карт."""
         cls._cards.clear()
         cls._sources.clear()
+        cls._by_name.clear()
 
         if not os.path.exists(path):
             os.makedirs(path, exist_ok=True)
             return
 
+        CARD_PACK_CACHE.open()
         if os.path.isdir(path):
             files = glob.glob(os.path.join(path, "*.json"))
             for filepath in files:
                 cls._load_single_file(filepath)
         else:
             cls._load_single_file(path)
+        CARD_PACK_CACHE.save()
 
     @classmethod
     def reload(cls):
         """Принудительно перечитывает папку карт."""
         cls.load_all(CARDS_DIR)
 
+    @staticmethod
+    def _parse_pack(filepath) -> List[Card]:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        cards_list = data.get("cards", []) if isinstance(data, dict) else data
+        return [Card.from_dict(card_data) for card_data in cards_list]
+
     @classmethod
     def _load_single_file(cls, filepath):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            cards_list = data.get("cards", []) if isinstance(data, dict) else data
             filename = os.path.basename(filepath)
 
-            for card_data in cards_list:
-                card = Card.from_dict(card_data)
+            for card in CARD_PACK_CACHE.get(filepath, cls._parse_pack):
                 cls.register(card)
                 if card.id:
                     cls._sources[card.id] = filename
@@ -102,39 +192,77 @@ class Library:
             logger.log(f"Error loading {filepath}: {e}", LogLevel.NORMAL, "System")
 
     @classmethod
-    def save_card(cls, card: Card, filename="custom_cards.json"):
-        folder = "data/cards"
-        filepath = os.path.join(folder, filename)
-        os.makedirs(folder, exist_ok=True)
-
-        current_data = {"cards": []}
+    def _get_pack(cls, filename) -> "_PackDoc":
+        """Пак в памяти; перечитывается с диска, только если файл изменили снаружи."""
+        path = os.path.join(CARDS_DIR, filename)
+        stamp = file_stamp(path) if os.path.exists(path) else None
+        doc = cls._packs.get(filename)
+        if doc is not None and (doc.stamp == stamp or filename in cls._dirty_packs):
+            return doc
 
-        if os.path.exists(filepath):
+        root = {"cards": []}
+        if stamp is not None:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = json.load(f)
-                    if isinstance(content, list):
-                        current_data["cards"] = content
-                    else:
-                        current_data = content
+                with open(path, 'r', encoding='utf-8') as f:
+                    root = json.load(f)
             except Exception as e:
                 logger.log(f"Error reading save file: {e}", LogLevel.NORMAL, "System")
+                root = {"cards": []}
+
+        doc = _PackDoc(root, stamp)
+        cls._packs[filename] = doc
+        return doc
+
+    @classmethod
+    def _write_pack(cls, filename):
+        """Пишет пак атомарно (временный файл + rename). Внутри batch_edits запись откладывается."""
+        if cls._batch_depth:
+            cls._dirty_packs.add(filename)
+            return
 
-        card_dict = card.to_dict()
-        found = False
+        doc = cls._packs[filename]
+        path = os.path.join(CARDS_DIR, filename)
+        tmp_path = f"{path}.tmp"
+        os.makedirs(CARDS_DIR, exist_ok=True)
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(doc.root, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Память и диск разошлись: пак перечитается при следующей правке
+            cls._packs.pop(filename, None)
+            raise
+        doc.stamp = file_stamp(path)
 
-        for i, existing in enumerate(current_data["cards"]):
-            if existing.get("id") == card.id:
-                current_data["cards"][i] = card_dict
-                found = True
-                break
+    @classmethod
+    @contextmanager
+    def batch_edits(cls):
+        """Сохранения и удаления внутри блока пишутся на диск один раз на пак — при выходе."""
+        cls._batch_depth += 1
+        try:
+            yield
+        finally:
+            cls._batch_depth -= 1
+            if not cls._batch_depth:
+                cls.flush()
 
-        if not found:
-            current_data["cards"].append(card_dict)
+    @classmethod
+    def flush(cls):
+        """Записывает паки, отложенные в batch_edits."""
+        pending, cls._dirty_packs = sorted(cls._dirty_packs), set()
+        for filename in pending:
+            try:
+                cls._write_pack(filename)
+            except Exception as e:
+                logger.log(f"Error saving pack {filename}: {e}", LogLevel.NORMAL, "System")
+
+    @classmethod
+    def save_card(cls, card: Card, filename="custom_cards.json"):
+        doc = cls._get_pack(filename)
+        doc.put(card.to_dict())
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(current_data, f, ensure_ascii=False, indent=2)
+            cls._write_pack(filename)
 
             logger.log(f"💾 Card '{card.name}' saved to {filename}", LogLevel.NORMAL, "System")
 
@@ -147,34 +275,22 @@ class Library:
     def delete_card(cls, card_id):
         if card_id in cls._cards:
             del cls._cards[card_id]
-        if card_id in cls._sources:
-            del cls._sources[card_id]
+            cls._rebuild_name_index()
 
-        path = "data/cards"
-        if os.path.exists(path) and os.path.isdir(path):
-            files = glob.glob(os.path.join(path, "*.json"))
-            for filepath in files:
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    cards_list = data.get("cards", []) if isinstance(data, dict) else data
-                    if not isinstance(cards_list, list): continue
-
-                    new_list = [c for c in cards_list if c.get("id") != card_id]
-
-                    if len(new_list) != len(cards_list):
-                        if isinstance(data, dict):
-                            data["cards"] = new_list
-                        else:
-                            data = new_list
-
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
-                        return True
-                except:
-                    pass
-        return False
+        # Файл карты известен из индекса источников: остальные паки не открываем
+        filename = cls._sources.pop(card_id, None)
+        if filename is None or not os.path.exists(os.path.join(CARDS_DIR, filename)):
+            return False
+
+        doc = cls._get_pack(filename)
+        if not doc.remove(card_id):
+            return False
+        try:
+            cls._write_pack(filename)
+            return True
+        except Exception as e:
+            logger.log(f"Error deleting card {card_id}: {e}", LogLevel.NORMAL, "System")
+            return False
 
     @staticmethod
     def get_all_source_files() -> List[str]:
@@ -1,19 +1,90 @@
+import atexit
+import heapq
 import os
+import threading
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 from enum import IntEnum
+from itertools import islice
 
-_memory_log_storage = []
+# Путь к файлу полного лога
+LOG_FILE_PATH = "data/logs/full_battle_log.txt"
 
+# Сколько последних записей лога хранится в памяти для UI
+LOG_STORAGE_CAPACITY = 5000
 
-def _get_session_state():
-    try:
-        import streamlit as st
-    except Exception:
-        return None
-    return getattr(st, "session_state", None)
+# Буфер файлового лога: сброс по количеству строк или по времени (сек)
+LOG_FLUSH_LINES = 256
+LOG_FLUSH_INTERVAL = 0.5
 
-# Путь к файлу полного лога
-LOG_FILE_PATH = "data/logs/full_battle_log.txt"
+# Уровень записи по умолчанию (MINIMAL / NORMAL / VERBOSE); в UI каждая сессия задает свой в логе симулятора
+LOG_LEVEL_ENV = "LOR_LOG_LEVEL"
+
+
+class BufferedLogWriter:
+    """
+    Фоновая запись лога в файл.
+    log() только добавляет строку в буфер; фоновый поток пишет пачками,
+    когда набралось LOG_FLUSH_LINES строк или прошло LOG_FLUSH_INTERVAL секунд.
+    flush() пишет остаток синхронно (конец боя, очистка лога, выход из процесса).
+    """
+
+    def __init__(self, path: str, max_lines: int = LOG_FLUSH_LINES, interval: float = LOG_FLUSH_INTERVAL):
+        self.path = path
+        self.max_lines = max_lines
+        self.interval = interval
+        self._buffer = []
+        self._cond = threading.Condition()
+        # Порядок строк: забор буфера и запись в файл идут под одним замком
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+
+    def write(self, line: str):
+        self._ensure_thread()
+        with self._cond:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.max_lines:
+                self._cond.notify()
+
+    def flush(self):
+        with self._write_lock:
+            with self._cond:
+                lines, self._buffer = self._buffer, []
+            self._write_lines(lines)
+
+    def discard(self):
+        """Выбрасывает несброшенные строки (файл будет перезаписан)."""
+        with self._write_lock:
+            with self._cond:
+                self._buffer = []
+
+    def _ensure_thread(self):
+        # После fork (пул процессов) поток родителя в дочернем процессе не существует
+        if self._pid != os.getpid() or self._thread is None or not self._thread.is_alive():
+            self._pid = os.getpid()
+            self._buffer = []
+            self._thread = threading.Thread(target=self._run, name="BattleLogWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if len(self._buffer) < self.max_lines:
+                    self._cond.wait(self.interval)
+                if not self._buffer:
+                    continue
+            self.flush()
+
+    def _write_lines(self, lines):
+        if not lines:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except Exception as e:
+            print(f"Logger File Error: {e}")
 
 
 class LogLevel(IntEnum):
@@ -25,11 +96,125 @@ class LogLevel(IntEnum):
     VERBOSE = 3  # Уровень 3: Полный (Триггеры пассивок, Кулдауны, Детали расчетов, Начало фаз)
 
 
+def _level_from_env() -> LogLevel:
+    name = os.environ.get(LOG_LEVEL_ENV, "").strip().upper()
+    return LogLevel[name] if name in LogLevel.__members__ else LogLevel.VERBOSE
+
+
+class LogStorage:
+    """
+    Кольцевой буфер записей лога для UI.
+    - Хранит не больше capacity записей, старые вытесняются.
+    - Индекс (уровень, категория) -> id записей обновляется при добавлении/вытеснении,
+      поэтому фильтры и список категорий не требуют полного прохода.
+    - query() отдает страницу записей; стоимость зависит от offset + limit, а не от размера лога.
+    """
+
+    def __init__(self, capacity: int = LOG_STORAGE_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._slots = [None] * self.capacity
+        self._next_id = 0
+        self._size = 0
+        self._index = {}  # (level, category) -> deque(id), id по возрастанию
+        # Уровень записи владельца буфера (сессии UI); None — уровень логгера по умолчанию
+        self.capture_level = None
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        first = self._next_id - self._size
+        for entry_id in range(first, self._next_id):
+            yield self._slots[entry_id % self.capacity]
+
+    def append(self, timestamp: str, level: LogLevel, category: str, message: str) -> dict:
+        if self._size == self.capacity:
+            self._evict_oldest()
+
+        entry = {
+            "id": self._next_id,
+            "time": timestamp,
+            "level": level,
+            "category": category,
+            "message": message
+        }
+        self._slots[self._next_id % self.capacity] = entry
+        self._index.setdefault((level, category), deque()).append(self._next_id)
+        self._next_id += 1
+        self._size += 1
+        return entry
+
+    def _evict_oldest(self):
+        oldest_id = self._next_id - self._size
+        slot = oldest_id % self.capacity
+        old = self._slots[slot]
+        key = (old["level"], old["category"])
+        ids = self._index[key]
+        ids.popleft()
+        if not ids:
+            del self._index[key]
+        self._slots[slot] = None
+        self._size -= 1
+
+    def clear(self):
+        self._slots = [None] * self.capacity
+        self._size = 0
+        self._index = {}
+
+    def set_capacity(self, capacity: int):
+        """Меняет размер буфера, сохраняя самые свежие записи."""
+        entries = list(self)[-max(1, int(capacity)):]
+        self.capacity = max(1, int(capacity))
+        self.clear()
+        for e in entries:
+            self.append(e["time"], e["level"], e["category"], e["message"])
+
+    # =========================================================================
+    # ЗАПРОСЫ
+    # =========================================================================
+
+    def _keys(self, max_level=None, categories=None):
+        cats = set(categories) if categories is not None else None
+        return [
+            key for key in self._index
+            if (max_level is None or key[0] <= max_level) and (cats is None or key[1] in cats)
+        ]
+
+    def categories(self, max_level=None) -> list:
+        """Категории, у которых есть записи (с учетом уровня)."""
+        return sorted({cat for _, cat in self._keys(max_level)})
+
+    def count(self, max_level=None, categories=None) -> int:
+        return sum(len(self._index[key]) for key in self._keys(max_level, categories))
+
+    def query(self, max_level=None, categories=None, offset: int = 0, limit=None,
+              newest_first: bool = False) -> list:
+        """
+        Записи с level <= max_level из указанных категорий.
+        offset/limit считаются от начала (или от конца при newest_first).
+        """
+        keys = self._keys(max_level, categories)
+        if newest_first:
+            ids = heapq.merge(*(reversed(self._index[k]) for k in keys), reverse=True)
+        else:
+            ids = heapq.merge(*(self._index[k] for k in keys))
+
+        stop = None if limit is None else offset + limit
+        return [self._slots[i % self.capacity] for i in islice(ids, offset, stop)]
+
+
+_memory_log_storage = LogStorage()
+
+
 class BattleLogger:
     """
     Система логгирования.
-    - Пишет ВСЕ логи в файл data/logs/full_battle_log.txt.
-    - Сохраняет логи в st.session_state для отображения в UI с фильтрацией.
+    - Пишет ВСЕ логи в файл data/logs/full_battle_log.txt (через буфер, см. BufferedLogWriter).
+    - Сохраняет логи в кольцевой буфер (LogStorage) для отображения в UI с фильтрацией.
+      Буфер по умолчанию — общий для процесса; UI подставляет свой на сессию (set_storage_provider),
+      так что движок сам streamlit не импортирует.
+    - Уровень записи хранится в буфере текущего контекста: сессии UI не меняют его друг другу.
+      Уровень процесса (default_level) действует для буферов без своего уровня.
     """
     _instance = None
 
@@ -42,6 +227,17 @@ class BattleLogger:
         # Инициализация происходит один раз при создании
         if not hasattr(self, 'initialized'):
             self.ensure_log_dir()
+            # Выключается для массовых headless-прогонов (симуляции), где лог не нужен
+            self.enabled = True
+            # Файловый вывод можно отключить отдельно от UI-лога
+            self.file_enabled = True
+            self.writer = BufferedLogWriter(LOG_FILE_PATH)
+            atexit.register(self.flush)
+            # Уровень записи для буферов без своего (headless-прогоны, новая сессия до выбора в сайдбаре)
+            self.default_level = _level_from_env()
+            # Откуда брать буфер записей (None — общий буфер процесса) и буфер, уже найденный в этом потоке
+            self._storage_provider = None
+            self._local = threading.local()
             # При первом запуске (или перезагрузке сервера) можно отбить начало сессии
             # Но файл мы будем очищать только по команде clear(), чтобы сохранять историю между реранами
             self.initialized = True
@@ -50,57 +246,111 @@ class BattleLogger:
         """Создает папку для логов, если её нет."""
         os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
 
-    def log(self, message: str, level: LogLevel = LogLevel.NORMAL, category: str = "Info"):
+    def log(self, message, level: LogLevel = LogLevel.NORMAL, category: str = "Info", *args):
         """
         Основной метод записи лога.
 
         Args:
-            message (str): Текст сообщения.
+            message (str | callable): Текст сообщения. Для горячих мест — шаблон с %s
+                (аргументы в *args) или функция без аргументов, возвращающая строку.
+                Форматирование выполняется, только если уровень записывается.
             level (LogLevel): Важность (MINIMAL, NORMAL, VERBOSE).
             category (str): Категория (Combat, Effect, System, Dice...).
         """
+        if not self.enabled:
+            return
+        storage = self.get_storage()
+        if level > (storage.capture_level or self.default_level):
+            return
+
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Часы:Минуты:Секунды.Миллисекунды
 
-        # 1. Запись в файл (Пишем ВСЕГДА всё подряд для дебага)
+        # 1. Запись в файл (те же строки, что прошли уровень записи)
         # Формат: [TIME] [LEVEL] [CATEGORY] Message
         log_entry_str = f"[{timestamp}] [{level.name:<7}] [{category}] {message}\n"
 
-        try:
-            with open(LOG_FILE_PATH, "a", encoding="utf-8") as f:
-                f.write(log_entry_str)
-        except Exception as e:
-            print(f"Logger File Error: {e}")
+        if self.file_enabled:
+            self.writer.write(log_entry_str)
 
         # 2. Запись в память (Session State) для UI
-        session_state = _get_session_state()
-        if session_state is None:
-            storage = _memory_log_storage
-        else:
-            if 'battle_log_storage' not in session_state:
-                session_state['battle_log_storage'] = []
-            storage = session_state['battle_log_storage']
+        storage.append(timestamp, level, category, message)
 
-        # Сохраняем объект лога
-        ui_entry = {
-            "id": len(storage),
-            "time": timestamp,
-            "level": level,
-            "category": category,
-            "message": message
-        }
+    def set_enabled(self, enabled: bool):
+        """Включает/выключает запись логов (файл и память)."""
+        self.enabled = enabled
+
+    @property
+    def capture_level(self) -> LogLevel:
+        """Самый подробный уровень, который записывается в текущем контексте (VERBOSE = всё)."""
+        return self.get_storage().capture_level or self.default_level
+
+    def set_level(self, level: LogLevel):
+        """
+        Детализация записи для текущего контекста: сообщения подробнее level отбрасываются сразу.
+        В UI — уровень сессии пользователя, без провайдера — общего буфера процесса.
+        """
+        self.get_storage().capture_level = LogLevel(level)
+
+    @contextmanager
+    def capturing(self, level: LogLevel):
+        """
+        Временно записывает сообщения до level включительно (не ниже текущего уровня) в текущем контексте.
+        Для мест, которым нужен подробный лог независимо от настройки, например расчет статов в профиле.
+        """
+        storage = self.get_storage()
+        previous = storage.capture_level
+        storage.capture_level = max(previous or self.default_level, LogLevel(level))
+        try:
+            yield self
+        finally:
+            storage.capture_level = previous
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Будет ли записано сообщение уровня level (для защиты дорогих блоков логирования)."""
+        return self.enabled and level <= self.capture_level
 
-        storage.append(ui_entry)
+    def set_file_output(self, enabled: bool):
+        """Включает/выключает запись в файл (UI-лог в памяти продолжает работать)."""
+        if not enabled:
+            self.writer.flush()
+        self.file_enabled = enabled
+
+    def flush(self):
+        """Дописывает накопленные строки в файл (конец боя, выход)."""
+        self.writer.flush()
+
+    def set_storage_provider(self, provider):
+        """
+        provider() -> LogStorage: буфер для текущего контекста (UI — буфер сессии пользователя).
+        Вызывается один раз на поток (запуск скрипта streamlit), дальше буфер берется из потока.
+        None — общий буфер процесса (headless-прогоны, тесты).
+        """
+        if provider is self._storage_provider:
+            return  # скрипт streamlit перезапускается на каждом действии — привязка та же
+        self._storage_provider = provider
+        self._local = threading.local()
+
+    def get_storage(self) -> LogStorage:
+        """Кольцевой буфер логов текущего контекста (см. set_storage_provider)."""
+        storage = getattr(self._local, "storage", None)
+        if storage is None:
+            provider = self._storage_provider
+            storage = provider() if provider is not None else _memory_log_storage
+            self._local.storage = storage
+        return storage
 
     def clear(self):
         """
         Очищает логи в памяти и перезаписывает файл (например, при кнопке Reset Battle).
         """
-        session_state = _get_session_state()
-        if session_state is None:
-            _memory_log_storage.clear()
-        else:
-            session_state['battle_log_storage'] = []
+        self.get_storage().clear()
 
+        self.writer.discard()
         try:
             with open(LOG_FILE_PATH, "w", encoding="utf-8") as f:
                 f.write(f"=== BATTLE LOG CLEARED: {datetime.now()} ===\n")
@@ -112,19 +362,19 @@ class BattleLogger:
         Возвращает список логов для отображения, фильтруя по уровню.
         Пример: Если выбран NORMAL (2), покажет MINIMAL (1) и NORMAL (2).
         """
-        session_state = _get_session_state()
-        storage = _memory_log_storage if session_state is None else session_state.get('battle_log_storage', [])
+        return self.get_storage().query(max_level=filter_level)
 
-        return [entry for entry in storage if entry['level'] <= filter_level]
+    def query_logs(self, filter_level: LogLevel, categories=None, offset: int = 0, limit=None,
+                   newest_first: bool = False) -> list:
+        """Постраничная выборка для UI (см. LogStorage.query)."""
+        return self.get_storage().query(filter_level, categories, offset, limit, newest_first)
 
     def get_logs(self):
         """
         Возвращает простой список сообщений (строк) из текущей сессии.
         Используется в профиле для отображения лога расчета.
         """
-        session_state = _get_session_state()
-        storage = _memory_log_storage if session_state is None else session_state.get('battle_log_storage', [])
-        return [entry['message'] for entry in storage]
+        return [entry['message'] for entry in self.get_storage()]
 
 
 # Глобальный экземпляр логгера для импорта в других файлах
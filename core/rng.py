@@ -0,0 +1,92 @@
+import hashlib
+import random
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+def _splitmix64(x: int) -> int:
+    """Финализатор SplitMix64: превращает номер позиции в 64-битное случайное число."""
+    x = (x + _GOLDEN) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _normalize_seed(seed) -> int:
+    """Приводит сид к 64-битному целому (строки хешируются стабильно, без PYTHONHASHSEED)."""
+    if seed is None:
+        return random.SystemRandom().getrandbits(63)
+    if isinstance(seed, int):
+        return seed & _MASK64
+    digest = hashlib.sha256(str(seed).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class BattleRNG:
+    """
+    Детерминированный поток случайных чисел для одного боя.
+
+    Каждое обращение (random/randint/choice) берет ровно одно значение из потока,
+    а значение на позиции N зависит только от (seed, N). Поэтому состояние — это
+    всего два числа: {"seed", "position"}. Их можно сохранить в слепок и
+    переиграть любой раунд с того же места.
+
+    Интерфейс совместим с модулем `random` в той части, что использует движок.
+    """
+
+    def __init__(self, seed=None, position: int = 0):
+        self.seed = _normalize_seed(seed)
+        self.position = position
+
+    def _next(self) -> int:
+        value = _splitmix64((self.seed + self.position * _GOLDEN) & _MASK64)
+        self.position += 1
+        return value
+
+    # =========================================================================
+    # API В СТИЛЕ random
+    # =========================================================================
+
+    def random(self) -> float:
+        """Число в [0, 1)."""
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def randint(self, a: int, b: int) -> int:
+        """Целое в [a, b] включительно."""
+        if a > b:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        return a + self._next() % (b - a + 1)
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randint(0, len(seq) - 1)]
+
+    def shuffle(self, seq):
+        """Перемешивание Фишера-Йетса на месте."""
+        for i in range(len(seq) - 1, 0, -1):
+            j = self.randint(0, i)
+            seq[i], seq[j] = seq[j], seq[i]
+
+    # =========================================================================
+    # СОСТОЯНИЕ
+    # =========================================================================
+
+    def get_state(self) -> dict:
+        return {"seed": self.seed, "position": self.position}
+
+    def set_state(self, state: dict):
+        self.seed = _normalize_seed(state.get("seed", self.seed))
+        self.position = int(state.get("position", 0))
+
+    @classmethod
+    def from_state(cls, state: dict) -> "BattleRNG":
+        return cls(state.get("seed"), int(state.get("position", 0)))
+
+    def spawn(self, index: int) -> "BattleRNG":
+        """Независимый дочерний поток (например, для параллельных симуляций)."""
+        return BattleRNG(_splitmix64((self.seed ^ _splitmix64(index + 1)) & _MASK64))
+
+    def __repr__(self):
+        return f"BattleRNG(seed={self.seed}, position={self.position})"
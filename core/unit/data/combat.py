@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple, Any
 
+from core.unit.data.status_store import StatusStore
+
 # Импорт Card с защитой от циклических ссылок
 try:
     from core.card import Card
@@ -35,7 +37,7 @@ class UnitCombatMixin:
 
     # === СОСТОЯНИЯ ===
     active_buffs: Dict[str, int] = field(default_factory=dict)
-    _status_effects: Dict[str, List[Dict]] = field(default_factory=dict)
+    _status_effects: StatusStore = field(default_factory=StatusStore)
     delayed_queue: List[dict] = field(default_factory=list)
 
     # Временные модификаторы боя
@@ -0,0 +1,57 @@
+import copy
+import json
+
+# Неизменяемые значения, которые можно не копировать
+_ATOMS = frozenset({str, int, float, bool, type(None)})
+
+
+def _json_roundtrip(obj, default):
+    return json.loads(json.dumps(obj, default=default))
+
+
+def json_copy(obj, default=str):
+    """
+    То же, что json.loads(json.dumps(obj, default=default)), но без текста в середине.
+
+    Словари со строковыми ключами, списки, кортежи и примитивы копируются напрямую;
+    объекты, которые json отдал бы в default, — через default, как и в json.
+    Все необычное (нестроковые ключи, подклассы str/int/float, Enum) идет через настоящий json,
+    поэтому результат и ошибки совпадают с json-версией.
+    """
+    t = type(obj)
+    if t in _ATOMS:
+        return obj
+    if t is list or t is tuple:
+        return [json_copy(v, default) for v in obj]
+    if isinstance(obj, dict):
+        result = {}
+        for k, v in obj.items():
+            if type(k) is not str:
+                return _json_roundtrip(obj, default)
+            result[k] = json_copy(v, default)
+        return result
+    if isinstance(obj, (str, int, float, list, tuple)):
+        return _json_roundtrip(obj, default)
+    return json_copy(default(obj), default)
+
+
+def plain_copy(obj):
+    """
+    copy.deepcopy для данных из JSON/слепков: dict, list, tuple и примитивы копируются напрямую,
+    остальное (объекты, подклассы, нестандартные ключи) — через copy.deepcopy.
+    """
+    t = type(obj)
+    if t in _ATOMS:
+        return obj
+    if t is dict:
+        result = {}
+        for k, v in obj.items():
+            if type(k) not in _ATOMS:
+                return copy.deepcopy(obj)
+            result[k] = plain_copy(v)
+        return result
+    if t is list:
+        return [plain_copy(v) for v in obj]
+    if t is tuple:
+        return tuple(plain_copy(v) for v in obj)
+    return copy.deepcopy(obj)
@@ -1,9 +1,13 @@
-import copy
-import json
-
 # Для type hinting
 from core.dice import Dice
 from core.resistances import Resistances
+from core.unit.data.fast_copy import json_copy, plain_copy
+from core.unit.data.status_store import StatusStore
+
+
+def _json_default(obj):
+    """Записи с to_dict (стаки статусов) сериализуем структурно, остальное — строкой."""
+    return obj.to_dict() if hasattr(obj, "to_dict") else str(obj)
 
 
 class UnitSerializationMixin:
@@ -16,7 +20,7 @@ class UnitSerializationMixin:
 
         def safe_copy(d):
             try:
-                return json.loads(json.dumps(d, default=str))
+                return json_copy(d, _json_default)
             except Exception:
                 return {}
 
@@ -48,12 +52,14 @@ class UnitSerializationMixin:
         self.death_count = state.get("death_count", 0)
         self.overkill_damage = state.get("overkill_damage", 0)
 
-        self.resources = copy.deepcopy(state.get("resources", {}))
-        self.active_buffs = copy.deepcopy(state.get("active_buffs", {}))
-        self._status_effects = copy.deepcopy(state.get("_status_effects", {}))
-        self.delayed_queue = copy.deepcopy(state.get("delayed_queue", []))
-        self.memory = copy.deepcopy(state.get("memory", {}))
-        self.money_log = copy.deepcopy(state.get("money_log", []))
+        self.resources = plain_copy(state.get("resources", {}))
+        self.active_buffs = plain_copy(state.get("active_buffs", {}))
+        self._status_effects = StatusStore(state.get("_status_effects", {}))
+        if hasattr(self, "_bump_status_version"):
+            self._bump_status_version()
+        self.delayed_queue = plain_copy(state.get("delayed_queue", []))
+        self.memory = plain_copy(state.get("memory", {}))
+        self.money_log = plain_copy(state.get("money_log", []))
         self.deck = list(state.get("deck", []))
 
         # Sanitize cooldowns
@@ -70,13 +76,13 @@ class UnitSerializationMixin:
         self.stored_dice = [Dice.from_dict(d) for d in state.get("stored_dice", [])]
         self.counter_dice = [Dice.from_dict(d) for d in state.get("counter_dice", [])]
 
-    def to_dict(self):
-        """Полная сериализация."""
+    def build_state(self) -> dict:
+        """Сборка юнита: все, что сохраняет to_dict, кроме динамического состояния (get_dynamic_state)."""
 
         def safe_dict_copy(d):
             if not d: return {}
             try:
-                return json.loads(json.dumps(d, default=str))
+                return json_copy(d, str)
             except TypeError:
                 return {}
 
@@ -90,11 +96,6 @@ class UnitSerializationMixin:
             "flat_mods": {
                 "imp_hp": self.implants_hp_flat, "imp_sp": self.implants_sp_flat, "imp_stg": self.implants_stagger_flat
             },
-            **self.get_dynamic_state(),
-            "base_stats": {
-                "current_hp": self.current_hp, "current_sp": self.current_sp,
-                "current_stagger": self.current_stagger
-            },
             "defense": {
                 "armor_name": self.armor_name, "armor_type": self.armor_type,
                 "armor_id": getattr(self, 'armor_id', 'none'),
@@ -113,6 +114,20 @@ class UnitSerializationMixin:
             "unit_type": self.unit_type,
         }
 
+    def to_dict(self):
+        """Полная сериализация: сборка (build_state) + динамическое состояние."""
+        build = self.build_state()
+        # Порядок ключей как в старых сохранениях: шапка, динамика, затем остальная сборка
+        data = {k: build.pop(k) for k in
+                ("name", "level", "rank", "avatar", "base_intellect", "total_xp", "pct_mods", "flat_mods")}
+        data.update(self.get_dynamic_state())
+        data["base_stats"] = {
+            "current_hp": self.current_hp, "current_sp": self.current_sp,
+            "current_stagger": self.current_stagger
+        }
+        data.update(build)
+        return data
+
     @classmethod
     def from_dict(cls, data: dict):
         # Создаем экземпляр
@@ -199,7 +214,7 @@ class UnitSerializationMixin:
                 s_copy['card'] = card_obj.id
             elif card_obj:
                 s_copy['card'] = None
-            return json.loads(json.dumps(s_copy, default=str))
+            return json_copy(s_copy, str)
         except Exception:
             return {}
 
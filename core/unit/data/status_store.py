@@ -0,0 +1,180 @@
+from types import MappingProxyType
+
+
+class StatusInstance:
+    """
+    Один экземпляр (стак) статуса.
+    Компактная запись вместо словаря {"amount": .., "duration": ..};
+    доступ по ключу (item["amount"], item.get("duration")) оставлен для совместимости.
+    """
+    __slots__ = ("amount", "duration")
+
+    def __init__(self, amount: int, duration: int = 1):
+        self.amount = amount
+        self.duration = duration
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self) -> dict:
+        return {"amount": self.amount, "duration": self.duration}
+
+    @classmethod
+    def coerce(cls, item) -> "StatusInstance":
+        if isinstance(item, cls):
+            return item
+        return cls(item.get("amount", 0), item.get("duration", 1))
+
+    def __repr__(self):
+        return f"StatusInstance(amount={self.amount}, duration={self.duration})"
+
+
+class StatusStore(dict):
+    """
+    Хранилище статусов юнита: {status_id: [StatusInstance, ...]}.
+
+    Дополнительно ведет суммы стаков по статусам (totals), которые обновляются
+    при добавлении, снятии и истечении, — get_status и unit.statuses не пересчитывают списки.
+    В totals попадают только статусы с положительной суммой.
+    Изменять стаки нужно через методы хранилища (add/remove/tick) или присваиванием списка целиком.
+    """
+
+    def __init__(self, data=None):
+        super().__init__()
+        self.totals = {}
+        self.view = MappingProxyType(self.totals)
+        if data:
+            self.update(data)
+
+    def _recount(self, name):
+        total = sum(i.amount for i in dict.get(self, name, ()))
+        if total > 0:
+            self.totals[name] = total
+        else:
+            self.totals.pop(name, None)
+
+    # =========================================================================
+    # API СЛОВАРЯ (поддерживаем суммы в актуальном состоянии)
+    # =========================================================================
+
+    def __setitem__(self, name, instances):
+        dict.__setitem__(self, name, [StatusInstance.coerce(i) for i in instances])
+        self._recount(name)
+
+    def __delitem__(self, name):
+        dict.__delitem__(self, name)
+        self.totals.pop(name, None)
+
+    def pop(self, name, *default):
+        self.totals.pop(name, None)
+        return dict.pop(self, name, *default)
+
+    def clear(self):
+        dict.clear(self)
+        self.totals.clear()
+
+    def update(self, other=(), **kwargs):
+        for name, instances in dict(other, **kwargs).items():
+            self[name] = instances
+
+    def setdefault(self, name, default=None):
+        if name not in self:
+            self[name] = default or []
+        return dict.__getitem__(self, name)
+
+    # =========================================================================
+    # ОПЕРАЦИИ ДВИЖКА
+    # =========================================================================
+
+    def total(self, name: str) -> int:
+        return self.totals.get(name, 0)
+
+    def add(self, name: str, amount: int, duration: int, pool: bool = False):
+        """Новый стак. pool=True: копится в первом экземпляре (длительность — максимум)."""
+        instances = dict.get(self, name)
+        if instances is None:
+            instances = []
+            dict.__setitem__(self, name, instances)
+
+        if pool and instances:
+            first = instances[0]
+            first.amount += amount
+            first.duration = max(first.duration, duration)
+        else:
+            instances.append(StatusInstance(amount, duration))
+        self.totals[name] = self.totals.get(name, 0) + amount
+
+    def remove(self, name: str, amount: int) -> int:
+        """Снимает amount стаков, начиная с самых коротких. Возвращает фактически снятое количество."""
+        instances = dict.get(self, name)
+        if instances is None:
+            return 0
+
+        before = self.totals.get(name, 0)
+        rem = amount
+        kept = []
+        for item in sorted(instances, key=lambda x: x.duration):
+            if rem <= 0:
+                kept.append(item)
+            elif item.amount > rem:
+                item.amount -= rem
+                rem = 0
+                kept.append(item)
+            else:
+                rem -= item.amount
+
+        if kept:
+            dict.__setitem__(self, name, kept)
+            self._recount(name)
+        else:
+            del self[name]
+        return before - self.totals.get(name, 0)
+
+    def tick(self) -> list:
+        """Конец раунда: -1 длительности всем стакам. Возвращает id полностью истекших статусов."""
+        expired = []
+        for name in list(self):
+            instances = dict.__getitem__(self, name)
+            kept = []
+            for item in instances:
+                item.duration -= 1
+                if item.duration > 0:
+                    kept.append(item)
+
+            if not kept:
+                del self[name]
+                expired.append(name)
+            elif len(kept) != len(instances):
+                dict.__setitem__(self, name, kept)
+                self._recount(name)
+        return expired
+
+    # =========================================================================
+    # СЕРИАЛИЗАЦИЯ / КОПИРОВАНИЕ
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        return {name: [i.to_dict() for i in instances] for name, instances in self.items()}
+
+    def copy(self) -> "StatusStore":
+        return StatusStore(self.to_dict())
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __reduce__(self):
+        return StatusStore, (self.to_dict(),)
+
+
+def ensure_status_store(unit) -> StatusStore:
+    """Возвращает хранилище статусов юнита, приводя старый формат (dict списков dict) к StatusStore."""
+    store = getattr(unit, "_status_effects", None)
+    if not isinstance(store, StatusStore):
+        store = StatusStore(store or {})
+        unit._status_effects = store
+    return store
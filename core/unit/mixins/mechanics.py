@@ -1,11 +1,58 @@
 from core.logging import logger, LogLevel
+from logic.base_effect import implements_hook
 from logic.statuses.status_definitions import STATUS_REGISTRY
 
 
+_REGISTRIES = None
+
+
+def _get_registries():
+    """Реестры механик (импорт откладывается до первого вызова из-за циклических зависимостей)."""
+    global _REGISTRIES
+    if _REGISTRIES is None:
+        from logic.character_changing.passives import PASSIVE_REGISTRY
+        from logic.character_changing.talents import TALENT_REGISTRY
+        from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
+        from logic.weapon_definitions import WEAPON_REGISTRY
+        _REGISTRIES = (PASSIVE_REGISTRY, TALENT_REGISTRY, AUGMENTATION_REGISTRY, WEAPON_REGISTRY)
+    return _REGISTRIES
+
+
+class _MechanicsCache:
+    """
+    Кэш механик юнита: упорядоченный кортеж (механика, стак) и выборки по хукам.
+    Стак есть только у статусов, у остальных механик — None.
+    """
+    __slots__ = ("key", "entries", "by_hook")
+
+    def __init__(self, key, entries):
+        self.key = key
+        self.entries = entries
+        self.by_hook = {}
+
+    def for_hook(self, hook):
+        """Только механики, реально реализующие hook (см. implements_hook)."""
+        found = self.by_hook.get(hook)
+        if found is None:
+            found = tuple(e for e in self.entries if implements_hook(e[0], hook))
+            self.by_hook[hook] = found
+        return found
+
+    def __deepcopy__(self, memo):
+        # Копия юнита пересоберет кэш сама (реестровые объекты копировать нельзя)
+        return None
+
+    def __reduce__(self):
+        return _MechanicsCache, (None, ())
+
+
 class MechanicsIteratorMixin:  # <--- Имя класса должно совпадать с импортом в unit.py
     """
     Миксин, предоставляющий единый интерфейс для доступа ко всем
     источникам механик (Пассивки, Таланты, Аугментации, Статусы, Оружие).
+
+    Список механик кэшируется и пересобирается только при изменении статусов
+    (счетчик _status_version, см. UnitStatusMixin) или сборки (пассивки, таланты, аугментации, оружие).
     """
 
     @property
@@ -13,90 +60,74 @@ class MechanicsIteratorMixin:  # <--- Имя класса должно совп
         """Возвращает список всех активных механик юнита."""
         return list(self._iter_all_mechanics())
 
-    def _iter_all_mechanics(self):  # <--- Переименовано для совместимости с checks.py
+    def _mechanics_cache(self) -> _MechanicsCache:
+        key = (
+            getattr(self, "_status_version", 0),
+            id(getattr(self, "_status_effects", None)),
+            tuple(getattr(self, "passives", ())),
+            tuple(getattr(self, "talents", ())),
+            tuple(getattr(self, "augmentations", ())),
+            getattr(self, "weapon_id", None),
+        )
+        cache = self.__dict__.get("_mech_cache")
+        if cache is None or cache.key != key:
+            cache = _MechanicsCache(key, tuple(self._build_mechanics()))
+            self._mech_cache = cache
+        return cache
+
+    def invalidate_mechanics(self):
+        """Сбрасывает кэш механик (для прямых правок сборки или статусов в обход методов)."""
+        self.__dict__.pop("_mech_cache", None)
+
+    def _build_mechanics(self):
         """
-        Генератор, возвращающий все активные объекты эффектов на юните.
+        Генератор пар (механика, стак).
         Порядок: Статусы -> Пассивки -> Таланты -> Аугментации -> Оружие.
         """
-        # Локальные импорты для предотвращения циклической зависимости
-        from logic.character_changing.passives import PASSIVE_REGISTRY
-        from logic.character_changing.talents import TALENT_REGISTRY
-        from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
-        from logic.weapon_definitions import WEAPON_REGISTRY
+        PASSIVE_REGISTRY, TALENT_REGISTRY, AUGMENTATION_REGISTRY, WEAPON_REGISTRY = _get_registries()
 
         # 1. Статусы (У них приоритет, т.к. они часто меняют логику статов)
         if hasattr(self, "statuses"):
             for status_id, stack in self.statuses.items():
                 if status_id in STATUS_REGISTRY:
-                    yield STATUS_REGISTRY[status_id]
+                    yield STATUS_REGISTRY[status_id], stack
 
         # 2. Пассивки
         if hasattr(self, "passives"):
             for pid in self.passives:
-                if pid in PASSIVE_REGISTRY: yield PASSIVE_REGISTRY[pid]
+                if pid in PASSIVE_REGISTRY: yield PASSIVE_REGISTRY[pid], None
 
         # 3. Таланты
         if hasattr(self, "talents"):
             for tid in self.talents:
-                if tid in TALENT_REGISTRY: yield TALENT_REGISTRY[tid]
+                if tid in TALENT_REGISTRY: yield TALENT_REGISTRY[tid], None
 
         # 4. Аугментации
         if hasattr(self, "augmentations"):
             for aid in self.augmentations:
-                if aid in AUGMENTATION_REGISTRY: yield AUGMENTATION_REGISTRY[aid]
+                if aid in AUGMENTATION_REGISTRY: yield AUGMENTATION_REGISTRY[aid], None
 
         # 5. Пассивка оружия
         if hasattr(self, "weapon_id") and self.weapon_id in WEAPON_REGISTRY:
             wep = WEAPON_REGISTRY[self.weapon_id]
             if wep.passive_id and wep.passive_id in PASSIVE_REGISTRY:
-                yield PASSIVE_REGISTRY[wep.passive_id]
+                yield PASSIVE_REGISTRY[wep.passive_id], None
+
+    def _iter_all_mechanics(self):  # <--- Переименовано для совместимости с checks.py
+        """Все активные объекты эффектов на юните (из кэша)."""
+        return (mech for mech, _ in self._mechanics_cache().entries)
 
     def trigger_mechanics(self, method_name, *args, **kwargs):
         """
         Запускает метод method_name у всех механик, если он существует.
         Пример: unit.trigger_mechanics("on_combat_start", unit, log_func)
+        Статусы получают stack, остальные механики — нет.
         """
-        from logic.character_changing.passives import PASSIVE_REGISTRY
-        from logic.character_changing.talents import TALENT_REGISTRY
-        from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
-        from logic.weapon_definitions import WEAPON_REGISTRY
-
-        # === 1. СТАТУСЫ (Передаем stack) ===
-        if hasattr(self, "statuses"):
-            for status_id, stack in self.statuses.items():
-                if status_id in STATUS_REGISTRY:
-                    mech = STATUS_REGISTRY[status_id]
-                    if hasattr(mech, method_name):
-                        getattr(mech, method_name)(*args, stack=stack, **kwargs)
-
-        # === 2. ОСТАЛЬНЫЕ МЕХАНИКИ (Без stack) ===
-        other_mechanics = []
-
-        # Пассивки
-        if hasattr(self, "passives"):
-            for pid in self.passives:
-                if pid in PASSIVE_REGISTRY: other_mechanics.append(PASSIVE_REGISTRY[pid])
-
-        # Таланты
-        if hasattr(self, "talents"):
-            for tid in self.talents:
-                if tid in TALENT_REGISTRY: other_mechanics.append(TALENT_REGISTRY[tid])
-
-        # Аугментации
-        if hasattr(self, "augmentations"):
-            for aid in self.augmentations:
-                if aid in AUGMENTATION_REGISTRY: other_mechanics.append(AUGMENTATION_REGISTRY[aid])
-
-        # Оружие
-        if hasattr(self, "weapon_id") and self.weapon_id in WEAPON_REGISTRY:
-            wep = WEAPON_REGISTRY[self.weapon_id]
-            if wep.passive_id and wep.passive_id in PASSIVE_REGISTRY:
-                other_mechanics.append(PASSIVE_REGISTRY[wep.passive_id])
-
-        # Запуск для остальных
-        for mech in other_mechanics:
-            if hasattr(mech, method_name):
+        for mech, stack in self._mechanics_cache().for_hook(method_name):
+            if stack is None:
                 getattr(mech, method_name)(*args, **kwargs)
+            else:
+                getattr(mech, method_name)(*args, stack=stack, **kwargs)
 
     def apply_mechanics_filter(self, method_name, initial_value, *args, **kwargs):
         """
@@ -105,22 +136,21 @@ class MechanicsIteratorMixin:  # <--- Имя класса должно совп
         """
         value = initial_value
 
-        # Используем переименованный метод _iter_all_mechanics
-        for mech in self._iter_all_mechanics():
-            if hasattr(mech, method_name):
-                old_val = value
+        # Заглушки BaseEffect возвращают значение без изменений — их не вызываем
+        for mech, _ in self._mechanics_cache().for_hook(method_name):
+            old_val = value
 
-                # Примечание: тут мы не передаем stack явно, так как генератор не возвращает stack.
-                # Но статусы в своих методах (например, modify_incoming_damage) обычно делают:
-                # if stack == 0: stack = unit.get_status(self.id)
-                # Так что это будет работать корректно.
+            # Примечание: тут мы не передаем stack явно.
+            # Статусы в своих методах (например, modify_incoming_damage) обычно делают:
+            # if stack == 0: stack = unit.get_status(self.id)
+            # Так что это будет работать корректно.
 
-                value = getattr(mech, method_name)(self, value, *args, **kwargs)
+            value = getattr(mech, method_name)(self, value, *args, **kwargs)
 
-                # Логируем, если значение изменилось
-                if value != old_val:
-                    mech_id = getattr(mech, 'id', 'Unknown')
-                    logger.log(f"Filter change by {mech_id}: {old_val} -> {value}", LogLevel.VERBOSE, "Filter")
+            # Логируем, если значение изменилось
+            if value != old_val:
+                logger.log("Filter change by %s: %s -> %s", LogLevel.VERBOSE, "Filter",
+                           getattr(mech, 'id', 'Unknown'), old_val, value)
 
         return value
 
@@ -129,7 +159,7 @@ class MechanicsIteratorMixin:  # <--- Имя класса должно совп
         Вызывает метод hook_name у всех активных механик.
         Пример: unit.trigger_hooks('on_luck_check', result=15)
         """
-        for mechanic in self._iter_all_mechanics():
+        for mechanic, _ in self._mechanics_cache().for_hook(hook_name):
             # Проверяем, есть ли у механики нужный метод (например, on_luck_check)
             hook_method = getattr(mechanic, hook_name, None)
 
@@ -1,6 +1,5 @@
-import random
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
 
 
 class SpeedRollMixin:
@@ -35,13 +34,16 @@ class SpeedRollMixin:
             if hasattr(effect, "get_speed_dice_value_modifier"):
                 speed_modifier += effect.get_speed_dice_value_modifier(self)
 
+        # Броски идут через RNG боя (если юнит в сессии), иначе — глобальный random
+        rng = get_rng(self)
+
         speed_rolls = []
 
         # 1. Основные слоты
         for i, (d_min, d_max) in enumerate(self.computed_speed_dice):
             if i >= slots_to_roll: break
 
-            val = max(1, random.randint(int(d_min), int(d_max)) + speed_modifier)
+            val = max(1, rng.randint(int(d_min), int(d_max)) + speed_modifier)
             self.active_slots.append({
                 'speed': val, 'card': None, 'target_slot': None, 'is_aggro': False
             })
@@ -63,7 +65,7 @@ class SpeedRollMixin:
                 d_min, d_max = self.base_speed_min, self.base_speed_max
 
             for _ in range(extra_dice_count):
-                val = max(1, random.randint(d_min, d_max) + speed_modifier)
+                val = max(1, rng.randint(d_min, d_max) + speed_modifier)
                 self.active_slots.append({
                     'speed': val, 'card': None, 'target_slot': None,
                     'is_aggro': False, 'source_effect': 'Bonus 🌟'
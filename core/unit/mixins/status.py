@@ -1,27 +1,29 @@
-from typing import Dict, TYPE_CHECKING
-
-import streamlit as st
+from typing import Mapping, TYPE_CHECKING
 
 from core.logging import logger, LogLevel
+from core.unit.data.status_store import ensure_status_store
+from logic.base_effect import implements_hook
 
 if TYPE_CHECKING:
     pass
 
 
+POOL_STATUSES = frozenset({"smoke", "charge", "satiety", "tremor", "self_control", "poise", "adaptation", "exhaustion"})
+
+
 class UnitStatusMixin:
     def _ensure_status_storage(self):
-        if not hasattr(self, "_status_effects"): self._status_effects = {}
+        ensure_status_store(self)
         if not hasattr(self, "delayed_queue"): self.delayed_queue = []
 
+    def _bump_status_version(self):
+        """Отмечает изменение статусов: кэш механик юнита пересоберется при следующем обращении."""
+        self._status_version = getattr(self, "_status_version", 0) + 1
+
     @property
-    def statuses(self) -> Dict[str, int]:
-        self._ensure_status_storage()
-        summary = {}
-        for name, instances in self._status_effects.items():
-            total = sum(i["amount"] for i in instances)
-            if total > 0:
-                summary[name] = total
-        return summary
+    def statuses(self) -> Mapping[str, int]:
+        """Суммы стаков (только > 0). Read-only представление, обновляется хранилищем без пересчета."""
+        return ensure_status_store(self).view
 
     def add_status(self, name: str, amount: int, duration: int = 1, delay: int = 0, trigger_events: bool = True):
         self._ensure_status_storage()
@@ -29,7 +31,7 @@ class UnitStatusMixin:
 
         if hasattr(self, "iter_mechanics"):
             for mech in self.iter_mechanics():
-                if hasattr(mech, "on_before_status_add"):
+                if implements_hook(mech, "on_before_status_add"):
                     res = mech.on_before_status_add(self, name, amount)
 
                     # Обработка результата (bool или tuple)
@@ -51,19 +53,10 @@ class UnitStatusMixin:
             logger.log(f"⏰ {self.name}: {name} delayed for {delay} turns", LogLevel.NORMAL, "Status")
             return True, "Delayed"
 
-        if name not in self._status_effects:
-            self._status_effects[name] = []
-
-        POOL_STATUSES = ["smoke", "charge", "satiety", "tremor", "self_control", "poise", "adaptation", "exhaustion"]
-
-        if name in POOL_STATUSES and self._status_effects[name]:
-            # Если статус уже есть, просто увеличиваем количество в первом слоте
-            self._status_effects[name][0]["amount"] += amount
-            # Обновляем длительность (берем максимум)
-            self._status_effects[name][0]["duration"] = max(self._status_effects[name][0]["duration"], duration)
-        else:
-            # Обычное поведение: добавляем новый отдельный стак
-            self._status_effects[name].append({"amount": amount, "duration": duration})
+        # Пуловые статусы копятся в первом слоте (длительность — максимум),
+        # остальные добавляются отдельным стаком
+        self._status_effects.add(name, amount, duration, pool=name in POOL_STATUSES)
+        self._bump_status_version()
 
         # Логируем наложение (NORMAL)
         logger.log(f"🧪 {self.name}: +{amount} {name} ({duration}t)", LogLevel.NORMAL, "Status")
@@ -75,14 +68,11 @@ class UnitStatusMixin:
                 self.trigger_mechanics("on_status_applied", self, name, amount, duration=duration)
 
             # B. [NEW] ГЛОБАЛЬНЫЙ ХУК (Для наблюдателей, например Аксис)
-            # Мы оповещаем всех остальных юнитов в бою, что на 'self' наложился статус
-            try:
-                # Получаем списки команд из сессии (безопасный доступ)
-                team_l = st.session_state.get('team_left', [])
-                team_r = st.session_state.get('team_right', [])
-                all_units = team_l + team_r
-
-                for observer in all_units:
+            # Мы оповещаем всех остальных юнитов в бою, что на 'self' наложился статус.
+            # Участников берем из сессии боя, к которой привязан юнит (вне боя сессии нет).
+            session = getattr(self, "session", None)
+            if session is not None:
+                for observer in session.all_units():
                     # Пропускаем себя (локальный хук уже сработал) и мертвых
                     if observer is self or observer.is_dead():
                         continue
@@ -98,17 +88,12 @@ class UnitStatusMixin:
                             amount=amount,
                             duration=duration
                         )
-            except Exception as e:
-                # Заглушка на случай ошибок доступа к session_state вне контекста
-                pass
         # ==============================================
 
         return True, None
 
     def get_status(self, name: str) -> int:
-        self._ensure_status_storage()
-        if name not in self._status_effects: return 0
-        return sum(i["amount"] for i in self._status_effects[name])
+        return ensure_status_store(self).total(name)
 
     def remove_status(self, name: str, amount: int = None):
         self._ensure_status_storage()
@@ -118,31 +103,15 @@ class UnitStatusMixin:
 
         if amount is None:
             del self._status_effects[name]
+            self._bump_status_version()
             logger.log(f"🧹 {self.name}: Cleared all {name} ({current_val})", LogLevel.NORMAL, "Status")
             return
 
-        items = sorted(self._status_effects[name], key=lambda x: x["duration"])
-        rem = amount
-        new_items = []
-
-        for item in items:
-            if rem <= 0:
-                new_items.append(item)
-                continue
-            if item["amount"] > rem:
-                item["amount"] -= rem
-                rem = 0
-                new_items.append(item)
-            else:
-                rem -= item["amount"]
-
-        if not new_items:
-            del self._status_effects[name]
-        else:
-            self._status_effects[name] = new_items
+        # Снимаем начиная с самых коротких стаков
+        removed = self._status_effects.remove(name, amount)
+        self._bump_status_version()
 
         # Логируем фактическое снятие
-        removed = current_val - self.get_status(name)
         if removed > 0:
             logger.log(f"🧹 {self.name}: Removed {removed} {name}", LogLevel.NORMAL, "Status")
 
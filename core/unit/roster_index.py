@@ -0,0 +1,211 @@
+import json
+import os
+from collections.abc import MutableMapping
+from dataclasses import dataclass, asdict
+
+from core.data_cache import CACHE_DIR, file_stamp
+from core.logging import logger, LogLevel
+
+INDEX_PATH = os.path.join(CACHE_DIR, "roster_index.json")
+
+
+@dataclass
+class RosterEntry:
+    """Строка индекса персонажей: то, что нужно спискам и фильтрам, без сборки Unit."""
+    name: str
+    path: str
+    mtime: int
+    size: int
+    level: int = 1
+    rank: int = 9
+    avatar: str = None
+    unit_type: str = "fixer"
+    # Файл читается, но Unit из него не собирается (как при полной загрузке, в ростер не попадает)
+    broken: bool = False
+
+    @classmethod
+    def from_data(cls, data: dict, path: str, stamp: tuple) -> "RosterEntry":
+        # Значения по умолчанию как в Unit.from_dict
+        return cls(
+            name=data.get("name", "Unknown"), path=path, mtime=stamp[0], size=stamp[1],
+            level=data.get("level", 1), rank=data.get("rank", 9),
+            avatar=data.get("avatar", None), unit_type=data.get("unit_type", "fixer"),
+        )
+
+    @classmethod
+    def from_unit(cls, unit, path: str) -> "RosterEntry":
+        stamp = file_stamp(path)
+        return cls(
+            name=unit.name, path=path, mtime=stamp[0], size=stamp[1],
+            level=unit.level, rank=unit.rank, avatar=unit.avatar, unit_type=unit.unit_type,
+        )
+
+
+class RosterIndex:
+    """
+    Индекс файлов персонажей (data/.cache/roster_index.json): путь -> RosterEntry.
+    Обновляется инкрементально: перечитываются только файлы с новыми mtime/размером.
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self._entries = None
+
+    def _load(self):
+        self._entries = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            self._entries = {path: RosterEntry(**data) for path, data in raw.items()}
+        except Exception as e:
+            logger.log(f"⚠️ Roster index is unreadable, rebuilding: {e}", LogLevel.VERBOSE, "System")
+
+    def refresh(self, directory: str, validate=None) -> list:
+        """
+        Актуальные записи для всех .json в папке (в порядке os.listdir, как при полной загрузке).
+        validate(path) вызывается для новых и измененных файлов: если он падает, запись помечается broken
+        и в список не попадает (как при полной загрузке, где такой Unit в ростер не добавлялся).
+        """
+        if self._entries is None:
+            self._load()
+
+        directory = os.path.abspath(directory)
+        changed = False
+        seen = set()
+        result = []
+
+        for filename in os.listdir(directory):
+            if not filename.endswith('.json'):
+                continue
+            path = os.path.join(directory, filename)
+            seen.add(path)
+            try:
+                stamp = file_stamp(path)
+                entry = self._entries.get(path)
+                if entry is None or (entry.mtime, entry.size) != stamp:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        entry = RosterEntry.from_data(json.load(f), path, stamp)
+                    if validate is not None:
+                        try:
+                            validate(path)
+                        except Exception as e:
+                            logger.log(f"❌ Error loading {filename}: {e}", LogLevel.NORMAL, "System")
+                            entry.broken = True
+                    self._entries[path] = entry
+                    changed = True
+            except Exception as e:
+                logger.log(f"❌ Error loading {filename}: {e}", LogLevel.NORMAL, "System")
+                changed |= self._entries.pop(path, None) is not None
+                continue
+            if not entry.broken:
+                result.append(entry)
+
+        for path in [p for p in self._entries if os.path.dirname(p) == directory and p not in seen]:
+            del self._entries[path]
+            changed = True
+
+        if changed:
+            self.save()
+        return result
+
+    def update(self, entry: RosterEntry):
+        if self._entries is None:
+            self._load()
+        self._entries[entry.path] = entry
+        self.save()
+
+    def mark_broken(self, entry: RosterEntry):
+        """Запоминает, что из этой версии файла Unit не собрать (до следующего изменения файла)."""
+        entry.broken = True
+        self.update(entry)
+
+    def remove(self, path: str):
+        if self._entries is None:
+            self._load()
+        if self._entries.pop(os.path.abspath(path), None) is not None:
+            self.save()
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({path: asdict(e) for path, e in self._entries.items()}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.log(f"⚠️ Failed to write roster index: {e}", LogLevel.VERBOSE, "System")
+
+
+class LazyRoster(MutableMapping):
+    """
+    Ростер {имя: Unit}, который собирает Unit только при обращении по имени
+    (открытие в профиле, добавление в команду). Списки имен и peek работают по индексу.
+    """
+
+    def __init__(self, entries=(), loader=None, on_error=None):
+        self._entries = {e.name: e for e in entries}
+        self._units = {}
+        self._loader = loader
+        self._on_error = on_error
+
+    def __getitem__(self, name):
+        unit = self._units.get(name)
+        if unit is not None:
+            return unit
+
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(name)
+        try:
+            unit = self._loader(entry)
+        except Exception as e:
+            logger.log(f"❌ Error loading {os.path.basename(entry.path)}: {e}", LogLevel.NORMAL, "System")
+            del self._entries[name]
+            if self._on_error:
+                self._on_error(entry)
+            raise KeyError(name) from e
+        self._units[name] = unit
+        return unit
+
+    def __setitem__(self, name, unit):
+        self._units[name] = unit
+
+    def __delitem__(self, name):
+        found = self._units.pop(name, None) is not None
+        found |= self._entries.pop(name, None) is not None
+        if not found:
+            raise KeyError(name)
+
+    def __contains__(self, name):
+        return name in self._units or name in self._entries
+
+    def __iter__(self):
+        return iter(dict.fromkeys([*self._entries, *self._units]))
+
+    def __len__(self):
+        return len(self._entries.keys() | self._units.keys())
+
+    def items(self):
+        """Пары (имя, Unit) со сборкой всех персонажей; несобираемые файлы пропускаются."""
+        result = []
+        for name in list(self):
+            unit = self.get(name)
+            if unit is not None:
+                result.append((name, unit))
+        return result
+
+    def values(self):
+        return [unit for _, unit in self.items()]
+
+    def peek(self, name):
+        """Собранный Unit, если он уже есть, иначе запись индекса (name, level, rank, avatar, unit_type)."""
+        unit = self._units.get(name)
+        return unit if unit is not None else self._entries[name]
+
+    def is_loaded(self, name) -> bool:
+        return name in self._units
+
+    def __repr__(self):
+        return f"LazyRoster({len(self)} units, {len(self._units)} loaded)"
@@ -18,25 +18,30 @@ class Unit(UnitData, UnitStatusMixin, UnitCombatMixin, UnitLifecycleMixin, Mecha
     Объединяет данные (UnitData) и логику (Mixins).
     """
 
-    def recalculate_stats(self):
-        """Пересчитывает характеристики на основе атрибутов, навыков и пассивок."""
+    def recalculate_stats(self, explain: bool = False):
+        """
+        Пересчитывает характеристики на основе атрибутов, навыков и пассивок.
+        explain=True — без кэша, с полным логом расчета (см. recalculate_unit_stats).
+        """
         # Импорт здесь, чтобы избежать циклических ссылок
         from core.calculations import recalculate_unit_stats
 
         logger.log(f"Recalculating stats for {self.name}", LogLevel.VERBOSE, "Stats")
 
-        return recalculate_unit_stats(self)
+        return recalculate_unit_stats(self, explain)
 
     def get_total_money(self) -> int:
         """Считает текущий баланс."""
         return sum(item.get("amount", 0) for item in self.money_log)
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(cls, data: dict, recalculate: bool = True):
+        """recalculate=False — без пересчета статов (вызывающий пересчитает сам, например после наложения дельты)."""
         unit = super().from_dict(data)
 
         # Логируем загрузку юнита
         logger.log(f"Unit loaded/created: {unit.name} (Lvl {unit.level})", LogLevel.VERBOSE, "System")
 
-        unit.recalculate_stats()
+        if recalculate:
+            unit.recalculate_stats()
         return unit
\ No newline at end of file
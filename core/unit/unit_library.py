@@ -2,9 +2,18 @@
 import json
 import os
 
+from core.data_cache import CompiledCache
+from core.library import CARDS_DIR
 from core.logging import logger, LogLevel  # [LOG] Импорт логгера
+from core.unit.roster_index import RosterIndex, RosterEntry, LazyRoster
 from core.unit.unit import Unit
 
+# Собранные персонажи по отпечатку файла. Unit.from_dict читает реестры брони, оружия и способностей,
+# берет карты слотов из Library и пересчитывает статы, поэтому кэш зависит от всего кода core/ и logic/
+# и от паков карт
+UNIT_CACHE = CompiledCache("units", code_paths=("core", "logic"), data_paths=(CARDS_DIR,))
+ROSTER_INDEX = RosterIndex()
+
 
 class UnitLibrary:
     _roster = {}
@@ -12,33 +21,42 @@ class UnitLibrary:
 
     @classmethod
     def load_all(cls):
-        """Загружает всех персонажей из JSON файлов в папке."""
-        cls._roster = {}
+        """
+        Индексирует персонажей из JSON файлов в папке.
+        Возвращает LazyRoster: Unit собирается только при обращении по имени.
+        """
+        cls._roster = LazyRoster()
         if not os.path.exists(cls.DATA_PATH):
             os.makedirs(cls.DATA_PATH, exist_ok=True)
             logger.log(f"Created directory: {cls.DATA_PATH}", LogLevel.VERBOSE, "System")
-            return {}
+            return cls._roster
 
-        files = [f for f in os.listdir(cls.DATA_PATH) if f.endswith('.json')]
         logger.log(f"Loading units from {cls.DATA_PATH}...", LogLevel.VERBOSE, "System")
 
-        loaded_count = 0
-        for filename in files:
-            path = os.path.join(cls.DATA_PATH, filename)
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    unit = Unit.from_dict(data)
-                    cls._roster[unit.name] = unit
-                    loaded_count += 1
-            except Exception as e:
-                logger.log(f"❌ Error loading {filename}: {e}", LogLevel.NORMAL, "System")
+        # Новые и измененные файлы сразу собираются (в кэш): несобираемые не попадут в списки имен
+        UNIT_CACHE.open()
+        entries = ROSTER_INDEX.refresh(cls.DATA_PATH, validate=lambda path: UNIT_CACHE.get(path, cls._parse_unit))
+        UNIT_CACHE.save()
+        cls._roster = LazyRoster(entries, loader=cls._load_entry, on_error=ROSTER_INDEX.mark_broken)
 
-        if loaded_count > 0:
-            logger.log(f"✔ Loaded {loaded_count} units into roster.", LogLevel.NORMAL, "System")
+        if entries:
+            logger.log(f"✔ Indexed {len(cls._roster)} units into roster.", LogLevel.NORMAL, "System")
 
         return cls._roster
 
+    @classmethod
+    def _load_entry(cls, entry: RosterEntry) -> Unit:
+        """Собирает Unit по записи индекса (через кэш собранных персонажей)."""
+        UNIT_CACHE.open()
+        unit = UNIT_CACHE.get(entry.path, cls._parse_unit)
+        UNIT_CACHE.save()
+        return unit
+
+    @staticmethod
+    def _parse_unit(path) -> Unit:
+        with open(path, 'r', encoding='utf-8') as f:
+            return Unit.from_dict(json.load(f))
+
     @classmethod
     def save_unit(cls, unit: Unit):
         """Сохраняет одного персонажа в файл."""
@@ -54,8 +72,9 @@ class UnitLibrary:
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(unit.to_dict(), f, indent=4, ensure_ascii=False)
             logger.log(f"💾 Saved unit: {unit.name} -> {path}", LogLevel.NORMAL, "System")
-            # Обновляем кэш
+            # Обновляем кэш и индекс
             cls._roster[unit.name] = unit
+            ROSTER_INDEX.update(RosterEntry.from_unit(unit, os.path.abspath(path)))
             return True
         except Exception as e:
             logger.log(f"Error saving unit {unit.name}: {e}", LogLevel.NORMAL, "System")
@@ -76,6 +95,7 @@ class UnitLibrary:
         if os.path.exists(path):
             try:
                 os.remove(path)
+                ROSTER_INDEX.remove(path)
                 logger.log(f"🗑️ Deleted unit file: {path}", LogLevel.NORMAL, "System")
                 return True
             except Exception as e:
@@ -1,8 +1,7 @@
 # engine.py
-import random
-
 from core.dice import Dice
 from core.events import EventManager
+from core.rng import BattleRNG
 from core.unit.unit import Unit
 from logic.character_changing.augmentations.augmentations import AUGMENTATION_REGISTRY
 from logic.character_changing.passives import PASSIVE_REGISTRY
@@ -13,7 +12,7 @@ from logic.modifiers import RollContext
 class CombatEngine:
     def __init__(self, seed=None):
         self.events = EventManager()
-        self.rng = random.Random(seed)
+        self.rng = BattleRNG(seed)
 
     def initialize_unit(self, unit: Unit):
         """Подключает пассивки и таланты юнита к событиям"""
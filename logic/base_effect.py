@@ -1,3 +1,5 @@
+import dis
+
 from logic.context import RollContext
 
 
@@ -11,6 +13,24 @@ class BaseEffect:
     description = ""
     active_description = ""
 
+    # Результат on_calculate_stats зависит только от сборки и статусов юнита (и стака),
+    # поэтому пересчет статов может брать его из кэша (см. logic/calculations/stats_cache.py).
+    # Если класс не объявляет флаг сам, он выводится автоматически: хук, не читающий unit, — чистый.
+    pure_stats = True
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        [NEW] При объявлении класса эффекта отмечаем, какие хуки он реально переопределяет.
+        Диспетчер механик (MechanicsIteratorMixin) вызывает только их, пропуская заглушки.
+        """
+        super().__init_subclass__(**kwargs)
+        for hook in BASE_HOOKS:
+            if getattr(cls, hook) is not getattr(BaseEffect, hook):
+                HOOK_IMPLEMENTERS.setdefault(hook, set()).add(cls)
+
+        if "on_calculate_stats" in vars(cls) and "pure_stats" not in vars(cls):
+            cls.pure_stats = not _reads_unit_argument(cls.on_calculate_stats)
+
     # === БАЗОВЫЕ СОБЫТИЯ (Lifecycle) ===
 
     def on_combat_start(self, unit, *args, **kwargs):
@@ -423,4 +443,49 @@ class BaseEffect:
         ```
         """
         return params
-        pass
\ No newline at end of file
+        pass
+
+
+# === ТАБЛИЦА ДИСПЕТЧЕРИЗАЦИИ ХУКОВ ===
+# Хуки-заглушки BaseEffect и классы, у которых есть собственная реализация каждого хука
+BASE_HOOKS = frozenset(
+    name for name, value in vars(BaseEffect).items()
+    if callable(value) and not name.startswith("_")
+)
+HOOK_IMPLEMENTERS = {}
+
+
+def _reads_unit_argument(func) -> bool:
+    """Обращается ли метод к своему первому аргументу после self (unit). При сомнениях — да."""
+    code = getattr(func, "__code__", None)
+    if code is None or code.co_argcount < 2:
+        return True
+    arg = code.co_varnames[1]
+    if arg in code.co_cellvars:
+        return True
+    return any(_mentions_local(ins, arg) for ins in dis.get_instructions(code))
+
+
+def _mentions_local(ins, name: str) -> bool:
+    """
+    Инструкция работает с локальной переменной name.
+    Учитываются все *_FAST-инструкции, включая суперинструкции Python 3.12+
+    (LOAD_FAST_LOAD_FAST, STORE_FAST_LOAD_FAST...), у которых argval — кортеж имен.
+    """
+    if "FAST" not in ins.opname:
+        return False
+    argval = ins.argval
+    if isinstance(argval, tuple):
+        return name in argval
+    return argval == name
+
+
+def implements_hook(mech, hook: str) -> bool:
+    """
+    Нужно ли вызывать hook у механики.
+    Заглушки BaseEffect пропускаются (они ничего не делают или возвращают значение без изменений).
+    Хуки вне BaseEffect и объекты других классов проверяются через hasattr, как раньше.
+    """
+    if hook in BASE_HOOKS and isinstance(mech, BaseEffect):
+        return type(mech) in HOOK_IMPLEMENTERS.get(hook, ()) or hook in vars(mech)
+    return hasattr(mech, hook)
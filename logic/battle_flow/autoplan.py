@@ -0,0 +1,83 @@
+from collections import Counter
+
+from core.library import Library
+from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
+
+
+def get_available_card_ids(unit) -> list:
+    """
+    ID карт колоды, которые можно сыграть сейчас (без кулдауна и предметов).
+    Повторяет правила выбора карты в слоте UI: копия доступна, если она не на перезарядке.
+    """
+    deck_counts = Counter(getattr(unit, 'deck', None) or [])
+    available = []
+
+    for cid, total_owned in deck_counts.items():
+        cooldowns_list = unit.card_cooldowns.get(cid, [])
+        if isinstance(cooldowns_list, int): cooldowns_list = [cooldowns_list]
+
+        free_copies = total_owned - len(cooldowns_list)
+        if free_copies <= 0:
+            continue
+
+        card = Library.get_template(cid)
+        if card is None or card.id == "unknown" or str(card.card_type).lower() == "item":
+            continue
+        available.extend([cid] * free_copies)
+
+    return available
+
+
+def _pick_target(unit, enemies, rng):
+    """Случайная живая цель с учетом Провокации и Невидимости (как в списке целей UI)."""
+    alive = [(idx, e) for idx, e in enumerate(enemies) if not e.is_dead()]
+    am_i_invisible = unit.get_status("invisibility") > 0
+    visible = [(idx, e) for idx, e in alive if am_i_invisible or e.get_status("invisibility") <= 0]
+
+    taunted = [(idx, e) for idx, e in visible if e.get_status("taunt") > 0]
+    pool = taunted or visible
+    if not pool:
+        return -1, -1
+
+    t_idx, target = rng.choice(pool)
+    t_slot = rng.randint(0, len(target.active_slots) - 1) if target.active_slots else -1
+    return t_idx, t_slot
+
+
+def auto_plan_unit(unit, enemies, rng):
+    """Раскладывает случайные доступные карты по слотам юнита и назначает цели."""
+    if unit.is_dead():
+        return
+
+    pool = get_available_card_ids(unit)
+
+    for slot in unit.active_slots:
+        if slot.get('stunned') or slot.get('locked'):
+            continue
+        if not pool:
+            slot['card'] = None
+            continue
+
+        cid = pool.pop(rng.randint(0, len(pool) - 1))
+        card = Library.get_card(cid)
+        slot['card'] = card
+        slot['destroy_on_speed'] = True
+
+        # Чистые баффы оставляем без цели: prepare_turn применит их на себя
+        flags = getattr(card, 'flags', [])
+        if "friendly" in flags and "offensive" not in flags:
+            continue
+
+        slot['target_unit_idx'], slot['target_slot_idx'] = _pick_target(unit, enemies, rng)
+
+    logger.log(f"🤖 Auto-plan: {unit.name} -> {[s['card'].name for s in unit.active_slots if s.get('card')]}",
+               LogLevel.VERBOSE, "Planning")
+
+
+def auto_plan(session):
+    """Автоматическое планирование хода для обеих команд (headless-прогоны)."""
+    rng = get_rng(session)
+    for unit in session.all_units():
+        _, enemies = session.get_sides(unit)
+        auto_plan_unit(unit, enemies or [], rng)
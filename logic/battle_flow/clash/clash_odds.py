@@ -0,0 +1,363 @@
+"""
+Точные шансы стычки (без Монте-Карло).
+
+Бросок кубика — равномерное распределение на [min, max], сдвинутое плоскими
+модификаторами (apply_roll_modifiers). Преимущество/Помеха — максимум/минимум
+из двух бросков. Для пары кубиков исход считается сверткой распределений
+(внешнее произведение вероятностей), для карты целиком — динамикой по состояниям
+очередей кубиков, повторяющей правила process_clash:
+- уворот, выигравший у атаки, и выигравший контр-кубик возвращаются (recycle);
+- два защитных кубика тратятся без урона;
+- кубики без пары разыгрываются односторонне (атака бьет полным значением).
+
+Урон считается «сырым» — до сопротивлений, щитов и эффектов скриптов.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from core.enums import DiceType
+from logic.battle_flow.speed import calculate_speed_advantage
+from logic.mechanics.rolling.rolling_calc import apply_roll_modifiers
+
+ATK_TYPES = (DiceType.SLASH, DiceType.PIERCE, DiceType.BLUNT)
+DEF_TYPES = (DiceType.BLOCK, DiceType.EVADE)
+
+
+class DieSpec(NamedTuple):
+    """Кубик, приведенный к виду, достаточному для расчета шансов."""
+    min_val: int
+    max_val: int
+    dtype: DiceType
+    modifier: int = 0
+    adv: int = 0  # 1 = Преимущество, -1 = Помеха, 0 = обычный бросок
+    is_counter: bool = False
+
+
+@dataclass(frozen=True)
+class PairOdds:
+    """Исход одного обмена кубиками (A против D)."""
+    win: float
+    draw: float
+    lose: float
+    # Матожидания вида E[X * 1{исход}], а не условные средние
+    win_value: float  # E[val_a ; a > d]
+    win_diff: float   # E[val_a - val_d ; a > d]
+    lose_value: float  # E[val_d ; d > a]
+    lose_diff: float   # E[val_d - val_a ; d > a]
+
+
+@dataclass(frozen=True)
+class ClashOdds:
+    """Итог стычки карт: шансы по числу выигранных обменов и ожидаемый урон."""
+    win: float
+    draw: float
+    lose: float
+    exchanges: Tuple[PairOdds, ...]  # Кубик i против кубика i (без учета recycle)
+    hp_to_attacker: float = 0.0
+    hp_to_defender: float = 0.0
+    # Удар по HP бьет и по выдержке, поэтому stagger включает hp + урон от блоков
+    stagger_to_attacker: float = 0.0
+    stagger_to_defender: float = 0.0
+    # Восстановление выдержки выигранными уворотами (без учета потолка max_stagger)
+    stagger_recovered_attacker: float = 0.0
+    stagger_recovered_defender: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "win": self.win, "draw": self.draw, "lose": self.lose,
+            "hp_to_attacker": self.hp_to_attacker, "hp_to_defender": self.hp_to_defender,
+            "stagger_to_attacker": self.stagger_to_attacker, "stagger_to_defender": self.stagger_to_defender,
+            "stagger_recovered_attacker": self.stagger_recovered_attacker,
+            "stagger_recovered_defender": self.stagger_recovered_defender,
+            "exchanges": [(p.win, p.draw, p.lose) for p in self.exchanges],
+        }
+
+
+# =============================================================================
+# РАСПРЕДЕЛЕНИЯ
+# =============================================================================
+
+@lru_cache(maxsize=4096)
+def roll_distribution(min_val: int, max_val: int, modifier: int = 0, adv: int = 0):
+    """
+    Распределение итогового значения кубика.
+    Возвращает (lo, probs): probs[k] = P(значение == lo + k). Массив только для чтения (кэшируется).
+    """
+    if min_val > max_val:
+        min_val, max_val = max_val, min_val
+    n = max_val - min_val + 1
+    cdf = np.arange(1, n + 1, dtype=float) / n
+
+    if adv > 0:
+        # max(r1, r2): P(X <= k) = F(k)^2
+        cdf = cdf ** 2
+    elif adv < 0:
+        # min(r1, r2): P(X > k) = (1 - F(k))^2
+        cdf = 1.0 - (1.0 - cdf) ** 2
+
+    probs = np.diff(cdf, prepend=0.0)
+    probs.setflags(write=False)
+    return min_val + modifier, probs
+
+
+def _values(lo: int, probs) -> np.ndarray:
+    return np.arange(lo, lo + len(probs), dtype=float)
+
+
+@lru_cache(maxsize=4096)
+def _pair_odds(key_a: tuple, key_d: tuple) -> PairOdds:
+    lo_a, p_a = roll_distribution(*key_a)
+    lo_d, p_d = roll_distribution(*key_d)
+    v_a = _values(lo_a, p_a)[:, None]
+    v_d = _values(lo_d, p_d)[None, :]
+
+    joint = np.outer(p_a, p_d)
+    a_wins = v_a > v_d
+    d_wins = v_d > v_a
+
+    # Значения ниже нуля урона не наносят
+    full_a = np.broadcast_to(np.maximum(v_a, 0), joint.shape)
+    full_d = np.broadcast_to(np.maximum(v_d, 0), joint.shape)
+
+    win = float(joint[a_wins].sum())
+    lose = float(joint[d_wins].sum())
+    return PairOdds(
+        win=win,
+        draw=max(0.0, 1.0 - win - lose),
+        lose=lose,
+        win_value=float((joint * full_a)[a_wins].sum()),
+        win_diff=float((joint * (v_a - v_d))[a_wins].sum()),
+        lose_value=float((joint * full_d)[d_wins].sum()),
+        lose_diff=float((joint * (v_d - v_a))[d_wins].sum()),
+    )
+
+
+def _key(spec: DieSpec) -> tuple:
+    return spec.min_val, spec.max_val, spec.modifier, spec.adv
+
+
+def pair_odds(die_a: DieSpec, die_d: DieSpec) -> PairOdds:
+    """Шансы одного обмена. Кэш по (диапазон, модификатор, преимущество) обеих сторон."""
+    return _pair_odds(_key(die_a), _key(die_d))
+
+
+def expected_value(spec: DieSpec) -> float:
+    """Ожидаемый урон одностороннего удара (отрицательные значения урона не наносят)."""
+    lo, probs = roll_distribution(*_key(spec))
+    return float(np.dot(np.maximum(_values(lo, probs), 0), probs))
+
+
+# =============================================================================
+# СТЫЧКА КАРТ
+# =============================================================================
+
+class _Side(NamedTuple):
+    idx: int
+    held: int  # Индекс вернувшегося кубика (active_counter) или -1
+
+    def die(self, queue, broken):
+        if self.held >= 0:
+            return self.held
+        if self.idx < len(queue) and not broken:
+            return self.idx
+        return None
+
+    def has_dice(self, queue):
+        return self.idx < len(queue) or self.held >= 0
+
+    def consume(self):
+        if self.held >= 0:
+            return _Side(self.idx, -1)
+        return _Side(self.idx + 1, -1)
+
+    def recycle(self, die_idx):
+        if self.held >= 0:
+            return self
+        return _Side(self.idx + 1, die_idx)
+
+
+def _step(state, dice_a, dice_d, destroy_a, destroy_d):
+    """
+    Один обмен process_clash.
+    Возвращает список (вероятность, новое_состояние, урон) или None, если стычка окончена.
+    Урон: (hp_a, hp_d, stagger_a, stagger_d, recovered_a, recovered_d) как E[урон ; исход].
+    """
+    side_a, side_d, score = state
+    if not (side_a.has_dice(dice_a) or side_d.has_dice(dice_d)):
+        return None
+
+    i_a = side_a.die(dice_a, destroy_a and side_a.idx < len(dice_a))
+    i_d = side_d.die(dice_d, destroy_d and side_d.idx < len(dice_d))
+    no_dmg = (0.0,) * 6
+
+    if i_a is None and i_d is None:
+        return [(1.0, (side_a.consume(), side_d.consume(), score), no_dmg)]
+
+    # Односторонний обмен (повторяет handle_one_sided_exchange + доп. сдвиг индексов в process_clash)
+    if i_a is None or i_d is None:
+        a_active = i_a is not None
+        active, passive = (side_a, side_d) if a_active else (side_d, side_a)
+        die = dice_a[i_a] if a_active else dice_d[i_d]
+        passive_queue = dice_d if a_active else dice_a
+
+        if die.is_counter:
+            return None
+
+        hit = expected_value(die) if die.dtype in ATK_TYPES else 0.0
+        active = active.consume().consume()
+        passive = passive.consume()
+        if passive.idx < len(passive_queue):
+            passive = _Side(passive.idx + 1, passive.held)
+
+        if a_active:
+            return [(1.0, (active, passive, score), (0.0, hit, 0.0, hit, 0.0, 0.0))]
+        return [(1.0, (passive, active, score), (hit, 0.0, hit, 0.0, 0.0, 0.0))]
+
+    die_a, die_d = dice_a[i_a], dice_d[i_d]
+
+    if die_a.dtype in DEF_TYPES and die_d.dtype in DEF_TYPES:
+        return [(1.0, (side_a.consume(), side_d.consume(), score), no_dmg)]
+
+    odds = pair_odds(die_a, die_d)
+    atk_a, atk_d = die_a.dtype in ATK_TYPES, die_d.dtype in ATK_TYPES
+    branches = []
+
+    if odds.win > 0:
+        if atk_a:
+            # Атака против блока бьет разницей, против атаки/уворота — полным значением
+            hp = odds.win_diff if die_d.dtype == DiceType.BLOCK else odds.win_value
+            dmg = (0.0, hp, 0.0, hp, 0.0, 0.0)
+        elif die_a.dtype == DiceType.BLOCK:
+            dmg = (0.0, 0.0, 0.0, odds.win_diff, 0.0, 0.0)
+        else:
+            dmg = (0.0, 0.0, 0.0, 0.0, odds.win_value, 0.0)
+        recycle = die_a.dtype == DiceType.EVADE or die_a.is_counter
+        new_a = side_a.recycle(i_a) if recycle else side_a.consume()
+        branches.append((odds.win, (new_a, side_d.consume(), score + 1), dmg))
+
+    if odds.lose > 0:
+        if atk_d:
+            hp = odds.lose_diff if die_a.dtype == DiceType.BLOCK else odds.lose_value
+            dmg = (hp, 0.0, hp, 0.0, 0.0, 0.0)
+        elif die_d.dtype == DiceType.BLOCK:
+            dmg = (0.0, 0.0, odds.lose_diff, 0.0, 0.0, 0.0)
+        else:
+            dmg = (0.0, 0.0, 0.0, 0.0, 0.0, odds.lose_value)
+        recycle = die_d.dtype == DiceType.EVADE or die_d.is_counter
+        new_d = side_d.recycle(i_d) if recycle else side_d.consume()
+        branches.append((odds.lose, (side_a.consume(), new_d, score - 1), dmg))
+
+    if odds.draw > 0:
+        branches.append((odds.draw, (side_a.consume(), side_d.consume(), score), no_dmg))
+
+    return branches
+
+
+@lru_cache(maxsize=1024)
+def clash_odds(dice_a: Tuple[DieSpec, ...], dice_d: Tuple[DieSpec, ...],
+               destroy_a: bool = False, destroy_d: bool = False,
+               max_iterations: int = 25) -> ClashOdds:
+    """
+    Точное распределение исхода стычки двух карт.
+    win/draw/lose — вероятность того, что A выиграет больше / столько же / меньше обменов, чем D.
+    """
+    start = (_Side(0, -1), _Side(0, -1), 0)
+    frontier = {start: 1.0}
+    finals = {}
+    totals = [0.0] * 6
+
+    for _ in range(max_iterations):
+        if not frontier:
+            break
+        nxt = {}
+        for state, mass in frontier.items():
+            branches = _step(state, dice_a, dice_d, destroy_a, destroy_d)
+            if branches is None:
+                finals[state[2]] = finals.get(state[2], 0.0) + mass
+                continue
+            for prob, new_state, dmg in branches:
+                for k in range(6):
+                    totals[k] += mass * dmg[k]
+                if prob:
+                    nxt[new_state] = nxt.get(new_state, 0.0) + mass * prob
+        frontier = nxt
+
+    # Обрыв по лимиту итераций (как в process_clash) — считаем текущий счет итоговым
+    for state, mass in frontier.items():
+        finals[state[2]] = finals.get(state[2], 0.0) + mass
+
+    return ClashOdds(
+        win=sum(p for s, p in finals.items() if s > 0),
+        draw=finals.get(0, 0.0),
+        lose=sum(p for s, p in finals.items() if s < 0),
+        exchanges=tuple(pair_odds(a, d) for a, d in zip(dice_a, dice_d)),
+        hp_to_attacker=totals[0],
+        hp_to_defender=totals[1],
+        stagger_to_attacker=totals[2],
+        stagger_to_defender=totals[3],
+        stagger_recovered_attacker=totals[4],
+        stagger_recovered_defender=totals[5],
+    )
+
+
+# =============================================================================
+# ПОСТРОЕНИЕ ИЗ ЮНИТОВ
+# =============================================================================
+
+class _PowerCollector:
+    """Заглушка RollContext: собирает плоские модификаторы без броска."""
+
+    def __init__(self):
+        self.total = 0
+
+    def modify_power(self, amount, reason=None):
+        self.total += amount
+
+
+def flat_roll_modifier(unit, die) -> int:
+    """Сумма плоских бонусов к броску (статы, оружие, пассивки), как в apply_roll_modifiers."""
+    collector = _PowerCollector()
+    apply_roll_modifiers(collector, unit, die)
+    return collector.total
+
+
+def card_dice_specs(unit, card, is_disadvantage: bool = False) -> Tuple[DieSpec, ...]:
+    """
+    Кубики карты с модификаторами юнита.
+    Преимущество тратит по заряду на бросок — считаем, что заряды достаются первым кубикам карты
+    (Преимущество + Помеха взаимно гасятся, как в calculate_base_roll).
+    """
+    adv_stacks = unit.get_status("advantage") if hasattr(unit, "get_status") else 0
+    specs = []
+    for i, die in enumerate(getattr(card, "dice_list", None) or []):
+        has_adv = i < adv_stacks
+        if has_adv and is_disadvantage:
+            adv = 0
+        elif is_disadvantage:
+            adv = -1
+        else:
+            adv = 1 if has_adv else 0
+        specs.append(DieSpec(die.min_val, die.max_val, die.dtype, flat_roll_modifier(unit, die),
+                             adv, bool(getattr(die, "is_counter", False))))
+    return tuple(specs)
+
+
+def estimate_clash(attacker, defender, card_a=None, card_d=None,
+                   spd_a: Optional[int] = None, spd_d: Optional[int] = None,
+                   intent_a: bool = True, intent_d: bool = True) -> ClashOdds:
+    """Шансы стычки для планирования: помеха/слом по скорости берутся из calculate_speed_advantage."""
+    card_a = card_a or attacker.current_card
+    card_d = card_d or defender.current_card
+
+    adv_a = adv_d = destroy_a = destroy_d = False
+    if spd_a is not None and spd_d is not None:
+        adv_a, adv_d, destroy_a, destroy_d = calculate_speed_advantage(spd_a, spd_d, intent_a, intent_d)
+
+    return clash_odds(
+        card_dice_specs(attacker, card_a, adv_a),
+        card_dice_specs(defender, card_d, adv_d),
+        destroy_a, destroy_d,
+    )
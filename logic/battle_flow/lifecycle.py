@@ -1,6 +1,5 @@
-import random
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
 from logic.battle_flow.priorities import get_action_priority
 from logic.battle_flow.targeting import calculate_redirections
 
@@ -22,6 +21,7 @@ def prepare_turn(engine, team_left: list, team_right: list):
     logger.log("Redirections calculated.", LogLevel.VERBOSE, "Flow")
 
     actions = []
+    rng = get_rng(engine)
 
     def collect_actions(source_team, target_team, is_left_side):
         for u_idx, unit in enumerate(source_team):
@@ -38,7 +38,7 @@ def prepare_turn(engine, team_left: list, team_right: list):
                 base_prio = get_action_priority(card)
                 # Левая сторона получает микро-бонус приоритета при прочих равных (convention)
                 if base_prio >= 4000 and is_left_side: base_prio += 500
-                score = base_prio + slot['speed'] + random.random()
+                score = base_prio + slot['speed'] + rng.random()
 
                 # --- ВЫБОР ЦЕЛИ ---
                 t_u_idx = slot.get('target_unit_idx', -1)
@@ -1,7 +1,6 @@
-import random
-
 from core.enums import CardType
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
 
 
 def process_mass_attack(engine, action, opposing_team, round_label, executed_slots=None):
@@ -83,13 +82,13 @@ def process_mass_attack(engine, action, opposing_team, round_label, executed_slo
 
         if not target_slot and not is_undefended:
             if valid_defense_slots:
-                s_idx, slot = random.choice(valid_defense_slots)
+                s_idx, slot = get_rng(engine).choice(valid_defense_slots)
                 target_slot = slot
                 chosen_s_idx = s_idx
                 logger.log(f"Targeting {target.name} (Auto: S{s_idx + 1} {slot['card'].name})", LogLevel.VERBOSE,
                            "MassAtk")
             elif executed_card_slots:
-                s_idx, slot = random.choice(executed_card_slots)
+                s_idx, slot = get_rng(engine).choice(executed_card_slots)
                 target_slot = slot
                 chosen_s_idx = s_idx
                 is_undefended = True
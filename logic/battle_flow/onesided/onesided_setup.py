@@ -1,4 +1,5 @@
 from core.logging import logger, LogLevel
+from logic.base_effect import implements_hook
 from logic.battle_flow.speed import calculate_speed_advantage
 
 
@@ -46,7 +47,7 @@ def setup_onesided_parameters(engine, source, target, spd_atk, spd_d, intent_atk
     if not def_card and (spd_d - spd_atk >= 8):
         if hasattr(target, "iter_mechanics"):
             for mech in target.iter_mechanics():
-                if hasattr(mech, "can_break_empty_slot") and mech.can_break_empty_slot(target):
+                if implements_hook(mech, "can_break_empty_slot") and mech.can_break_empty_slot(target):
                     if source_immune:
                         logger.log(f"🛡️ Empty Slot Break prevented by Immunity for {source.name}", LogLevel.VERBOSE,
                                    "OneSided")
@@ -0,0 +1,182 @@
+from collections import Counter
+
+from core.enums import CardType
+from core.library import Library
+from core.unit.data.status_store import StatusStore
+from logic.statuses.status_manager import StatusManager
+
+
+# Жизненный цикл раунда без привязки к интерфейсу.
+# UI (step_func) и headless-прогоны используют одни и те же функции, передавая BattleSession.
+
+def init_unit_for_battle(session, u):
+    """Начальные кулдауны карт и хук on_combat_start (один раз за бой)."""
+    if u.memory.get("battle_initialized"):
+        return
+    u.memory["battle_initialized"] = True
+
+    if not hasattr(u, "card_cooldowns") or u.card_cooldowns is None:
+        u.card_cooldowns = {}
+
+    if getattr(u, 'deck', None):
+        # Считаем, сколько копий каждой карты
+        deck_counts = Counter(u.deck)
+
+        for card_id, count in deck_counts.items():
+            card = Library.get_template(card_id)
+            if card:
+                # Пропускаем предметы
+                if card.card_type.upper() == CardType.ITEM.name:
+                    continue
+
+                # Начальный кулдаун (Tier - 1)
+                initial_cd = max(0, card.tier - 1)
+
+                if initial_cd > 0:
+                    # "Разогрев" накладывается на ВСЕ копии карты в начале боя
+                    u.card_cooldowns[card_id] = [initial_cd] * count
+
+    # === ВЫЗОВ ON_COMBAT_START ===
+    my_allies, opponents = session.get_sides(u)
+
+    def log_start(msg):
+        session.add_report({
+            "round": "Start",
+            "rolls": "Event",
+            "details": f"🚩 **{u.name}**: {msg}"
+        })
+
+    if hasattr(u, "trigger_mechanics"):
+        u.trigger_mechanics("on_combat_start", u, log_start,
+                            enemies=opponents or [], allies=my_allies or [])
+
+
+def start_round(session):
+    """
+    Начало раунда: события on_round_start, бросок кубиков скорости, on_speed_rolled.
+    """
+    all_units = session.all_units()
+
+    # === TRIGGERS (События начала) ===
+    for u in all_units:
+        u.recalculate_stats()
+        init_unit_for_battle(session, u)
+
+        my_allies, opponents = session.get_sides(u)
+
+        def log_round(msg, u=u):
+            session.add_report({
+                "round": "Round Start",
+                "rolls": "Event",
+                "details": f"🔄 **{u.name}**: {msg}"
+            })
+
+        if hasattr(u, "trigger_mechanics"):
+            u.trigger_mechanics("on_round_start", u, log_round,
+                                enemies=opponents, allies=my_allies)
+
+    # === БРОСОК КУБИКОВ ===
+    for u in all_units:
+        u.recalculate_stats()
+
+        if u.is_staggered():
+            u.active_slots = [{
+                'speed': 0, 'card': None,
+                'target_unit_idx': -1, 'target_slot_idx': -1,
+                'stunned': True, 'is_aggro': False
+            }]
+        else:
+            u.roll_speed_dice()
+
+            for s in u.active_slots:
+                s['target_unit_idx'] = -1
+                s['target_slot_idx'] = -1
+                s['is_aggro'] = False
+                s['force_clash'] = False
+
+    # === SPEED ROLLED EVENTS ===
+    for u in all_units:
+        my_allies, opponents = session.get_sides(u)
+
+        def log_speed(msg, u=u):
+            session.add_report({
+                "round": "Speed Roll", "rolls": "Passive", "details": f"⚡ **{u.name}**: {msg}"
+            })
+
+        if hasattr(u, "trigger_mechanics"):
+            u.trigger_mechanics("on_speed_rolled", u, log_speed,
+                                enemies=opponents, allies=my_allies)
+
+    for u in all_units:
+        u.recalculate_stats()
+
+
+def end_round(session) -> list:
+    """
+    Конец раунда: восстановление после оглушения, on_round_end, статусы, кулдауны.
+    Переводит сессию на следующий раунд. Возвращает список сообщений.
+    """
+    msg = []
+
+    def log_collector(message):
+        msg.append(message)
+
+    for u in session.all_units():
+        if u.active_slots and u.active_slots[0].get('stunned'):
+            u.current_stagger = u.max_stagger
+            msg.append(f"✨ {u.name} recovered!")
+
+        my_allies = session.get_team(u)
+
+        if hasattr(u, "trigger_mechanics"):
+            u.trigger_mechanics("on_round_end", u, log_collector, allies=my_allies)
+
+        status_logs = StatusManager.process_turn_end(u)
+        msg.extend(status_logs)
+
+        u.tick_cooldowns()
+        u.active_slots = []
+        if hasattr(u, 'stored_dice') and u.stored_dice:
+            u.stored_dice = []
+            msg.append(f"{u.name}: Stored evade dice burned.")
+
+    session.next_round()
+
+    # Конец боя: дописываем буфер файлового лога
+    if session.is_finished():
+        session.logger.flush()
+    return msg
+
+
+def reset_battle(session):
+    """Возвращает всех юнитов к состоянию до боя и сбрасывает сессию на первый раунд."""
+    for u in session.all_units():
+        u.memory.pop("battle_initialized", None)
+        saved_stats = u.memory.get('start_of_battle_stats')
+
+        if saved_stats:
+            u.current_hp = saved_stats['hp']
+            u.current_sp = saved_stats['sp']
+            u.current_stagger = saved_stats['stagger']
+        else:
+            u.current_hp = u.max_hp
+            u.current_stagger = u.max_stagger
+            u.current_sp = u.max_sp
+
+        u.active_buffs = {}
+        u.card_cooldowns = {}
+        u.cooldowns = {}
+        u.recalculate_stats()
+        u._status_effects = StatusStore()
+        u._bump_status_version()
+        u.delayed_queue = []
+        u.active_slots = []
+        u.overkill_damage = 0
+        u.stored_dice = []
+        u.death_count = 0
+
+    session.round_number = 1
+    session.executed_slots = set()
+    session.battle_logs = []
+    session.notifications = []
+    session.logger.flush()
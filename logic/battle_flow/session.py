@@ -0,0 +1,207 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from core.logging import logger as default_logger, LogLevel
+from core.rng import BattleRNG
+
+# Сессия, активная в текущем потоке/контексте выполнения.
+# Нужна только для кода, у которого нет ссылки на юнита (например, списки целей для UI).
+_active_session: ContextVar = ContextVar("active_battle_session", default=None)
+
+
+class BattleSession:
+    """
+    Состояние одного боя, независимое от Streamlit.
+    Владеет командами, номером раунда, RNG, логгером и множеством сыгранных слотов.
+
+    Все броски боя идут через `session.rng` (BattleRNG): при одинаковом сиде и позиции
+    потока раунд воспроизводится в точности.
+
+    Юниты, добавленные в сессию, получают обратную ссылку `unit.session`,
+    поэтому механики и скрипты находят союзников и врагов без обращения к session_state.
+    """
+
+    def __init__(self, team_left=None, team_right=None, round_number: int = 1, seed=None,
+                 logger=None, roster=None):
+        self.team_left = team_left if team_left is not None else []
+        self.team_right = team_right if team_right is not None else []
+        self.round_number = round_number
+        self.rng = BattleRNG(seed)
+        self.logger = logger or default_logger
+        self.roster = roster if roster is not None else {}
+
+        # Слоты, которые уже сыграли в текущем ходу: {(unit_name, slot_idx)}
+        self.executed_slots = set()
+
+        # Визуальный отчет о бое (карточки столкновений, события раунда)
+        self.battle_logs = []
+
+        # События для интерфейса (тосты, флаги). UI забирает их через drain_notifications().
+        self.notifications = []
+
+        # Статистика урона по картам: {card_id: {"hp": int, "stagger": int}}
+        self.damage_by_card = {}
+
+        self._attached = []
+        self.attach_units()
+
+    # Сессия — это общий «дескриптор» боя: копии юнитов должны ссылаться на тот же бой
+    def __deepcopy__(self, memo):
+        return self
+
+    # =========================================================================
+    # КОМАНДЫ
+    # =========================================================================
+
+    def bind(self, team_left=None, team_right=None, round_number=None, roster=None,
+             executed_slots=None, battle_logs=None):
+        """
+        Подменяет списки, которыми владеет сессия (используется адаптером UI,
+        чтобы сессия работала с теми же объектами, что и session_state).
+        """
+        if team_left is not None: self.team_left = team_left
+        if team_right is not None: self.team_right = team_right
+        if round_number is not None: self.round_number = round_number
+        if roster is not None: self.roster = roster
+        if executed_slots is not None: self.executed_slots = executed_slots
+        if battle_logs is not None: self.battle_logs = battle_logs
+        self.attach_units()
+        return self
+
+    def attach_units(self):
+        """Проставляет юнитам ссылку на сессию и снимает её с выбывших."""
+        current = self.all_units()
+        current_ids = {id(u) for u in current}
+
+        for u in self._attached:
+            if id(u) not in current_ids and getattr(u, "session", None) is self:
+                u.session = None
+
+        for u in current:
+            u.session = self
+
+        self._attached = current
+
+    def all_units(self) -> list:
+        return list(self.team_left) + list(self.team_right)
+
+    def get_team(self, unit):
+        """Возвращает список команды, в которой находится юнит (или None)."""
+        if any(u is unit for u in self.team_left): return self.team_left
+        if any(u is unit for u in self.team_right): return self.team_right
+        return None
+
+    def get_sides(self, unit):
+        """Возвращает (союзники, враги) для юнита. Если юнит не в бою — (None, None)."""
+        if any(u is unit for u in self.team_left): return self.team_left, self.team_right
+        if any(u is unit for u in self.team_right): return self.team_right, self.team_left
+        return None, None
+
+    def add_unit(self, unit, team):
+        """Добавляет юнита в указанную команду (например, призыв)."""
+        team.append(unit)
+        unit.session = self
+        self._attached.append(unit)
+
+    def is_finished(self) -> bool:
+        """Бой окончен, если в одной из команд не осталось живых."""
+        left_alive = any(not u.is_dead() for u in self.team_left)
+        right_alive = any(not u.is_dead() for u in self.team_right)
+        return not (left_alive and right_alive)
+
+    # =========================================================================
+    # РАУНДЫ И ОТЧЕТ
+    # =========================================================================
+
+    @property
+    def seed(self) -> int:
+        return self.rng.seed
+
+    def get_rng_state(self) -> dict:
+        return self.rng.get_state()
+
+    def set_rng_state(self, state: dict):
+        if state:
+            self.rng.set_state(state)
+
+    def next_round(self):
+        self.round_number += 1
+        self.executed_slots = set()
+        return self.round_number
+
+    def add_report(self, entry: dict):
+        self.battle_logs.append(entry)
+
+    def record_damage(self, card, amount: int, dmg_type: str = "hp"):
+        """Учитывает нанесенный картой урон (для отчетов симуляций)."""
+        if not card or amount <= 0:
+            return
+        card_id = getattr(card, "id", None) or getattr(card, "name", "unknown")
+        stats = self.damage_by_card.setdefault(card_id, {"hp": 0, "stagger": 0})
+        stats[dmg_type] = stats.get(dmg_type, 0) + amount
+
+    def notify(self, message: str, icon: str = None, **data):
+        """Сообщение для интерфейса (в UI показывается тостом)."""
+        self.notifications.append({"message": message, "icon": icon, **data})
+        self.logger.log(f"🔔 {message}", LogLevel.VERBOSE, "Session")
+
+    def drain_notifications(self) -> list:
+        items, self.notifications = self.notifications, []
+        return items
+
+    # =========================================================================
+    # АКТИВНАЯ СЕССИЯ
+    # =========================================================================
+
+    def activate(self):
+        """Делает сессию активной для текущего контекста выполнения."""
+        _active_session.set(self)
+        return self
+
+    @contextmanager
+    def activated(self):
+        """Делает сессию активной на время блока и возвращает предыдущую."""
+        token = _active_session.set(self)
+        try:
+            yield self
+        finally:
+            _active_session.reset(token)
+
+    @staticmethod
+    def current():
+        return _active_session.get()
+
+
+def get_session(obj=None):
+    """
+    Находит сессию боя: сам объект-сессию, ссылку у объекта (контекст броска или юнит),
+    иначе — активную сессию текущего контекста.
+    """
+    if isinstance(obj, BattleSession):
+        return obj
+    if obj is not None:
+        session = getattr(obj, "session", None)
+        if session is not None:
+            return session
+        source = getattr(obj, "source", None)
+        session = getattr(source, "session", None)
+        if session is not None:
+            return session
+    return _active_session.get()
+
+
+def get_rng(obj=None):
+    """
+    RNG текущего боя. Вне боя (тесты, проверки навыков) — глобальный модуль random.
+    """
+    rng = getattr(get_session(obj), "rng", None)
+    return rng if isinstance(rng, BattleRNG) else random
+
+
+def get_battle_teams(obj=None):
+    """Возвращает (team_left, team_right) текущего боя или два пустых списка."""
+    session = get_session(obj)
+    if session is None:
+        return [], []
+    return session.team_left, session.team_right
@@ -16,7 +16,7 @@ def apply_attribute_effects(attrs, mods):
 
     if mod_sila_5 != 0:
         word = get_word(mod_sila_5)
-        mods["power_attack"]["flat"] += mod_sila_5
+        mods.add_named("power_attack", flat=mod_sila_5)
         logger.log(f"{word} значение куба ⚔️ атаки на {abs(mod_sila_5)}", LogLevel.VERBOSE, "Stats")
 
     # --- СТОЙКОСТЬ ---
@@ -25,7 +25,7 @@ def apply_attribute_effects(attrs, mods):
 
     if mod_stoyk_5 != 0:
         word = get_word(mod_stoyk_5)
-        mods["power_block"]["flat"] += mod_stoyk_5
+        mods.add_named("power_block", flat=mod_stoyk_5)
         logger.log(f"{word} значение куба 🛡️ блока на {abs(mod_stoyk_5)}", LogLevel.VERBOSE, "Stats")
 
     # --- ЛОВКОСТЬ ---
@@ -35,12 +35,12 @@ def apply_attribute_effects(attrs, mods):
 
     if mod_lov != 0:
         word = get_word(mod_lov)
-        mods["initiative"]["flat"] += mod_lov
+        mods.add_named("initiative", flat=mod_lov)
         logger.log(f"{word} значение броска ловкости и 👢 инициативу на {abs(mod_lov)}", LogLevel.VERBOSE, "Stats")
 
     if mod_lov_5 != 0:
         word = get_word(mod_lov_5)
-        mods["power_evade"]["flat"] += mod_lov_5
+        mods.add_named("power_evade", flat=mod_lov_5)
         logger.log(f"{word} значение куба 💨 уклонения на {abs(mod_lov_5)}", LogLevel.VERBOSE, "Stats")
 
     # --- МУДРОСТЬ ---
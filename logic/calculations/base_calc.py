@@ -1,3 +1,6 @@
+from logic.calculations.modifiers import COMBAT_STATS, ModifierVector
+
+
 def get_word(value, positive="Повышает", negative="Понижает"):
     return positive if value >= 0 else negative
 
@@ -13,8 +16,38 @@ def get_modded_value(base_val, stat_name, mods):
     Универсальная формула: (Base + Flat) * (1 + Pct / 100)
     Округляет результат до целого.
     """
+    if type(mods) is ModifierVector:
+        return mods.value(stat_name, base_val)
+
     flat = mods[stat_name]["flat"]
     pct = mods[stat_name]["pct"]
 
     total = (base_val + flat) * (1 + pct / 100.0)
-    return int(total)
\ No newline at end of file
+    return int(total)
+
+def get_final(mods, stat: int) -> int:
+    """
+    Итоговое значение боевого стата по индексу схемы (Stat.*): (0 + Flat) * (1 + Pct / 100).
+    Для ModifierVector берется готовое значение; словари старого формата (моки, юниты без пересчета)
+    считаются по имени, отсутствующий стат дает 0.
+    """
+    if type(mods) is ModifierVector:
+        return mods.final(stat)
+    data = mods.get(COMBAT_STATS[stat])
+    if not data:
+        return 0
+    return int(data.get("flat", 0) * (1 + data.get("pct", 0) / 100.0))
+
+
+def get_flat(mods, stat: int) -> float:
+    """Flat-часть боевого стата по индексу схемы (0, если стата нет)."""
+    if type(mods) is ModifierVector:
+        return mods.flat[stat]
+    return mods.get(COMBAT_STATS[stat], {}).get("flat", 0)
+
+
+def get_pct(mods, stat: int) -> float:
+    """Pct-часть боевого стата по индексу схемы (0, если стата нет)."""
+    if type(mods) is ModifierVector:
+        return mods.pct[stat]
+    return mods.get(COMBAT_STATS[stat], {}).get("pct", 0)
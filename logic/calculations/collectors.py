@@ -1,4 +1,5 @@
 from core.logging import logger, LogLevel
+from logic.base_effect import implements_hook
 from logic.character_changing.passives import PASSIVE_REGISTRY
 from logic.statuses.status_definitions import STATUS_REGISTRY
 from logic.weapon_definitions import WEAPON_REGISTRY
@@ -10,49 +11,56 @@ ALL_SKILLS = [
     "firearms", "eloquence", "forging", "engineering", "programming"
 ]
 
-def collect_ability_bonuses(unit, source_list, registry, prefix_icon, mods, bonuses):
+def _selected(obj, pure):
+    """pure=None — все источники, True/False — только чистые/зависящие от состояния (см. BaseEffect.pure_stats)."""
+    return pure is None or getattr(obj, "pure_stats", False) == pure
+
+
+def collect_ability_bonuses(unit, source_list, registry, prefix_icon, mods, bonuses, pure=None):
     """
     Сбор бонусов от списков способностей (Пассивки, Таланты, Аугментации).
     """
     for pid in source_list:
         if pid in registry:
             obj = registry[pid]
-            if hasattr(obj, "on_calculate_stats"):
+            if implements_hook(obj, "on_calculate_stats") and _selected(obj, pure):
                 bonus_dict = obj.on_calculate_stats(unit)
                 if bonus_dict:
                     _apply_smart_bonuses(obj.name, bonus_dict, mods, bonuses, prefix_icon)
 
 
-def collect_weapon_bonuses(unit, mods, bonuses):
+def collect_weapon_bonuses(unit, mods, bonuses, pure=None):
     """
     Сбор бонусов от оружия (базовые статы + встроенная пассивка).
+    Базовые статы оружия — данные, они относятся к чистым источникам.
     """
     if unit.weapon_id in WEAPON_REGISTRY:
         wep = WEAPON_REGISTRY[unit.weapon_id]
         if wep.id != "none":
             # Логируем название оружия
-            logger.log(f"⚔️ Weapon equipped: {wep.name}", LogLevel.VERBOSE, "Stats")
+            logger.log("⚔️ Weapon equipped: %s", LogLevel.VERBOSE, "Stats", wep.name)
 
             # 1. Обычные статы оружия
-            _apply_smart_bonuses("Weapon", wep.stats, mods, bonuses, None)
+            if pure is not False:
+                _apply_smart_bonuses("Weapon", wep.stats, mods, bonuses, None)
 
             # 2. Статы от пассивки оружия
             if wep.passive_id and wep.passive_id in PASSIVE_REGISTRY:
                 p_obj = PASSIVE_REGISTRY[wep.passive_id]
-                if hasattr(p_obj, "on_calculate_stats"):
+                if implements_hook(p_obj, "on_calculate_stats") and _selected(p_obj, pure):
                     bonus_dict = p_obj.on_calculate_stats(unit)
                     if bonus_dict:
                         _apply_smart_bonuses(f"{p_obj.name} (Wep)", bonus_dict, mods, bonuses, "⚔️")
 
 
-def collect_status_bonuses(unit, mods, bonuses):
+def collect_status_bonuses(unit, mods, bonuses, pure=None):
     """
     Сбор бонусов от активных статусов.
     """
-    for status_id, stack in unit.statuses.items():
+    for status_id, stack in list(unit.statuses.items()):
         if status_id in STATUS_REGISTRY and stack > 0:
             st_obj = STATUS_REGISTRY[status_id]
-            if hasattr(st_obj, 'on_calculate_stats'):
+            if implements_hook(st_obj, 'on_calculate_stats') and _selected(st_obj, pure):
                 try:
                     # Передаем stack, так как многие статусы скейлятся от стаков
                     bonus_dict = st_obj.on_calculate_stats(unit, stack)
@@ -73,13 +81,13 @@ def _apply_smart_bonuses(source_name, bonus_dict, mods, bonuses, icon):
         if key == "all_attributes":
             for attr in ALL_ATTRIBUTES:
                 bonuses[attr] += val
-                if icon: logger.log(f"{icon} {source_name}: {attr} {val:+}", LogLevel.VERBOSE, "Stats")
+                if icon: logger.log("%s %s: %s %+g", LogLevel.VERBOSE, "Stats", icon, source_name, attr, val)
             continue
 
         if key == "all_skills":
             for skill in ALL_SKILLS:
                 bonuses[skill] += val
-                if icon: logger.log(f"{icon} {source_name}: {skill} {val:+}", LogLevel.VERBOSE, "Stats")
+                if icon: logger.log("%s %s: %s %+g", LogLevel.VERBOSE, "Stats", icon, source_name, skill, val)
             continue
 
         stat_name = key
@@ -99,14 +107,12 @@ def _apply_smart_bonuses(source_name, bonus_dict, mods, bonuses, icon):
         if is_attribute and mode == "flat":
             bonuses[stat_name] += val
             if icon:
-                logger.log(f"{icon} {source_name}: {stat_name} {val:+}", LogLevel.VERBOSE, "Stats")
+                logger.log("%s %s: %s %+g", LogLevel.VERBOSE, "Stats", icon, source_name, stat_name, val)
         else:
             # [FIX] Убрали проверку "if stat_name in mods", так как mods это defaultdict
-            mods[stat_name][mode] += val
+            mods.add_named(stat_name, **{mode: val})
 
             # Красивый лог
             if icon:
-                sign = "+" if val >= 0 else ""
-                suffix = "%" if mode == "pct" else ""
-                logger.log(f"{icon} {source_name}: {stat_name.upper()} {sign}{val}{suffix}", LogLevel.VERBOSE,
-                           "Stats")
\ No newline at end of file
+                logger.log(lambda: f"{icon} {source_name}: {stat_name.upper()} {'+' if val >= 0 else ''}{val}"
+                                   f"{'%' if mode == 'pct' else ''}", LogLevel.VERBOSE, "Stats")
\ No newline at end of file
@@ -4,17 +4,17 @@ def calculate_totals(unit, bonuses, mods):
     for k in unit.attributes:
         val = unit.attributes[k] + bonuses[k]
         attrs[k] = val
-        mods[k]["flat"] = val
+        mods.set_flat(k, val)
 
     skills = {}
     for k in unit.skills:
         val = unit.skills[k] + bonuses[k]
         skills[k] = val
-        mods[k]["flat"] = val
+        mods.set_flat(k, val)
 
     base_int = unit.base_intellect + bonuses["bonus_intellect"] + (attrs["wisdom"] // 3)
-    mods["total_intellect"]["flat"] = base_int
-    mods["intellect"]["flat"] = base_int
+    mods.set_flat("total_intellect", base_int)
+    mods.set_flat("intellect", base_int)
 
     return attrs, skills
 
@@ -1,15 +1,275 @@
+from array import array
 from collections import defaultdict
 
+
+# =============================================================================
+# СХЕМА СТАТОВ
+# =============================================================================
+
+class Stat:
+    """
+    Индексы боевых статов в схеме модификаторов.
+    Они фиксированы и идут первыми: для них ModifierVector держит готовые итоговые значения.
+    """
+    POWER_ATTACK = 0
+    POWER_BLOCK = 1
+    POWER_EVADE = 2
+    POWER_ALL = 3
+    POWER_LIGHT = 4
+    POWER_MEDIUM = 5
+    POWER_HEAVY = 6
+    POWER_RANGED = 7
+    POWER_SLASH = 8
+    POWER_PIERCE = 9
+    POWER_BLUNT = 10
+    DAMAGE_DEAL = 11
+    DAMAGE_TAKE = 12
+    DAMAGE_THRESHOLD = 13
+    STAGGER_TAKE = 14
+    INITIATIVE = 15
+    DISABLE_BLOCK = 16
+    DISABLE_EVADE = 17
+
+
+COMBAT_STATS = (
+    "power_attack", "power_block", "power_evade", "power_all",
+    "power_light", "power_medium", "power_heavy", "power_ranged",
+    "power_slash", "power_pierce", "power_blunt",
+    "damage_deal", "damage_take", "damage_threshold", "stagger_take",
+    "initiative", "disable_block", "disable_evade",
+)
+COMBAT_STAT_COUNT = len(COMBAT_STATS)
+
+
+class StatSchema:
+    """
+    Соответствие имя стата -> индекс в массивах модификаторов.
+    Схема общая для всех юнитов и растет при встрече нового имени
+    (способности могут возвращать произвольные ключи в on_calculate_stats).
+    """
+
+    def __init__(self, names):
+        self.index = {}
+        self.names = []
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        idx = self.index.get(name)
+        if idx is None:
+            idx = len(self.names)
+            self.index[name] = idx
+            self.names.append(name)
+        return idx
+
+    def __len__(self):
+        return len(self.names)
+
+
+STAT_SCHEMA = StatSchema(COMBAT_STATS + (
+    "strength", "endurance", "agility", "wisdom", "psych",
+    "total_intellect", "intellect",
+    "hp", "sp", "stagger", "heal_efficiency", "talent_slots",
+))
+
+
+# =============================================================================
+# ВЕКТОР МОДИФИКАТОРОВ
+# =============================================================================
+
+def _number(value: float):
+    """Целые значения отдаем как int (массив хранит double), чтобы UI не показывал '12.0'."""
+    return int(value) if value.is_integer() else value
+
+
+class StatSlot(dict):
+    """
+    Словарь {"flat": .., "pct": ..} одного стата для старого API (mods[name]["flat"] += x).
+    Создается при каждом обращении с текущими значениями и записывает изменения обратно в вектор.
+    """
+    __slots__ = ("_vec", "_idx")
+
+    def __init__(self, vec, idx):
+        super().__init__(flat=_number(vec.flat[idx]), pct=_number(vec.pct[idx]))
+        self._vec = vec
+        self._idx = idx
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if key == "flat":
+            self._vec.flat[self._idx] = value
+        elif key == "pct":
+            self._vec.pct[self._idx] = value
+        else:
+            return
+        self._vec._finals = None
+
+
+class ModifierVector:
+    """
+    Модификаторы юнита: пара массивов flat/pct по индексам STAT_SCHEMA.
+
+    Быстрый доступ — по индексам (Stat.*): final(idx) отдает готовое (0 + Flat) * (1 + Pct / 100)
+    для боевых статов, итоги пересчитываются лениво после изменений.
+    Словарный API (mods[name]["flat"], get, in, items) сохранен для талантов, скриптов и UI;
+    как и defaultdict раньше, обращение по имени заводит стат.
+    """
+    __slots__ = ("flat", "pct", "present", "_finals")
+
+    def __init__(self):
+        size = len(STAT_SCHEMA)
+        self.flat = array("d", bytes(8 * size))
+        self.pct = array("d", bytes(8 * size))
+        self.present = bytearray(size)
+        self._finals = None
+
+    def _grow(self):
+        extra = len(STAT_SCHEMA) - len(self.flat)
+        if extra > 0:
+            self.flat.frombytes(bytes(8 * extra))
+            self.pct.frombytes(bytes(8 * extra))
+            self.present.extend(bytes(extra))
+
+    def _slot(self, name: str) -> int:
+        idx = STAT_SCHEMA.intern(name)
+        if idx >= len(self.flat):
+            self._grow()
+        self.present[idx] = 1
+        return idx
+
+    # --- Быстрый API (индексы) ---
+
+    def add(self, idx: int, flat: float = 0.0, pct: float = 0.0):
+        if idx >= len(self.flat):
+            self._grow()
+        self.flat[idx] += flat
+        self.pct[idx] += pct
+        self.present[idx] = 1
+        self._finals = None
+
+    def add_named(self, name: str, flat: float = 0.0, pct: float = 0.0):
+        """mods[name]["flat"] += flat; mods[name]["pct"] += pct — без промежуточного словаря."""
+        self.add(self._slot(name), flat, pct)
+
+    def set_flat(self, name: str, value: float):
+        idx = self._slot(name)
+        self.flat[idx] = value
+        self._finals = None
+
+    def final(self, idx: int) -> int:
+        """Итоговое значение стата (0 + Flat) * (1 + Pct / 100), округленное через int()."""
+        finals = self._finals
+        if finals is None:
+            flat, pct = self.flat, self.pct
+            finals = self._finals = [int(flat[i] * (1 + pct[i] / 100.0)) for i in range(COMBAT_STAT_COUNT)]
+        if idx < COMBAT_STAT_COUNT:
+            return finals[idx]
+        if idx >= len(self.flat):
+            return 0
+        return int(self.flat[idx] * (1 + self.pct[idx] / 100.0))
+
+    def value(self, name: str, base_val=0) -> int:
+        """То же, что get_modded_value, по имени стата."""
+        idx = STAT_SCHEMA.index.get(name)
+        if idx is None or idx >= len(self.flat):
+            return int(base_val)
+        if base_val == 0:
+            return self.final(idx)
+        return int((base_val + self.flat[idx]) * (1 + self.pct[idx] / 100.0))
+
+    # --- Словарный API ---
+
+    def __getitem__(self, name: str) -> StatSlot:
+        return StatSlot(self, self._slot(name))
+
+    def __setitem__(self, name: str, value):
+        idx = self._slot(name)
+        self.flat[idx] = value.get("flat", 0.0)
+        self.pct[idx] = value.get("pct", 0.0)
+        self._finals = None
+
+    def __contains__(self, name) -> bool:
+        idx = STAT_SCHEMA.index.get(name)
+        return idx is not None and idx < len(self.present) and bool(self.present[idx])
+
+    def get(self, name, default=None):
+        if name in self:
+            return StatSlot(self, STAT_SCHEMA.index[name])
+        return default
+
+    def keys(self):
+        names = STAT_SCHEMA.names
+        return [names[i] for i, used in enumerate(self.present) if used]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return sum(self.present)
+
+    def items(self):
+        return [(name, StatSlot(self, STAT_SCHEMA.index[name])) for name in self.keys()]
+
+    def values(self):
+        return [slot for _, slot in self.items()]
+
+    # --- Копирование и сериализация ---
+
+    def freeze(self) -> tuple:
+        """
+        Неизменяемый снимок (для ключей и кэшей внутри процесса).
+        Хвост незаведенных статов отбрасывается, чтобы рост схемы не менял снимок.
+        """
+        size = len(self.present.rstrip(b"\x00"))
+        return self.flat[:size].tobytes(), self.pct[:size].tobytes(), bytes(self.present[:size])
+
+    @classmethod
+    def thaw(cls, frozen) -> "ModifierVector":
+        vec = cls.__new__(cls)
+        flat, pct, present = frozen
+        vec.flat = array("d")
+        vec.flat.frombytes(flat)
+        vec.pct = array("d")
+        vec.pct.frombytes(pct)
+        vec.present = bytearray(present)
+        vec._finals = None
+        vec._grow()
+        return vec
+
+    def copy(self) -> "ModifierVector":
+        return ModifierVector.thaw(self.freeze())
+
+    def to_dict(self) -> dict:
+        return {name: {"flat": slot["flat"], "pct": slot["pct"]} for name, slot in self.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ModifierVector":
+        vec = cls()
+        for name, value in data.items():
+            vec[name] = value
+        return vec
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def __reduce__(self):
+        # Индексы схемы зависят от процесса, поэтому наружу отдаем словарь по именам
+        return ModifierVector.from_dict, (self.to_dict(),)
+
+    def __repr__(self):
+        return f"ModifierVector({self.to_dict()})"
+
+
 def init_modifiers():
     """
-    Создает динамическое хранилище модификаторов.
-    Структура: { "stat_name": { "flat": 0.0, "pct": 0.0 } }
+    Создает хранилище модификаторов (ModifierVector).
+    Словарный доступ: { "stat_name": { "flat": 0.0, "pct": 0.0 } }
     """
-    return defaultdict(lambda: {"flat": 0.0, "pct": 0.0})
+    return ModifierVector()
 
 
 def init_bonuses(unit):
     """
     Собирает временные бонусы к базовым атрибутам.
     """
-    return defaultdict(int)
\ No newline at end of file
+    return defaultdict(int)
@@ -1,12 +1,13 @@
 from core.logging import logger, LogLevel
-from logic.calculations.base_calc import get_word, get_modded_value
+from logic.calculations.base_calc import get_word, get_modded_value, get_flat
+from logic.calculations.modifiers import Stat
 
 
 def calculate_speed_dice(unit, speed_val, mods):
     """Считает кубики скорости с поддержкой оверкапа."""
     dice_count = speed_val // 10 + 1
     final_dice = []
-    global_init = mods["initiative"]["flat"]
+    global_init = get_flat(mods, Stat.INITIATIVE)
 
     for i in range(dice_count):
         points = max(0, min(10, speed_val - (i * 10)))
@@ -36,7 +37,7 @@ def calculate_pools(unit, attrs, skills, mods):
             if growth_data:
                 rolls_h = growth_data.get("hp", 0)
                 if "logs" in growth_data:
-                    for l in growth_data["logs"]: logger.log(l, LogLevel.VERBOSE, "Stats")
+                    for l in growth_data["logs"]: logger.log("%s", LogLevel.VERBOSE, "Stats", l)
                 custom_growth = True
                 break
 
@@ -48,17 +49,19 @@ def calculate_pools(unit, attrs, skills, mods):
     hp_pct_attr = min(abs(endurance_val) * 2, 100)
     if endurance_val < 0: hp_pct_attr = -hp_pct_attr
 
-    if endurance_val != 0:
-        word = get_word(endurance_val)
-        logger.log(f"{word} максимальный показатель ❤️ здоровья на {abs(hp_pct_attr)}% от основного", LogLevel.VERBOSE,
-                   "Stats")
+    # Описания считаются только если VERBOSE-лог кто-то пишет
+    log_stats = logger.is_enabled_for(LogLevel.VERBOSE)
 
-    if hp_flat_attr != 0:
+    if log_stats and endurance_val != 0:
+        logger.log("%s максимальный показатель ❤️ здоровья на %s%% от основного", LogLevel.VERBOSE,
+                   "Stats", get_word(endurance_val), abs(hp_pct_attr))
+
+    if log_stats and hp_flat_attr != 0:
         action = "получает дополнительные" if hp_flat_attr > 0 else "теряет"
-        logger.log(f"Персонаж {action} {abs(hp_flat_attr)} ❤️ здоровья", LogLevel.VERBOSE, "Stats")
+        logger.log("Персонаж %s %s ❤️ здоровья", LogLevel.VERBOSE, "Stats", action, abs(hp_flat_attr))
 
-    mods["hp"]["flat"] += base_h + rolls_h + hp_flat_attr + unit.implants_hp_flat
-    mods["hp"]["pct"] += hp_pct_attr + unit.implants_hp_pct + unit.talents_hp_pct
+    mods.add_named("hp", flat=base_h + rolls_h + hp_flat_attr + unit.implants_hp_flat)
+    mods.add_named("hp", pct=hp_pct_attr + unit.implants_hp_pct + unit.talents_hp_pct)
     unit.max_hp = get_modded_value(0, "hp", mods)
 
     # --- 2. SP ---
@@ -76,27 +79,25 @@ def calculate_pools(unit, attrs, skills, mods):
     sp_pct_attr = min(abs(psych_val) * 2, 100)
     if psych_val < 0: sp_pct_attr = -sp_pct_attr
 
-    if psych_val != 0:
-        word = get_word(psych_val)
-        logger.log(f"{word} максимальный показатель 🧠 рассудка на {abs(sp_pct_attr)}% от основного", LogLevel.VERBOSE,
-                   "Stats")
+    if log_stats and psych_val != 0:
+        logger.log("%s максимальный показатель 🧠 рассудка на %s%% от основного", LogLevel.VERBOSE,
+                   "Stats", get_word(psych_val), abs(sp_pct_attr))
 
-    if sp_flat_attr != 0:
+    if log_stats and sp_flat_attr != 0:
         action = "получает дополнительные" if sp_flat_attr > 0 else "теряет"
-        logger.log(f"Персонаж {action} {abs(sp_flat_attr)} 🧠 рассудка", LogLevel.VERBOSE, "Stats")
+        logger.log("Персонаж %s %s 🧠 рассудка", LogLevel.VERBOSE, "Stats", action, abs(sp_flat_attr))
 
-    mods["sp"]["flat"] += base_s + rolls_s + sp_flat_attr + unit.implants_sp_flat
-    mods["sp"]["pct"] += sp_pct_attr + unit.implants_sp_pct + unit.talents_sp_pct
+    mods.add_named("sp", flat=base_s + rolls_s + sp_flat_attr + unit.implants_sp_flat)
+    mods.add_named("sp", pct=sp_pct_attr + unit.implants_sp_pct + unit.talents_sp_pct)
     unit.max_sp = get_modded_value(0, "sp", mods)
 
     # --- 3. Stagger ---
     base_stg = unit.max_hp // 2
     stg_pct = min(skills["willpower"], 50)
 
-    if stg_pct != 0:
-        word = get_word(stg_pct)
-        logger.log(f"{word} 😵 выдержку на {abs(stg_pct)}%", LogLevel.VERBOSE, "Stats")
+    if log_stats and stg_pct != 0:
+        logger.log("%s 😵 выдержку на %s%%", LogLevel.VERBOSE, "Stats", get_word(stg_pct), abs(stg_pct))
 
-    mods["stagger"]["flat"] += base_stg + unit.implants_stagger_flat
-    mods["stagger"]["pct"] += stg_pct + unit.implants_stagger_pct
+    mods.add_named("stagger", flat=base_stg + unit.implants_stagger_flat)
+    mods.add_named("stagger", pct=stg_pct + unit.implants_stagger_pct)
     unit.max_stagger = get_modded_value(0, "stagger", mods)
\ No newline at end of file
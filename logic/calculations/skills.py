@@ -10,7 +10,7 @@ def apply_skill_effects(skills, mods):
     mod_su = safe_int_div(su, 3)
     if mod_su != 0:
         word = get_word(mod_su)
-        mods["damage_deal"]["flat"] += mod_su
+        mods.add_named("damage_deal", flat=mod_su)
         logger.log(f"Ваш показатель 💥 урона при ударе {word.lower()}ся на {abs(mod_su)}", LogLevel.VERBOSE, "Stats")
 
     # --- МЕДИЦИНА ---
@@ -19,7 +19,7 @@ def apply_skill_effects(skills, mods):
     if mod_med != 0:
         heal_eff = mod_med * 10
         word = get_word(mod_med, "повышается", "понижается")
-        mods["heal_efficiency"]["pct"] += heal_eff
+        mods.add_named("heal_efficiency", pct=heal_eff)
         logger.log(f"Ваш бросок 💚 медицины {word} на {abs(mod_med)}, эффективность лечения — {abs(heal_eff)}%", LogLevel.VERBOSE, "Stats")
 
     # --- АКРОБАТИКА ---
@@ -29,7 +29,7 @@ def apply_skill_effects(skills, mods):
         val = int(mod_acro * 0.8)
         if val != 0:
             word = get_word(val)
-            mods["power_evade"]["flat"] += val
+            mods.add_named("power_evade", flat=val)
             logger.log(f"{word} значение куба 💨 уклонения на {abs(val)} (Акробатика)", LogLevel.VERBOSE, "Stats")
 
     # --- ЩИТЫ ---
@@ -39,7 +39,7 @@ def apply_skill_effects(skills, mods):
         val = int(mod_shields * 0.8)
         if val != 0:
             word = get_word(val)
-            mods["power_block"]["flat"] += val
+            mods.add_named("power_block", flat=val)
             logger.log(f"{word} значение куба 🛡️ щита на {abs(val)}", LogLevel.VERBOSE, "Stats")
 
     # --- ОРУЖИЕ ---
@@ -55,7 +55,7 @@ def apply_skill_effects(skills, mods):
         mod_w = safe_int_div(val, 3)
         if mod_w != 0:
             word = get_word(mod_w)
-            mods[mod_key]["flat"] += mod_w
+            mods.add_named(mod_key, flat=mod_w)
             logger.log(f"{word} значение куба ⚔️ удара атакующими картами {name_ru} на {abs(mod_w)}", LogLevel.VERBOSE, "Stats")
 
     # --- КРЕПКАЯ КОЖА ---
@@ -64,10 +64,10 @@ def apply_skill_effects(skills, mods):
     if mod_skin != 0:
         val = int(mod_skin * 1.2)
         if val > 0:
-            mods["damage_take"]["flat"] += val
+            mods.add_named("damage_take", flat=val)
             logger.log(f"Понижает 🧱 получаемый урон на {val}", LogLevel.VERBOSE, "Stats")
         elif val < 0:
-            mods["damage_take"]["flat"] += val
+            mods.add_named("damage_take", flat=val)
             logger.log(f"Повышает 🧱 получаемый урон на {abs(val)}", LogLevel.VERBOSE, "Stats")
 
     # --- СОЦИАЛЬНЫЕ И КРАФТ ---
@@ -0,0 +1,107 @@
+from collections import defaultdict
+
+from logic.calculations.modifiers import init_modifiers, ModifierVector
+
+
+def build_key(unit) -> tuple:
+    """Отпечаток сборки: способности и оружие."""
+    return (
+        tuple(unit.passives),
+        tuple(unit.talents),
+        tuple(unit.augmentations),
+        unit.weapon_id,
+    )
+
+
+def status_key(unit) -> tuple:
+    """Отпечаток статусов: суммы стаков (порядок не важен)."""
+    return tuple(sorted(unit.statuses.items()))
+
+
+def base_key(unit) -> tuple:
+    """Отпечаток собственных характеристик юнита, которые читают этапы атрибутов, скорости и пулов."""
+    return (
+        tuple(unit.attributes.items()),
+        tuple(unit.skills.items()),
+        tuple((lvl, tuple(rolls.items())) for lvl, rolls in unit.level_rolls.items()),
+        unit.base_intellect, unit.base_hp, unit.base_sp,
+        unit.base_speed_min, unit.base_speed_max,
+        unit.implants_hp_flat, unit.implants_sp_flat, unit.implants_stagger_flat,
+        unit.implants_hp_pct, unit.implants_sp_pct, unit.implants_stagger_pct,
+        unit.talents_hp_pct, unit.talents_sp_pct,
+    )
+
+
+def _stat_deltas(mods) -> tuple:
+    """Ненулевой вклад этапа: (индекс, flat, pct) по заведенным статам."""
+    flat, pct = mods.flat, mods.pct
+    return tuple((i, flat[i], pct[i]) for i, used in enumerate(mods.present) if used)
+
+
+class StatsCache:
+    """
+    Кэш пересчета статов юнита (recalculate_unit_stats).
+
+    stages: вклад этапов сбора бонусов с чистыми источниками (BaseEffect.pure_stats),
+            {этап: (ключ, вклад в mods по индексам схемы, бонусы)} — вклад аддитивен и просто прибавляется.
+    derived: результат этапов атрибутов, навыков, скорости и пулов для отпечатка собранных бонусов.
+    """
+    __slots__ = ("stages", "derived_key", "derived")
+
+    def __init__(self):
+        self.stages = {}
+        self.derived_key = None
+        self.derived = None
+
+    def merge_stage(self, stage, key, mods, bonuses, collect) -> bool:
+        """Прибавляет вклад этапа к mods/bonuses; collect(mods, bonuses) вызывается только при смене ключа."""
+        entry = self.stages.get(stage)
+        hit = entry is not None and entry[0] == key
+        if not hit:
+            part_mods, part_bonuses = init_modifiers(), defaultdict(int)
+            collect(part_mods, part_bonuses)
+            entry = (key, _stat_deltas(part_mods), tuple(part_bonuses.items()))
+            self.stages[stage] = entry
+
+        for idx, flat, pct in entry[1]:
+            mods.add(idx, flat, pct)
+        for name, val in entry[2]:
+            bonuses[name] += val
+        return hit
+
+    def restore_derived(self, unit, key):
+        """Возвращает итоговые mods, если производные статы для key уже посчитаны (и выставляет их юниту)."""
+        if self.derived_key != key:
+            return None
+        frozen, speed_dice, dice_count, max_hp, max_sp, max_stagger = self.derived
+        unit.computed_speed_dice = list(speed_dice)
+        unit.speed_dice_count = dice_count
+        unit.max_hp, unit.max_sp, unit.max_stagger = max_hp, max_sp, max_stagger
+        return ModifierVector.thaw(frozen)
+
+    def store_derived(self, unit, key, mods):
+        self.derived_key = key
+        self.derived = (
+            mods.freeze(), tuple(unit.computed_speed_dice), unit.speed_dice_count,
+            unit.max_hp, unit.max_sp, unit.max_stagger,
+        )
+
+    def __deepcopy__(self, memo):
+        # Копия юнита начнет с пустого кэша
+        return None
+
+    def __reduce__(self):
+        return StatsCache, ()
+
+
+def get_stats_cache(unit) -> StatsCache:
+    cache = unit.__dict__.get("_stats_cache")
+    if cache is None:
+        cache = StatsCache()
+        unit._stats_cache = cache
+    return cache
+
+
+def invalidate_stats_cache(unit):
+    """Сбрасывает кэш пересчета (для правок, которые отпечатки не видят, например подмены реестров)."""
+    unit.__dict__.pop("_stats_cache", None)
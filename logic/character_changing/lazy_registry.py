@@ -0,0 +1,63 @@
+import importlib
+from collections.abc import MutableMapping
+
+_MISSING = object()
+
+
+class LazyRegistry(MutableMapping):
+    """
+    Реестр механик {id: объект}, собираемый по манифесту {id: "модуль:Класс"}.
+
+    Модуль импортируется, а объект создается при первом обращении к id,
+    так что бой двух персонажей тянет только их таланты и пассивки.
+    `id in REGISTRY`, keys() и len() работают по манифесту, без импорта;
+    items()/values() (списки в UI) загружают все.
+    """
+
+    def __init__(self, package: str, manifest: dict):
+        self._package = package
+        self._manifest = dict(manifest)
+        self._objects = {}
+
+    def _load(self, key):
+        module_name, _, class_name = self._manifest[key].partition(":")
+        module = importlib.import_module(f".{module_name}", self._package)
+        obj = getattr(module, class_name)()
+        self._objects[key] = obj
+        return obj
+
+    def __getitem__(self, key):
+        obj = self._objects.get(key, _MISSING)
+        if obj is not _MISSING:
+            return obj
+        if key not in self._manifest:
+            raise KeyError(key)
+        return self._load(key)
+
+    def __setitem__(self, key, obj):
+        self._objects[key] = obj
+
+    def __delitem__(self, key):
+        found = self._objects.pop(key, _MISSING) is not _MISSING
+        found |= self._manifest.pop(key, None) is not None
+        if not found:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._objects or key in self._manifest
+
+    def __iter__(self):
+        return iter(dict.fromkeys([*self._manifest, *self._objects]))
+
+    def __len__(self):
+        return len(self._manifest.keys() | self._objects.keys())
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def loaded(self) -> list:
+        """id уже созданных объектов (для отладки и тестов)."""
+        return list(self._objects)
+
+    def __repr__(self):
+        return f"LazyRegistry({self._package}: {len(self)} ids, {len(self._objects)} loaded)"
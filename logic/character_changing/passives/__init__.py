@@ -1,92 +1,74 @@
-from logic.character_changing.passives.adam_passives import AugmentationCombatTrance, AugmentationOckhamsRazor, \
-    WeaknessSystemDissonance, WeaknessPhantomPain, AugmentationTitaniumSkin, PassiveRuthlessProtocol, \
-    AugmentationSandevistan, WeaponMuramasaPassive, ArmorGhostExoPassive
-from logic.character_changing.passives.asgick_passives import PassiveWitnessOfGroGoroth, PassivePovar, PassiveFoodLover, \
-    PassiveDistortionGroGoroth
-from logic.character_changing.passives.equipment_passives import PassiveAnnihilator, PassiveBanganrang, PassiveGanitar, \
-    PassiveLimagun, PassivePhantomRazors, PassiveCoagulation, PassiveMagneticPickaxe, PassiveDragonSlab, ArmorZafBron
-from logic.character_changing.passives.fanat_passives import PassiveFanatReflect, PassiveFanatMarkHunter, \
-    PassiveFanatAntiDefense, PassiveFanatStaggerRecovery, PassiveFanatUnwavering
-from logic.character_changing.passives.lilith_passives import PassiveHedonism, PassiveWagTail, PassiveBackstreetDemon, \
-    PassiveDaughterOfBackstreets, PassiveLiveFastDieYoung
-from logic.character_changing.passives.lima_passives import PassiveAcceleratedLearning, TalentArtOfSelfDefense, \
-    PassiveLuckyStreak, \
-    PassiveFourEyes, PassiveHuntersVedas, PassiveMindSuppression, PassiveShipOfTheseus, PassiveWildCityscape
-from logic.character_changing.passives.rein_passives import PassiveSCells, PassiveNewDiscovery, TalentRedLycoris, TalentShadowOfMajesty
-from logic.character_changing.passives.zafiel_passives import PassiveSevereTraining, PassiveAdaptation, \
-    PassiveBlueHyacinth
-from logic.character_changing.passives.leila_passives import PassiveStances, PassiveHardenedBySolitude, \
-    PassiveFearOfHealing, PassiveNotEconomicallyMinded, PassiveTopographicCretinism, PassiveSharpMind, PassiveLowEndurance, PassiveSocialPhobia
-from logic.character_changing.passives.axis_passives import PassiveAxisUnity, PassivePseudoProtagonist, \
-    PassiveSourceAccess, PassiveMetaAwareness, PassiveChthonic
-    
+from logic.character_changing.lazy_registry import LazyRegistry
+
+# Манифест: id -> "модуль:Класс" (модуль относительно пакета).
+# Классы импортируются и создаются при первом обращении к id (см. LazyRegistry).
 # === РЕГИСТРАЦИЯ ===
-PASSIVE_REGISTRY = {
-"hedonism": PassiveHedonism(),
-"wag_tail": PassiveWagTail(),
-"backstreet_demon": PassiveBackstreetDemon(),
-"daughter_of_backstreets": PassiveDaughterOfBackstreets(),
-"live_fast_die_young": PassiveLiveFastDieYoung(),
-"s_cells": PassiveSCells(),
-"new_discovery": PassiveNewDiscovery(),
-"red_lycoris": TalentRedLycoris(),
-"shadow_majesty":TalentShadowOfMajesty(),
-"severe_training": PassiveSevereTraining(),
-"adaptation": PassiveAdaptation(),
-"accelerated_learning": PassiveAcceleratedLearning(),
-"art_of_self_defense": TalentArtOfSelfDefense(),
-"lucky_streak": PassiveLuckyStreak(),
-"four_eyes": PassiveFourEyes(),
-"hunters_vedas": PassiveHuntersVedas(),
-"mind_suppression": PassiveMindSuppression(),
-"witness_gro_goroth": PassiveWitnessOfGroGoroth(),
+PASSIVE_REGISTRY = LazyRegistry(__name__, {
+"hedonism": "lilith_passives:PassiveHedonism",
+"wag_tail": "lilith_passives:PassiveWagTail",
+"backstreet_demon": "lilith_passives:PassiveBackstreetDemon",
+"daughter_of_backstreets": "lilith_passives:PassiveDaughterOfBackstreets",
+"live_fast_die_young": "lilith_passives:PassiveLiveFastDieYoung",
+"s_cells": "rein_passives:PassiveSCells",
+"new_discovery": "rein_passives:PassiveNewDiscovery",
+"red_lycoris": "rein_passives:TalentRedLycoris",
+"shadow_majesty":"rein_passives:TalentShadowOfMajesty",
+"severe_training": "zafiel_passives:PassiveSevereTraining",
+"adaptation": "zafiel_passives:PassiveAdaptation",
+"accelerated_learning": "lima_passives:PassiveAcceleratedLearning",
+"art_of_self_defense": "lima_passives:TalentArtOfSelfDefense",
+"lucky_streak": "lima_passives:PassiveLuckyStreak",
+"four_eyes": "lima_passives:PassiveFourEyes",
+"hunters_vedas": "lima_passives:PassiveHuntersVedas",
+"mind_suppression": "lima_passives:PassiveMindSuppression",
+"witness_gro_goroth": "asgick_passives:PassiveWitnessOfGroGoroth",
 
-"mech_annihilator": PassiveAnnihilator(),
-"mech_banganrang": PassiveBanganrang(),
-"mech_ganitar": PassiveGanitar(),
-"mech_limagun": PassiveLimagun(),
-"povar":PassivePovar(),
-"food_lover": PassiveFoodLover(),
-"ship_of_theseus": PassiveShipOfTheseus(),
-"wild_cityscape": PassiveWildCityscape(),
-"distortionGroGoroth": PassiveDistortionGroGoroth(),
-"mech_phantom_razors": PassivePhantomRazors(),
-"coagulation": PassiveCoagulation(),
+"mech_annihilator": "equipment_passives:PassiveAnnihilator",
+"mech_banganrang": "equipment_passives:PassiveBanganrang",
+"mech_ganitar": "equipment_passives:PassiveGanitar",
+"mech_limagun": "equipment_passives:PassiveLimagun",
+"povar":"asgick_passives:PassivePovar",
+"food_lover": "asgick_passives:PassiveFoodLover",
+"ship_of_theseus": "lima_passives:PassiveShipOfTheseus",
+"wild_cityscape": "lima_passives:PassiveWildCityscape",
+"distortionGroGoroth": "asgick_passives:PassiveDistortionGroGoroth",
+"mech_phantom_razors": "equipment_passives:PassivePhantomRazors",
+"coagulation": "equipment_passives:PassiveCoagulation",
 
-"fanat_stagger_recovery": PassiveFanatStaggerRecovery(),
-    "fanat_anti_defense": PassiveFanatAntiDefense(),
-    "fanat_mark_hunter": PassiveFanatMarkHunter(),
-    "fanat_reflect": PassiveFanatReflect(),
-"fanat_unwavering": PassiveFanatUnwavering(),
-"stances": PassiveStances(),
-"hardened_by_solitude": PassiveHardenedBySolitude(),
-"fear_of_healing": PassiveFearOfHealing(),
-"not_economically_minded": PassiveNotEconomicallyMinded(),
-"topographic_cretinism": PassiveTopographicCretinism(),
-"sharp_mind": PassiveSharpMind(),
-"low_endurance": PassiveLowEndurance(),
-"social_phobia": PassiveSocialPhobia(),
+"fanat_stagger_recovery": "fanat_passives:PassiveFanatStaggerRecovery",
+    "fanat_anti_defense": "fanat_passives:PassiveFanatAntiDefense",
+    "fanat_mark_hunter": "fanat_passives:PassiveFanatMarkHunter",
+    "fanat_reflect": "fanat_passives:PassiveFanatReflect",
+"fanat_unwavering": "fanat_passives:PassiveFanatUnwavering",
+"stances": "leila_passives:PassiveStances",
+"hardened_by_solitude": "leila_passives:PassiveHardenedBySolitude",
+"fear_of_healing": "leila_passives:PassiveFearOfHealing",
+"not_economically_minded": "leila_passives:PassiveNotEconomicallyMinded",
+"topographic_cretinism": "leila_passives:PassiveTopographicCretinism",
+"sharp_mind": "leila_passives:PassiveSharpMind",
+"low_endurance": "leila_passives:PassiveLowEndurance",
+"social_phobia": "leila_passives:PassiveSocialPhobia",
 
 # Axis Mundi
-"axis_unity": PassiveAxisUnity(),
-"pseudo_protagonist": PassivePseudoProtagonist(),
-"source_access": PassiveSourceAccess(),
-"meta_awareness": PassiveMetaAwareness(),
-"chthonic_nature": PassiveChthonic(),
+"axis_unity": "axis_passives:PassiveAxisUnity",
+"pseudo_protagonist": "axis_passives:PassivePseudoProtagonist",
+"source_access": "axis_passives:PassiveSourceAccess",
+"meta_awareness": "axis_passives:PassiveMetaAwareness",
+"chthonic_nature": "axis_passives:PassiveChthonic",
 
 # Adam Gray Fox
-"sandevistan": AugmentationSandevistan(),
-"ruthless_protocol": PassiveRuthlessProtocol(),
-"titanium_skin": AugmentationTitaniumSkin(),
-"phantom_pain": WeaknessPhantomPain(),
-"system_dissonance": WeaknessSystemDissonance(),
-"ockhams_razor": AugmentationOckhamsRazor(),
-"combat_trance": AugmentationCombatTrance(),
-"weapon_muramasa": WeaponMuramasaPassive(),
-"armor_ghost_exo": ArmorGhostExoPassive(),
-"mech_magnetic_pickaxe": PassiveMagneticPickaxe(),
+"sandevistan": "adam_passives:AugmentationSandevistan",
+"ruthless_protocol": "adam_passives:PassiveRuthlessProtocol",
+"titanium_skin": "adam_passives:AugmentationTitaniumSkin",
+"phantom_pain": "adam_passives:WeaknessPhantomPain",
+"system_dissonance": "adam_passives:WeaknessSystemDissonance",
+"ockhams_razor": "adam_passives:AugmentationOckhamsRazor",
+"combat_trance": "adam_passives:AugmentationCombatTrance",
+"weapon_muramasa": "adam_passives:WeaponMuramasaPassive",
+"armor_ghost_exo": "adam_passives:ArmorGhostExoPassive",
+"mech_magnetic_pickaxe": "equipment_passives:PassiveMagneticPickaxe",
 
-"blue_hyacinth_passive": PassiveBlueHyacinth(),
-"mech_dragon_slab": PassiveDragonSlab(),
-"armor_zaf_bron": ArmorZafBron()
-}
\ No newline at end of file
+"blue_hyacinth_passive": "zafiel_passives:PassiveBlueHyacinth",
+"mech_dragon_slab": "equipment_passives:PassiveDragonSlab",
+"armor_zaf_bron": "equipment_passives:ArmorZafBron"
+})
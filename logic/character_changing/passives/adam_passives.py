@@ -1,4 +1,4 @@
-import random
+from logic.battle_flow.session import get_rng
 from logic.character_changing.passives.base_passive import BasePassive
 from core.logging import logger, LogLevel
 from logic.context import RollContext
@@ -107,7 +107,7 @@ class WeaknessSystemDissonance(BasePassive):
     description = "При проигрыше столкновения шанс 30% получить Паралич."
 
     def on_clash_lose(self, ctx, **kwargs):
-        if random.random() < 0.30:
+        if get_rng(ctx).random() < 0.30:
             # Паралич на 99 ходов (или пока не снимут) - жестко, как ты хотел в коде
             ctx.source.add_status("paralysis", 2, duration=99)
             ctx.log.append("⚠️ System Error: Paralysis applied!")
@@ -69,9 +69,10 @@ class PassiveWitnessOfGroGoroth(BasePassive):
             ally_names = unit.memory.get('cached_allies_names', [])
             if not ally_names: return
 
-            # Импортируем streamlit для доступа к глобальным спискам команд
-            import streamlit as st
-            all_units = st.session_state.get('team_left', []) + st.session_state.get('team_right', [])
+            # Союзники ищутся в сессии боя
+            from logic.battle_flow.session import get_session
+            session = get_session(unit)
+            all_units = session.all_units() if session else []
 
             # Находим живые объекты по именам
             shared_names = []
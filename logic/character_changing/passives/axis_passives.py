@@ -220,7 +220,7 @@ class PassiveAxisUnity(BasePassive):
 
 from core.logging import logger, LogLevel
 from logic.character_changing.passives.base_passive import BasePassive
-import streamlit as st
+from logic.battle_flow.session import get_session
 
 class PassivePseudoProtagonist(BasePassive):
     id = "pseudo_protagonist"
@@ -254,15 +254,21 @@ class PassivePseudoProtagonist(BasePassive):
             logger.log(f"📚 Pseudo Protagonist: {unit.name} gained {xp_gain} XP from {check_type} roll {check_result}",
                        LogLevel.NORMAL, "System")
 
-            # Тост для игрока
-            st.toast(f"Псевдо-ГГ: +{xp_gain} XP ({check_type})!", icon="📚")
+            # Тост для игрока: в бою — через сессию, вне боя — через колбэк интерфейса
+            msg = f"Псевдо-ГГ: +{xp_gain} XP ({check_type})!"
+            session = get_session(unit)
+            notify = kwargs.get("notify")
+            if session:
+                session.notify(msg, icon="📚")
+            elif callable(notify):
+                notify(msg, icon="📚")
 
     def on_luck_check(self, unit, result: int, **kwargs):
         """
         Перехватывает броски удачи (trigger_hooks('on_luck_check')) и направляет их в общую логику.
         """
         # Передаем результат броска удачи как check_result, а ключ как 'luck'
-        self.on_skill_check(unit, result, "luck")
+        self.on_skill_check(unit, result, "luck", **kwargs)
 
 
 class PassiveSourceAccess(BasePassive):
@@ -76,8 +76,9 @@ class PassiveGanitar(BasePassive):
             if log_func: log_func("❌ Ганитар: Цели не найдены в памяти.")
             return False
 
-        import streamlit as st
-        all_units = st.session_state.get('team_left', []) + st.session_state.get('team_right', [])
+        from logic.battle_flow.session import get_session
+        session = get_session(unit)
+        all_units = session.all_units() if session else []
 
         count = 0
         names = []
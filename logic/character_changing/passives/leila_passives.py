@@ -51,8 +51,8 @@ class PassiveStances(BasePassive):
     def _get_all_units(self):
         """Получает всех юнитов в бою (вспомогательный метод)."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams()
             return (l_team or []) + (r_team or [])
         except Exception:
             return []
@@ -362,8 +362,9 @@ class PassiveLowEndurance(BasePassive):
     def on_round_start(self, unit, *args, **kwargs):
         """Проверяет номер сцены и накладывает дебафы после 6-й сцены."""
         try:
-            import streamlit as st
-            current_round = st.session_state.get('round_number', 1)
+            from logic.battle_flow.session import get_session
+            session = get_session(unit)
+            current_round = session.round_number if session else 1
             
             # Если это 6-я или более поздняя сцена
             if current_round >= 6:
@@ -381,7 +382,7 @@ class PassiveLowEndurance(BasePassive):
                         LogLevel.NORMAL, "Passive"
                     )
         except Exception as e:
-            # Если streamlit не доступен (например, в тестах), игнорируем
+            # Юнит вне боя (например, в тестах) — игнорируем
             logger.log(f"⚠️ Low Endurance check error: {e}", LogLevel.VERBOSE, "Passive")
             pass
 
@@ -403,8 +404,8 @@ class PassiveHardenedBySolitude(BasePassive):
     def _has_active_allies(self, unit):
         """Проверяет наличие активных союзников на поле боя."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
             
             # Определяем команду юнита
             my_team = None
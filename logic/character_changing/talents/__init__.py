@@ -1,336 +1,255 @@
 # logic/talents/__init__.py
-from logic.character_changing.talents.branch_10_energy import (
-    TalentElectrician, TalentPainPoints, TalentMechanicalEnergy, TalentPainShock,
-    TalentEmergencyProtection, TalentStaticElectricity, TalentEnteringRhythm, TalentDirtyTricks,
-    TalentPlayingOnNerves, TalentOvervoltage, TalentEMField, TalentWithCaution, TalentSharpEye,
-    TalentTeamPlayer, TalentArrest, TalentBattery, TalentGrounding, TalentFeint, TalentWeakPointEnergy,
-    TalentRuptureApplication, TalentRiftingSpace, TalentCapacitor, TalentAchillesHeel, TalentNoMistakes,
-    TalentShortCircuit, TalentPrideOfSeven
-)
-from logic.character_changing.talents.branch_11_flame import (
-    TalentStrikeWhileIronHot, TalentSpark, TalentCauterization, TalentHot,
-    TalentBodyAdaptation, TalentHearthOfPower, TalentAshesToAshes,
-    TalentHellfire, TalentWildfire, TalentFieryTemper,
-    TalentIfrit, TalentPhoenix, TalentFirestorm, TalentBurnMeDown
-)
-from logic.character_changing.talents.branch_12_technologist import (
-    TalentProjection, TalentHacker, TalentLittleHelper, TalentProgrammingLanguages,
-    TalentPortableShield, TalentEnergyCycle, TalentModulation, TalentAccessPoint,
-    TalentError404, TalentAssHack)
-from logic.character_changing.talents.branch_13_roboticist import (
-    TalentBestFriendsForever, TalentLittleBigTrouble, TalentCellExpander,
-    TalentNoFirstLaw, TalentBrightTalent, TalentSmallerLighterFaster,
-    TalentFrameUpgrade, TalentMadeToLast, TalentChimeraCore,
-    TalentUpshotRobot, TalentQuantumHub, TalentJackOfAllTrades,
-    TalentMachinaExDeo, TalentExogenesisProtocol, TalentMultiConnection
-)
-from logic.character_changing.talents.branch_14_tremor import (
-    TalentFightToTheEnd, TalentShareWithFriend, TalentCarelessness,
-    TalentPassTheFare, TalentOwnTremor, TalentReadinessForEverything,
-    TalentKeepGoing, TalentResonance, TalentImmobile, TalentTremorToBone
-)
-from logic.character_changing.talents.branch_1_mindgames import TalentKeepItTogether, TalentCenterOfBalance, \
-    TalentControlledDistortion, \
-    TalentSafeEGO, TalentEmotionalStorm, TalentUnbearablePresence, TalentTeaMaster, TalentMindPower, TalentPeakSanity, \
-    TalentPsychicStrain
-from logic.character_changing.talents.branch_2_best import TalentInnateTalent, TalentCelestialEyes, TalentBlueFlashStep, \
-    TalentBlackFlashSpark, TalentJustWarmingUp, TalentSilenceExecution, TalentMainCharacterShell, TalentArrogantTaunt, \
-    TalentIdealStandard, TalentCopycatInsight, TalentVoidCleave, TalentGoldenReputation
-from logic.character_changing.talents.branch_3_tireless import (
-    TalentBigGuy, TalentDefense, TalentCommendableConstitution, TalentBigHeart,
-    TalentRock, TalentDespiteAdversities, TalentHardenedSkin,
-    TalentAdaptationTireless, TalentToughAsSteel, TalentDefender,
-    TalentSurvivor, TalentMuscleOverstrain, TalentIdolOath, TalentSurgeOfStrength
-)
-from logic.character_changing.talents.branch_4_medic import TalentNoHippocraticOath, TalentGoodAsNew, TalentRemedyGood, \
-    TalentCheese, \
-    TalentYouWontDieGood, TalentCarefulNeutralization, TalentDoingGoodWork, TalentNotToday, \
-    TalentMadGoodDoctor, TalentToxicologyWeapon, TalentRemedyBad, TalentOrganStriking, TalentAdvancedToxicology, \
-    TalentYouWontDieBad, TalentMedicalJargon, TalentChristmasTree, TalentInsaneZeal, TalentGeniusToxicologist, \
-    TalentConfete
-from logic.character_changing.talents.branch_5_berseker import (
-    TalentNakedDefense, TalentVengefulPayback, TalentBerserkerRage, TalentCalmMind,
-    TalentFrenzy, TalentCatchBreath, TalentRagingFury, TalentFullConcentration,
-    TalentNakedDefense2, TalentNakedDefense3, TalentDescendingIntoMadness,
-    TalentSteadyHand, TalentKeyMoment, TalentSecondWindBerserk, TalentDieHard
-)
-from logic.character_changing.talents.branch_6_smoker import (
-    TalentHidingInSmoke, TalentSmokeUniversality, TalentAerialFoot, TalentSmokeScreen,
-    TalentRecycling, TalentSelfPreservation, TalentCleansing, TalentExperiencedSmoker,
-    TalentLungProcessing, TalentToNarnia, TalentSmokeAdvantage, TalentVulnerabilitySmoke,
-    TalentThickSmoke, TalentSmokeAndMirrors
-)
-from logic.character_changing.talents.branch_7_luck import (
-    TalentDealWithFortune, TalentSecondChance, TalentSequentialLuck,
-    TalentLuckyBastard, TalentJustSkill, TalentRaiseStakes,
-    TalentAzino777, TalentBlessedByFate, TalentAceSleeve,
-    TalentImpossiblePossible
-)
-from logic.character_changing.talents.branch_8_military import (
-    TalentAthletic, TalentFastHands, TalentLeader, TalentAddiction,
-    TalentRapidRetreat, TalentCombatReload, TalentFindVulnerability,
-    TalentBorrowedTime, TalentIronFormation, TalentLastHope
-)
-from logic.character_changing.talents.branch_9_shadow import (
-    TalentAthleticismShadow, TalentRevenge, TalentNotGreatAttention, TalentFormidablePerson,
-    TalentSmashingBlade, TalentSlaughter, TalentTrapmaster, TalentFastAndSilent,
-    TalentAggressiveParry, TalentStepIntoShadow, TalentTasteOfVictory, TalentSleightOfHand,
-    TalentCatReflexes, TalentEnduranceLessons, TalentEyeForDanger, TalentColdBlooded,
-    TalentIdentityThief, TalentCoveringTracks, TalentCompetentAdrenaline, TalentKnifeInBack,
-    TalentOppression, TalentVulnerabilityPoint, TalentExtremeMeasures, TalentButcher
-)
-from logic.character_changing.talents.link_talents import (
-    TalentCenser, TalentArdentDefense, TalentHitmanAssortment,
-    TalentThermalEnergy, TalentScorchingMastery
-)
+from logic.character_changing.lazy_registry import LazyRegistry
 
-TALENT_REGISTRY = {
+# Манифест: id -> "модуль:Класс" (модуль относительно пакета).
+# Классы импортируются и создаются при первом обращении к id (см. LazyRegistry).
+TALENT_REGISTRY = LazyRegistry(__name__, {
 # === ВЕТКА 1: ИСКАЖЕНИЕ (MINDGAMES) ===
-    "keep_it_together": TalentKeepItTogether(),
-    "center_of_balance": TalentCenterOfBalance(),
-    "tea_master": TalentTeaMaster(),
-    "mind_power": TalentMindPower(),
-    "peak_sanity": TalentPeakSanity(),
-    "psychic_strain": TalentPsychicStrain(),
-    "unbearable_presence": TalentUnbearablePresence(),
-    "emotional_storm": TalentEmotionalStorm(),
-    "safe_ego": TalentSafeEGO(),
-    "controlled_distortion": TalentControlledDistortion(),
+    "keep_it_together": "branch_1_mindgames:TalentKeepItTogether",
+    "center_of_balance": "branch_1_mindgames:TalentCenterOfBalance",
+    "tea_master": "branch_1_mindgames:TalentTeaMaster",
+    "mind_power": "branch_1_mindgames:TalentMindPower",
+    "peak_sanity": "branch_1_mindgames:TalentPeakSanity",
+    "psychic_strain": "branch_1_mindgames:TalentPsychicStrain",
+    "unbearable_presence": "branch_1_mindgames:TalentUnbearablePresence",
+    "emotional_storm": "branch_1_mindgames:TalentEmotionalStorm",
+    "safe_ego": "branch_1_mindgames:TalentSafeEGO",
+    "controlled_distortion": "branch_1_mindgames:TalentControlledDistortion",
 
 # === ВЕТКА 2: ЛУЧШИЙ ИЗ ЛУЧШИХ ===
-    "innate_talent":TalentInnateTalent(),
-    "celestial_eyes":TalentCelestialEyes(),
+    "innate_talent":"branch_2_best:TalentInnateTalent",
+    "celestial_eyes":"branch_2_best:TalentCelestialEyes",
     # === ВЕТКА 2: ЛУЧШИЙ ИЗ ЛУЧШИХ ===
-    "innate_talent": TalentInnateTalent(),
-    "celestial_eyes": TalentCelestialEyes(),
-    "void_cleave": TalentVoidCleave(),
-    "copycat_insight": TalentCopycatInsight(),
-    "golden_reputation": TalentGoldenReputation(),
+    "innate_talent": "branch_2_best:TalentInnateTalent",
+    "celestial_eyes": "branch_2_best:TalentCelestialEyes",
+    "void_cleave": "branch_2_best:TalentVoidCleave",
+    "copycat_insight": "branch_2_best:TalentCopycatInsight",
+    "golden_reputation": "branch_2_best:TalentGoldenReputation",
 
     # Референсные
-    "ideal_standard": TalentIdealStandard(),
-    "arrogant_taunt": TalentArrogantTaunt(),
-    "main_character_shell": TalentMainCharacterShell(),
-    "silence_execution": TalentSilenceExecution(),
-    "just_warming_up": TalentJustWarmingUp(),
+    "ideal_standard": "branch_2_best:TalentIdealStandard",
+    "arrogant_taunt": "branch_2_best:TalentArrogantTaunt",
+    "main_character_shell": "branch_2_best:TalentMainCharacterShell",
+    "silence_execution": "branch_2_best:TalentSilenceExecution",
+    "just_warming_up": "branch_2_best:TalentJustWarmingUp",
 
     # Опциональные
-    "black_flash_spark": TalentBlackFlashSpark(),
-    "blue_flash_step": TalentBlueFlashStep(),
+    "black_flash_spark": "branch_2_best:TalentBlackFlashSpark",
+    "blue_flash_step": "branch_2_best:TalentBlueFlashStep",
 
 # === ВЕТКА 3: НЕУТОМИМЫЙ ===
-    "big_guy": TalentBigGuy(),
-    "defense": TalentDefense(), # Перезаписали старую версию
-    "commendable_constitution": TalentCommendableConstitution(),
-    "big_heart": TalentBigHeart(),
-    "rock": TalentRock(),
-    "despiteAdversities": TalentDespiteAdversities(), # ID должен совпадать с тем, что в unit_mixins
-    "hardened_skin": TalentHardenedSkin(),
-    "adaptation_tireless": TalentAdaptationTireless(),
-    "tough_as_steel": TalentToughAsSteel(),
-    "defender": TalentDefender(),
-    "survivor": TalentSurvivor(),
-    "muscle_overstrain": TalentMuscleOverstrain(),
-    "idol_oath": TalentIdolOath(),
-    "surgeOfStrength": TalentSurgeOfStrength(),
+    "big_guy": "branch_3_tireless:TalentBigGuy",
+    "defense": "branch_3_tireless:TalentDefense", # Перезаписали старую версию
+    "commendable_constitution": "branch_3_tireless:TalentCommendableConstitution",
+    "big_heart": "branch_3_tireless:TalentBigHeart",
+    "rock": "branch_3_tireless:TalentRock",
+    "despiteAdversities": "branch_3_tireless:TalentDespiteAdversities", # ID должен совпадать с тем, что в unit_mixins
+    "hardened_skin": "branch_3_tireless:TalentHardenedSkin",
+    "adaptation_tireless": "branch_3_tireless:TalentAdaptationTireless",
+    "tough_as_steel": "branch_3_tireless:TalentToughAsSteel",
+    "defender": "branch_3_tireless:TalentDefender",
+    "survivor": "branch_3_tireless:TalentSurvivor",
+    "muscle_overstrain": "branch_3_tireless:TalentMuscleOverstrain",
+    "idol_oath": "branch_3_tireless:TalentIdolOath",
+    "surgeOfStrength": "branch_3_tireless:TalentSurgeOfStrength",
 
     # === ВЕТКА 4: ПОЛЕВОЙ МЕДИК ===
-    "no_hippocratic_oath": TalentNoHippocraticOath(),
+    "no_hippocratic_oath": "branch_4_medic:TalentNoHippocraticOath",
 
     # Хороший Врач
-    "good_as_new": TalentGoodAsNew(),
-    "remedy_good": TalentRemedyGood(),
-    "cheese": TalentCheese(),
-    "confete": TalentConfete(),
-    "you_wont_die_good": TalentYouWontDieGood(),
-    "careful_neutralization": TalentCarefulNeutralization(),
-    "doing_good_work": TalentDoingGoodWork(),
-    "not_today": TalentNotToday(),
-    "mad_good_doctor": TalentMadGoodDoctor(),
+    "good_as_new": "branch_4_medic:TalentGoodAsNew",
+    "remedy_good": "branch_4_medic:TalentRemedyGood",
+    "cheese": "branch_4_medic:TalentCheese",
+    "confete": "branch_4_medic:TalentConfete",
+    "you_wont_die_good": "branch_4_medic:TalentYouWontDieGood",
+    "careful_neutralization": "branch_4_medic:TalentCarefulNeutralization",
+    "doing_good_work": "branch_4_medic:TalentDoingGoodWork",
+    "not_today": "branch_4_medic:TalentNotToday",
+    "mad_good_doctor": "branch_4_medic:TalentMadGoodDoctor",
 
     # Плохой Врач
-    "toxicology_weapon": TalentToxicologyWeapon(),
-    "remedy_bad": TalentRemedyBad(),
-    "organ_striking": TalentOrganStriking(),
-    "advanced_toxicology": TalentAdvancedToxicology(),
-    "you_wont_die_bad": TalentYouWontDieBad(),
-    "medical_jargon": TalentMedicalJargon(),
-    "christmas_tree": TalentChristmasTree(),
-    "insane_zeal": TalentInsaneZeal(),
-    "genius_toxicologist": TalentGeniusToxicologist(),
+    "toxicology_weapon": "branch_4_medic:TalentToxicologyWeapon",
+    "remedy_bad": "branch_4_medic:TalentRemedyBad",
+    "organ_striking": "branch_4_medic:TalentOrganStriking",
+    "advanced_toxicology": "branch_4_medic:TalentAdvancedToxicology",
+    "you_wont_die_bad": "branch_4_medic:TalentYouWontDieBad",
+    "medical_jargon": "branch_4_medic:TalentMedicalJargon",
+    "christmas_tree": "branch_4_medic:TalentChristmasTree",
+    "insane_zeal": "branch_4_medic:TalentInsaneZeal",
+    "genius_toxicologist": "branch_4_medic:TalentGeniusToxicologist",
 
 # === ВЕТКА 5: БЕРСЕРК ===
-    "naked_defense": TalentNakedDefense(),
-    "vengeful_payback": TalentVengefulPayback(),
-    "berserker_rage": TalentBerserkerRage(),
-    "naked_defense_2": TalentNakedDefense2(),
-    "calm_mind": TalentCalmMind(),
-    "frenzy": TalentFrenzy(),
-    "catch_breath": TalentCatchBreath(),
-    "raging_fury": TalentRagingFury(),
-    "full_concentration": TalentFullConcentration(),
-    "naked_defense_3": TalentNakedDefense3(),
-    "descending_into_madness": TalentDescendingIntoMadness(),
-    "steady_hand": TalentSteadyHand(),
-    "key_moment": TalentKeyMoment(),
-    "second_wind_berserk": TalentSecondWindBerserk(),
-    "die_hard": TalentDieHard(),
+    "naked_defense": "branch_5_berseker:TalentNakedDefense",
+    "vengeful_payback": "branch_5_berseker:TalentVengefulPayback",
+    "berserker_rage": "branch_5_berseker:TalentBerserkerRage",
+    "naked_defense_2": "branch_5_berseker:TalentNakedDefense2",
+    "calm_mind": "branch_5_berseker:TalentCalmMind",
+    "frenzy": "branch_5_berseker:TalentFrenzy",
+    "catch_breath": "branch_5_berseker:TalentCatchBreath",
+    "raging_fury": "branch_5_berseker:TalentRagingFury",
+    "full_concentration": "branch_5_berseker:TalentFullConcentration",
+    "naked_defense_3": "branch_5_berseker:TalentNakedDefense3",
+    "descending_into_madness": "branch_5_berseker:TalentDescendingIntoMadness",
+    "steady_hand": "branch_5_berseker:TalentSteadyHand",
+    "key_moment": "branch_5_berseker:TalentKeyMoment",
+    "second_wind_berserk": "branch_5_berseker:TalentSecondWindBerserk",
+    "die_hard": "branch_5_berseker:TalentDieHard",
 
 # === ВЕТКА 6: ДЫМОВОЙ ЭКСПЕРТ ===
-    "hiding_in_smoke": TalentHidingInSmoke(),
-    "smoke_universality": TalentSmokeUniversality(),
-    "aerial_foot": TalentAerialFoot(),
-    "smoke_screen": TalentSmokeScreen(),
-    "recycling": TalentRecycling(),
-    "self_preservation": TalentSelfPreservation(),
-    "cleansing": TalentCleansing(),
-    "experienced_smoker": TalentExperiencedSmoker(),
-    "lung_processing": TalentLungProcessing(),
-    "to_narnia": TalentToNarnia(),
-    "smoke_advantage": TalentSmokeAdvantage(),
-    "vulnerability_smoke": TalentVulnerabilitySmoke(),
-    "thick_smoke": TalentThickSmoke(),
-    "smoke_and_mirrors": TalentSmokeAndMirrors(),
+    "hiding_in_smoke": "branch_6_smoker:TalentHidingInSmoke",
+    "smoke_universality": "branch_6_smoker:TalentSmokeUniversality",
+    "aerial_foot": "branch_6_smoker:TalentAerialFoot",
+    "smoke_screen": "branch_6_smoker:TalentSmokeScreen",
+    "recycling": "branch_6_smoker:TalentRecycling",
+    "self_preservation": "branch_6_smoker:TalentSelfPreservation",
+    "cleansing": "branch_6_smoker:TalentCleansing",
+    "experienced_smoker": "branch_6_smoker:TalentExperiencedSmoker",
+    "lung_processing": "branch_6_smoker:TalentLungProcessing",
+    "to_narnia": "branch_6_smoker:TalentToNarnia",
+    "smoke_advantage": "branch_6_smoker:TalentSmokeAdvantage",
+    "vulnerability_smoke": "branch_6_smoker:TalentVulnerabilitySmoke",
+    "thick_smoke": "branch_6_smoker:TalentThickSmoke",
+    "smoke_and_mirrors": "branch_6_smoker:TalentSmokeAndMirrors",
 
 # === ВЕТКА 7: ПОКРОВИТЕЛЬ УДАЧИ ===
-    "deal_with_fortune": TalentDealWithFortune(),
-    "second_chance": TalentSecondChance(),
-    "sequential_luck": TalentSequentialLuck(),
-    "lucky_bastard": TalentLuckyBastard(),
-    "not_luck_just_skill": TalentJustSkill(),
-    "raise_stakes": TalentRaiseStakes(),
-    "azino_777": TalentAzino777(),
-    "blessed_by_fate": TalentBlessedByFate(),
-    "ace_sleeve": TalentAceSleeve(),
-    "impossible_possible": TalentImpossiblePossible(),
+    "deal_with_fortune": "branch_7_luck:TalentDealWithFortune",
+    "second_chance": "branch_7_luck:TalentSecondChance",
+    "sequential_luck": "branch_7_luck:TalentSequentialLuck",
+    "lucky_bastard": "branch_7_luck:TalentLuckyBastard",
+    "not_luck_just_skill": "branch_7_luck:TalentJustSkill",
+    "raise_stakes": "branch_7_luck:TalentRaiseStakes",
+    "azino_777": "branch_7_luck:TalentAzino777",
+    "blessed_by_fate": "branch_7_luck:TalentBlessedByFate",
+    "ace_sleeve": "branch_7_luck:TalentAceSleeve",
+    "impossible_possible": "branch_7_luck:TalentImpossiblePossible",
 
 # === ВЕТКА 8: ВОЕННЫЙ ===
-    "athletic": TalentAthletic(), # Обновили класс
-    "fast_hands": TalentFastHands(),
-    "leader": TalentLeader(),
-    "addiction_is_a_bitch": TalentAddiction(),
-    "rapid_retreat": TalentRapidRetreat(),
-    "combat_reload": TalentCombatReload(),
-    "find_vulnerability": TalentFindVulnerability(),
-    "borrowed_time": TalentBorrowedTime(),
-    "iron_formation": TalentIronFormation(),
-    "last_hope": TalentLastHope(),
+    "athletic": "branch_8_military:TalentAthletic", # Обновили класс
+    "fast_hands": "branch_8_military:TalentFastHands",
+    "leader": "branch_8_military:TalentLeader",
+    "addiction_is_a_bitch": "branch_8_military:TalentAddiction",
+    "rapid_retreat": "branch_8_military:TalentRapidRetreat",
+    "combat_reload": "branch_8_military:TalentCombatReload",
+    "find_vulnerability": "branch_8_military:TalentFindVulnerability",
+    "borrowed_time": "branch_8_military:TalentBorrowedTime",
+    "iron_formation": "branch_8_military:TalentIronFormation",
+    "last_hope": "branch_8_military:TalentLastHope",
 
     # === ВЕТКА 9: СКИТАЛЕЦ ТЕНЕЙ / КРОВОЖАДНЫЙ ===
-    "athleticism_shadow": TalentAthleticismShadow(),
-    "revenge": TalentRevenge(),
-    "not_great_attention": TalentNotGreatAttention(),
-    "formidable_person": TalentFormidablePerson(),
-    "smashing_blade": TalentSmashingBlade(),
-    "slaughter": TalentSlaughter(),
-    "trapmaster": TalentTrapmaster(),
-    "fast_and_silent": TalentFastAndSilent(),
-    "aggressive_parry": TalentAggressiveParry(),
-    "step_into_shadow": TalentStepIntoShadow(),
-    "taste_of_victory": TalentTasteOfVictory(),
-    "sleight_of_hand": TalentSleightOfHand(),
-    "cat_reflexes": TalentCatReflexes(),
-    "endurance_lessons": TalentEnduranceLessons(),
-    "eye_for_danger": TalentEyeForDanger(),
-    "cold_blooded": TalentColdBlooded(),
-    "identity_thief": TalentIdentityThief(),
-    "covering_tracks": TalentCoveringTracks(),
-    "competent_adrenaline": TalentCompetentAdrenaline(),
-    "knife_in_back": TalentKnifeInBack(),
-    "oppression": TalentOppression(),
-    "vulnerability_point": TalentVulnerabilityPoint(),
-    "extreme_measures": TalentExtremeMeasures(),
-    "butcher": TalentButcher(),
+    "athleticism_shadow": "branch_9_shadow:TalentAthleticismShadow",
+    "revenge": "branch_9_shadow:TalentRevenge",
+    "not_great_attention": "branch_9_shadow:TalentNotGreatAttention",
+    "formidable_person": "branch_9_shadow:TalentFormidablePerson",
+    "smashing_blade": "branch_9_shadow:TalentSmashingBlade",
+    "slaughter": "branch_9_shadow:TalentSlaughter",
+    "trapmaster": "branch_9_shadow:TalentTrapmaster",
+    "fast_and_silent": "branch_9_shadow:TalentFastAndSilent",
+    "aggressive_parry": "branch_9_shadow:TalentAggressiveParry",
+    "step_into_shadow": "branch_9_shadow:TalentStepIntoShadow",
+    "taste_of_victory": "branch_9_shadow:TalentTasteOfVictory",
+    "sleight_of_hand": "branch_9_shadow:TalentSleightOfHand",
+    "cat_reflexes": "branch_9_shadow:TalentCatReflexes",
+    "endurance_lessons": "branch_9_shadow:TalentEnduranceLessons",
+    "eye_for_danger": "branch_9_shadow:TalentEyeForDanger",
+    "cold_blooded": "branch_9_shadow:TalentColdBlooded",
+    "identity_thief": "branch_9_shadow:TalentIdentityThief",
+    "covering_tracks": "branch_9_shadow:TalentCoveringTracks",
+    "competent_adrenaline": "branch_9_shadow:TalentCompetentAdrenaline",
+    "knife_in_back": "branch_9_shadow:TalentKnifeInBack",
+    "oppression": "branch_9_shadow:TalentOppression",
+    "vulnerability_point": "branch_9_shadow:TalentVulnerabilityPoint",
+    "extreme_measures": "branch_9_shadow:TalentExtremeMeasures",
+    "butcher": "branch_9_shadow:TalentButcher",
 
 # === ВЕТКА 10: ЭНЕРГЕТИЧЕСКИЙ ВОИН ===
-    "electrician": TalentElectrician(),
-    "pain_points": TalentPainPoints(),
-    "mechanical_energy": TalentMechanicalEnergy(),
-    "pain_shock": TalentPainShock(),
-    "emergency_protection": TalentEmergencyProtection(),
-    "static_electricity": TalentStaticElectricity(),
-    "entering_rhythm": TalentEnteringRhythm(),
-    "dirty_tricks": TalentDirtyTricks(),
-    "playing_on_nerves": TalentPlayingOnNerves(),
-    "overvoltage": TalentOvervoltage(),
-    "em_field": TalentEMField(),
-    "with_caution": TalentWithCaution(),
-    "sharp_eye": TalentSharpEye(),
-    "team_player": TalentTeamPlayer(),
-    "arrest": TalentArrest(),
-    "battery": TalentBattery(),
-    "grounding": TalentGrounding(),
-    "feint": TalentFeint(),
-    "weak_point_energy": TalentWeakPointEnergy(),
-    "rupture_application": TalentRuptureApplication(),
-    "rifting_space": TalentRiftingSpace(),
-    "capacitor": TalentCapacitor(),
-    "achilles_heel": TalentAchillesHeel(),
-    "no_mistakes": TalentNoMistakes(),
-    "short_circuit": TalentShortCircuit(),
-    "pride_of_seven": TalentPrideOfSeven(),
+    "electrician": "branch_10_energy:TalentElectrician",
+    "pain_points": "branch_10_energy:TalentPainPoints",
+    "mechanical_energy": "branch_10_energy:TalentMechanicalEnergy",
+    "pain_shock": "branch_10_energy:TalentPainShock",
+    "emergency_protection": "branch_10_energy:TalentEmergencyProtection",
+    "static_electricity": "branch_10_energy:TalentStaticElectricity",
+    "entering_rhythm": "branch_10_energy:TalentEnteringRhythm",
+    "dirty_tricks": "branch_10_energy:TalentDirtyTricks",
+    "playing_on_nerves": "branch_10_energy:TalentPlayingOnNerves",
+    "overvoltage": "branch_10_energy:TalentOvervoltage",
+    "em_field": "branch_10_energy:TalentEMField",
+    "with_caution": "branch_10_energy:TalentWithCaution",
+    "sharp_eye": "branch_10_energy:TalentSharpEye",
+    "team_player": "branch_10_energy:TalentTeamPlayer",
+    "arrest": "branch_10_energy:TalentArrest",
+    "battery": "branch_10_energy:TalentBattery",
+    "grounding": "branch_10_energy:TalentGrounding",
+    "feint": "branch_10_energy:TalentFeint",
+    "weak_point_energy": "branch_10_energy:TalentWeakPointEnergy",
+    "rupture_application": "branch_10_energy:TalentRuptureApplication",
+    "rifting_space": "branch_10_energy:TalentRiftingSpace",
+    "capacitor": "branch_10_energy:TalentCapacitor",
+    "achilles_heel": "branch_10_energy:TalentAchillesHeel",
+    "no_mistakes": "branch_10_energy:TalentNoMistakes",
+    "short_circuit": "branch_10_energy:TalentShortCircuit",
+    "pride_of_seven": "branch_10_energy:TalentPrideOfSeven",
 
 # === ВЕТКА 11: НЕУГАСИМОЕ ПЛАМЯ ===
-    "strike_iron_hot": TalentStrikeWhileIronHot(),
-    "spark": TalentSpark(),
-    "cauterization": TalentCauterization(),
-    "hot_talent": TalentHot(),
-    "body_adaptation": TalentBodyAdaptation(),
-    "hearth_of_power": TalentHearthOfPower(),
-    "ashes_to_ashes": TalentAshesToAshes(),
-    "hellfire": TalentHellfire(),
-    "wildfire": TalentWildfire(),
-    "fiery_temper": TalentFieryTemper(),
-    "ifrit": TalentIfrit(),
-    "phoenix": TalentPhoenix(),
-    "firestorm": TalentFirestorm(),
-    "burn_me_down": TalentBurnMeDown(),
+    "strike_iron_hot": "branch_11_flame:TalentStrikeWhileIronHot",
+    "spark": "branch_11_flame:TalentSpark",
+    "cauterization": "branch_11_flame:TalentCauterization",
+    "hot_talent": "branch_11_flame:TalentHot",
+    "body_adaptation": "branch_11_flame:TalentBodyAdaptation",
+    "hearth_of_power": "branch_11_flame:TalentHearthOfPower",
+    "ashes_to_ashes": "branch_11_flame:TalentAshesToAshes",
+    "hellfire": "branch_11_flame:TalentHellfire",
+    "wildfire": "branch_11_flame:TalentWildfire",
+    "fiery_temper": "branch_11_flame:TalentFieryTemper",
+    "ifrit": "branch_11_flame:TalentIfrit",
+    "phoenix": "branch_11_flame:TalentPhoenix",
+    "firestorm": "branch_11_flame:TalentFirestorm",
+    "burn_me_down": "branch_11_flame:TalentBurnMeDown",
 
 # === ВЕТКА 12: ТЕХНОЛОГ ===
-    "projection": TalentProjection(),
-    "hacker": TalentHacker(),
-    "little_helper": TalentLittleHelper(),
-    "programming_languages": TalentProgrammingLanguages(),
-    "portable_shield": TalentPortableShield(),
-    "energy_cycle": TalentEnergyCycle(),
-    "modulation": TalentModulation(),
-    "access_point": TalentAccessPoint(),
-    "error_404": TalentError404(),
-    "ass_hack": TalentAssHack(),
+    "projection": "branch_12_technologist:TalentProjection",
+    "hacker": "branch_12_technologist:TalentHacker",
+    "little_helper": "branch_12_technologist:TalentLittleHelper",
+    "programming_languages": "branch_12_technologist:TalentProgrammingLanguages",
+    "portable_shield": "branch_12_technologist:TalentPortableShield",
+    "energy_cycle": "branch_12_technologist:TalentEnergyCycle",
+    "modulation": "branch_12_technologist:TalentModulation",
+    "access_point": "branch_12_technologist:TalentAccessPoint",
+    "error_404": "branch_12_technologist:TalentError404",
+    "ass_hack": "branch_12_technologist:TalentAssHack",
 
 # === ВЕТКА 13: РОБОТОТЕХНИК ===
-    "best_friends_forever": TalentBestFriendsForever(),
-    "little_big_trouble": TalentLittleBigTrouble(),
-    "cell_expander": TalentCellExpander(),
-    "no_first_law": TalentNoFirstLaw(),
-    "bright_talent": TalentBrightTalent(),
-    "smaller_lighter_faster": TalentSmallerLighterFaster(),
-    "frame_upgrade": TalentFrameUpgrade(),
-    "made_to_last": TalentMadeToLast(),
-    "chimera_core": TalentChimeraCore(),
-    "upshot_robot": TalentUpshotRobot(),
-    "quantum_hub": TalentQuantumHub(),
-    "jack_of_all_trades": TalentJackOfAllTrades(),
-    "machina_ex_deo": TalentMachinaExDeo(),
-    "exogenesis_protocol": TalentExogenesisProtocol(),
-    "multi_connection": TalentMultiConnection(),
+    "best_friends_forever": "branch_13_roboticist:TalentBestFriendsForever",
+    "little_big_trouble": "branch_13_roboticist:TalentLittleBigTrouble",
+    "cell_expander": "branch_13_roboticist:TalentCellExpander",
+    "no_first_law": "branch_13_roboticist:TalentNoFirstLaw",
+    "bright_talent": "branch_13_roboticist:TalentBrightTalent",
+    "smaller_lighter_faster": "branch_13_roboticist:TalentSmallerLighterFaster",
+    "frame_upgrade": "branch_13_roboticist:TalentFrameUpgrade",
+    "made_to_last": "branch_13_roboticist:TalentMadeToLast",
+    "chimera_core": "branch_13_roboticist:TalentChimeraCore",
+    "upshot_robot": "branch_13_roboticist:TalentUpshotRobot",
+    "quantum_hub": "branch_13_roboticist:TalentQuantumHub",
+    "jack_of_all_trades": "branch_13_roboticist:TalentJackOfAllTrades",
+    "machina_ex_deo": "branch_13_roboticist:TalentMachinaExDeo",
+    "exogenesis_protocol": "branch_13_roboticist:TalentExogenesisProtocol",
+    "multi_connection": "branch_13_roboticist:TalentMultiConnection",
 
 # === ВЕТКА 14: ОШЕЛОМЛЯЮЩАЯ ТРЯСКА ===
-    "fight_to_the_end": TalentFightToTheEnd(),
-    "share_with_friend": TalentShareWithFriend(),
-    "carelessness": TalentCarelessness(),
-    "pass_the_fare": TalentPassTheFare(),
-    "own_tremor": TalentOwnTremor(),
-    "readiness_for_everything": TalentReadinessForEverything(),
-    "keep_going": TalentKeepGoing(),
-    "resonance": TalentResonance(),
-    "immobile": TalentImmobile(),
-    "tremor_to_bone": TalentTremorToBone(),
+    "fight_to_the_end": "branch_14_tremor:TalentFightToTheEnd",
+    "share_with_friend": "branch_14_tremor:TalentShareWithFriend",
+    "carelessness": "branch_14_tremor:TalentCarelessness",
+    "pass_the_fare": "branch_14_tremor:TalentPassTheFare",
+    "own_tremor": "branch_14_tremor:TalentOwnTremor",
+    "readiness_for_everything": "branch_14_tremor:TalentReadinessForEverything",
+    "keep_going": "branch_14_tremor:TalentKeepGoing",
+    "resonance": "branch_14_tremor:TalentResonance",
+    "immobile": "branch_14_tremor:TalentImmobile",
+    "tremor_to_bone": "branch_14_tremor:TalentTremorToBone",
 
 # === СВЯЗИ (LINK TALENTS) ===
-    "censer": TalentCenser(),
-    "ardent_defense": TalentArdentDefense(),
-    "hitman_assortment": TalentHitmanAssortment(),
-    "thermal_energy": TalentThermalEnergy(),
-    "scorching_mastery": TalentScorchingMastery(),
-}
+    "censer": "link_talents:TalentCenser",
+    "ardent_defense": "link_talents:TalentArdentDefense",
+    "hitman_assortment": "link_talents:TalentHitmanAssortment",
+    "thermal_energy": "link_talents:TalentThermalEnergy",
+    "scorching_mastery": "link_talents:TalentScorchingMastery",
+})
@@ -317,8 +317,8 @@ class TalentArrest(BasePassive):
     def _get_battle_targets(self):
         """Возвращает всех участников боя (левая + правая команды), если симулятор запущен."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams  # type: ignore
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams()
             return (l_team or []) + (r_team or [])
         except Exception:
             return []
@@ -535,8 +535,8 @@ class TalentAchillesHeel(BasePassive):
     def _get_battle_targets(self):
         """Возвращает всех участников боя (враги), аналогично Аресту."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams  # type: ignore
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams()
             return (l_team or []) + (r_team or [])
         except Exception:
             return []
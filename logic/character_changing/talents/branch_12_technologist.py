@@ -1,4 +1,5 @@
 from core.logging import logger, LogLevel  # [NEW] Import
+from logic.battle_flow.session import get_rng
 from logic.character_changing.passives.base_passive import BasePassive
 
 
@@ -37,8 +38,7 @@ class TalentHacker(BasePassive):
         # Заглушка механики взлома
         # Нужно выбрать цель, кинуть дайс и сравнить
         prog = unit.skills.get("programming", 0)
-        import random
-        roll = random.randint(1, 20) + prog
+        roll = get_rng(unit).randint(1, 20) + prog
         if log_func: log_func(f"💻 **Взлом**: Бросок {roll} (1d20+{prog}).")
         logger.log(f"💻 Hacker attempt by {unit.name}: Roll {roll}", LogLevel.NORMAL, "Talent")
         return True
@@ -1,6 +1,5 @@
-import random
-
 from core.logging import logger, LogLevel  # [NEW] Import
+from logic.battle_flow.session import get_rng
 from logic.character_changing.passives.base_passive import BasePassive
 
 
@@ -143,7 +142,7 @@ class TalentKeepGoing(BasePassive):
             tremor = unit.get_status("tremor")
             if tremor > 0:
                 # Шанс спасения (Заглушка броска, допустим d20)
-                roll = random.randint(1, 20)
+                roll = get_rng(unit).randint(1, 20)
                 if roll < tremor:
                     # Спасение!
                     unit.current_hp = 1  # Не умираем
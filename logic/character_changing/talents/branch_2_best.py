@@ -1,9 +1,9 @@
 import copy
-import random
 
 from core.enums import DiceType, CardType
 from core.library import Library
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
 from logic.character_changing.passives.base_passive import BasePassive
 
 # ======================================================================================
@@ -82,10 +82,10 @@ class TalentCelestialEyes(BasePassive):
 #todo переделать, расчет идёт без учета бонусов
         # 2. Расчет бросков
         my_wis = unit.attributes.get("wisdom", 0)
-        my_roll = random.randint(1, 20) + my_wis
+        my_roll = get_rng(unit).randint(1, 20) + my_wis
 
         target_wis = getattr(target, "attributes", {}).get("wisdom", 0)
-        target_roll = random.randint(1, 20) + target_wis
+        target_roll = get_rng(unit).randint(1, 20) + target_wis
 
         diff = my_roll - target_roll
 
@@ -320,7 +320,7 @@ class TalentCopycatInsight(BasePassive):
         copied_card.description = f"✨ [Копия] {copied_card.description}"
 
         # 3. Регистрируем уникальную временную карту
-        temp_id = f"{card_id}_copy_{unit.name}_{len(unit.deck)}_{random.randint(100, 999)}"
+        temp_id = f"{card_id}_copy_{unit.name}_{len(unit.deck)}_{get_rng(unit).randint(100, 999)}"
 
         copied_card.id = temp_id
         Library.register(copied_card)  # Регистрируем в памяти
@@ -359,8 +359,8 @@ class TalentIdealStandard(BasePassive):
     def _count_active_allies(self, unit):
         """Подсчитывает активных союзников на поле боя (живые и не оглушенные)."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
 
             # Определяем команду юнита
             my_team = None
@@ -397,8 +397,8 @@ class TalentIdealStandard(BasePassive):
     def _get_active_allies(self, unit):
         """Возвращает список активных союзников на поле боя."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
 
             # Определяем команду юнита
             my_team = None
@@ -570,8 +570,8 @@ class TalentArrogantTaunt(BasePassive):
         """Получает список всех юнитов в текущей симуляции."""
         try:
             # Ленивый импорт для предотвращения циклических зависимостей
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams()
             return (l_team or []) + (r_team or [])
         except ImportError:
             return []
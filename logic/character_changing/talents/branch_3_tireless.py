@@ -182,7 +182,7 @@ class TalentBigHeart(BasePassive):
         Вспомогательный метод для поиска союзников.
         Приоритет:
         1. Переданные аргументы (kwargs) - для тестов.
-        2. Глобальное состояние симулятора (get_teams) - для игры.
+        2. Сессия боя (get_battle_teams) - для игры.
         """
         # 1. Если передали явно (например, в тесте)
         if kwargs_allies:
@@ -190,8 +190,8 @@ class TalentBigHeart(BasePassive):
 
         # 2. Пытаемся достать из движка
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
 
             # Ищем, в какой команде наш юнит
             if unit in (l_team or []):
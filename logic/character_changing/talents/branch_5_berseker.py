@@ -2,6 +2,7 @@ from core.dice import Dice
 from core.enums import DiceType
 from core.logging import logger, LogLevel  # [NEW] Import
 from core.ranks import get_base_roll_by_level
+from logic.battle_flow.session import get_rng
 from logic.character_changing.passives.base_passive import BasePassive
 
 
@@ -425,8 +426,7 @@ class TalentDieHard(BasePassive):
         # Реализуем "Иммунитет к негативу"
         # Если куб абсолютный (эмулируем каждый 3-й куб или просто рандомно 33%)
         # Для простоты: 33% шанс что куб "Абсолютный"
-        import random
-        if random.random() < 0.33:
+        if get_rng(ctx).random() < 0.33:
             # Снимаем штрафы силы, если они есть (power < 0)
             # В текущей архитектуре это сложно отменить постфактум,
             # но мы можем добавить компенсирующий бонус
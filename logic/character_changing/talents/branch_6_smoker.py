@@ -175,17 +175,10 @@ class TalentSmokeScreen(BasePassive):
         # 2. Поиск врагов (автоматически или через аргументы)
         enemies = kwargs.get("enemies")
         if enemies is None:
-            try:
-                import streamlit as st
-                if hasattr(st, 'session_state'):
-                    l_team = st.session_state.get('team_left', [])
-                    r_team = st.session_state.get('team_right', [])
-                    if unit in l_team:
-                        enemies = r_team
-                    elif unit in r_team:
-                        enemies = l_team
-            except ImportError:
-                pass
+            from logic.battle_flow.session import get_session
+            session = get_session(unit)
+            if session:
+                _, enemies = session.get_sides(unit)
 
         if not enemies:
             if log_func: log_func(f"⚠️ {self.name}: Нет целей.")
@@ -1,8 +1,8 @@
 import os
 import json
-import random
 
 from core.logging import logger, LogLevel  # [NEW] Import
+from logic.battle_flow.session import get_rng
 from logic.character_changing.passives.base_passive import BasePassive
 
 
@@ -106,7 +106,7 @@ class TalentLuckyBastard(BasePassive):
             return amount
 
         # Бросаем 1d5
-        roll = random.randint(1, 5)
+        roll = get_rng(unit).randint(1, 5)
 
         # Если выпала 5 (20% шанс)
         if roll == 5:
@@ -137,7 +137,7 @@ class TalentLuckyBastard(BasePassive):
                 unit.deck.remove(old_item)
 
         # 1. Проверка шанса (25%)
-        if random.random() > 0.25:
+        if get_rng(unit).random() > 0.25:
             return
 
         # 2. Список файлов для лута
@@ -170,7 +170,7 @@ class TalentLuckyBastard(BasePassive):
 
         # 4. Выдача награды
         if loot_pool:
-            found_id = random.choice(loot_pool)
+            found_id = get_rng(unit).choice(loot_pool)
 
             # Добавляем в руку/колоду
             unit.deck.append(found_id)
@@ -273,7 +273,7 @@ class TalentRaiseStakes(BasePassive):
             return False
 
         # Бросок 1d21
-        roll = random.randint(1, 21)
+        roll = get_rng(unit).randint(1, 21)
         unit.cooldowns[self.id] = self.cooldown
 
         # === ВАРИАНТ 1: ПРОВАЛ (1-6) ===
@@ -317,7 +317,7 @@ class TalentRaiseStakes(BasePassive):
         # === ВАРИАНТ 3: ОБЫЧНЫЙ УСПЕХ ===
         else:
             # Случайный бафф
-            buff = random.choice(["attack_power_up", "endurance", "haste"])
+            buff = get_rng(unit).choice(["attack_power_up", "endurance", "haste"])
             unit.add_status(buff, 1, duration=3)
 
             if log_func:
@@ -470,7 +470,7 @@ class TalentAzino777(BasePassive):
             if val > 0:
                 final_slots.append(val)
             else:
-                final_slots.append(random.randint(1, 7))
+                final_slots.append(get_rng(unit).randint(1, 7))
 
         slots_str = " | ".join([f"[{x}]" for x in final_slots])
         if log_func: log_func(f"🎰 **Вращение...** {slots_str}")
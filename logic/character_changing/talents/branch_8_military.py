@@ -75,8 +75,8 @@ class TalentLeader(BasePassive):
     def _get_active_allies(self, unit):
         """Возвращает список активных союзников на поле боя."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
 
             # Определяем команду юнита
             my_team = None
@@ -293,8 +293,8 @@ class TalentBorrowedTime(BasePassive):
         
         # Получаем команду
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
 
             my_team = None
             if unit in (l_team or []):
@@ -361,8 +361,8 @@ class TalentIronFormation(BasePassive):
         bonus_per_leader = 3
         
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
 
             # Определяем команду
             my_team = None
@@ -429,8 +429,8 @@ class TalentIronFormation(BasePassive):
             return False
 
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
 
             # Определяем команду
             my_team = None
@@ -491,8 +491,8 @@ class TalentLastHope(BasePassive):
     def _has_active_allies(self, unit):
         """Проверяет наличие активных союзников на поле боя."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
             
             # Определяем команду юнита
             my_team = None
@@ -1,8 +1,7 @@
-import random
-
 from core.enums import DiceType
 from core.logging import logger, LogLevel  # [NEW] Import
 from core.tree_data import SKILL_TREE
+from logic.battle_flow.session import get_rng
 from logic.character_changing.passives.base_passive import BasePassive
 from logic.context import RollContext
 
@@ -159,7 +158,7 @@ class TalentSmashingBlade(BasePassive):
             bleed_stack = 0
             rolls = []
             for _ in range(x_count):
-                r = random.randint(1, 6)
+                r = get_rng(unit).randint(1, 6)
                 bleed_stack += r
                 rolls.append(str(r))
 
@@ -635,8 +634,8 @@ class TalentExtremeMeasures(BasePassive):
     def _get_battle_targets(self):
         """Возвращает всех участников боя (левая + правая команды)."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams  # type: ignore
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams()
             return (l_team or []) + (r_team or [])
         except Exception:
             return []
@@ -644,8 +643,8 @@ class TalentExtremeMeasures(BasePassive):
     def _get_enemy_team(self, unit):
         """Возвращает команду врагов для данного юнита."""
         try:
-            from ui.simulator.logic.simulator_logic import get_teams  # type: ignore
-            l_team, r_team = get_teams()
+            from logic.battle_flow.session import get_battle_teams
+            l_team, r_team = get_battle_teams(unit)
             if unit in (l_team or []):
                 return r_team or []
             elif unit in (r_team or []):
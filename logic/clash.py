@@ -2,6 +2,7 @@ from core.logging import logger, LogLevel
 from logic.battle_flow.clash.clash_flow import ClashFlowMixin
 from logic.battle_flow.executor import execute_single_action
 from logic.battle_flow.lifecycle import prepare_turn, finalize_turn
+from logic.battle_flow.session import BattleSession
 from logic.battle_flow.targeting import calculate_redirections
 
 
@@ -11,7 +12,9 @@ class ClashSystem(ClashFlowMixin):
     Делегирует задачи специализированным модулям.
     """
 
-    def __init__(self):
+    def __init__(self, session: BattleSession = None):
+        # Сессия боя: команды, раунд, RNG и сыгранные слоты. Без неё создаем пустую (headless).
+        self.session = session if session is not None else BattleSession()
         self.logs = []
 
     def log(self, message):
@@ -24,19 +27,26 @@ class ClashSystem(ClashFlowMixin):
     def calculate_redirections(atk_team: list, def_team: list):
         return calculate_redirections(atk_team, def_team)
 
-    def prepare_turn(self, team_left: list, team_right: list):
+    def prepare_turn(self, team_left: list = None, team_right: list = None):
+        if team_left is None: team_left = self.session.team_left
+        if team_right is None: team_right = self.session.team_right
         return prepare_turn(self, team_left, team_right)
 
-    def execute_single_action(self, act, executed_slots):
+    def execute_single_action(self, act, executed_slots=None):
+        if executed_slots is None: executed_slots = self.session.executed_slots
         return execute_single_action(self, act, executed_slots)
 
     def finalize_turn(self, all_units: list):
         return finalize_turn(self, all_units)
 
-    def resolve_turn(self, team_left: list, team_right: list):
+    def resolve_turn(self, team_left: list = None, team_right: list = None):
         """
         ГЛАВНЫЙ МЕТОД (Pipeline).
+        Без аргументов разыгрывает ход команд из сессии.
         """
+        if team_left is None: team_left = self.session.team_left
+        if team_right is None: team_right = self.session.team_right
+
         logger.log(">>> RESOLVE TURN START <<<", LogLevel.NORMAL, "System")
 
         full_report = []
@@ -45,8 +55,9 @@ class ClashSystem(ClashFlowMixin):
         init_logs, actions = self.prepare_turn(team_left, team_right)
         full_report.extend(init_logs)
 
-        # Множество сыгранных слотов
+        # Множество сыгранных слотов (новый ход — новое множество)
         executed_slots = set()
+        self.session.executed_slots = executed_slots
 
         # 2. Выполнение
         for act in actions:
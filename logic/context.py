@@ -4,6 +4,8 @@ from typing import List, Optional, Tuple
 from core.dice import Dice
 from core.enums import DiceType
 from core.logging import logger, LogLevel  # [NEW] Для логов
+from logic.calculations.base_calc import get_flat
+from logic.calculations.modifiers import Stat
 
 
 @dataclass
@@ -37,6 +39,9 @@ class RollContext:
     is_critical: bool = False
     is_disadvantage: bool = False
 
+    # Сессия боя (BattleSession), в рамках которой сделан бросок. Скрипты берут из неё команды.
+    session: Optional['BattleSession'] = None
+
     # =========================================================================
     # ОСНОВНЫЕ МЕТОДЫ БРОСКА
     # =========================================================================
@@ -74,8 +79,9 @@ class RollContext:
 
         # --- 1. ПРОВЕРКА ОТКЛЮЧЕНИЯ (Logic moved from formulas.py) ---
         # Проверяем флаги в модификаторах юнита
-        disable_block = self.source.modifiers.get("disable_block", {}).get("flat", 0) > 0
-        disable_evade = self.source.modifiers.get("disable_evade", {}).get("flat", 0) > 0
+        mods = self.source.modifiers
+        disable_block = get_flat(mods, Stat.DISABLE_BLOCK) > 0
+        disable_evade = get_flat(mods, Stat.DISABLE_EVADE) > 0
 
         # Если Блок отключен -> Штраф -9999 (чтобы результат стал 0)
         if self.dice.dtype == DiceType.BLOCK and disable_block:
@@ -96,14 +102,14 @@ class RollContext:
         if self.dice.dtype in [DiceType.SLASH, DiceType.PIERCE, DiceType.BLUNT]:
             # Атака -> Сила + Мод. Атаки
             base_str = self.source.stats.get("attack_power_up", 0)
-            mod_atk = self.source.modifiers.get("power_attack", {}).get("flat", 0)
+            mod_atk = get_flat(mods, Stat.POWER_ATTACK)
             stat_bonus = base_str + mod_atk
             reason = "Strength"
 
         elif self.dice.dtype == DiceType.BLOCK:
             # Блок -> Стойкость + Мод. Блока
             base_end = self.source.stats.get("endurance", 0)
-            mod_blk = self.source.modifiers.get("power_block", {}).get("flat", 0)
+            mod_blk = get_flat(mods, Stat.POWER_BLOCK)
             stat_bonus = base_end + mod_blk
             reason = "Endurance"
 
@@ -111,7 +117,7 @@ class RollContext:
             # Уклонение -> Акробатика (Навык) + Мод. Уклонения
             # (Или Ловкость, зависит от вашей системы, здесь берем Акробатику как навык)
             base_acro = self.source.skills.get("acrobatics", 0)
-            mod_evd = self.source.modifiers.get("power_evade", {}).get("flat", 0)
+            mod_evd = get_flat(mods, Stat.POWER_EVADE)
             stat_bonus = base_acro + mod_evd
             reason = "Acrobatics"
 #todo щиты
@@ -119,7 +125,7 @@ class RollContext:
             self.modify_power(stat_bonus, reason)
 
         # --- 3. ГЛОБАЛЬНЫЙ БОНУС (Power All) ---
-        power_all = self.source.modifiers.get("power_all", {}).get("flat", 0)
+        power_all = get_flat(mods, Stat.POWER_ALL)
         if power_all != 0:
             self.modify_power(power_all, "Power All")
 
@@ -138,6 +144,7 @@ class RollContext:
         from logic.character_changing.passives import PASSIVE_REGISTRY
         from logic.character_changing.talents import TALENT_REGISTRY
         from logic.statuses.status_definitions import STATUS_REGISTRY
+        from logic.base_effect import implements_hook
 
         for pid in all_ability_ids:
             obj = None
@@ -146,14 +153,14 @@ class RollContext:
             elif pid in TALENT_REGISTRY:
                 obj = TALENT_REGISTRY[pid]
 
-            if obj and hasattr(obj, "on_roll"):
+            if obj and implements_hook(obj, "on_roll"):
                 obj.on_roll(self, stack=stack)
 
         # 2. Статусы
-        for status_id, amount in self.source.statuses.items():
+        for status_id, amount in list(self.source.statuses.items()):
             if amount > 0 and status_id in STATUS_REGISTRY:
                 st_obj = STATUS_REGISTRY[status_id]
-                if hasattr(st_obj, "on_roll"):
+                if implements_hook(st_obj, "on_roll"):
                     st_obj.on_roll(self, stack=amount)  # FIX: передаём amount статуса, а не stack из аргумента
 
     # =========================================================================
@@ -17,11 +17,12 @@ class ClashMechanicsMixin:
     def _process_card_self_scripts(self, trigger: str, source, target, custom_log_list=None, card_override=None):
         # Делегируем выполнение скриптов "на себя"
         # card_override добавлен для поддержки предметов
-        return scripts.process_card_self_scripts(trigger, source, target, custom_log_list, card_override)
+        return scripts.process_card_self_scripts(trigger, source, target, custom_log_list, card_override,
+                                                 session=getattr(self, "session", None))
 
     def _create_roll_context(self, source, target, die, is_disadvantage=False):
         # Создаем контекст броска
-        return create_roll_context(source, target, die, is_disadvantage)
+        return create_roll_context(source, target, die, is_disadvantage, session=getattr(self, "session", None))
 
     def _handle_clash_win(self, ctx):
         logger.log(f"🏆 Clash Win Hook: {ctx.source.name}", LogLevel.VERBOSE, "Mechanics")
@@ -1,14 +1,15 @@
 from core.logging import logger, LogLevel
-from logic.calculations.base_calc import get_modded_value
+from logic.calculations.base_calc import get_final, get_pct
+from logic.calculations.modifiers import Stat
 from logic.mechanics.damage.damage_calc import _calculate_resistance, _calculate_outgoing_damage
 # Импортируем из новых модулей
 from logic.mechanics.damage.damage_utils import _get_attack_info, _apply_resource_damage
 
 
 def _apply_stagger_side_damage(target, attacker_ctx, final_amt):
-    """Наносит побочный урон по Stagger при получении HP урона."""
+    """Наносит побочный урон по Stagger при получении HP урона. Возвращает снятую выносливость."""
     if target.is_staggered() or target.get_status("red_lycoris") > 0:
-        return
+        return 0
 
     dtype, dice_obj = _get_attack_info(attacker_ctx)
 
@@ -22,18 +23,20 @@ def _apply_stagger_side_damage(target, attacker_ctx, final_amt):
     if hasattr(target, "apply_mechanics_filter"):
         stg_base_amt = target.apply_mechanics_filter("modify_incoming_damage", stg_base_amt, damage_type="hp")
 
-    stat_reduction = get_modded_value(0, "damage_take", target.modifiers)
+    stat_reduction = get_final(target.modifiers, Stat.DAMAGE_TAKE)
     stg_after_def = max(0, stg_base_amt - stat_reduction)
 
     stg_dmg = int(stg_after_def * res_stg)
 
-    stg_take_pct = target.modifiers["stagger_take"]["pct"]
+    stg_take_pct = get_pct(target.modifiers, Stat.STAGGER_TAKE)
     if stg_take_pct != 0:
         mod_mult = 1.0 + (stg_take_pct / 100.0)
         stg_dmg = int(stg_dmg * mod_mult)
 
+    before = target.current_stagger
     target.current_stagger = max(0, target.current_stagger - stg_dmg)
     logger.log(f"😵 {target.name} took {stg_dmg} Stagger Side-Damage (Res: {res_stg:.2f})", LogLevel.MINIMAL, "Damage")
+    return before - target.current_stagger
 
 
 def deal_direct_damage(source_ctx, target, amount: int, dmg_type: str, trigger_event_func):
@@ -55,13 +58,13 @@ def deal_direct_damage(source_ctx, target, amount: int, dmg_type: str, trigger_e
     log_list = source_ctx.log if source_ctx else None
 
     if dmg_type == "hp":
-        stat_reduction = get_modded_value(0, "damage_take", target.modifiers)
+        stat_reduction = get_final(target.modifiers, Stat.DAMAGE_TAKE)
         amount_after_def = max(0, amount - stat_reduction)
 
         res, is_stag_hit = _calculate_resistance(target, source_ctx, dtype_name, dice_obj, log_list)
         final_dmg = int(amount_after_def * res)
 
-        threshold = get_modded_value(0, "damage_threshold", target.modifiers)
+        threshold = get_final(target.modifiers, Stat.DAMAGE_THRESHOLD)
 
         if final_dmg < threshold:
             if log_list is not None: log_list.append(f"🛡️ Ignored (<{threshold})")
@@ -80,7 +83,7 @@ def deal_direct_damage(source_ctx, target, amount: int, dmg_type: str, trigger_e
 
     elif dmg_type == "stagger":
         res = getattr(target.hp_resists, dtype_name, 1.0)
-        stg_take_pct = target.modifiers["stagger_take"]["pct"]
+        stg_take_pct = get_pct(target.modifiers, Stat.STAGGER_TAKE)
         mod_mult = 1.0 + (stg_take_pct / 100.0)
 
         final_dmg = int(amount * res * mod_mult)
@@ -176,8 +179,17 @@ def apply_damage(attacker_ctx, defender_ctx, dmg_type="hp",
         # [FIX] Сохраняем результат
         damage_dealt = deal_direct_damage(attacker_ctx, defender, final_amt, "stagger", trigger_event_func)
 
+    side_stagger = 0
     if dmg_type == "hp":
-        _apply_stagger_side_damage(defender, attacker_ctx, final_amt)
+        side_stagger = _apply_stagger_side_damage(defender, attacker_ctx, final_amt)
+
+    # Статистика урона по картам (для симуляций): побочный урон по выносливости тоже идет в колонку stagger
+    session = getattr(attacker_ctx, "session", None) or getattr(attacker, "session", None)
+    if session is not None:
+        card = getattr(attacker, "current_card", None)
+        if isinstance(damage_dealt, (int, float)):
+            session.record_damage(card, damage_dealt, dmg_type)
+        session.record_damage(card, side_stagger, "stagger")
 
     # [FIX] Возвращаем результат
     return damage_dealt
\ No newline at end of file
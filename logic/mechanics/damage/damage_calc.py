@@ -1,4 +1,5 @@
-from logic.calculations.base_calc import get_modded_value
+from logic.calculations.base_calc import get_final
+from logic.calculations.modifiers import Stat
 
 
 def _calculate_resistance(target, source_ctx, dtype_name, dice_obj, log_list=None):
@@ -51,7 +52,7 @@ def _calculate_resistance(target, source_ctx, dtype_name, dice_obj, log_list=Non
 def _calculate_outgoing_damage(attacker, attacker_ctx, dmg_type):
     """Рассчитывает исходящий урон атакующего до применения защиты цели."""
     base_dmg = attacker_ctx.final_value
-    stat_bonus = get_modded_value(0, "damage_deal", attacker.modifiers)
+    stat_bonus = get_final(attacker.modifiers, Stat.DAMAGE_DEAL)
     current_dmg = base_dmg + stat_bonus
 
     if hasattr(attacker, "apply_mechanics_filter"):
@@ -1,11 +1,12 @@
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
 from logic.context import RollContext
 # Импортируем логику из новых файлов
 from logic.mechanics.rolling.rolling_calc import calculate_base_roll, apply_roll_modifiers
 from logic.mechanics.scripts import process_card_scripts
 
 
-def create_roll_context(source, target, die, is_disadvantage=False) -> RollContext:
+def create_roll_context(source, target, die, is_disadvantage=False, session=None) -> RollContext:
     if not die: return None
 
     # === [ОПТИМИЗАЦИЯ] 1. Модификация границ кубика ===
@@ -18,8 +19,9 @@ def create_roll_context(source, target, die, is_disadvantage=False) -> RollConte
         base_max = source.apply_mechanics_filter("modify_dice_max", base_max, die=die)
 
     # === 2. БАЗОВЫЙ БРОСОК (Advantage / Disadvantage) ===
+    rng = session.rng if session is not None else get_rng(source)
     roll, base_val, log_prefix, final_is_disadvantage = calculate_base_roll(
-        source, base_min, base_max, is_disadvantage
+        source, base_min, base_max, is_disadvantage, rng
     )
 
     # Создаем контекст с base_value
@@ -29,7 +31,8 @@ def create_roll_context(source, target, die, is_disadvantage=False) -> RollConte
         dice=die,
         final_value=roll,
         base_value=base_val,
-        is_disadvantage=final_is_disadvantage
+        is_disadvantage=final_is_disadvantage,
+        session=session
     )
 
     if log_prefix:
@@ -60,6 +63,6 @@ def create_roll_context(source, target, die, is_disadvantage=False) -> RollConte
     if hasattr(ctx, 'get_formatted_roll_log'):
         formula_text = ctx.get_formatted_roll_log()
         ctx.log.insert(0, formula_text)
-        logger.log(f"🎲 Final: {ctx.final_value} ({formula_text})", LogLevel.VERBOSE, "Roll")
+        logger.log("🎲 Final: %s (%s)", LogLevel.VERBOSE, "Roll", ctx.final_value, formula_text)
 
     return ctx
\ No newline at end of file
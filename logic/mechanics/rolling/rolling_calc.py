@@ -1,13 +1,31 @@
 from core.enums import DiceType
 from core.logging import logger, LogLevel
-from logic.calculations.base_calc import get_modded_value
+from logic.calculations.base_calc import get_final, get_flat
+from logic.calculations.modifiers import Stat
 from logic.mechanics.rolling.rolling_utils import safe_randint
 from logic.weapon_definitions import WEAPON_REGISTRY
 
+# Модификатор силы по типу оружия (gun использует тот же модификатор, что и ranged)
+_WEAPON_POWER = {
+    "light": Stat.POWER_LIGHT,
+    "medium": Stat.POWER_MEDIUM,
+    "heavy": Stat.POWER_HEAVY,
+    "ranged": Stat.POWER_RANGED,
+    "gun": Stat.POWER_RANGED,
+}
 
-def calculate_base_roll(source, base_min, base_max, is_disadvantage):
+# Бонус конкретного типа атаки
+_DICE_POWER = {
+    DiceType.SLASH: Stat.POWER_SLASH,
+    DiceType.PIERCE: Stat.POWER_PIERCE,
+    DiceType.BLUNT: Stat.POWER_BLUNT,
+}
+
+
+def calculate_base_roll(source, base_min, base_max, is_disadvantage, rng=None):
     """
     Выполняет базовый бросок кубика с учетом Преимущества и Помехи.
+    rng: поток случайных чисел боя.
     Возвращает: (roll, base_val, log_prefix, final_is_disadvantage)
     """
     has_advantage = source.get_status("advantage") > 0
@@ -18,37 +36,37 @@ def calculate_base_roll(source, base_min, base_max, is_disadvantage):
 
     if is_disadvantage and has_advantage:
         # Взаимопоглощение -> Обычный бросок
-        roll = safe_randint(base_min, base_max)
+        roll = safe_randint(base_min, base_max, rng)
         base_val = roll
         log_prefix = "⚖️ **Advantage + Disadvantage** -> Normal"
         source.remove_status("advantage", 1)
-        logger.log(f"⚖️ {source.name}: Adv cancels Disadv. Rolled {roll}", LogLevel.VERBOSE, "Roll")
+        logger.log("⚖️ %s: Adv cancels Disadv. Rolled %s", LogLevel.VERBOSE, "Roll", source.name, roll)
 
     elif is_disadvantage:
         # Помеха (Худший из 2)
-        r1 = safe_randint(base_min, base_max)
-        r2 = safe_randint(base_min, base_max)
+        r1 = safe_randint(base_min, base_max, rng)
+        r2 = safe_randint(base_min, base_max, rng)
         roll = min(r1, r2)
         base_val = roll
         log_prefix = f"📉 **Помеха!** ({r1}, {r2})"
         final_is_disadvantage = True
-        logger.log(f"📉 {source.name}: Disadvantage ({r1}, {r2}) -> {roll}", LogLevel.VERBOSE, "Roll")
+        logger.log("📉 %s: Disadvantage (%s, %s) -> %s", LogLevel.VERBOSE, "Roll", source.name, r1, r2, roll)
 
     elif has_advantage:
         # Преимущество (Лучший из 2)
-        r1 = safe_randint(base_min, base_max)
-        r2 = safe_randint(base_min, base_max)
+        r1 = safe_randint(base_min, base_max, rng)
+        r2 = safe_randint(base_min, base_max, rng)
         roll = max(r1, r2)
         base_val = roll
         log_prefix = f"🍀 **Преимущество!** ({r1}, {r2})"
         source.remove_status("advantage", 1)
-        logger.log(f"🍀 {source.name}: Advantage ({r1}, {r2}) -> {roll}", LogLevel.VERBOSE, "Roll")
+        logger.log("🍀 %s: Advantage (%s, %s) -> %s", LogLevel.VERBOSE, "Roll", source.name, r1, r2, roll)
 
     else:
         # Обычный
-        roll = safe_randint(base_min, base_max)
+        roll = safe_randint(base_min, base_max, rng)
         base_val = roll
-        logger.log(f"🎲 {source.name}: Rolled {roll} [{base_min}-{base_max}]", LogLevel.VERBOSE, "Roll")
+        logger.log("🎲 %s: Rolled %s [%s-%s]", LogLevel.VERBOSE, "Roll", source.name, roll, base_min, base_max)
 
     return roll, base_val, log_prefix, final_is_disadvantage
 
@@ -74,16 +92,17 @@ def apply_roll_modifiers(ctx, source, die):
             ctx.modify_power(override_val, override_reason)
             # Отключаем стандартные бонусы от характеристик (Сила, Стойкость и т.д.)
             skip_standard_stats = True
-            logger.log(f"⚡ Stat Override: Used {override_reason} (+{override_val}), standard stats skipped.", LogLevel.VERBOSE, "Roll")
+            logger.log("⚡ Stat Override: Used %s (+%s), standard stats skipped.", LogLevel.VERBOSE, "Roll",
+                       override_reason, override_val)
 
     # Атака
     if die.dtype in [DiceType.SLASH, DiceType.PIERCE, DiceType.BLUNT]:
         # Общая сила (от стата Strength) - применяем только если нет оверрайда
         if not skip_standard_stats:
-            p_atk = get_modded_value(0, "power_attack", mods)
+            p_atk = get_final(mods, Stat.POWER_ATTACK)
             if p_atk:
                 ctx.modify_power(p_atk, "Сила")
-                logger.log(f"💪 Power Atk Bonus: {p_atk:+}", LogLevel.VERBOSE, "Roll")
+                logger.log("💪 Power Atk Bonus: %+g", LogLevel.VERBOSE, "Roll", p_atk)
 
         # === БОНУС ОРУЖИЯ ===
         current_weapon_id = getattr(source, "weapon_id", "none")
@@ -92,16 +111,7 @@ def apply_roll_modifiers(ctx, source, die):
         if current_weapon_id in WEAPON_REGISTRY:
             weapon_type = WEAPON_REGISTRY[current_weapon_id].weapon_type
 
-        type_to_mod = {
-            "light": "power_light",
-            "medium": "power_medium",
-            "heavy": "power_heavy",
-            "ranged": "power_ranged",
-            "gun": "power_ranged"  # gun использует тот же модификатор что и ranged
-        }
-
-        target_mod_key = type_to_mod.get(weapon_type, "power_light")
-        w_bonus = get_modded_value(0, target_mod_key, mods)
+        w_bonus = get_final(mods, _WEAPON_POWER.get(weapon_type, Stat.POWER_LIGHT))
 
         if w_bonus != 0:
             ru_names = {
@@ -113,32 +123,31 @@ def apply_roll_modifiers(ctx, source, die):
             }
             reason = ru_names.get(weapon_type, "Оружие")
             ctx.modify_power(w_bonus, reason)
-            logger.log(f"⚔️ Weapon Bonus ({weapon_type}): {w_bonus:+}", LogLevel.VERBOSE, "Roll")
+            logger.log("⚔️ Weapon Bonus (%s): %+g", LogLevel.VERBOSE, "Roll", weapon_type, w_bonus)
 
         # Бонус конкретного типа атаки (Slash/Pierce/Blunt)
-        type_key = f"power_{die.dtype.value.lower()}"
-        type_bonus = get_modded_value(0, type_key, mods)
+        type_bonus = get_final(mods, _DICE_POWER[die.dtype])
         if type_bonus:
             ctx.modify_power(type_bonus, f"Bonus {die.dtype.name}")
-            logger.log(f"⚔️ Type Bonus ({die.dtype.name}): {type_bonus:+}", LogLevel.VERBOSE, "Roll")
+            logger.log("⚔️ Type Bonus (%s): %+g", LogLevel.VERBOSE, "Roll", die.dtype.name, type_bonus)
 
     # Блок
     elif die.dtype == DiceType.BLOCK:
         if not skip_standard_stats:
-            p_blk = get_modded_value(0, "power_block", mods)
+            p_blk = get_final(mods, Stat.POWER_BLOCK)
             if p_blk:
                 ctx.modify_power(p_blk, "Стойкость")
-                logger.log(f"🛡️ Block Bonus: {p_blk:+}", LogLevel.VERBOSE, "Roll")
+                logger.log("🛡️ Block Bonus: %+g", LogLevel.VERBOSE, "Roll", p_blk)
 
     # Уворот
     elif die.dtype == DiceType.EVADE:
         if not skip_standard_stats:
-            p_evd = get_modded_value(0, "power_evade", mods)
+            p_evd = get_final(mods, Stat.POWER_EVADE)
             if p_evd:
                 ctx.modify_power(p_evd, "Ловкость")
-                logger.log(f"💨 Evade Bonus: {p_evd:+}", LogLevel.VERBOSE, "Roll")
+                logger.log("💨 Evade Bonus: %+g", LogLevel.VERBOSE, "Roll", p_evd)
 
     # --- ГЛОБАЛЬНЫЙ БОНУС (Power All) ---
-    power_all = mods.get("power_all", {}).get("flat", 0)
+    power_all = get_flat(mods, Stat.POWER_ALL)
     if power_all != 0:
         ctx.modify_power(power_all, "Power All")
\ No newline at end of file
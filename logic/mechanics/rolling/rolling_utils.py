@@ -1,9 +1,12 @@
 import random
 
-def safe_randint(min_val: int, max_val: int) -> int:
+
+def safe_randint(min_val: int, max_val: int, rng=None) -> int:
     """
     Безопасный рандом: если min > max, меняет их местами.
+    rng: поток случайных чисел боя (BattleRNG); по умолчанию — глобальный random.
     """
+    rng = rng or random
     if min_val > max_val:
-        return random.randint(max_val, min_val)
-    return random.randint(min_val, max_val)
\ No newline at end of file
+        return rng.randint(max_val, min_val)
+    return rng.randint(min_val, max_val)
@@ -16,7 +16,7 @@ def process_card_scripts(trigger: str, ctx: RollContext):
             SCRIPTS_REGISTRY[script_id](ctx, params)
 
 
-def process_card_self_scripts(trigger: str, source, target, custom_log_list=None, card_override=None):
+def process_card_self_scripts(trigger: str, source, target, custom_log_list=None, card_override=None, session=None):
     """
     Запускает скрипты самой карты (например, On Use).
 
@@ -27,7 +27,7 @@ def process_card_self_scripts(trigger: str, source, target, custom_log_list=None
     card = card_override if card_override else source.current_card
     if not card or not card.scripts or trigger not in card.scripts: return
     target_log = custom_log_list if custom_log_list is not None else []
-    ctx = RollContext(source=source, target=target, dice=None, final_value=0, log=target_log)
+    ctx = RollContext(source=source, target=target, dice=None, final_value=0, log=target_log, session=session)
 
     for script_data in card.scripts[trigger]:
         script_id = script_data.get("script_id")
@@ -1,4 +1,5 @@
 from logic.context import RollContext
+from logic.base_effect import implements_hook
 from logic.statuses.status_definitions import STATUS_REGISTRY
 
 
@@ -16,7 +17,7 @@ class ModifierSystem:
                 handler = STATUS_REGISTRY[status_id]
 
                 # [FIX] Используем стандартный метод on_roll вместо modify_roll
-                if hasattr(handler, "on_roll"):
+                if implements_hook(handler, "on_roll"):
                     # logger.log(f"Applying status {status_id} (stack {stack})", LogLevel.VERBOSE, "Modifiers")
                     handler.on_roll(context, stack=stack)
 
@@ -1,8 +1,5 @@
-import random
-
-import streamlit as st
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_session, get_rng
 
 
 def calculate_revival_chance(unit):
@@ -26,18 +23,21 @@ def calculate_revival_chance(unit):
     return dc, wp_bonus, penalty
 
 
-def attempt_revive_action(unit):
+def attempt_revive_action(unit, session=None):
     """
     Выполняет механику возрождения.
+    Результат для интерфейса отправляется уведомлением сессии.
     """
+    session = session or get_session(unit)
+
     # Запоминаем раунд попытки (блокировка до конца хода)
-    current_round = st.session_state.get('round_number', 1)
+    current_round = session.round_number if session else 1
     unit.memory["last_revive_attempt_round"] = current_round
 
     dc, wp_bonus, penalty = calculate_revival_chance(unit)
 
     # Бросок 1d6
-    roll = random.randint(1, 6)
+    roll = get_rng(session or unit).randint(1, 6)
 
     # Итоговый результат
     total = roll + wp_bonus - penalty
@@ -68,70 +68,8 @@ def attempt_revive_action(unit):
             unit.current_sp = max(unit.current_sp, heal_sp)
 
         logger.log(f"👼 {unit.name} REVIVED! (Roll {total} vs DC {dc})", LogLevel.NORMAL, "Revival")
-        st.toast(f"{unit.name} использует попытку и встает!", icon="👼")
+        if session: session.notify(f"{unit.name} использует попытку и встает!", icon="👼")
     else:
         # ПРОВАЛ: Попытка сгорела, юнит лежит
         logger.log(f"💀 {unit.name} Failed Revive (Roll {total} vs DC {dc})", LogLevel.NORMAL, "Revival")
-        st.toast(f"Попытка провалена... {unit.name} остается лежать.", icon="💀")
-
-
-def render_death_overlay(unit, key_prefix):
-    """
-    Рисует интерфейс смерти вместо обычных слотов.
-    """
-    st.error(f"💀 **{unit.name} В БЕССОЗНАТЕЛЬНОМ СОСТОЯНИИ**")
-
-    # [CHECK] Проверка лимита попыток (0, 1, 2 - ок; 3 - всё)
-    if unit.death_count >= 3:
-        st.markdown("⛔ **Все 3 попытки возрождения исчерпаны.**")
-        st.caption(f"Персонаж окончательно мертв. Overkill: {unit.overkill_damage}")
-        return
-
-    # Проверка на повторную попытку в том же ходу
-    last_attempt = unit.memory.get("last_revive_attempt_round", -1)
-    current_round = st.session_state.get("round_number", 1)
-
-    if last_attempt == current_round:
-        st.warning(f"⏳ Попытка в этом раунде уже использована.")
-
-        last_log = unit.memory.get("last_revive_log")
-        if last_log:
-            res_text = "УСПЕХ" if last_log["success"] else "ПРОВАЛ"
-            st.info(f"Результат: **{res_text}** (Roll {last_log['total']} vs DC {last_log['dc']})")
-        return
-
-    # === РАСЧЕТ И ИНТЕРФЕЙС ===
-    dc, wp_bonus, penalty = calculate_revival_chance(unit)
-    attempt_num = unit.death_count + 1
-
-    # Предпросмотр шансов
-    target_roll = dc - wp_bonus + penalty
-    winning_faces = 0
-    for r in range(1, 7):
-        if r >= target_roll: winning_faces += 1
-    chance_pct = int((winning_faces / 6) * 100)
-    chance_pct = max(0, min(100, chance_pct))
-
-    color = "red"
-    if chance_pct > 50: color = "orange"
-    if chance_pct > 80: color = "green"
-
-    cols = st.columns([2, 1])
-    with cols[0]:
-        st.markdown(f"**Попытка возрождения: {attempt_num} из 3**")
-        st.caption(f"Overkill: {unit.overkill_damage} | Сложность (DC): **{dc}**")
-        st.caption(f"Willpower: +{wp_bonus} | Штраф за смерти: -{penalty}")
-        st.markdown(f"Шанс успеха: :{color}[**{chance_pct}%**]")
-
-    with cols[1]:
-        # Кнопка красная, если шанс маленький, иначе обычная
-        btn_type = "primary" if chance_pct > 30 else "secondary"
-        if st.button("🎲 РИСКНУТЬ", key=f"revive_btn_{key_prefix}", type=btn_type):
-            attempt_revive_action(unit)
-            st.rerun()
-
-    # История последнего броска (из прошлого раунда)
-    last_log = unit.memory.get("last_revive_log")
-    if last_log and last_attempt != current_round:
-        res_emoji = "✅" if last_log["success"] else "❌"
-        st.caption(f"Прошлый бросок: {res_emoji} {last_log['total']} (vs {last_log['dc']})")
\ No newline at end of file
+        if session: session.notify(f"Попытка провалена... {unit.name} остается лежать.", icon="💀")
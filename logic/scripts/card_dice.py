@@ -35,7 +35,7 @@ def repeat_dice_by_status(ctx: 'RollContext', params: dict):
         base_die = card.dice_list[die_idx]
         new_dice = []
         for _ in range(count):
-            new_dice.append(copy.deepcopy(base_die))
+            new_dice.append(copy.copy(base_die))
         card.dice_list.extend(new_dice)
         if ctx.log: ctx.log.append(f"♻️ **{unit.name}** repeats dice {count} times (Status: {status_name})")
         logger.log(f"♻️ Dice Repeated {count} times due to {status_name}", LogLevel.VERBOSE, "Scripts")
@@ -146,16 +146,16 @@ def unity_chain_reaction(ctx: 'RollContext', params: dict):
 
     # 1. ЗАПОМИНАЕМ РОДНОЙ КУБИК (До модификаций)
     # Берем первый кубик карты как "вклад" в общее дело.
-    # Важно сделать глубокую копию сейчас, пока мы не добавили в начало чужие кубики.
+    # Важно сделать копию сейчас, пока мы не добавили в начало чужие кубики.
     original_die = card.dice_list[0]
-    die_to_store = copy.deepcopy(original_die)
+    die_to_store = copy.copy(original_die)
 
     # 2. ЗАБИРАЕМ КУБИКИ ИЗ ПАМЯТИ (Наследие)
     chain_dice = unit.memory["unity_chain"]
 
     if chain_dice:
         # Создаем копии накопленных кубиков
-        inherited_dice = [copy.deepcopy(d) for d in chain_dice]
+        inherited_dice = [copy.copy(d) for d in chain_dice]
 
         # Вставляем их в НАЧАЛО списка кубиков карты
         # Теперь порядок: [Наследие А], [Наследие Б], [Родной куб], [Родной куб 2]...
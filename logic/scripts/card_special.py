@@ -2,9 +2,8 @@ import copy
 import uuid
 from typing import TYPE_CHECKING
 
-import streamlit as st
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_session
 
 if TYPE_CHECKING:
     from logic.context import RollContext
@@ -20,11 +19,8 @@ def apply_axis_team_buff(ctx: 'RollContext', params: dict):
     duration = int(params.get("duration", 1))
 
     # 1. Определяем команду
-    my_team = []
-    if 'team_left' in st.session_state and source in st.session_state['team_left']:
-        my_team = st.session_state['team_left']
-    elif 'team_right' in st.session_state and source in st.session_state['team_right']:
-        my_team = st.session_state['team_right']
+    session = get_session(ctx)
+    my_team = (session.get_team(source) if session else None) or []
 
     # 2. Ищем других живых союзников
     other_allies = [u for u in my_team if u is not source and not u.is_dead()]
@@ -55,11 +51,9 @@ def summon_ally(ctx: 'RollContext', params: dict):
         return
 
     # 1. Определяем команду
-    target_team_list = None
-    if 'team_left' in st.session_state and source in st.session_state['team_left']:
-        target_team_list = st.session_state['team_left']
-    elif 'team_right' in st.session_state and source in st.session_state['team_right']:
-        target_team_list = st.session_state['team_right']
+    session = get_session(ctx)
+    if session is None: return
+    target_team_list = session.get_team(source)
 
     if target_team_list is None: return
 
@@ -70,7 +64,7 @@ def summon_ally(ctx: 'RollContext', params: dict):
         return
 
     # 2. Ищем шаблон в Ростере
-    roster = st.session_state.get('roster', {})
+    roster = session.roster or {}
     template_unit = roster.get(unit_name)
 
     if not template_unit:
@@ -101,7 +95,7 @@ def summon_ally(ctx: 'RollContext', params: dict):
     }
 
     # 4. Добавляем в команду
-    target_team_list.append(new_unit)
+    session.add_unit(new_unit, target_team_list)
 
     msg = f"🤖 **Summon**: {new_unit.name} прибыл!"
     if ctx.log is not None: ctx.log.append(msg)
@@ -120,12 +114,11 @@ def set_memory_flag(ctx: 'RollContext', params: dict):
         logger.log(f"🚩 Memory: Set {flag}={value} for {ctx.source.name}", LogLevel.VERBOSE, "Scripts")
 
 
-def _get_team_lists(source):
-    if 'team_left' in st.session_state and source in st.session_state['team_left']:
-        return st.session_state['team_left'], st.session_state['team_right']
-    if 'team_right' in st.session_state and source in st.session_state['team_right']:
-        return st.session_state['team_right'], st.session_state['team_left']
-    return None, None
+def _get_team_lists(ctx):
+    session = get_session(ctx)
+    if session is None:
+        return None, None
+    return session.get_sides(ctx.source)
 
 
 def apply_marked_flesh(ctx: 'RollContext', params: dict):
@@ -134,7 +127,7 @@ def apply_marked_flesh(ctx: 'RollContext', params: dict):
     if not source:
         return
 
-    my_team, enemy_team = _get_team_lists(source)
+    my_team, enemy_team = _get_team_lists(ctx)
     if not enemy_team:
         return
 
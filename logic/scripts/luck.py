@@ -91,7 +91,7 @@ def repeat_dice_by_luck(ctx: 'RollContext', params: dict):
 
     # Добавляем копии
     for _ in range(repeats):
-        new_die = copy.deepcopy(template_die)
+        new_die = copy.copy(template_die)
         card.dice_list.append(new_die)
 
     # Логируем и в UI, и в системный лог
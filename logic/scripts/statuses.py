@@ -1,7 +1,7 @@
-import random
 from typing import TYPE_CHECKING
 
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
 from logic.scripts.utils import _check_conditions, _resolve_value, _get_targets
 from logic.statuses.status_constants import POSITIVE_BUFFS
 
@@ -220,7 +220,7 @@ def remove_random_status(ctx: 'RollContext', params: dict):
 
     if not active_statuses: return
 
-    chosen_status = random.choice(active_statuses)
+    chosen_status = get_rng(ctx).choice(active_statuses)
     amount = int(params.get("amount", 1))
 
     target.remove_status(chosen_status, amount)
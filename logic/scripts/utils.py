@@ -1,9 +1,7 @@
-import random
 from typing import TYPE_CHECKING
 
-import streamlit as st
-
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_session, get_rng
 
 if TYPE_CHECKING:
     pass
@@ -110,11 +108,8 @@ def _get_targets(ctx, target_mode: str):
         return res
     elif target_mode == "all_allies":
         source = ctx.source
-        my_team = []
-        if 'team_left' in st.session_state and source in st.session_state['team_left']:
-            my_team = st.session_state['team_left']
-        elif 'team_right' in st.session_state and source in st.session_state['team_right']:
-            my_team = st.session_state['team_right']
+        session = get_session(ctx)
+        my_team = session.get_team(source) if session else None
 
         if not my_team: return [source]
         return [u for u in my_team if not u.is_dead()]
@@ -126,7 +121,7 @@ def _check_conditions(unit, params) -> bool:
     """Проверяет вероятность и требования к статам."""
     # 1. Вероятность (0.01 = 1%)
     prob = float(params.get("probability", 1.0))
-    if prob < 1.0 and random.random() > prob:
+    if prob < 1.0 and get_rng(unit).random() > prob:
         logger.log(f"🎲 Script chance failed ({prob})", LogLevel.VERBOSE, "Scripts")
         return False
 
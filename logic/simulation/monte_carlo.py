@@ -0,0 +1,289 @@
+"""
+Монте-Карло симулятор матчапов.
+
+Прогоняет N полных боев между двумя составами без Streamlit:
+start_round -> auto_plan -> ClashSystem.resolve_turn -> end_round, пока одна из команд не падет.
+Работа распределяется по ProcessPoolExecutor; каждый бой получает собственный сид,
+выведенный из мастер-сида и номера боя, поэтому результат не зависит от числа процессов.
+
+Запуск из корня проекта:
+    python -m logic.simulation.monte_carlo --left Рейн Лима --right Зафиэль --battles 2000
+"""
+import argparse
+import json
+import os
+import statistics
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.library import Library
+from core.logging import logger
+from core.rng import BattleRNG
+from core.unit.unit import Unit
+from core.unit.unit_library import UnitLibrary
+from logic.battle_flow.autoplan import auto_plan
+from logic.battle_flow.rounds import start_round, end_round
+from logic.battle_flow.session import BattleSession
+from logic.clash import ClashSystem
+
+DEFAULT_MAX_ROUNDS = 30
+
+
+@dataclass
+class SimulationReport:
+    """Сводка по серии боев."""
+    battles: int = 0
+    wins_left: int = 0
+    wins_right: int = 0
+    draws: int = 0
+    timeouts: int = 0
+    avg_rounds: float = 0.0
+    # {unit_name: [доля оставшегося HP в каждом бою]}
+    hp_remaining: Dict[str, List[float]] = field(default_factory=dict)
+    # {card_id: {"hp": средний урон за бой, "stagger": ...}}
+    damage_by_card: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def win_rate_left(self) -> float:
+        return self.wins_left / self.battles if self.battles else 0.0
+
+    @property
+    def win_rate_right(self) -> float:
+        return self.wins_right / self.battles if self.battles else 0.0
+
+    def hp_summary(self) -> Dict[str, dict]:
+        """Распределение остатка HP: среднее, перцентили и доля смертей."""
+        summary = {}
+        for name, values in self.hp_remaining.items():
+            ordered = sorted(values)
+            n = len(ordered)
+            if not n:
+                continue
+            summary[name] = {
+                "mean": statistics.fmean(ordered),
+                "p10": ordered[int(0.1 * (n - 1))],
+                "p50": ordered[int(0.5 * (n - 1))],
+                "p90": ordered[int(0.9 * (n - 1))],
+                "death_rate": sum(1 for v in ordered if v <= 0) / n,
+            }
+        return summary
+
+    def to_dict(self) -> dict:
+        return {
+            "battles": self.battles,
+            "wins_left": self.wins_left,
+            "wins_right": self.wins_right,
+            "draws": self.draws,
+            "timeouts": self.timeouts,
+            "win_rate_left": self.win_rate_left,
+            "win_rate_right": self.win_rate_right,
+            "avg_rounds": self.avg_rounds,
+            "hp_remaining": self.hp_summary(),
+            "damage_by_card": self.damage_by_card,
+        }
+
+
+# =============================================================================
+# ПОДГОТОВКА СОСТАВОВ
+# =============================================================================
+
+def load_team(names: List[str], roster: Optional[dict] = None) -> List[dict]:
+    """Ищет юнитов в data/units по имени и возвращает их сериализованные данные."""
+    roster = roster if roster is not None else UnitLibrary.load_all()
+    team = []
+    for name in names:
+        unit = roster.get(name)
+        if unit is None:
+            raise KeyError(f"Unit '{name}' not found in {UnitLibrary.DATA_PATH}")
+        team.append(unit.to_dict())
+    return team
+
+
+def _unique_names(team_left: List[dict], team_right: List[dict]):
+    """
+    Движок различает слоты по имени юнита, поэтому зеркальные матчи
+    и дубликаты внутри команды получают суффиксы.
+    """
+    seen = Counter()
+    for side, team in (("L", team_left), ("R", team_right)):
+        for data in team:
+            name = data.get("name", "Unknown")
+            seen[name] += 1
+            if seen[name] > 1:
+                data["name"] = f"{name} ({side}{seen[name]})"
+
+
+def _build_unit(data: dict) -> Unit:
+    unit = Unit.from_dict(data)
+    unit.recalculate_stats()
+
+    # Каждый бой начинается с полных ресурсов и чистого состояния
+    unit.current_hp = unit.max_hp
+    unit.current_sp = unit.max_sp
+    unit.current_stagger = unit.max_stagger
+    unit.card_cooldowns = {}
+    unit.cooldowns = {}
+    unit.active_slots = []
+    unit.memory = {'start_of_battle_stats': {
+        'hp': unit.max_hp, 'sp': unit.max_sp, 'stagger': unit.max_stagger
+    }}
+    return unit
+
+
+# =============================================================================
+# ОДИН БОЙ
+# =============================================================================
+
+def run_single_battle(team_left: List[dict], team_right: List[dict], seed,
+                      max_rounds: int = DEFAULT_MAX_ROUNDS, recorder=None) -> dict:
+    """
+    Разыгрывает один бой до конца (или до лимита раундов).
+    Возвращает словарь: winner ('left'/'right'/'draw'), rounds, timeout, hp, damage_by_card.
+    recorder — BattleRecorder, если бой нужно записать (logic/simulation/recording.py).
+    """
+    left = [_build_unit(d) for d in team_left]
+    right = [_build_unit(d) for d in team_right]
+
+    session = BattleSession(left, right, seed=seed)
+    clash = ClashSystem(session)
+
+    with session.activated():
+        while not session.is_finished() and session.round_number <= max_rounds:
+            if recorder: recorder.round_started(session)
+            start_round(session)
+            auto_plan(session)
+            if recorder: recorder.round_planned(session)
+            clash.resolve_turn()
+            end_round(session)
+
+    left_alive = any(not u.is_dead() for u in left)
+    right_alive = any(not u.is_dead() for u in right)
+    if left_alive and not right_alive:
+        winner = "left"
+    elif right_alive and not left_alive:
+        winner = "right"
+    else:
+        winner = "draw"
+
+    return {
+        "winner": winner,
+        "rounds": session.round_number - 1,
+        "timeout": left_alive and right_alive,
+        "hp": {u.name: max(0.0, u.current_hp / u.max_hp) if u.max_hp else 0.0 for u in left + right},
+        "damage_by_card": session.damage_by_card,
+    }
+
+
+# =============================================================================
+# ПУЛ ПРОЦЕССОВ
+# =============================================================================
+
+def _init_worker(cards_path: str):
+    """Инициализация процесса: карты в память, лог отключен (иначе файл станет узким местом)."""
+    logger.set_enabled(False)
+    if not Library.get_cards_dict():
+        Library.load_all(cards_path)
+
+
+def _run_chunk(team_left, team_right, master_seed: int, indices: range, max_rounds: int) -> List[dict]:
+    master = BattleRNG(master_seed)
+    return [
+        run_single_battle(team_left, team_right, master.spawn(i).seed, max_rounds)
+        for i in indices
+    ]
+
+
+def _aggregate(results: List[dict]) -> SimulationReport:
+    report = SimulationReport(battles=len(results))
+    total_rounds = 0
+    damage_totals: Dict[str, Dict[str, int]] = {}
+
+    for res in results:
+        if res["winner"] == "left":
+            report.wins_left += 1
+        elif res["winner"] == "right":
+            report.wins_right += 1
+        else:
+            report.draws += 1
+        if res["timeout"]:
+            report.timeouts += 1
+        total_rounds += res["rounds"]
+
+        for name, frac in res["hp"].items():
+            report.hp_remaining.setdefault(name, []).append(frac)
+
+        for card_id, dmg in res["damage_by_card"].items():
+            totals = damage_totals.setdefault(card_id, {"hp": 0, "stagger": 0})
+            for k, v in dmg.items():
+                totals[k] = totals.get(k, 0) + v
+
+    if results:
+        report.avg_rounds = total_rounds / len(results)
+        report.damage_by_card = {
+            cid: {k: v / len(results) for k, v in totals.items()}
+            for cid, totals in sorted(damage_totals.items(), key=lambda kv: -kv[1].get("hp", 0))
+        }
+    return report
+
+
+def run_monte_carlo(team_left: List[dict], team_right: List[dict], battles: int = 1000,
+                    seed=None, workers: Optional[int] = None, max_rounds: int = DEFAULT_MAX_ROUNDS,
+                    chunk_size: int = 50, cards_path: str = "data/cards") -> SimulationReport:
+    """
+    Прогоняет `battles` боев между составами (списки словарей Unit.to_dict()).
+    workers=1 — в текущем процессе (удобно для тестов и отладки).
+    """
+    master_seed = BattleRNG(seed).seed
+    team_left = [dict(d) for d in team_left]
+    team_right = [dict(d) for d in team_right]
+    _unique_names(team_left, team_right)
+
+    chunks = [range(i, min(i + chunk_size, battles)) for i in range(0, battles, chunk_size)]
+    results: List[dict] = []
+
+    if workers == 1:
+        was_enabled = logger.enabled
+        try:
+            _init_worker(cards_path)
+            for chunk in chunks:
+                results.extend(_run_chunk(team_left, team_right, master_seed, chunk, max_rounds))
+        finally:
+            logger.set_enabled(was_enabled)
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=_init_worker, initargs=(cards_path,)) as pool:
+            futures = [
+                pool.submit(_run_chunk, team_left, team_right, master_seed, chunk, max_rounds)
+                for chunk in chunks
+            ]
+            for future in futures:
+                results.extend(future.result())
+
+    return _aggregate(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo battle simulator")
+    parser.add_argument("--left", nargs="+", required=True, help="Имена юнитов левой команды (data/units)")
+    parser.add_argument("--right", nargs="+", required=True, help="Имена юнитов правой команды (data/units)")
+    parser.add_argument("--battles", type=int, default=1000)
+    parser.add_argument("--seed", default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS)
+    args = parser.parse_args(argv)
+
+    logger.set_enabled(False)
+    Library.load_all()
+    roster = UnitLibrary.load_all()
+
+    report = run_monte_carlo(
+        load_team(args.left, roster), load_team(args.right, roster),
+        battles=args.battles, seed=args.seed, workers=args.workers, max_rounds=args.max_rounds,
+    )
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
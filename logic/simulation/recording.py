@@ -0,0 +1,211 @@
+"""
+Запись и воспроизведение боя.
+
+Запись хранит только то, что нельзя вычислить: стартовые составы, сид и позиции потока RNG,
+а также решения планирования каждого раунда (карта, цель, агро, уничтожение по скорости).
+Все остальное (скорость, броски, урон) движок повторяет сам, поэтому запись на порядки меньше
+слепков состояния и годится для архива и регрессионных прогонов на новых версиях движка.
+
+Формат (JSON):
+    {"format": "lor-battle", "version": 1, "seed": ..., "round_number": ...,
+     "team_left": [Unit.to_dict()], "team_right": [...],
+     "rounds": [{"round": n, "rng_start": позиция, "check": [[hp, sp, stagger], ...],
+                 "rng_plan": позиция, "plans": [[[card_id, цель, слот цели, агро, уничтожение], ...], ...]}]}
+plans идут по юнитам (сначала левая команда), внутри — по слотам.
+check — ресурсы юнитов в начале раунда: по нему replay находит раунд, где бой разошелся с записью
+(правки ГМ, изменения механик в новой версии движка).
+
+Запуск из корня проекта:
+    python -m logic.simulation.recording data/recordings/battle.json --repeat 100
+"""
+import argparse
+import gzip
+import json
+import time
+from typing import Optional
+
+from core.library import Library
+from core.logging import logger
+from core.unit.unit import Unit
+from logic.battle_flow.rounds import start_round, end_round
+from logic.battle_flow.session import BattleSession
+from logic.clash import ClashSystem
+
+RECORDING_FORMAT = "lor-battle"
+RECORDING_VERSION = 1
+
+
+def _unit_check(session) -> list:
+    return [[u.current_hp, u.current_sp, u.current_stagger] for u in session.all_units()]
+
+
+class BattleRecorder:
+    """
+    Пишет бой по ходу игры. Хуки вызываются в тех же местах, где UI и headless-прогоны двигают раунд:
+      round_started(session) — перед start_round (бросок скорости);
+      round_planned(session) — после планирования, перед розыгрышем хода.
+    Сама запись — обычный словарь (self.data), ее можно сохранить как JSON.
+    """
+
+    def __init__(self, data: Optional[dict] = None):
+        self.data = data
+
+    def reset(self):
+        self.data = None
+
+    def round_started(self, session):
+        if self.data is None or session.round_number < self.data["round_number"] or not self._same_teams(session):
+            self.data = {
+                "format": RECORDING_FORMAT,
+                "version": RECORDING_VERSION,
+                "seed": session.seed,
+                "round_number": session.round_number,
+                "team_left": [u.to_dict() for u in session.team_left],
+                "team_right": [u.to_dict() for u in session.team_right],
+                "rounds": [],
+            }
+
+        # Повторный бросок того же раунда (откат) заменяет его и все, что было после
+        rounds = [r for r in self.data["rounds"] if r["round"] < session.round_number]
+        self.data["rounds"] = rounds
+        rounds.append({
+            "round": session.round_number,
+            "rng_start": session.rng.position,
+            "check": _unit_check(session),
+        })
+
+    def _same_teams(self, session) -> bool:
+        """Составы не менялись с начала записи (иначе это уже другой бой)."""
+        return ([d.get("name") for d in self.data["team_left"]] == [u.name for u in session.team_left] and
+                [d.get("name") for d in self.data["team_right"]] == [u.name for u in session.team_right])
+
+    def round_planned(self, session):
+        if not self.data or not self.data["rounds"]:
+            return
+        entry = self.data["rounds"][-1]
+        if entry["round"] != session.round_number:
+            return
+        entry["rng_plan"] = session.rng.position
+        entry["plans"] = [
+            [[getattr(s.get('card'), 'id', None), s.get('target_unit_idx', -1), s.get('target_slot_idx', -1),
+              bool(s.get('is_aggro')), bool(s.get('destroy_on_speed'))] for s in u.active_slots]
+            for u in session.all_units()
+        ]
+
+    def truncate(self, round_number: int):
+        """
+        Оставляет раунды до round_number включительно (откат по истории).
+        У последнего оставленного раунда снимаются решения: его планируют заново.
+        """
+        if not self.data:
+            return
+        rounds = [r for r in self.data["rounds"] if r["round"] <= round_number]
+        if rounds and rounds[-1]["round"] == round_number:
+            rounds[-1].pop("plans", None)
+            rounds[-1].pop("rng_plan", None)
+        self.data["rounds"] = rounds
+
+
+def save_recording(recording: dict, path: str):
+    """JSON; при расширении .gz — сжатый."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        json.dump(recording, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_recording(path: str) -> dict:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        recording = json.load(f)
+    if recording.get("format") != RECORDING_FORMAT:
+        raise ValueError(f"{path} is not a battle recording")
+    if recording.get("version", 0) > RECORDING_VERSION:
+        raise ValueError(f"Recording v{recording['version']} is newer than supported v{RECORDING_VERSION}")
+    return recording
+
+
+def _apply_plans(session, plans):
+    for unit, unit_plans in zip(session.all_units(), plans):
+        for slot, (card_id, t_unit, t_slot, is_aggro, destroy) in zip(unit.active_slots, unit_plans):
+            slot['card'] = Library.get_card(card_id) if card_id else None
+            slot['target_unit_idx'] = t_unit
+            slot['target_slot_idx'] = t_slot
+            slot['is_aggro'] = is_aggro
+            slot['destroy_on_speed'] = destroy
+
+
+def replay_battle(recording: dict) -> dict:
+    """
+    Переигрывает запись без UI.
+    Возвращает winner, finished, rounds, hp и diverged_at —
+    первый раунд, где ресурсы юнитов не совпали с записью (None, если бой повторился точно).
+    """
+    left = [Unit.from_dict(d) for d in recording["team_left"]]
+    right = [Unit.from_dict(d) for d in recording["team_right"]]
+
+    session = BattleSession(left, right, round_number=recording["round_number"], seed=recording["seed"])
+    clash = ClashSystem(session)
+    diverged_at = None
+    rounds_played = 0
+
+    with session.activated():
+        for entry in recording["rounds"]:
+            if "plans" not in entry:
+                break
+            session.round_number = entry["round"]
+            # Как в UI: статы пересчитываются перед броском и перед розыгрышем
+            for u in session.all_units():
+                u.recalculate_stats()
+            if diverged_at is None and _unit_check(session) != entry["check"]:
+                diverged_at = entry["round"]
+
+            session.rng.position = entry["rng_start"]
+            start_round(session)
+
+            session.rng.position = entry["rng_plan"]
+            _apply_plans(session, entry["plans"])
+            for u in session.all_units():
+                u.recalculate_stats()
+            clash.resolve_turn()
+            end_round(session)
+            rounds_played += 1
+
+    left_alive = any(not u.is_dead() for u in left)
+    right_alive = any(not u.is_dead() for u in right)
+    if left_alive and not right_alive:
+        winner = "left"
+    elif right_alive and not left_alive:
+        winner = "right"
+    else:
+        winner = "draw"
+
+    return {
+        "winner": winner,
+        "finished": not (left_alive and right_alive),
+        "rounds": rounds_played,
+        "hp": {u.name: u.current_hp for u in left + right},
+        "diverged_at": diverged_at,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Battle recording replay")
+    parser.add_argument("path", help="Файл записи (.json или .json.gz)")
+    parser.add_argument("--repeat", type=int, default=1, help="Сколько раз переиграть (замер скорости движка)")
+    args = parser.parse_args(argv)
+
+    logger.set_enabled(False)
+    Library.load_all()
+    recording = load_recording(args.path)
+
+    started = time.perf_counter()
+    for _ in range(max(1, args.repeat)):
+        result = replay_battle(recording)
+    elapsed = time.perf_counter() - started
+
+    result["seconds_per_replay"] = elapsed / max(1, args.repeat)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,63 +1,269 @@
 import glob
 import json
 import os
+import threading
+
+from logic.state.state_diff import StateDiff
+from logic.state.state_format import StateFormat
 
 STATES_DIR = "data/states"
 
+# Через сколько записей журнал сворачивается в опорный кадр (фоновым потоком)
+JOURNAL_COMPACT_EVERY = 64
+
+
+class _Journal:
+    """Состояние журнала одного файла сохранения в этом процессе."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.last = None  # последнее записанное состояние (как оно лежит на диске)
+        self.seq = 0  # номер последней записи журнала
+        self.records = 0  # записей в журнале после опорного кадра
+        self.generation = 0  # меняется при полной перезаписи файла
+        self.compactor = None
+
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+
 class StateFileManager:
+    """
+    Файлы сохранений: data/states/<name>.state — опорный кадр (сжатые секции, см. StateFormat),
+    data/states/<name>.journal — журнал (по строке JSON на запись: номер и дифф, см. StateDiff).
+    Старые data/states/<name>.json читаются и заменяются на .state при первой полной записи.
+
+    save_journaled() дописывает в журнал только изменения относительно прошлой записи,
+    поэтому шаг боя не дорожает с ростом сохранения. Когда в журнале набирается
+    JOURNAL_COMPACT_EVERY записей, фоновый поток сворачивает его в опорный кадр.
+    load_json() собирает состояние из опорного кадра и журнала.
+    """
+
     @staticmethod
     def ensure_dir():
         if not os.path.exists(STATES_DIR):
             os.makedirs(STATES_DIR, exist_ok=True)
-            default_path = os.path.join(STATES_DIR, "default.json")
-            if not os.path.exists(default_path):
-                with open(default_path, "w", encoding="utf-8") as f:
-                    json.dump({}, f)
+            if StateFileManager._existing_path("default") is None:
+                StateFileManager._write_bytes(StateFileManager._state_path("default"), StateFormat.dumps({}))
 
     @staticmethod
     def get_available_states():
         StateFileManager.ensure_dir()
-        files = glob.glob(os.path.join(STATES_DIR, "*.json"))
-        names = [os.path.splitext(os.path.basename(f))[0] for f in files]
+        files = glob.glob(os.path.join(STATES_DIR, "*.state")) + glob.glob(os.path.join(STATES_DIR, "*.json"))
+        names = {os.path.splitext(os.path.basename(f))[0] for f in files}
         return sorted(names)
 
     @staticmethod
     def create_new_state(name):
         StateFileManager.ensure_dir()
-        filename = f"{name}.json"
-        path = os.path.join(STATES_DIR, filename)
-        if not os.path.exists(path):
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump({}, f)
+        if StateFileManager._existing_path(name) is None:
+            StateFileManager._drop_journal(name)
+            StateFileManager._write_bytes(StateFileManager._state_path(name), StateFormat.dumps({}))
             return True
         return False
 
     @staticmethod
     def delete_state(name):
-        path = os.path.join(STATES_DIR, f"{name}.json")
-        if os.path.exists(path):
-            os.remove(path)
+        path = StateFileManager._existing_path(name)
+        if path is not None:
+            StateFileManager._drop_journal(name)
+            for p in (StateFileManager._state_path(name), StateFileManager._legacy_path(name)):
+                if os.path.exists(p):
+                    os.remove(p)
             return True
         return False
 
     @staticmethod
-    def load_json(filename="default"):
+    def load_json(filename="default", sections=None):
+        """
+        Состояние из опорного кадра и журнала.
+        sections — загрузить только эти секции ("teams", "history", "logs"); None — все.
+        """
         StateFileManager.ensure_dir()
-        target_file = os.path.join(STATES_DIR, f"{filename}.json")
-        if not os.path.exists(target_file):
-            return {}
-        try:
-            with open(target_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
+        with StateFileManager._journal(filename).lock:
+            target_file = StateFileManager._existing_path(filename)
+            if target_file is None:
+                return {}
+            try:
+                data, folded_seq = StateFormat.read(target_file, sections)
+            except Exception:
+                return {}
+
+            for record in StateFileManager._read_journal(filename):
+                if record["seq"] <= folded_seq:
+                    continue
+                diff = record["diff"]
+                if sections is not None:
+                    diff = {k: op for k, op in diff.items() if StateFormat.section_of(k) in sections}
+                data = StateDiff.apply(data, diff)
+            return data
 
     @staticmethod
     def save_json(data, filename="default"):
+        """Полная перезапись сохранения (опорный кадр без журнала)."""
         StateFileManager.ensure_dir()
-        target_file = os.path.join(STATES_DIR, f"{filename}.json")
+        journal = StateFileManager._journal(filename)
+        with journal.lock:
+            try:
+                # Сначала журнал: упав между шагами, получим старый кадр, а не чужие диффы поверх нового
+                journal_path = StateFileManager._journal_path(filename)
+                if os.path.exists(journal_path):
+                    os.remove(journal_path)
+                StateFileManager._write_keyframe(filename, StateFormat.dumps(data))
+            except Exception as e:
+                print(f"Error saving state to {filename}: {e}")
+                journal.last = None
+                return
+            journal.last = StateFileManager._detach(data)
+            journal.seq = 0
+            journal.records = 0
+            journal.generation += 1
+
+    @staticmethod
+    def save_journaled(data, filename="default"):
+        """
+        Сохраняет состояние дописыванием диффа в журнал.
+        Первое сохранение файла в процессе пишет полный опорный кадр.
+        """
+        journal = StateFileManager._journal(filename)
+        with journal.lock:
+            if journal.last is None:
+                StateFileManager.save_json(data, filename)
+                return
+
+            diff = StateDiff.diff(journal.last, data)
+            if not diff:
+                return
+            try:
+                line = json.dumps({"seq": journal.seq + 1, "diff": diff}, ensure_ascii=False, separators=(",", ":"))
+                with open(StateFileManager._journal_path(filename), "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except Exception as e:
+                print(f"Error saving state to {filename}: {e}")
+                # Журнал мог остаться недописанным -> следующее сохранение будет полным
+                journal.last = None
+                return
+
+            journal.seq += 1
+            journal.records += 1
+            journal.last = StateFileManager._detach(data)
+
+            if journal.records >= JOURNAL_COMPACT_EVERY and not (journal.compactor and journal.compactor.is_alive()):
+                journal.compactor = threading.Thread(
+                    target=StateFileManager.compact, args=(filename,), name="StateCompactor", daemon=True
+                )
+                journal.compactor.start()
+
+    @staticmethod
+    def compact(filename="default"):
+        """Сворачивает журнал в опорный кадр. Сериализация идет вне замка, сохранения не ждут."""
+        journal = StateFileManager._journal(filename)
+        with journal.lock:
+            if journal.last is None or journal.records == 0:
+                return
+            data, seq, generation = journal.last, journal.seq, journal.generation
+
         try:
-            with open(target_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            blob = StateFormat.dumps(data, journal_seq=seq)
         except Exception as e:
-            print(f"Error saving state to {filename}: {e}")
\ No newline at end of file
+            print(f"Error compacting state {filename}: {e}")
+            return
+
+        with journal.lock:
+            if journal.generation != generation:
+                return  # файл перезаписан целиком, пока мы сериализовали
+            try:
+                StateFileManager._write_keyframe(filename, blob)
+                # Записи, дописанные во время сериализации, остаются в журнале
+                tail = [r for r in StateFileManager._read_journal(filename) if r["seq"] > seq]
+                StateFileManager._write_bytes(
+                    StateFileManager._journal_path(filename),
+                    "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in tail).encode("utf-8")
+                )
+                journal.records = len(tail)
+            except Exception as e:
+                print(f"Error compacting state {filename}: {e}")
+
+    @staticmethod
+    def flush():
+        """Дожидается фоновых сворачиваний журналов (тесты, выход из процесса)."""
+        with _journals_lock:
+            threads = [j.compactor for j in _journals.values() if j.compactor]
+        for thread in threads:
+            thread.join()
+
+    # === Внутреннее ===
+    @staticmethod
+    def _journal(filename) -> _Journal:
+        with _journals_lock:
+            journal = _journals.get(filename)
+            if journal is None:
+                journal = _journals[filename] = _Journal()
+            return journal
+
+    @staticmethod
+    def _state_path(filename):
+        return os.path.join(STATES_DIR, f"{filename}.state")
+
+    @staticmethod
+    def _legacy_path(filename):
+        return os.path.join(STATES_DIR, f"{filename}.json")
+
+    @staticmethod
+    def _existing_path(filename):
+        for path in (StateFileManager._state_path(filename), StateFileManager._legacy_path(filename)):
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _journal_path(filename):
+        return os.path.join(STATES_DIR, f"{filename}.journal")
+
+    @staticmethod
+    def _drop_journal(filename):
+        journal = StateFileManager._journal(filename)
+        with journal.lock:
+            path = StateFileManager._journal_path(filename)
+            if os.path.exists(path):
+                os.remove(path)
+            journal.last = None
+            journal.generation += 1
+
+    @staticmethod
+    def _read_journal(filename):
+        path = StateFileManager._journal_path(filename)
+        if not os.path.exists(path):
+            return []
+        records = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break  # оборванная последняя строка (процесс упал посреди записи)
+        return records
+
+    @staticmethod
+    def _detach(data):
+        """
+        Копия верхнего уровня: списки и словари состояния (battle_logs, undo_stack)
+        дальше меняются на месте, а сравнивать нужно с тем, что уже записано.
+        """
+        return {k: (list(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v)
+                for k, v in data.items()}
+
+    @staticmethod
+    def _write_keyframe(filename, blob: bytes):
+        StateFileManager._write_bytes(StateFileManager._state_path(filename), blob)
+        legacy_path = StateFileManager._legacy_path(filename)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+
+    @staticmethod
+    def _write_bytes(path, blob: bytes):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
@@ -1,6 +1,14 @@
 from logic.state.action_serializer import ActionSerializer
 
 class SnapshotMaker:
+    @staticmethod
+    def _rng_state(session_state):
+        """Позиция потока случайных чисел боя (для точного повтора раунда)."""
+        session = session_state.get('battle_session')
+        if session is not None:
+            return session.get_rng_state()
+        return session_state.get('rng_state')
+
     @staticmethod
     def get_state_snapshot(session_state):
         """Создает ПОЛНЫЙ слепок состояния (Keyframe)."""
@@ -20,6 +28,7 @@ class SnapshotMaker:
             "turn_phase": session_state.get('turn_phase', 'planning'),
             "action_idx": session_state.get('action_idx', 0),
             "executed_slots": list(session_state.get('executed_slots', [])),
+            "rng_state": SnapshotMaker._rng_state(session_state),
 
             "turn_actions": ActionSerializer.serialize_actions(
                 session_state.get('turn_actions', []),
@@ -55,4 +64,5 @@ class SnapshotMaker:
             "turn_phase": session_state.get('turn_phase', 'planning'),
             "action_idx": session_state.get('action_idx', 0),
             "executed_slots": list(session_state.get('executed_slots', [])),
+            "rng_state": SnapshotMaker._rng_state(session_state),
         }
\ No newline at end of file
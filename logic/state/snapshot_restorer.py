@@ -1,33 +1,71 @@
+from dataclasses import fields
+
 from core.unit.unit import Unit
 from logic.state.action_serializer import ActionSerializer
 
+# Не из слепка, но переживают восстановление на месте: ссылка на сессию боя (перепривязывается
+# при get_battle_session) и кэш пересчета статов (ключи по отпечаткам, устареть не может)
+_KEEP_RUNTIME_ATTRS = ("session", "_stats_cache")
+
 
 class SnapshotRestorer:
     @staticmethod
-    def _restore_teams_from_full(data):
+    def _restore_teams_from_full(data, recalculate=True):
         l_data = data.get("team_left_data", [])
         r_data = data.get("team_right_data", [])
 
         team_left = []
         for d in l_data:
             try:
-                team_left.append(Unit.from_dict(d))
+                team_left.append(Unit.from_dict(d, recalculate=recalculate))
             except Exception as e:
                 print(f"Error restoring left: {e}")
 
         team_right = []
         for d in r_data:
             try:
-                team_right.append(Unit.from_dict(d))
+                team_right.append(Unit.from_dict(d, recalculate=recalculate))
             except Exception as e:
                 print(f"Error restoring right: {e}")
 
         return team_left, team_right
 
+    @staticmethod
+    def _can_restore_in_place(session_state, base_data) -> bool:
+        """
+        Живые юниты совпадают с базовым слепком по составу и сборке (build_state),
+        то есть Unit.from_dict собрал бы тех же юнитов и отличаться будет только динамика.
+        """
+        for team_key, data_key in (("team_left", "team_left_data"), ("team_right", "team_right_data")):
+            team = session_state.get(team_key)
+            team_data = base_data.get(data_key, [])
+            if team is None or len(team) != len(team_data):
+                return False
+            for u, d in zip(team, team_data):
+                build = u.build_state()
+                if any(d.get(k) != v for k, v in build.items()):
+                    return False
+        return True
+
+    @staticmethod
+    def _reset_runtime_state(unit):
+        """Сбрасывает то, чего нет в слепке: так юнит совпадает со свежим из Unit.from_dict."""
+        field_names = {f.name for f in fields(unit)}
+        for attr in list(unit.__dict__):
+            if attr not in field_names and attr not in _KEEP_RUNTIME_ATTRS:
+                del unit.__dict__[attr]  # флаги способностей (_nerve_counter...), current_die
+        unit.current_card = None
+
     @staticmethod
     def restore_from_dynamic(session_state, dynamic_data, base_data):
-        # 1. Base
-        team_left, team_right = SnapshotRestorer._restore_teams_from_full(base_data)
+        # 1. Base: если сборка не менялась, дельта накладывается на живых юнитов,
+        # иначе юниты собираются заново из базового слепка
+        if SnapshotRestorer._can_restore_in_place(session_state, base_data):
+            team_left, team_right = session_state['team_left'], session_state['team_right']
+            for u in team_left + team_right:
+                SnapshotRestorer._reset_runtime_state(u)
+        else:
+            team_left, team_right = SnapshotRestorer._restore_teams_from_full(base_data, recalculate=False)
 
         # 2. Delta
         l_dyn = dynamic_data.get("team_left_dyn", [])
@@ -39,6 +77,7 @@ class SnapshotRestorer:
         for i, u in enumerate(team_right):
             if i < len(r_dyn): u.apply_dynamic_state(r_dyn[i])
 
+        # 3. Единственный пересчет — уже с восстановленными статусами и ресурсами
         for u in team_left + team_right: u.recalculate_stats()
 
         session_state['team_left'] = team_left
@@ -97,4 +136,8 @@ class SnapshotRestorer:
 
         session_state['executed_slots'] = set()
         for item in data.get('executed_slots', []):
-            session_state['executed_slots'].add(tuple(item))
\ No newline at end of file
+            session_state['executed_slots'].add(tuple(item))
+
+        # RNG боя: применяется к сессии при следующем get_battle_session()
+        if data.get('rng_state'):
+            session_state['rng_state'] = data['rng_state']
\ No newline at end of file
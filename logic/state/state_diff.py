@@ -0,0 +1,105 @@
+class StateDiff:
+    """
+    Диффы JSON-подобных словарей (слепки юнитов, состояние боя).
+
+    Дифф — {ключ: операция}; ключи без изменений в него не попадают.
+      ["=", значение]           — значение заменено целиком
+      ["+", элементы]           — список дополнен в конец (money_log, battle_logs, undo_stack...)
+      ["*", [дифф, ...]]        — список словарей той же длины, по диффу на элемент (юниты команды)
+      ["^", начало, удалено, вставка, добавка] — из середины списка удалены элементы (на их место — вставка),
+                                  в конец дописана добавка (история раундов, упершаяся в лимит)
+      ["~", {ключ: значение}, [удаленные ключи]] — словарь изменен на первом уровне
+      ["-"]                     — ключ пропал
+    """
+
+    @staticmethod
+    def diff_value(old, new):
+        if isinstance(old, dict) and isinstance(new, dict):
+            changed = {k: v for k, v in new.items() if k not in old or old[k] != v}
+            removed = [k for k in old if k not in new]
+            if len(changed) + len(removed) < len(new):
+                return ["~", changed, removed]
+        elif isinstance(old, list) and isinstance(new, list):
+            if len(old) < len(new) and new[:len(old)] == old:
+                return ["+", new[len(old):]]
+            splice = StateDiff._splice(old, new) if old else None
+            if splice is not None:
+                return splice
+            if old and len(old) == len(new) and all(isinstance(o, dict) and isinstance(n, dict)
+                                                    for o, n in zip(old, new)):
+                return ["*", [StateDiff.diff(o, n) for o, n in zip(old, new)]]
+        return ["=", new]
+
+    @staticmethod
+    def _splice(old: list, new: list):
+        """
+        new = old[:start] + вставка + old[start + удалено:] + добавка, если элементы сдвинулись
+        и так заметно короче, чем список целиком.
+        Хвост old ищется в new с конца: обычно это дописанный раунд после выброшенного старого.
+        """
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and (old[start] is new[start] or old[start] == new[start]):
+            start += 1
+
+        last = old[-1]
+        end = next((j for j in range(len(new) - 1, start - 1, -1) if new[j] is last or new[j] == last), None)
+        if end is None:
+            return None
+
+        # Общий участок old[len(old) - kept:] == new[end + 1 - kept:end + 1]
+        kept = 1
+        while (len(old) - kept > start and end - kept >= start and
+               (old[-kept - 1] is new[end - kept] or old[-kept - 1] == new[end - kept])):
+            kept += 1
+
+        insert = new[start:end + 1 - kept]
+        append = new[end + 1:]
+        removed = len(old) - kept - start
+        if removed == len(insert) or len(insert) + len(append) >= len(new) // 2:
+            return None  # элементы не сдвинулись (для этого есть "*") или переписать список дешевле
+        return ["^", start, removed, insert, append]
+
+    @staticmethod
+    def diff(old: dict, new: dict) -> dict:
+        """Дифф old -> new. Пустой, если ничего не поменялось."""
+        result = {}
+        for key, value in new.items():
+            if key not in old:
+                result[key] = ["=", value]
+            elif old[key] != value:
+                result[key] = StateDiff.diff_value(old[key], value)
+        for key in old:
+            if key not in new:
+                result[key] = ["-"]
+        return result
+
+    @staticmethod
+    def apply(state: dict, diff: dict) -> dict:
+        """
+        Накладывает дифф. Возвращает новый словарь;
+        исходный и вложенные в него объекты не меняются (копируются только измененные контейнеры).
+        """
+        result = dict(state)
+        for key, op in diff.items():
+            kind = op[0]
+            if kind == "=":
+                result[key] = op[1]
+            elif kind == "+":
+                result[key] = list(result.get(key, [])) + op[1]
+            elif kind == "*":
+                items = result.get(key, [])
+                result[key] = [StateDiff.apply(item, d) if d else item for item, d in zip(items, op[1])]
+            elif kind == "^":
+                _, start, removed, insert, append = op
+                items = result.get(key, [])
+                result[key] = items[:start] + insert + items[start + removed:] + append
+            elif kind == "~":
+                patched = dict(result.get(key, {}))
+                patched.update(op[1])
+                for k in op[2]:
+                    patched.pop(k, None)
+                result[key] = patched
+            elif kind == "-":
+                result.pop(key, None)
+        return result
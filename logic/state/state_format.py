@@ -0,0 +1,78 @@
+import json
+import zlib
+
+MAGIC = b"LORSTATE"
+FORMAT_VERSION = 1
+
+# Секция -> ключи состояния. Все остальное (команды, фаза, селекторы) — в "teams".
+SECTION_KEYS = {
+    "history": ("undo_stack",),
+    "logs": ("battle_logs", "script_logs"),
+}
+SECTIONS = ("teams", "history", "logs")
+_KEY_SECTIONS = {key: section for section, keys in SECTION_KEYS.items() for key in keys}
+
+
+class StateFormat:
+    """
+    Контейнер файла сохранения (data/states/<name>.state):
+
+        LORSTATE <версия>\\n
+        {"journal_seq": ..., "codec": "zlib", "sections": {"teams": [смещение, длина], ...}}\\n
+        <секции: сжатый zlib компактный JSON>
+
+    Заголовок читается без распаковки секций, поэтому загрузка команд
+    не трогает историю ходов и логи. Старые .json-сохранения читаются как есть.
+    """
+
+    @staticmethod
+    def section_of(key: str) -> str:
+        return _KEY_SECTIONS.get(key, "teams")
+
+    @staticmethod
+    def dumps(data: dict, journal_seq: int = 0) -> bytes:
+        parts = {section: {} for section in SECTIONS}
+        for key, value in data.items():
+            parts[StateFormat.section_of(key)][key] = value
+
+        blobs, directory, offset = [], {}, 0
+        for section, values in parts.items():
+            if not values:
+                continue
+            raw = json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            blob = zlib.compress(raw, 6)
+            directory[section] = [offset, len(blob)]
+            blobs.append(blob)
+            offset += len(blob)
+
+        header = {"journal_seq": journal_seq, "codec": "zlib", "sections": directory}
+        head = MAGIC + b" %d\n" % FORMAT_VERSION + json.dumps(header).encode("utf-8") + b"\n"
+        return head + b"".join(blobs)
+
+    @staticmethod
+    def read(path: str, sections=None):
+        """
+        Читает сохранение -> (данные, journal_seq).
+        sections — какие секции распаковать (None — все); у старого .json читается все.
+        """
+        with open(path, "rb") as f:
+            first = f.readline()
+            if not first.startswith(MAGIC):
+                data = json.loads(first + f.read())
+                if not isinstance(data, dict):
+                    return {}, 0
+                return data, data.pop("_journal_seq", 0)
+
+            version = int(first.split()[1])
+            if version > FORMAT_VERSION:
+                raise ValueError(f"State format v{version} is newer than supported v{FORMAT_VERSION}")
+
+            header = json.loads(f.readline())
+            body_start = f.tell()
+            data = {}
+            for section, (offset, length) in header["sections"].items():
+                if sections is not None and section not in sections:
+                    continue
+                f.seek(body_start + offset)
+                data.update(json.loads(zlib.decompress(f.read(length))))
+            return data, header.get("journal_seq", 0)
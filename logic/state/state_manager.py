@@ -2,6 +2,7 @@ from logic.state.action_serializer import ActionSerializer
 from logic.state.file_manager import StateFileManager
 from logic.state.snapshot_maker import SnapshotMaker
 from logic.state.snapshot_restorer import SnapshotRestorer
+from logic.state.undo_history import UndoHistory
 
 
 class StateManager:
@@ -21,7 +22,7 @@ class StateManager:
     def save_state(session_state, filename="default"):
         data = SnapshotMaker.get_state_snapshot(session_state)
         data["undo_stack"] = session_state.get("undo_stack", [])
-        StateFileManager.save_json(data, filename)
+        StateFileManager.save_journaled(data, filename)
 
     # === Snapshots ===
     get_state_snapshot = SnapshotMaker.get_state_snapshot
@@ -30,6 +31,10 @@ class StateManager:
     restore_state_from_snapshot = SnapshotRestorer.restore_from_full
     restore_from_dynamic_snapshot = SnapshotRestorer.restore_from_dynamic
 
+    # === History ===
+    push_history = UndoHistory.push
+    restore_round = UndoHistory.restore
+
     # === Helpers (проброс для совместимости) ===
     restore_actions = ActionSerializer.restore_actions
     _serialize_actions = ActionSerializer.serialize_actions
\ No newline at end of file
@@ -0,0 +1,136 @@
+from logic.state.snapshot_maker import SnapshotMaker
+from logic.state.snapshot_restorer import SnapshotRestorer
+from logic.state.state_diff import StateDiff
+
+# Поля слепка, которые относятся к юнитам (остальное — общие поля раунда)
+TEAM_KEYS = (("team_left_dyn", "team_left_diff"), ("team_right_dyn", "team_right_diff"))
+
+
+class UndoHistory:
+    """
+    История раундов (session_state['undo_stack']) в виде диффов.
+
+    [0] — полный слепок ("full"), дальше опорные кадры ("dynamic", как раньше)
+    и между ними диффы ("diff"): по каждому юниту только изменившиеся поля.
+    Опорный кадр пишется каждые KEYFRAME_INTERVAL раундов, так что для восстановления
+    любого раунда нужно наложить не больше KEYFRAME_INTERVAL - 1 диффов.
+    Формат диффа юнита — см. StateDiff.
+    """
+    KEYFRAME_INTERVAL = 10
+    MAX_ENTRIES = 50
+
+    # === Диффы ===
+    @staticmethod
+    def make_diff(prev: dict, current: dict):
+        """Дифф между двумя динамическими слепками или None, если состав команд поменялся."""
+        entry = {k: v for k, v in current.items() if k not in ("team_left_dyn", "team_right_dyn")}
+        entry["type"] = "diff"
+        for dyn_key, diff_key in TEAM_KEYS:
+            old_team, new_team = prev.get(dyn_key, []), current.get(dyn_key, [])
+            if len(old_team) != len(new_team):
+                return None
+            entry[diff_key] = [StateDiff.diff(o, n) for o, n in zip(old_team, new_team)]
+        return entry
+
+    # === Стек ===
+    @staticmethod
+    def materialize(stack: list, index: int) -> dict:
+        """
+        Слепок раунда index: полный ([0]) или динамический.
+        Диффы накладываются на ближайший предыдущий опорный кадр.
+        """
+        entry = stack[index]
+        if entry.get("type") != "diff":
+            return entry
+
+        start = index
+        while start > 0 and stack[start].get("type") == "diff":
+            start -= 1
+        keyframe = stack[start]
+        if keyframe.get("type") != "dynamic":
+            raise ValueError(f"Undo history: no keyframe before round {index + 1}")
+
+        teams = {dyn_key: list(keyframe.get(dyn_key, [])) for dyn_key, _ in TEAM_KEYS}
+        for step in stack[start + 1:index + 1]:
+            for dyn_key, diff_key in TEAM_KEYS:
+                team = teams[dyn_key]
+                for i, unit_diff in enumerate(step.get(diff_key, [])):
+                    if unit_diff and i < len(team):
+                        team[i] = StateDiff.apply(team[i], unit_diff)
+
+        snapshot = {k: v for k, v in entry.items() if k not in ("team_left_diff", "team_right_diff")}
+        snapshot.update(teams)
+        snapshot["type"] = "dynamic"
+        return snapshot
+
+    @staticmethod
+    def _since_keyframe(stack: list) -> int:
+        count = 0
+        for entry in reversed(stack):
+            if entry.get("type") != "diff":
+                break
+            count += 1
+        return count
+
+    @staticmethod
+    def push(session_state):
+        """Добавляет в историю текущий раунд (вызывается после броска скорости)."""
+        stack = session_state.get('undo_stack')
+        if stack is None:
+            stack = session_state['undo_stack'] = []
+
+        if not stack:
+            # Первый раунд -> Полный слепок
+            stack.append(SnapshotMaker.get_state_snapshot(session_state))
+            session_state['undo_tail'] = None
+            return
+
+        current = SnapshotMaker.get_dynamic_snapshot(session_state)
+
+        # Последний динамический слепок держим в памяти, чтобы не собирать его из диффов каждый раунд
+        tail = session_state.get('undo_tail')
+        if tail and tail[0] is stack[-1]:
+            prev = tail[1]
+        elif stack[-1].get("type") == "full":
+            prev = None
+        else:
+            prev = UndoHistory.materialize(stack, len(stack) - 1)
+
+        entry = None
+        if prev is not None and UndoHistory._since_keyframe(stack) < UndoHistory.KEYFRAME_INTERVAL - 1:
+            entry = UndoHistory.make_diff(prev, current)
+        if entry is None:
+            entry = current
+
+        stack.append(entry)
+        session_state['undo_tail'] = (entry, current)
+        UndoHistory._trim(stack)
+
+    @staticmethod
+    def _trim(stack: list):
+        """Лимит истории: выкидываем самый старый раунд после базы [0], сохраняя цепочку диффов."""
+        while len(stack) > UndoHistory.MAX_ENTRIES:
+            if len(stack) > 2 and stack[2].get("type") == "diff":
+                stack[2] = UndoHistory.materialize(stack, 2)
+            stack.pop(1)
+
+    @staticmethod
+    def restore(session_state, index: int):
+        """Восстанавливает раунд index и обрезает историю после него."""
+        stack = session_state.get('undo_stack', [])
+        snapshot = UndoHistory.materialize(stack, index)
+        if snapshot.get("type") == "dynamic":
+            base_snapshot = stack[0]
+            if base_snapshot.get("type") != "full":
+                raise ValueError("Undo history: base snapshot is corrupted")
+            SnapshotRestorer.restore_from_dynamic(session_state, snapshot, base_snapshot)
+        else:
+            SnapshotRestorer.restore_from_full(session_state, snapshot)
+
+        session_state['undo_stack'] = stack[:index + 1]
+        session_state['undo_tail'] = None
+
+        # Запись боя откатывается вместе с историей: восстановленный раунд планируется заново
+        recorder = session_state.get('battle_recorder')
+        if recorder is not None:
+            recorder.truncate(session_state.get('round_number', 1))
@@ -1,7 +1,6 @@
-import random
-
 from core.enums import DiceType
 from core.logging import logger, LogLevel
+from logic.battle_flow.session import get_rng
 from logic.context import RollContext
 from logic.statuses.common import StatusEffect
 
@@ -11,7 +10,7 @@ class SelfControlStatus(StatusEffect):
 
     def on_hit(self, ctx: RollContext, stack: int):
         chance = min(100, stack * 5)
-        roll = random.randint(1, 100)
+        roll = get_rng(ctx).randint(1, 100)
         if roll <= chance:
             ctx.damage_multiplier *= 2.0
             ctx.is_critical = True
@@ -231,6 +230,8 @@ class InvisibilityStatus(StatusEffect):
 
 class SatietyStatus(StatusEffect):
     id = "satiety"
+    pure_stats = True  # Штрафы зависят только от статусов и фильтров сборки
+
 
     def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
         stack = kwargs.get("stack")
@@ -522,11 +523,11 @@ class AzinoJackpotStatus(StatusEffect):
 
         unit.memory["azino_jackpot_link_opened"] = True
         url = "https://youtu.be/34Pl2DTuwoQ?si=0ojgA65awwY4dMEB"
-        try:
-            import streamlit as st
-            st.session_state["azino_jackpot_url"] = url
-        except Exception:
-            pass
+        # Ссылку открывает интерфейс, забирая уведомления сессии
+        from logic.battle_flow.session import get_session
+        session = get_session(unit)
+        if session:
+            session.notify("🎶 JACKPOT!", icon="🎰", azino_jackpot_url=url)
 
         logger.log(
             f"🎶 Azino Jackpot: opened link for {unit.name}",
@@ -589,8 +590,7 @@ class LuckyCoinStatus(StatusEffect):
 
         if coin_result is None:
             # Первый кубик карты: Бросаем монетку
-            import random
-            is_heads = random.choice([True, False])
+            is_heads = get_rng(unit).choice([True, False])
             coin_result = "HEADS" if is_heads else "TAILS"
             unit.memory[memory_key] = coin_result
 
@@ -854,19 +854,10 @@ class MarkedFleshStatus(StatusEffect):
         self._transfer_mark(unit)
 
     def _transfer_mark(self, unit):
-        try:
-            import streamlit as st
-        except Exception:
-            return
-
-        team_left = st.session_state.get("team_left", [])
-        team_right = st.session_state.get("team_right", [])
-
-        if unit in team_left:
-            team = team_left
-        elif unit in team_right:
-            team = team_right
-        else:
+        from logic.battle_flow.session import get_session
+        session = get_session(unit)
+        team = session.get_team(unit) if session else None
+        if team is None:
             return
 
         candidates = [u for u in team if not u.is_dead() and u is not unit]
@@ -1,6 +1,7 @@
 from typing import List, TYPE_CHECKING
 
 from core.logging import logger, LogLevel
+from core.unit.data.status_store import ensure_status_store
 
 if TYPE_CHECKING:
     from core.unit.unit import Unit
@@ -16,29 +17,15 @@ class StatusManager:
         """
         logs = []
 
-        active_ids = list(unit._status_effects.keys())
+        # Длительность (Duration) уменьшает хранилище: суммы стаков обновляются там же
+        store = ensure_status_store(unit)
+        had_statuses = bool(store)
 
-        for status_id in active_ids:
-            if status_id not in unit._status_effects: continue
+        for status_id in store.tick():
+            logger.log("📉 Status Expired: %s on %s", LogLevel.VERBOSE, "Status", status_id, unit.name)
 
-            # --- ЛОГИКА ЭФФЕКТОВ ПЕРЕНЕСЕНА В TRIGGER_MECHANICS ---
-            # Здесь мы только управляем длительностью (Duration)
-
-            # 1. Уменьшаем Duration
-            current_instances = unit._status_effects[status_id]
-            next_instances = []
-
-            for item in current_instances:
-                item["duration"] -= 1
-                if item["duration"] > 0:
-                    next_instances.append(item)
-
-            # 2. Обновляем или удаляем
-            if next_instances:
-                unit._status_effects[status_id] = next_instances
-            else:
-                del unit._status_effects[status_id]
-                logger.log(f"📉 Status Expired: {status_id} on {unit.name}", LogLevel.VERBOSE, "Status")
+        if had_statuses and hasattr(unit, "_bump_status_version"):
+            unit._bump_status_version()
 
         # Обработка Delayed
         if unit.delayed_queue:
@@ -159,10 +159,44 @@ class MockContext:
         self.target_die_result = 0
 
         self.opponent_ctx = None
+        self.session = None
 
     def modify_power(self, val, reason=""):
         self.final_value += val
         self.log.append(f"Modify Power: {val} ({reason})")
 
     def iter_mechanics(self):
-        return []
\ No newline at end of file
+        return []
+
+
+def make_session(state: dict):
+    """Сессия боя из словаря в стиле session_state ({'team_left', 'team_right', 'roster'})."""
+    from logic.battle_flow.session import BattleSession
+    return BattleSession(
+        team_left=state.get('team_left'),
+        team_right=state.get('team_right'),
+        roster=state.get('roster'),
+    )
+
+
+def unit_data(name: str, deck) -> dict:
+    """Словарь персонажа с заданной колодой (вход для run_single_battle / run_monte_carlo)."""
+    from core.unit.unit import Unit
+    unit = Unit(name=name)
+    unit.deck = list(deck)
+    return unit.to_dict()
+
+
+def register_cards(*cards) -> list:
+    """Регистрирует тестовые карты в Library (setUpClass); возвращает их id для unregister_cards."""
+    from core.library import Library
+    for card in cards:
+        Library.register(card)
+    return [card.id for card in cards]
+
+
+def unregister_cards(card_ids):
+    """Убирает тестовые карты из Library (tearDownClass)."""
+    from core.library import Library
+    for cid in card_ids:
+        Library.get_cards_dict().pop(cid, None)
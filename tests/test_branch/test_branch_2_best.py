@@ -0,0 +1,38 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from core.card import Card
+from core.library import Library
+from core.unit.unit import Unit
+from logic.battle_flow.session import BattleSession
+from logic.character_changing.talents.branch_2_best import TalentCopycatInsight
+
+
+class TestCopycatInsight(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Library.register(Card(id="copycat_source", name="Copycat Source"))
+
+    def _copy_id(self, seed):
+        unit, target = Unit(name="Copier"), Unit(name="Target")
+        session = BattleSession([unit], [target], seed=seed)
+        with session.activated():
+            TalentCopycatInsight().activate(unit, None, target=target, selected_card_id="copycat_source")
+        return unit.deck[-1]
+
+    def test_copy_id_follows_battle_seed(self):
+        """Id копии берется из RNG боя: повтор боя по записи получает те же карты."""
+        copy_id = self._copy_id(seed=7)
+
+        self.assertEqual(self._copy_id(seed=7), copy_id)
+        self.assertTrue(copy_id.startswith("copycat_source_copy_Copier_"))
+        self.assertEqual(Library.get_card(copy_id).id, copy_id)
+        self.assertTrue(Library.get_card(copy_id).exhaust_on_use)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from core.card import Card
+from core.dice import Dice
+from core.enums import DiceType
+from core.library import Library
+
+
+class TestLibraryIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.template = Card(name="Index Strike", id="idx_strike", tier=2,
+                             dice_list=[Dice(2, 5, DiceType.SLASH, scripts={"on_hit": [{"script_id": "x"}]})])
+        Library.register(self.template)
+
+    def tearDown(self):
+        Library.get_cards_dict().pop("idx_strike", None)
+        Library.get_cards_dict().pop("idx_other", None)
+
+    def test_lookup_by_id_and_name(self):
+        self.assertEqual(Library.get_card("idx_strike").id, "idx_strike")
+        self.assertEqual(Library.get_card("Index Strike").id, "idx_strike")
+        self.assertIs(Library.get_template("Index Strike"), self.template)
+        self.assertEqual(Library.get_card("No Such Card").id, "unknown")
+
+    def test_instance_does_not_touch_template(self):
+        card = Library.get_card("idx_strike")
+        self.assertIsNot(card, self.template)
+
+        card.dice_list[0].dtype = DiceType.BLUNT
+        card.dice_list.append(card.dice_list[0].copy())
+        card.description = "changed"
+
+        self.assertEqual(self.template.dice_list[0].dtype, DiceType.SLASH)
+        self.assertEqual(len(self.template.dice_list), 1)
+        self.assertEqual(self.template.description, "")
+        # Скрипты — общий шаблон, без копирования
+        self.assertIs(card.dice_list[0].scripts, self.template.dice_list[0].scripts)
+
+    def test_name_index_follows_changes(self):
+        Library.register(Card(name="Index Strike", id="idx_strike", tier=3))
+        self.assertEqual(Library.get_card("Index Strike").tier, 3)
+
+        Library.register(Card(name="Renamed Strike", id="idx_strike"))
+        self.assertEqual(Library.get_card("Index Strike").id, "unknown")
+
+        Library.register(Card(name="Other Strike", id="idx_other"))
+        Library.get_cards_dict().pop("idx_other")
+        self.assertIsNone(Library.get_template("Other Strike"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.getcwd())
+
+from core.card import Card
+from core.dice import Dice
+from core.enums import DiceType
+from core.logging import logger
+from logic.simulation.monte_carlo import run_single_battle
+from logic.simulation.recording import BattleRecorder, replay_battle, save_recording, load_recording
+from tests.mocks import register_cards, unregister_cards, unit_data
+
+
+class TestBattleRecording(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_ids = register_cards(
+            Card(name="Rec Strike", id="rec_strike", tier=1,
+                 dice_list=[Dice(4, 8, DiceType.SLASH), Dice(3, 6, DiceType.PIERCE)]),
+            Card(name="Rec Guard", id="rec_guard", tier=1,
+                 dice_list=[Dice(2, 5, DiceType.BLUNT), Dice(2, 4, DiceType.BLOCK)]),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        unregister_cards(cls.card_ids)
+
+    def setUp(self):
+        self._was_enabled = logger.enabled
+        logger.set_enabled(False)
+        self.left = [unit_data("Striker", ["rec_strike"] * 3)]
+        self.right = [unit_data("Guard", ["rec_guard"] * 3)]
+
+    def tearDown(self):
+        logger.set_enabled(self._was_enabled)
+
+    def _record(self, seed=5):
+        recorder = BattleRecorder()
+        result = run_single_battle(self.left, self.right, seed=seed, recorder=recorder)
+        return recorder, result
+
+    def test_replay_reproduces_battle(self):
+        recorder, result = self._record()
+        self.assertEqual(len(recorder.data["rounds"]), result["rounds"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "battle.json.gz")
+            save_recording(recorder.data, path)
+            recording = load_recording(path)
+
+        replay = replay_battle(recording)
+        self.assertIsNone(replay["diverged_at"])
+        self.assertEqual((replay["winner"], replay["rounds"]), (result["winner"], result["rounds"]))
+        self.assertEqual(replay_battle(recording), replay)
+
+    def test_divergence_is_reported(self):
+        recorder, result = self._record()
+        recording = json.loads(json.dumps(recorder.data))
+        self.assertGreater(len(recording["rounds"]), 1)
+        recording["rounds"][1]["check"][0][0] += 1
+
+        self.assertEqual(replay_battle(recording)["diverged_at"], recording["rounds"][1]["round"])
+
+    def test_truncate_replans_restored_round(self):
+        recorder, _ = self._record()
+        recorder.truncate(2)
+
+        rounds = recorder.data["rounds"]
+        self.assertEqual([r["round"] for r in rounds], [1, 2])
+        self.assertIn("plans", rounds[0])
+        self.assertNotIn("plans", rounds[1])
+        self.assertEqual(replay_battle(recorder.data)["rounds"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
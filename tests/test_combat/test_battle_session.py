@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from core.rng import BattleRNG
+from core.unit.unit import Unit
+from logic.battle_flow.rounds import start_round, end_round
+from logic.battle_flow.session import BattleSession, get_session, get_battle_teams
+from tests.mocks import MockUnit, MockContext
+
+
+class TestBattleSession(unittest.TestCase):
+
+    def test_units_get_back_reference(self):
+        """Юниты сессии получают ссылку на неё, выбывшие — теряют."""
+        a, b = MockUnit(name="A"), MockUnit(name="B")
+        session = BattleSession([a], [b])
+
+        self.assertIs(a.session, session)
+        self.assertEqual(session.get_sides(a), ([a], [b]))
+        self.assertEqual(session.get_sides(b), ([b], [a]))
+
+        session.bind(team_right=[])
+        self.assertIsNone(b.session)
+
+    def test_get_session_from_context(self):
+        """Контекст броска находит сессию через источник."""
+        a = MockUnit(name="A")
+        session = BattleSession([a], [])
+        ctx = MockContext(a)
+
+        self.assertIs(get_session(ctx), session)
+        self.assertEqual(get_battle_teams(ctx), ([a], []))
+
+    def test_add_unit_and_notifications(self):
+        a, summon = MockUnit(name="A"), MockUnit(name="Summon")
+        session = BattleSession([a], [])
+
+        session.add_unit(summon, session.team_left)
+        session.notify("Hello", icon="👋", flag=1)
+
+        self.assertIs(summon.session, session)
+        self.assertEqual(len(session.team_left), 2)
+        self.assertEqual(session.drain_notifications(), [{"message": "Hello", "icon": "👋", "flag": 1}])
+        self.assertEqual(session.notifications, [])
+
+    def test_headless_round(self):
+        """Полный цикл раунда без Streamlit."""
+        left, right = Unit(name="L"), Unit(name="R")
+        session = BattleSession([left], [right])
+
+        start_round(session)
+        self.assertEqual(len(left.active_slots), 1)
+        self.assertTrue(left.memory.get("battle_initialized"))
+
+        session.executed_slots.add(("L", 0))
+        end_round(session)
+
+        self.assertEqual(session.round_number, 2)
+        self.assertEqual(session.executed_slots, set())
+        self.assertEqual(left.active_slots, [])
+
+
+class TestBattleRNG(unittest.TestCase):
+
+    def test_same_seed_same_stream(self):
+        a, b = BattleRNG(42), BattleRNG(42)
+        self.assertEqual([a.randint(1, 20) for _ in range(50)], [b.randint(1, 20) for _ in range(50)])
+        self.assertNotEqual([BattleRNG(1).random() for _ in range(3)], [BattleRNG(2).random() for _ in range(3)])
+
+    def test_state_restores_position(self):
+        rng = BattleRNG("battle-1")
+        for _ in range(7): rng.random()
+        state = rng.get_state()
+        expected = [rng.randint(1, 6) for _ in range(10)]
+
+        self.assertEqual(state["position"], 7)
+        replay = BattleRNG.from_state(state)
+        self.assertEqual([replay.randint(1, 6) for _ in range(10)], expected)
+
+    def test_bounds(self):
+        rng = BattleRNG(0)
+        values = [rng.randint(3, 5) for _ in range(300)]
+        self.assertEqual(set(values), {3, 4, 5})
+        self.assertTrue(all(0.0 <= rng.random() < 1.0 for _ in range(300)))
+
+    def test_round_replay(self):
+        """Раунд с сохраненной позиции RNG повторяется в точности."""
+        def speeds(session):
+            start_round(session)
+            return [s['speed'] for u in session.all_units() for s in u.active_slots]
+
+        session = BattleSession([Unit(name="L")], [Unit(name="R")], seed=7)
+        state = session.get_rng_state()
+        first = speeds(session)
+
+        replay = BattleSession([Unit(name="L")], [Unit(name="R")])
+        replay.set_rng_state(state)
+        self.assertEqual(speeds(replay), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import itertools
+import unittest
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from core.enums import DiceType
+from logic.battle_flow.clash.clash_odds import DieSpec, roll_distribution, pair_odds, clash_odds
+
+
+def _brute_rolls(lo, hi, mod, adv):
+    """Все исходы броска с весами (перебор двух бросков для Преимущества/Помехи)."""
+    faces = range(lo, hi + 1)
+    if adv == 0:
+        return [(v + mod, 1.0 / len(faces)) for v in faces]
+    pick = max if adv > 0 else min
+    w = 1.0 / len(faces) ** 2
+    return [(pick(r1, r2) + mod, w) for r1, r2 in itertools.product(faces, faces)]
+
+
+class TestClashOdds(unittest.TestCase):
+
+    def test_distribution_matches_enumeration(self):
+        for adv in (-1, 0, 1):
+            lo, probs = roll_distribution(2, 7, 3, adv)
+            expected = {}
+            for v, w in _brute_rolls(2, 7, 3, adv):
+                expected[v] = expected.get(v, 0.0) + w
+            self.assertEqual(lo, 5)
+            for k, p in enumerate(probs):
+                self.assertAlmostEqual(p, expected[lo + k])
+
+    def test_pair_matches_enumeration(self):
+        a = DieSpec(3, 8, DiceType.SLASH, modifier=1, adv=1)
+        d = DieSpec(2, 9, DiceType.PIERCE, modifier=0, adv=-1)
+        odds = pair_odds(a, d)
+
+        win = lose = win_value = lose_diff = 0.0
+        for (va, wa), (vd, wd) in itertools.product(_brute_rolls(3, 8, 1, 1), _brute_rolls(2, 9, 0, -1)):
+            w = wa * wd
+            if va > vd:
+                win += w
+                win_value += w * va
+            elif vd > va:
+                lose += w
+                lose_diff += w * (vd - va)
+
+        self.assertAlmostEqual(odds.win, win)
+        self.assertAlmostEqual(odds.lose, lose)
+        self.assertAlmostEqual(odds.win + odds.draw + odds.lose, 1.0)
+        self.assertAlmostEqual(odds.win_value, win_value)
+        self.assertAlmostEqual(odds.lose_diff, lose_diff)
+
+    def test_single_die_clash(self):
+        """1 кубик на 1: атака против блока бьет разницей, блок — по выдержке."""
+        atk = DieSpec(1, 4, DiceType.SLASH)
+        blk = DieSpec(1, 4, DiceType.BLOCK)
+        odds = clash_odds((atk,), (blk,))
+
+        # P(a > d) = 6/16, E[a - d ; a > d] = (1*3 + 2*2 + 3*1)/16
+        self.assertAlmostEqual(odds.win, 6 / 16)
+        self.assertAlmostEqual(odds.draw, 4 / 16)
+        self.assertAlmostEqual(odds.hp_to_defender, 10 / 16)
+        self.assertAlmostEqual(odds.stagger_to_attacker, 10 / 16)
+        self.assertEqual(odds.hp_to_attacker, 0.0)
+
+    def test_evade_recycles(self):
+        """Выигравший уворот остается и встречает следующий кубик."""
+        evade = DieSpec(10, 10, DiceType.EVADE)
+        odds = clash_odds((evade,), (DieSpec(1, 2, DiceType.SLASH), DieSpec(1, 2, DiceType.SLASH)))
+
+        self.assertAlmostEqual(odds.win, 1.0)
+        self.assertAlmostEqual(odds.hp_to_attacker, 0.0)
+        self.assertAlmostEqual(odds.stagger_recovered_attacker, 20.0)
+
+    def test_broken_dice_give_one_sided_hits(self):
+        """Сломанные скоростью кубики: атака проходит без стычки."""
+        strike = DieSpec(2, 4, DiceType.BLUNT)
+        odds = clash_odds((strike,), (DieSpec(5, 9, DiceType.SLASH),), destroy_d=True)
+
+        self.assertAlmostEqual(odds.draw, 1.0)
+        self.assertAlmostEqual(odds.hp_to_defender, 3.0)
+        self.assertAlmostEqual(odds.hp_to_attacker, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -105,7 +105,7 @@ class TestMassAttackAdvanced(unittest.TestCase):
         engine._create_roll_context.return_value = MagicMock(final_value=10, log=[])
         engine._process_card_self_scripts = MagicMock()  # Мокаем скрипты
 
-        with patch('logic.battle_flow.mass_attack.random.choice') as mock_rand:
+        with patch('random.choice') as mock_rand:
             def side_effect(seq):
                 return seq[0]
 
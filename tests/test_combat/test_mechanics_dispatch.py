@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from core.unit.unit import Unit
+from logic.base_effect import BaseEffect, implements_hook
+from logic.statuses.status_definitions import STATUS_REGISTRY
+
+
+class _DoublerEffect(BaseEffect):
+    id = "test_doubler"
+
+    def modify_incoming_damage(self, unit, amount, damage_type, stack=0, **kwargs):
+        return amount * 2
+
+
+class TestHookDispatch(unittest.TestCase):
+
+    def test_only_overridden_hooks_are_dispatched(self):
+        effect = _DoublerEffect()
+        self.assertTrue(implements_hook(effect, "modify_incoming_damage"))
+        self.assertFalse(implements_hook(effect, "absorb_damage"))
+        self.assertFalse(implements_hook(effect, "on_roll"))
+        # Хуки вне BaseEffect проверяются как раньше
+        self.assertFalse(implements_hook(effect, "modify_dice_min"))
+
+    def test_instance_override_is_respected(self):
+        effect = _DoublerEffect()
+        effect.on_roll = lambda ctx, **kw: None
+        self.assertTrue(implements_hook(effect, "on_roll"))
+
+    def test_filter_uses_real_implementations(self):
+        unit = Unit(name="Dispatch")
+        STATUS_REGISTRY["test_doubler"] = _DoublerEffect()
+        try:
+            unit.add_status("test_doubler", 1, duration=2)
+            self.assertEqual(unit.apply_mechanics_filter("modify_incoming_damage", 5, "slash"), 10)
+            self.assertEqual(unit.apply_mechanics_filter("absorb_damage", 5, "slash"), 5)
+        finally:
+            del STATUS_REGISTRY["test_doubler"]
+
+
+class TestMechanicsCache(unittest.TestCase):
+
+    def setUp(self):
+        STATUS_REGISTRY["test_doubler"] = _DoublerEffect()
+        self.unit = Unit(name="Cache")
+
+    def tearDown(self):
+        del STATUS_REGISTRY["test_doubler"]
+
+    def test_cache_reused_until_statuses_change(self):
+        first = self.unit._mechanics_cache()
+        self.assertIs(self.unit._mechanics_cache(), first)
+
+        self.unit.add_status("test_doubler", 2, duration=2)
+        cached = self.unit._mechanics_cache()
+        self.assertIsNot(cached, first)
+        self.assertIn((STATUS_REGISTRY["test_doubler"], 2), cached.entries)
+
+        self.unit.remove_status("test_doubler", 1)
+        self.assertIn((STATUS_REGISTRY["test_doubler"], 1), self.unit._mechanics_cache().entries)
+
+    def test_build_change_invalidates(self):
+        from logic.character_changing.passives import PASSIVE_REGISTRY
+
+        pid, passive = next(iter(PASSIVE_REGISTRY.items()))
+        self.assertNotIn(passive, list(self.unit.iter_mechanics()))
+
+        # Правка списка на месте тоже должна сбросить кэш
+        self.unit.passives.append(pid)
+        self.assertIn(passive, list(self.unit.iter_mechanics()))
+
+    def test_turn_end_expiry_invalidates(self):
+        from logic.statuses.status_manager import StatusManager
+
+        self.unit.add_status("test_doubler", 1, duration=1)
+        self.assertEqual(self.unit.apply_mechanics_filter("modify_incoming_damage", 3, "slash"), 6)
+
+        StatusManager.process_turn_end(self.unit)
+        self.assertEqual(self.unit.apply_mechanics_filter("modify_incoming_damage", 3, "slash"), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
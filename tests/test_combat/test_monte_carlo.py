@@ -0,0 +1,64 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from core.card import Card
+from core.dice import Dice
+from core.enums import DiceType
+from core.logging import logger
+from logic.simulation.monte_carlo import run_monte_carlo, run_single_battle
+from tests.mocks import register_cards, unregister_cards, unit_data
+
+
+class TestMonteCarlo(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.card_ids = register_cards(
+            Card(name="MC Strike", id="mc_strike", tier=1,
+                 dice_list=[Dice(4, 8, DiceType.SLASH), Dice(3, 6, DiceType.PIERCE)]),
+            Card(name="MC Jab", id="mc_jab", tier=1,
+                 dice_list=[Dice(2, 4, DiceType.BLUNT)]),
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        unregister_cards(cls.card_ids)
+
+    def setUp(self):
+        self.left = [unit_data("Striker", ["mc_strike"] * 3)]
+        self.right = [unit_data("Jabber", ["mc_jab"] * 3)]
+        self._was_enabled = logger.enabled
+
+    def tearDown(self):
+        logger.set_enabled(self._was_enabled)
+
+    def test_single_battle_finishes(self):
+        logger.set_enabled(False)
+        res = run_single_battle(self.left, self.right, seed=1)
+
+        self.assertIn(res["winner"], ("left", "right", "draw"))
+        self.assertGreater(res["rounds"], 0)
+        self.assertIn("mc_strike", res["damage_by_card"])
+        # Обычные удары по HP снимают выносливость побочным уроном — он тоже учитывается за картой
+        self.assertGreater(res["damage_by_card"]["mc_strike"]["stagger"], 0)
+        self.assertEqual(set(res["hp"]), {"Striker", "Jabber"})
+
+    def test_report_is_reproducible(self):
+        a = run_monte_carlo(self.left, self.right, battles=6, seed=3, workers=1, chunk_size=4)
+        b = run_monte_carlo(self.left, self.right, battles=6, seed=3, workers=1, chunk_size=2)
+
+        self.assertEqual(a.to_dict(), b.to_dict())
+        self.assertEqual(a.wins_left + a.wins_right + a.draws, 6)
+        # Сильная карта должна стабильно побеждать слабую
+        self.assertGreater(a.win_rate_left, a.win_rate_right)
+
+    def test_mirror_match_names_are_unique(self):
+        report = run_monte_carlo(self.left, self.left, battles=2, seed=0, workers=1)
+        self.assertEqual(len(report.hp_remaining), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
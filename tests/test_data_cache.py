@@ -0,0 +1,102 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+
+sys.path.append(os.getcwd())
+
+from core.card import Card
+from core.data_cache import CompiledCache
+
+
+def _parse_pack(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [Card.from_dict(c) for c in json.load(f)["cards"]]
+
+
+class TestCompiledCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.pack = os.path.join(self.tmp, "pack.json")
+        self._write_pack("Cached Strike")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write_pack(self, name, mtime=None):
+        with open(self.pack, 'w', encoding='utf-8') as f:
+            json.dump({"cards": [{"id": "c1", "name": name, "dice": [{"type": "slash", "base_min": 2, "base_max": 4}]}]}, f)
+        if mtime is not None:
+            os.utime(self.pack, ns=(mtime, mtime))
+
+    def _cache(self):
+        return CompiledCache("cards", code_paths=("core/card.py",), cache_dir=os.path.join(self.tmp, ".cache"))
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        cache = self._cache()
+        cache.open()
+        first = cache.get(self.pack, _parse_pack)
+        cache.save()
+
+        # Новый процесс: кэш читается с диска
+        cache = self._cache()
+        cache.open()
+        second = cache.get(self.pack, lambda p: self.fail("pack should come from the cache"))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(second[0].to_dict(), first[0].to_dict())
+
+        # Выдаются новые объекты: правки не попадают в кэш
+        second[0].name = "Edited"
+        self.assertEqual(cache.get(self.pack, _parse_pack)[0].name, "Cached Strike")
+
+    def test_modified_file_is_reparsed(self):
+        cache = self._cache()
+        cache.open()
+        cache.get(self.pack, _parse_pack)
+
+        self._write_pack("Longer Cached Strike", mtime=os.stat(self.pack).st_mtime_ns + 10 ** 9)
+        self.assertEqual(cache.get(self.pack, _parse_pack)[0].name, "Longer Cached Strike")
+        self.assertEqual(cache.misses, 2)
+
+    def test_deleted_files_are_pruned(self):
+        cache = self._cache()
+        cache.open()
+        cache.get(self.pack, _parse_pack)
+        cache.save()
+
+        os.remove(self.pack)
+        cache.save()
+        cache = self._cache()
+        cache.open()
+        self.assertEqual(cache._entries, {})
+
+
+    def test_data_paths_invalidate_cache(self):
+        # Юниты берут карты слотов из паков: правка пака сбрасывает собранных персонажей
+        cards_dir = os.path.join(self.tmp, "cards")
+        os.makedirs(cards_dir)
+        dependency = os.path.join(cards_dir, "deps.json")
+        with open(dependency, 'w', encoding='utf-8') as f:
+            json.dump({"cards": []}, f)
+
+        def cache():
+            return CompiledCache("units", cache_dir=os.path.join(self.tmp, ".cache"), data_paths=(cards_dir,))
+
+        first = cache()
+        first.open()
+        first.get(self.pack, _parse_pack)
+        first.save()
+
+        with open(dependency, 'w', encoding='utf-8') as f:
+            json.dump({"cards": [{"id": "c2", "name": "New"}]}, f)
+        second = cache()
+        second.open()
+        second.get(self.pack, _parse_pack)
+        self.assertEqual((second.hits, second.misses), (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import sys
+
+sys.path.append(os.getcwd())
+
+from core.card import Card
+from core.data_cache import CompiledCache
+from core.library import Library
+
+
+class TestPackIndex(unittest.TestCase):
+
+    def setUp(self):
+        # Пак пишется во временную папку; create_new_pack перечитывает библиотеку,
+        # поэтому словари Library восстанавливаются после теста
+        self.tmp = tempfile.mkdtemp()
+        self.patches = [
+            patch("core.library.CARDS_DIR", self.tmp),
+            patch("core.library.CARD_PACK_CACHE", CompiledCache("cards", cache_dir=os.path.join(self.tmp, ".cache"))),
+            patch.dict(Library._cards),
+            patch.dict(Library._sources),
+            patch.dict(Library._by_name),
+            patch.dict(Library._packs, clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+        self.pack = "test_pack_index_temp.json"
+        self.path = os.path.join(self.tmp, self.pack)
+        Library.create_new_pack(self.pack)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _read(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)["cards"]
+
+    def test_save_updates_card_in_place(self):
+        Library.save_card(Card(id="idx_a", name="A"), filename=self.pack)
+        Library.save_card(Card(id="idx_b", name="B"), filename=self.pack)
+        Library.save_card(Card(id="idx_a", name="A2", tier=3), filename=self.pack)
+
+        cards = self._read()
+        self.assertEqual([c["id"] for c in cards], ["idx_a", "idx_b"])
+        self.assertEqual((cards[0]["name"], cards[0]["tier"]), ("A2", 3))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_external_changes_are_picked_up(self):
+        Library.save_card(Card(id="idx_a", name="A"), filename=self.pack)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({"cards": [{"id": "idx_c", "name": "External"}]}, f, indent=2)
+
+        Library.save_card(Card(id="idx_b", name="B"), filename=self.pack)
+        self.assertEqual([c["id"] for c in self._read()], ["idx_c", "idx_b"])
+
+    def test_batch_writes_once(self):
+        with patch("core.library.os.replace", wraps=os.replace) as replace:
+            with Library.batch_edits():
+                Library.save_card(Card(id="idx_a", name="A"), filename=self.pack)
+                Library.save_card(Card(id="idx_b", name="B"), filename=self.pack)
+                Library.delete_card("idx_a")
+                self.assertEqual(self._read(), [])
+        self.assertEqual(replace.call_count, 1)
+        self.assertEqual([c["id"] for c in self._read()], ["idx_b"])
+
+    def test_delete_uses_source_index(self):
+        Library.save_card(Card(id="idx_a", name="A"), filename=self.pack)
+        Library.save_card(Card(id="idx_b", name="B"), filename=self.pack)
+
+        with patch("core.library.glob.glob") as scan:
+            self.assertTrue(Library.delete_card("idx_a"))
+            self.assertFalse(Library.delete_card("idx_missing"))
+        scan.assert_not_called()
+
+        self.assertEqual([c["id"] for c in self._read()], ["idx_b"])
+        self.assertIsNone(Library.get_template("idx_a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
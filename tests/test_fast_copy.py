@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+import unittest
+from enum import Enum
+
+sys.path.append(os.getcwd())
+
+from core.unit.data.fast_copy import json_copy, plain_copy
+from core.unit.data.serialization import _json_default
+from core.unit.data.status_store import StatusInstance, StatusStore
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class TestFastCopy(unittest.TestCase):
+
+    def _same_as_json(self, value, default=str):
+        expected = json.loads(json.dumps(value, default=default))
+        result = json_copy(value, default)
+        self.assertEqual(result, expected)
+        self.assertEqual(json.dumps(result), json.dumps(expected))
+
+    def test_matches_json_roundtrip(self):
+        self._same_as_json({"a": [1, 2.5, None, True], "b": {"c": (1, "x")}, "d": ""})
+        self._same_as_json({1: "int key", None: 0, "s": Color.RED})
+        self._same_as_json([Color.RED, object, float("inf")])
+        store = StatusStore({"bleed": [StatusInstance(3, 2)], "haste": [StatusInstance(1)]})
+        self._same_as_json(store, _json_default)
+
+    def test_errors_match_json(self):
+        with self.assertRaises(TypeError):
+            json_copy({(1, 2): "tuple key"})
+
+    def test_copies_are_independent(self):
+        src = {"log": [{"amount": 1}], "pair": (1, [2])}
+        for copier in (json_copy, plain_copy):
+            dst = copier(src)
+            dst["log"][0]["amount"] = 99
+            self.assertEqual(src["log"][0]["amount"], 1)
+
+        self.assertEqual(plain_copy(src), src)
+        self.assertIsInstance(plain_copy(src)["pair"], tuple)
+        store = StatusStore({"bleed": [StatusInstance(3, 2)]})
+        self.assertIsInstance(plain_copy({"s": store})["s"], StatusStore)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+import os
+import unittest
+
+sys.path.append(os.getcwd())
+
+from logic.base_effect import BaseEffect
+from logic.character_changing.lazy_registry import LazyRegistry
+from logic.character_changing.passives import PASSIVE_REGISTRY
+from logic.character_changing.talents import TALENT_REGISTRY
+
+
+class TestLazyRegistry(unittest.TestCase):
+
+    def test_manifest_entries_resolve(self):
+        for registry in (TALENT_REGISTRY, PASSIVE_REGISTRY):
+            for key in registry.keys():
+                self.assertIsInstance(registry[key], BaseEffect, key)
+                self.assertIs(registry[key], registry[key])
+
+    def test_lookup_imports_only_needed_module(self):
+        code = (
+            "import sys\n"
+            "from logic.character_changing.talents import TALENT_REGISTRY\n"
+            "prefix = 'logic.character_changing.talents.branch_'\n"
+            "assert 'big_guy' in TALENT_REGISTRY\n"
+            "assert not [m for m in sys.modules if m.startswith(prefix)], 'manifest check imported a branch'\n"
+            "TALENT_REGISTRY['big_guy']\n"
+            "print(sorted(m for m in sys.modules if m.startswith(prefix)))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=os.getcwd())
+        self.assertEqual(out.returncode, 0, out.stderr)
+        loaded = out.stdout.strip().splitlines()[-1]
+        self.assertIn("branch_3_tireless", loaded)
+        self.assertNotIn("branch_14_tremor", loaded)
+
+    def test_mapping_api(self):
+        registry = LazyRegistry("logic.character_changing.talents", {"big_guy": "branch_3_tireless:TalentBigGuy"})
+        self.assertEqual(registry.loaded(), [])
+        self.assertEqual(len(registry), 1)
+        self.assertIsNone(registry.get("missing"))
+
+        marker = object()
+        registry["custom"] = marker
+        self.assertEqual(list(registry), ["big_guy", "custom"])
+        self.assertIs(registry["custom"], marker)
+
+        del registry["big_guy"]
+        self.assertNotIn("big_guy", registry)
+        with self.assertRaises(KeyError):
+            del registry["big_guy"]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.append(os.getcwd())
+
+from core.logging import BufferedLogWriter, LogLevel, LogStorage, logger, LOG_LEVEL_ENV, _level_from_env
+
+
+class TestBufferedLogWriter(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".log")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _read(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_flush_writes_in_order(self):
+        writer = BufferedLogWriter(self.path, max_lines=1000, interval=60)
+        for i in range(5):
+            writer.write(f"line {i}\n")
+
+        self.assertEqual(self._read(), "")
+        writer.flush()
+        self.assertEqual(self._read(), "".join(f"line {i}\n" for i in range(5)))
+
+    def test_size_threshold_wakes_writer(self):
+        writer = BufferedLogWriter(self.path, max_lines=3, interval=60)
+        for i in range(3):
+            writer.write(f"{i}\n")
+
+        deadline = time.time() + 2
+        while not self._read() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self._read(), "0\n1\n2\n")
+
+    def test_discard(self):
+        writer = BufferedLogWriter(self.path, max_lines=1000, interval=60)
+        writer.write("lost\n")
+        writer.discard()
+        writer.flush()
+        self.assertEqual(self._read(), "")
+
+
+class TestLazyLogging(unittest.TestCase):
+
+    def setUp(self):
+        self._level = logger.capture_level
+        self._file = logger.file_enabled
+        logger.set_file_output(False)
+        self._start = len(logger.get_logs())
+
+    def tearDown(self):
+        logger.set_level(self._level)
+        logger.set_file_output(self._file)
+
+    def _new_messages(self):
+        return logger.get_logs()[self._start:]
+
+    def test_deferred_arguments(self):
+        logger.set_level(LogLevel.VERBOSE)
+        logger.log("%s rolled %s", LogLevel.VERBOSE, "Roll", "Roland", 7)
+        logger.log(lambda: "lazy message", LogLevel.NORMAL, "Roll")
+
+        self.assertEqual(self._new_messages(), ["Roland rolled 7", "lazy message"])
+
+    def test_filtered_level_is_not_formatted(self):
+        calls = []
+        logger.set_level(LogLevel.NORMAL)
+
+        logger.log(lambda: calls.append(1) or "never", LogLevel.VERBOSE, "Roll")
+        logger.log("kept", LogLevel.MINIMAL, "Roll")
+
+        self.assertEqual(calls, [])
+        self.assertFalse(logger.is_enabled_for(LogLevel.VERBOSE))
+        self.assertEqual(self._new_messages(), ["kept"])
+
+    def test_capturing_raises_level_temporarily(self):
+        logger.set_level(LogLevel.NORMAL)
+        with logger.capturing(LogLevel.VERBOSE):
+            logger.log("detail", LogLevel.VERBOSE, "Stats")
+        logger.log("dropped", LogLevel.VERBOSE, "Stats")
+
+        self.assertEqual(logger.capture_level, LogLevel.NORMAL)
+        self.assertEqual(self._new_messages(), ["detail"])
+
+    def test_level_from_env(self):
+        with mock.patch.dict(os.environ, {LOG_LEVEL_ENV: "minimal"}):
+            self.assertEqual(_level_from_env(), LogLevel.MINIMAL)
+        with mock.patch.dict(os.environ, {LOG_LEVEL_ENV: "bogus"}):
+            self.assertEqual(_level_from_env(), LogLevel.VERBOSE)
+
+
+class TestStorageProvider(unittest.TestCase):
+
+    def tearDown(self):
+        logger.set_storage_provider(None)
+
+    def test_provider_is_resolved_once_per_thread(self):
+        calls = []
+        storages = {}
+
+        def provider():
+            calls.append(threading.current_thread().name)
+            return storages.setdefault(threading.current_thread().name, LogStorage())
+
+        logger.set_storage_provider(provider)
+        logger.log("main", LogLevel.MINIMAL, "Test")
+        logger.log("main again", LogLevel.MINIMAL, "Test")
+
+        worker = threading.Thread(target=logger.log, args=("worker", LogLevel.MINIMAL, "Test"), name="other")
+        worker.start()
+        worker.join()
+
+        self.assertEqual(sorted(calls), sorted([threading.current_thread().name, "other"]))
+        self.assertEqual([e["message"] for e in storages["other"]], ["worker"])
+        self.assertEqual([e["message"] for e in storages[threading.current_thread().name]][-2:],
+                         ["main", "main again"])
+
+    def test_capture_level_is_per_storage(self):
+        sessions = {"a": LogStorage(), "b": LogStorage()}
+        current = []
+        logger.set_storage_provider(lambda: sessions[current[-1]])
+
+        def run_as(name):
+            # Новый запуск скрипта streamlit: буфер берется заново у провайдера
+            current.append(name)
+            logger._local = threading.local()
+
+        run_as("a")
+        logger.set_level(LogLevel.MINIMAL)
+        run_as("b")
+        logger.set_level(LogLevel.NORMAL)
+
+        run_as("a")
+        with logger.capturing(LogLevel.VERBOSE):
+            logger.log("a detail", LogLevel.VERBOSE, "Stats")
+            run_as("b")
+            logger.log("b detail", LogLevel.VERBOSE, "Stats")
+            run_as("a")
+        run_as("b")
+        logger.log("b normal", LogLevel.NORMAL, "Stats")
+
+        self.assertEqual(sessions["a"].capture_level, LogLevel.MINIMAL)
+        self.assertEqual(sessions["b"].capture_level, LogLevel.NORMAL)
+        self.assertEqual([e["message"] for e in sessions["a"]], ["a detail"])
+        self.assertEqual([e["message"] for e in sessions["b"]], ["b normal"])
+
+    def test_headless_run_does_not_import_streamlit(self):
+        code = (
+            "import sys\n"
+            "from core.logging import logger, LogLevel\n"
+            "from logic.battle_flow.session import BattleSession\n"
+            "from logic.simulation.monte_carlo import run_single_battle\n"
+            "logger.set_file_output(False)\n"
+            "logger.log('headless', LogLevel.MINIMAL, 'Test')\n"
+            "assert logger.get_logs() == ['headless']\n"
+            "assert 'streamlit' not in sys.modules, 'streamlit imported'\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.getcwd(), capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+class TestLogStorage(unittest.TestCase):
+
+    def _fill(self, storage, n):
+        levels = [LogLevel.MINIMAL, LogLevel.NORMAL, LogLevel.VERBOSE]
+        cats = ["Roll", "Clash"]
+        for i in range(n):
+            storage.append("00:00", levels[i % 3], cats[i % 2], f"m{i}")
+
+    def test_capacity_evicts_oldest(self):
+        storage = LogStorage(capacity=4)
+        self._fill(storage, 10)
+
+        self.assertEqual(len(storage), 4)
+        self.assertEqual([e["message"] for e in storage], ["m6", "m7", "m8", "m9"])
+        self.assertEqual(storage.count(), 4)
+        self.assertEqual(storage.count(LogLevel.MINIMAL), 2)  # m6, m9
+
+    def test_query_filters_and_pages(self):
+        storage = LogStorage(capacity=100)
+        self._fill(storage, 12)
+
+        roll_normal = storage.query(LogLevel.NORMAL, ["Roll"])
+        self.assertEqual([e["message"] for e in roll_normal], ["m0", "m4", "m6", "m10"])
+        self.assertEqual(storage.count(LogLevel.NORMAL, ["Roll"]), 4)
+
+        page = storage.query(offset=2, limit=3, newest_first=True)
+        self.assertEqual([e["message"] for e in page], ["m9", "m8", "m7"])
+        self.assertEqual(storage.categories(LogLevel.MINIMAL), ["Clash", "Roll"])
+
+    def test_resize_keeps_newest(self):
+        storage = LogStorage(capacity=10)
+        self._fill(storage, 6)
+        storage.set_capacity(3)
+
+        self.assertEqual([e["message"] for e in storage.query()], ["m3", "m4", "m5"])
+
+
+if __name__ == '__main__':
+    unittest.main()
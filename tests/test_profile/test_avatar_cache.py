@@ -0,0 +1,104 @@
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.getcwd())
+
+from PIL import Image
+
+import ui.avatars as avatars
+
+
+class FakeUpload:
+    def __init__(self, name, data):
+        self.name = name
+        self._data = data
+
+    def getbuffer(self):
+        return memoryview(self._data)
+
+
+class TestAvatarCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.src = os.path.join(self.tmp, "hero.png")
+        Image.new("RGBA", (600, 1000), (200, 30, 30, 255)).save(self.src)
+        avatars._thumbnail_bytes.cache_clear()
+        self.patches = [
+            patch.object(avatars, "THUMBS_DIR", os.path.join(self.tmp, "thumbs")),
+            patch.object(avatars, "AVATARS_DIR", os.path.join(self.tmp, "avatars")),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        avatars._thumbnail_bytes.cache_clear()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_thumbnail_is_downscaled_and_cached(self):
+        data = avatars.avatar_thumbnail(self.src, "small")
+        with Image.open(io.BytesIO(data)) as img:
+            self.assertEqual(img.size, (192, 320))
+        self.assertEqual(len(os.listdir(avatars.THUMBS_DIR)), 1)
+
+        with patch.object(avatars.Image, "open") as reopen:
+            self.assertIs(avatars.avatar_thumbnail(self.src, "small"), data)
+        reopen.assert_not_called()
+
+    def test_replaced_file_gets_new_thumbnail(self):
+        first = avatars.avatar_thumbnail(self.src, "large")
+        Image.new("RGB", (300, 300), (0, 0, 255)).save(self.src)
+        second = avatars.avatar_thumbnail(self.src, "large")
+        self.assertNotEqual(first, second)
+        with Image.open(io.BytesIO(second)) as img:
+            self.assertEqual(img.size, (300, 300))
+
+    def test_missing_and_broken_files(self):
+        self.assertIsNone(avatars.avatar_thumbnail(None))
+        self.assertIsNone(avatars.avatar_thumbnail(os.path.join(self.tmp, "nope.png")))
+
+        broken = os.path.join(self.tmp, "broken.png")
+        with open(broken, "wb") as f:
+            f.write(b"not an image")
+        self.assertEqual(avatars.avatar_thumbnail(broken), broken)
+
+    def test_upload_is_transcoded(self):
+        with open(self.src, "rb") as f:
+            path = avatars.save_avatar_file(FakeUpload("hero.png", f.read()), "Big Hero")
+
+        self.assertEqual(os.path.basename(path), f"Big_Hero.{avatars.THUMB_EXT}")
+        with Image.open(path) as img:
+            self.assertEqual(img.width, 600)
+        # Миниатюры всех размеров готовы сразу после загрузки
+        self.assertEqual(len(os.listdir(avatars.THUMBS_DIR)), len(avatars.THUMB_SIZES))
+
+    def test_relationships_page_uses_thumbnails(self):
+        from types import SimpleNamespace
+        from ui.relationships import get_avatar_path
+
+        self.assertEqual(get_avatar_path(SimpleNamespace(avatar=self.src), "large"),
+                         avatars.avatar_thumbnail(self.src, "large"))
+        self.assertTrue(get_avatar_path(SimpleNamespace(avatar=None)).startswith("https://"))
+
+    def test_without_pillow_original_files_are_used(self):
+        with open(self.src, "rb") as f:
+            raw = f.read()
+        with patch.object(avatars, "Image", None):
+            self.assertEqual(avatars.avatar_thumbnail(self.src, "small"), self.src)
+            path = avatars.save_avatar_file(FakeUpload("hero.png", raw), "Big Hero")
+
+        self.assertEqual(os.path.basename(path), "Big_Hero.png")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), raw)
+        self.assertFalse(os.path.exists(avatars.THUMBS_DIR))
+
+
+if __name__ == '__main__':
+    unittest.main()
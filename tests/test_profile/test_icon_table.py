@@ -0,0 +1,43 @@
+import os
+import re
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.getcwd())
+
+import ui.icons
+from ui.icons import ICON_FILES, FALLBACK_EMOJIS, get_icon_html, get_icon_table, icon_stylesheet
+
+
+class TestIconTable(unittest.TestCase):
+
+    def test_badge_references_class_without_data_uri(self):
+        html = get_icon_html("Bleed", 24)
+        self.assertNotIn("base64", html)
+        css_class = re.search(r'class="lor-icon (lor-icon-[\w-]+)"', html).group(1)
+        self.assertIn("width: 24px", html)
+        self.assertIn(f".{css_class} {{ background-image: url(data:", icon_stylesheet())
+
+    def test_shared_files_are_embedded_once(self):
+        self.assertEqual(ICON_FILES["weakness"], ICON_FILES["power_down"])
+        self.assertEqual(get_icon_html("weakness"), get_icon_html("power_down").replace("power_down", "weakness"))
+        css = icon_stylesheet()
+        self.assertEqual(css.count("url(data:"), len(get_icon_table()))
+        self.assertLessEqual(len(get_icon_table()), len(set(ICON_FILES.values())))
+
+    def test_unknown_key_falls_back_to_emoji(self):
+        self.assertEqual(get_icon_html("regeneration"), FALLBACK_EMOJIS["regeneration"])
+        self.assertEqual(get_icon_html("no_such_status"), "❓")
+
+    def test_without_pillow_files_are_embedded_as_is(self):
+        path = os.path.join(ui.icons.ICON_DIR, ICON_FILES["slash"])
+        with open(path, "rb") as f:
+            raw = f.read()
+        with patch.object(ui.icons, "Image", None):
+            mime, data, ratio = ui.icons._encode_icon(path)
+        self.assertEqual((mime, data, ratio), ("image/webp", raw, 1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from unittest.mock import patch
+
+sys.path.append(os.getcwd())
+
+from core.data_cache import CompiledCache
+from core.unit.roster_index import RosterIndex
+from core.unit.unit import Unit
+from core.unit.unit_library import UnitLibrary
+
+
+class TestLazyRoster(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.units_dir = os.path.join(self.tmp, "units")
+        os.makedirs(self.units_dir)
+        self._write("Alpha", level=3, rank=7)
+        self._write("Beta", level=1, rank=9, unit_type="mob")
+
+        cache_dir = os.path.join(self.tmp, ".cache")
+        self.patches = [
+            patch.object(UnitLibrary, "DATA_PATH", self.units_dir),
+            patch("core.unit.unit_library.ROSTER_INDEX", RosterIndex(os.path.join(cache_dir, "roster_index.json"))),
+            patch("core.unit.unit_library.UNIT_CACHE", CompiledCache("units", cache_dir=cache_dir)),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        UnitLibrary._roster = {}
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write(self, name, **fields):
+        data = Unit(name=name).to_dict()
+        data.update(fields)
+        with open(os.path.join(self.units_dir, f"{name}.json"), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def test_names_come_from_index(self):
+        roster = UnitLibrary.load_all()
+        self.assertEqual(sorted(roster.keys()), ["Alpha", "Beta"])
+        self.assertEqual(roster.peek("Alpha").level, 3)
+        self.assertEqual(roster.peek("Beta").unit_type, "mob")
+        self.assertFalse(roster.is_loaded("Alpha"))
+
+    def test_unit_is_built_on_access(self):
+        roster = UnitLibrary.load_all()
+        alpha = roster["Alpha"]
+        self.assertIsInstance(alpha, Unit)
+        self.assertEqual((alpha.level, alpha.rank), (3, 7))
+        self.assertIs(roster["Alpha"], alpha)
+        self.assertTrue(roster.is_loaded("Alpha"))
+        self.assertFalse(roster.is_loaded("Beta"))
+        self.assertIsNone(roster.get("Gamma"))
+
+    def test_index_follows_files(self):
+        UnitLibrary.load_all()
+
+        path = os.path.join(self.units_dir, "Alpha.json")
+        self._write("Alpha", level=5, rank=6)
+        stamp = os.stat(path).st_mtime_ns + 10 ** 9
+        os.utime(path, ns=(stamp, stamp))
+        os.remove(os.path.join(self.units_dir, "Beta.json"))
+
+        roster = UnitLibrary.load_all()
+        self.assertEqual(list(roster.keys()), ["Alpha"])
+        self.assertEqual(roster.peek("Alpha").level, 5)
+        self.assertEqual(roster["Alpha"].level, 5)
+
+    def test_broken_unit_is_dropped(self):
+        self._write("Broken", stored_dice=5)
+        roster = UnitLibrary.load_all()
+        # Несобираемый файл не попадает даже в список имен (выбор его в профиле не должен падать)
+        self.assertEqual(sorted(roster.keys()), ["Alpha", "Beta"])
+        self.assertNotIn("Broken", UnitLibrary.load_all())
+
+        # После исправления файла персонаж возвращается
+        path = os.path.join(self.units_dir, "Broken.json")
+        self._write("Broken")
+        stamp = os.stat(path).st_mtime_ns + 10 ** 9
+        os.utime(path, ns=(stamp, stamp))
+        self.assertIsInstance(UnitLibrary.load_all()["Broken"], Unit)
+
+    def test_save_and_delete_update_roster(self):
+        roster = UnitLibrary.load_all()
+        UnitLibrary.save_unit(Unit(name="Gamma"))
+        self.assertIn("Gamma", roster)
+
+        UnitLibrary.delete_unit("Beta")
+        self.assertNotIn("Beta", roster)
+        self.assertEqual(sorted(UnitLibrary.load_all().keys()), ["Alpha", "Gamma"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 # Добавляем корень проекта
 sys.path.append(os.getcwd())
 
-from tests.mocks import MockUnit, MockContext
+from tests.mocks import MockUnit, MockContext, make_session
 from logic.scripts.card_special import apply_axis_team_buff, summon_ally
 
 
@@ -39,8 +39,8 @@ class TestCardSpecial(unittest.TestCase):
             'team_right': []
         }
 
-        # Подменяем session_state
-        with patch('streamlit.session_state', mock_state):
+        # Подменяем сессию боя
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             params = {"status": "strength", "duration": 2}
             apply_axis_team_buff(self.ctx, params)
 
@@ -57,7 +57,7 @@ class TestCardSpecial(unittest.TestCase):
             'team_right': []
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             params = {"status": "endurance"}
             apply_axis_team_buff(self.ctx, params)
 
@@ -77,7 +77,7 @@ class TestCardSpecial(unittest.TestCase):
             'team_right': []
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             apply_axis_team_buff(self.ctx, {"status": "haste"})
 
             self.assertEqual(self.unit.get_status("haste"), 2)
@@ -99,7 +99,7 @@ class TestCardSpecial(unittest.TestCase):
             'roster': roster
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             params = {"unit_name": "Minion"}
             summon_ally(self.ctx, params)
 
@@ -124,7 +124,7 @@ class TestCardSpecial(unittest.TestCase):
             'roster': roster
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             summon_ally(self.ctx, {"unit_name": "Minion"})
 
             self.assertEqual(len(team), 5)  # Размер не изменился
@@ -137,7 +137,7 @@ class TestCardSpecial(unittest.TestCase):
             'roster': {}
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             summon_ally(self.ctx, {"unit_name": "Ghost"})
 
             self.assertEqual(len(mock_state['team_left']), 1)
@@ -152,7 +152,7 @@ from unittest.mock import MagicMock, patch
 # Добавляем корень проекта
 sys.path.append(os.getcwd())
 
-from tests.mocks import MockUnit, MockContext
+from tests.mocks import MockUnit, MockContext, make_session
 # Импортируем тестируемые функции (включая новую set_memory_flag)
 from logic.scripts.card_special import apply_axis_team_buff, summon_ally, set_memory_flag
 
@@ -185,7 +185,7 @@ class TestCardSpecial(unittest.TestCase):
             'team_right': []
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             params = {"status": "strength", "duration": 2}
             apply_axis_team_buff(self.ctx, params)
 
@@ -201,7 +201,7 @@ class TestCardSpecial(unittest.TestCase):
             'team_right': []
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             params = {"status": "endurance"}
             apply_axis_team_buff(self.ctx, params)
 
@@ -219,7 +219,7 @@ class TestCardSpecial(unittest.TestCase):
             'team_right': []
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             apply_axis_team_buff(self.ctx, {"status": "haste"})
 
             self.assertEqual(self.unit.get_status("haste"), 2)
@@ -236,7 +236,7 @@ class TestCardSpecial(unittest.TestCase):
 
         mock_state = {'team_left': team, 'roster': roster}
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             params = {"unit_name": "Minion"}
             summon_ally(self.ctx, params)
 
@@ -253,7 +253,7 @@ class TestCardSpecial(unittest.TestCase):
 
         mock_state = {'team_left': team, 'roster': roster}
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             summon_ally(self.ctx, {"unit_name": "Minion"})
 
             self.assertEqual(len(team), 5)
@@ -263,7 +263,7 @@ class TestCardSpecial(unittest.TestCase):
         """Тест: Призыв несуществующего юнита."""
         mock_state = {'team_left': [self.unit], 'roster': {}}
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             summon_ally(self.ctx, {"unit_name": "Ghost"})
 
             self.assertEqual(len(mock_state['team_left']), 1)
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 # Add project root
 sys.path.append(os.getcwd())
 
-from tests.mocks import MockUnit, MockContext
+from tests.mocks import MockUnit, MockContext, make_session
 from logic.scripts.utils import (
     _get_unit_stat, _resolve_value, _get_targets, _check_conditions
 )
@@ -104,7 +104,7 @@ class TestScriptUtils(unittest.TestCase):
         self.assertEqual(len(_get_targets(self.ctx, "all")), 2)
 
     def test_get_targets_all_allies(self):
-        """Test: 'all_allies' retrieves team from session_state."""
+        """Test: 'all_allies' retrieves team from the battle session."""
         ally = MockUnit(name="Ally")
         team = [self.source, ally]
 
@@ -113,7 +113,7 @@ class TestScriptUtils(unittest.TestCase):
             'team_right': []
         }
 
-        with patch('streamlit.session_state', mock_state):
+        with patch.object(self.ctx, 'session', make_session(mock_state)):
             targets = _get_targets(self.ctx, "all_allies")
             self.assertEqual(len(targets), 2)
             self.assertIn(ally, targets)
@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.append(os.getcwd())
+
+from core.unit.unit import Unit
+from logic.state.snapshot_maker import SnapshotMaker
+from logic.state.snapshot_restorer import SnapshotRestorer
+
+
+class TestSnapshotRestore(unittest.TestCase):
+
+    def setUp(self):
+        self.left = [Unit(name="Left")]
+        self.right = [Unit(name="Right")]
+        for u in self.left + self.right:
+            u.recalculate_stats()
+        self.state = {"team_left": self.left, "team_right": self.right}
+        self.base = SnapshotMaker.get_state_snapshot(self.state)
+
+        # Раунд, к которому будем откатываться
+        self.left[0].current_hp -= 5
+        self.left[0].add_status("bind", 2, duration=3)
+        self.right[0].memory["seen"] = 1
+        self.right[0].recalculate_stats()
+        self.left[0].recalculate_stats()
+        self.snapshot = SnapshotMaker.get_dynamic_snapshot(self.state)
+        self.expected = [u.to_dict() for u in self.left + self.right]
+
+        # Дальше бой ушел вперед
+        self.left[0].current_hp -= 3
+        self.left[0].add_status("bind", 1, duration=3)
+        self.left[0]._nerve_counter = 2
+        self.right[0].memory["seen"] = 2
+
+    def test_in_place_keeps_unit_objects(self):
+        SnapshotRestorer.restore_from_dynamic(self.state, self.snapshot, self.base)
+
+        self.assertIs(self.state["team_left"], self.left)
+        self.assertIs(self.state["team_left"][0], self.left[0])
+        self.assertIs(self.state["team_right"][0], self.right[0])
+        self.assertEqual([u.to_dict() for u in self.left + self.right], self.expected)
+        self.assertEqual(self.left[0].statuses.get("bind"), 2)
+        self.assertFalse(hasattr(self.left[0], "_nerve_counter"))
+
+    def test_in_place_matches_full_rebuild(self):
+        rebuilt_state = {}
+        SnapshotRestorer.restore_from_dynamic(rebuilt_state, self.snapshot, self.base)
+        SnapshotRestorer.restore_from_dynamic(self.state, self.snapshot, self.base)
+
+        for live, fresh in zip(self.state["team_left"] + self.state["team_right"],
+                               rebuilt_state["team_left"] + rebuilt_state["team_right"]):
+            self.assertIsNot(live, fresh)
+            self.assertEqual(live.to_dict(), fresh.to_dict())
+            self.assertEqual((live.max_hp, live.max_sp, live.max_stagger), (fresh.max_hp, fresh.max_sp, fresh.max_stagger))
+            self.assertEqual(live.computed_speed_dice, fresh.computed_speed_dice)
+
+    def test_changed_build_falls_back_to_rebuild(self):
+        self.left[0].skills["speed"] = self.left[0].skills.get("speed", 0) + 3
+
+        SnapshotRestorer.restore_from_dynamic(self.state, self.snapshot, self.base)
+
+        restored = self.state["team_left"][0]
+        self.assertIsNot(restored, self.left[0])
+        self.assertEqual(restored.skills, self.base["team_left_data"][0]["skills"])
+        self.assertEqual(restored.current_hp, self.expected[0]["current_hp"])
+
+    def test_stats_recalculated_once_per_unit(self):
+        for state in (self.state, {}):
+            with mock.patch.object(Unit, "recalculate_stats", autospec=True) as recalc:
+                SnapshotRestorer.restore_from_dynamic(state, self.snapshot, self.base)
+            self.assertEqual(recalc.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.getcwd())
+
+import logic.state.file_manager as file_manager
+from logic.state.file_manager import StateFileManager
+from logic.state.state_format import StateFormat
+
+
+class TestStateFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.patches = [
+            patch.object(file_manager, "STATES_DIR", self.tmp),
+            patch.dict(file_manager._journals, clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+        self.data = {
+            "round_number": 3,
+            "team_left_data": [{"name": "Лилит", "current_hp": 40}],
+            "battle_logs": [{"round": 1, "text": "удар"}] * 50,
+            "script_logs": "",
+            "undo_stack": [{"type": "full", "round_number": 1}],
+        }
+
+    def tearDown(self):
+        StateFileManager.flush()
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_sections_load_lazily(self):
+        StateFileManager.save_json(self.data, "battle")
+        StateFileManager.save_journaled({**self.data, "round_number": 4, "undo_stack": []}, "battle")
+
+        teams = StateFileManager.load_json("battle", sections=("teams",))
+        self.assertEqual(teams, {"round_number": 4, "team_left_data": self.data["team_left_data"]})
+
+        with patch("logic.state.state_format.zlib.decompress", wraps=__import__("zlib").decompress) as unpack:
+            StateFileManager.load_json("battle", sections=("teams", "logs"))
+        self.assertEqual(unpack.call_count, 2)
+
+        self.assertEqual(StateFileManager.load_json("battle"), {**self.data, "round_number": 4, "undo_stack": []})
+
+    def test_container_is_compressed_and_versioned(self):
+        blob = StateFormat.dumps(self.data, journal_seq=7)
+        self.assertTrue(blob.startswith(b"LORSTATE 1\n"))
+        self.assertLess(len(blob), len(json.dumps(self.data, ensure_ascii=False, indent=2).encode()) / 5)
+
+        path = os.path.join(self.tmp, "future.state")
+        with open(path, "wb") as f:
+            f.write(blob.replace(b"LORSTATE 1", b"LORSTATE 9", 1))
+        with self.assertRaises(ValueError):
+            StateFormat.read(path)
+
+    def test_legacy_json_is_read_and_replaced(self):
+        legacy = os.path.join(self.tmp, "old.json")
+        with open(legacy, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+
+        self.assertIn("old", StateFileManager.get_available_states())
+        self.assertEqual(StateFileManager.load_json("old", sections=("history",)), self.data)
+
+        StateFileManager.save_journaled(self.data, "old")
+        self.assertFalse(os.path.exists(legacy))
+        self.assertEqual(StateFileManager.get_available_states().count("old"), 1)
+        self.assertEqual(StateFileManager.load_json("old"), self.data)
+
+        self.assertTrue(StateFileManager.delete_state("old"))
+        self.assertNotIn("old", StateFileManager.get_available_states())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.getcwd())
+
+import logic.state.file_manager as file_manager
+from core.unit.unit import Unit
+from logic.state.file_manager import StateFileManager
+from logic.state.state_format import StateFormat
+from logic.state.undo_history import UndoHistory
+
+
+class TestStateJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.patches = [
+            patch.object(file_manager, "STATES_DIR", self.tmp),
+            patch.dict(file_manager._journals, clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+        self.journal_path = os.path.join(self.tmp, "battle.journal")
+
+    def tearDown(self):
+        StateFileManager.flush()
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _state(self, step):
+        return {
+            "round_number": 1 + step // 5,
+            "battle_logs": [f"log {i}" for i in range(step)],
+            "team_left_data": [{"name": "A", "current_hp": 50 - step, "biography": "x" * 500}],
+            "undo_stack": [{"type": "full"}],
+        }
+
+    def _journal_lines(self):
+        if not os.path.exists(self.journal_path):
+            return []
+        with open(self.journal_path, encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_steps_append_compact_records(self):
+        for step in range(6):
+            StateFileManager.save_journaled(self._state(step), "battle")
+
+        lines = self._journal_lines()
+        self.assertEqual(len(lines), 5)
+        self.assertNotIn("biography", lines[-1])
+        self.assertEqual(json.loads(lines[-1])["diff"]["battle_logs"], ["+", ["log 4"]])
+        self.assertEqual(StateFileManager.load_json("battle"), self._state(5))
+
+        # Без изменений запись не пишется
+        StateFileManager.save_journaled(self._state(5), "battle")
+        self.assertEqual(len(self._journal_lines()), 5)
+
+    def test_background_compaction(self):
+        with patch.object(file_manager, "JOURNAL_COMPACT_EVERY", 3):
+            for step in range(8):
+                StateFileManager.save_journaled(self._state(step), "battle")
+                StateFileManager.flush()
+
+        self.assertLess(len(self._journal_lines()), 3)
+        _, folded_seq = StateFormat.read(os.path.join(self.tmp, "battle.state"), sections=())
+        self.assertGreater(folded_seq, 0)
+        self.assertEqual(StateFileManager.load_json("battle"), self._state(7))
+
+    def test_torn_tail_and_full_save(self):
+        for step in range(3):
+            StateFileManager.save_journaled(self._state(step), "battle")
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"seq": 3, "diff": {"round_')
+        self.assertEqual(StateFileManager.load_json("battle"), self._state(2))
+
+        StateFileManager.save_json(self._state(4), "battle")
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(StateFileManager.load_json("battle"), self._state(4))
+
+        self.assertTrue(StateFileManager.delete_state("battle"))
+        self.assertEqual(StateFileManager.load_json("battle"), {})
+
+    def test_trimmed_history_is_not_rewritten(self):
+        state = {"team_left": [Unit(name="Left")], "team_right": [Unit(name="Right")], "undo_stack": []}
+        sizes = []
+        for n in range(1, UndoHistory.MAX_ENTRIES + 10):
+            state["team_left"][0].current_hp -= 1
+            state["team_right"][0].memory[f"round_{n}"] = n
+            state["round_number"] = n
+            UndoHistory.push(state)
+            StateFileManager.save_journaled({"round_number": n, "undo_stack": state["undo_stack"]}, "battle")
+            sizes.append(len(self._journal_lines()[-1]) if n > 1 else 0)
+
+        # Раунды после лимита истории пишутся так же компактно, как и до него
+        self.assertLess(max(sizes[UndoHistory.MAX_ENTRIES:]), 4 * max(sizes[2:UndoHistory.MAX_ENTRIES]))
+        self.assertIn('"^"', self._journal_lines()[-1])
+        loaded = StateFileManager.load_json("battle")
+        self.assertEqual(json.dumps(loaded["undo_stack"], sort_keys=True),
+                         json.dumps(state["undo_stack"], sort_keys=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import copy
+import unittest
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.append(os.getcwd())
+
+from core.logging import logger
+from core.unit.unit import Unit
+from logic.base_effect import BaseEffect, _mentions_local
+from logic.calculations.base_calc import get_final, get_flat, get_modded_value
+from logic.calculations.modifiers import ModifierVector, Stat, init_modifiers
+from logic.calculations.stats_cache import get_stats_cache, invalidate_stats_cache
+from logic.character_changing.passives import PASSIVE_REGISTRY
+
+
+class _ConstantBonus(BaseEffect):
+    id = "test_constant_bonus"
+    calls = 0
+
+    def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
+        _ConstantBonus.calls += 1
+        return {"endurance": 3, "initiative": 1}
+
+
+class _MemoryDependent(BaseEffect):
+    id = "test_memory_dependent"
+
+    def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
+        return {"damage_deal": 5} if unit.memory.get("test_enraged") else {}
+
+
+def _bonus_for(unit, args):
+    return {"hp": unit.level}
+
+
+def _snapshot(unit):
+    mods = {k: dict(v) for k, v in unit.modifiers.items() if v["flat"] or v["pct"]}
+    return unit.max_hp, unit.max_sp, unit.max_stagger, list(unit.computed_speed_dice), mods
+
+
+class TestStatsCache(unittest.TestCase):
+
+    def setUp(self):
+        PASSIVE_REGISTRY["test_constant_bonus"] = _ConstantBonus()
+        PASSIVE_REGISTRY["test_memory_dependent"] = _MemoryDependent()
+        self.unit = Unit(name="Stats")
+        self.unit.passives = ["test_constant_bonus", "test_memory_dependent"]
+
+    def tearDown(self):
+        del PASSIVE_REGISTRY["test_constant_bonus"]
+        del PASSIVE_REGISTRY["test_memory_dependent"]
+
+    def _fresh(self):
+        clone = copy.deepcopy(self.unit)
+        invalidate_stats_cache(clone)
+        clone.recalculate_stats()
+        return _snapshot(clone)
+
+    def test_purity_is_detected(self):
+        self.assertTrue(_ConstantBonus.pure_stats)
+        self.assertFalse(_MemoryDependent.pure_stats)
+
+    def test_purity_across_hook_shapes(self):
+        class TwoReads(BaseEffect):
+            def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
+                return {"endurance": unit.level + unit.rank}
+
+        class PassesUnitOn(BaseEffect):
+            def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
+                return dict(_bonus_for(unit, args))
+
+        class ReadsInComprehension(BaseEffect):
+            def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
+                return {k: 1 for k in unit.attributes}
+
+        class ReadsInClosure(BaseEffect):
+            def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
+                return (lambda: {"hp": unit.level})()
+
+        class IgnoresUnit(BaseEffect):
+            def on_calculate_stats(self, unit, *args, **kwargs) -> dict:
+                bonus = {"endurance": 2}
+                return bonus
+
+        for cls in (TwoReads, PassesUnitOn, ReadsInComprehension, ReadsInClosure):
+            self.assertFalse(cls.pure_stats, cls.__name__)
+        self.assertTrue(IgnoresUnit.pure_stats)
+
+    def test_superinstruction_argvals(self):
+        # Python 3.12+: LOAD_FAST_LOAD_FAST и подобные несут кортеж имен
+        super_ins = SimpleNamespace(opname="LOAD_FAST_LOAD_FAST", argval=("self", "unit"))
+        self.assertTrue(_mentions_local(super_ins, "unit"))
+        self.assertTrue(_mentions_local(SimpleNamespace(opname="LOAD_FAST_BORROW", argval="unit"), "unit"))
+        self.assertFalse(_mentions_local(SimpleNamespace(opname="LOAD_FAST_LOAD_FAST", argval=("a", "b")), "unit"))
+        self.assertFalse(_mentions_local(SimpleNamespace(opname="LOAD_GLOBAL", argval="unit"), "unit"))
+
+    def test_pure_sources_run_once_per_build(self):
+        self.unit.recalculate_stats()
+        calls = _ConstantBonus.calls
+        self.unit.recalculate_stats()
+        self.unit.add_status("strength", 2, duration=3)
+        self.unit.recalculate_stats()
+        self.assertEqual(_ConstantBonus.calls, calls)
+
+        self.unit.talents.append("none")
+        self.unit.recalculate_stats()
+        self.assertEqual(_ConstantBonus.calls, calls + 1)
+
+    def test_results_match_full_recalculation(self):
+        self.unit.recalculate_stats()
+        self.assertEqual(_snapshot(self.unit), self._fresh())
+
+        # Состояние, которое читает только зависимый хук
+        self.unit.memory["test_enraged"] = True
+        self.unit.recalculate_stats()
+        self.assertEqual(self.unit.modifiers["damage_deal"]["flat"], 5)
+        self.assertEqual(_snapshot(self.unit), self._fresh())
+
+        self.unit.attributes["endurance"] += 6
+        self.unit.level_rolls["1"] = {"hp": 4, "sp": 2}
+        self.unit.recalculate_stats()
+        self.assertEqual(_snapshot(self.unit), self._fresh())
+
+    def test_derived_stage_reused(self):
+        self.unit.recalculate_stats()
+        key = get_stats_cache(self.unit).derived_key
+        self.unit.recalculate_stats()
+        self.assertEqual(get_stats_cache(self.unit).derived_key, key)
+
+        # Модификаторы юнита — своя копия, чтение через defaultdict не портит кэш
+        self.unit.modifiers["hp"]["flat"] += 100
+        self.unit.recalculate_stats()
+        self.assertEqual(_snapshot(self.unit), self._fresh())
+
+    def test_explain_logs_full_calculation(self):
+        def stats_log(**kwargs):
+            logger.get_storage().clear()
+            self.unit.recalculate_stats(**kwargs)
+            return [e["message"] for e in logger.get_storage() if e["category"] == "Stats"]
+
+        first = stats_log()
+        cached = stats_log()
+        self.assertLess(len(cached), len(first))
+        self.assertEqual(stats_log(explain=True), first)
+        self.assertEqual(_snapshot(self.unit), self._fresh())
+
+
+class TestModifierVector(unittest.TestCase):
+
+    def test_dict_api_writes_through(self):
+        mods = init_modifiers()
+        mods["power_attack"]["flat"] += 2
+        mods["power_attack"]["pct"] += 50
+        mods["custom_stat"]["flat"] = 4
+
+        self.assertEqual(mods.final(Stat.POWER_ATTACK), 3)
+        self.assertEqual(get_modded_value(0, "custom_stat", mods), 4)
+        self.assertEqual(dict(mods["power_attack"]), {"flat": 2, "pct": 50})
+        self.assertIsInstance(mods.get("custom_stat"), dict)
+        self.assertIn("custom_stat", mods)
+        self.assertNotIn("damage_deal", mods)
+        self.assertIsNone(mods.get("damage_deal"))
+
+    def test_finals_follow_changes(self):
+        mods = ModifierVector()
+        self.assertEqual(mods.final(Stat.DAMAGE_TAKE), 0)
+        mods.add(Stat.DAMAGE_TAKE, flat=3)
+        self.assertEqual(mods.final(Stat.DAMAGE_TAKE), 3)
+        mods["damage_take"]["pct"] = -50
+        self.assertEqual(mods.final(Stat.DAMAGE_TAKE), 1)
+
+    def test_legacy_dicts_are_supported(self):
+        legacy = {"power_all": {"flat": 2, "pct": 0}, "damage_deal": {"flat": 4, "pct": 50}}
+        self.assertEqual(get_flat(legacy, Stat.POWER_ALL), 2)
+        self.assertEqual(get_final(legacy, Stat.DAMAGE_DEAL), 6)
+        self.assertEqual(get_final({}, Stat.DAMAGE_DEAL), 0)
+
+    def test_copy_and_pickle_by_name(self):
+        import pickle
+
+        mods = ModifierVector.from_dict({"hp": {"flat": 30, "pct": 10}, "initiative": {"flat": 1, "pct": 0}})
+        clone = pickle.loads(pickle.dumps(mods))
+        self.assertEqual(clone.to_dict(), mods.to_dict())
+
+        copied = copy.deepcopy(mods)
+        copied["hp"]["flat"] = 0
+        self.assertEqual(mods.value("hp"), 33)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import copy
+import unittest
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from core.unit.unit import Unit
+from core.unit.data.status_store import StatusStore
+from logic.statuses.status_manager import StatusManager
+
+
+class TestStatusStore(unittest.TestCase):
+
+    def setUp(self):
+        self.unit = Unit(name="Store")
+
+    def test_totals_follow_add_remove_expiry(self):
+        self.unit.add_status("bleed", 3, duration=1)
+        self.unit.add_status("bleed", 2, duration=3)
+        self.unit.add_status("smoke", 4, duration=2)
+        self.unit.add_status("smoke", 1, duration=5)  # пуловый: копится в первом слоте
+
+        self.assertEqual(self.unit.statuses, {"bleed": 5, "smoke": 5})
+        self.assertEqual(len(self.unit._status_effects["smoke"]), 1)
+        self.assertEqual(self.unit._status_effects["smoke"][0]["duration"], 5)
+
+        # Снимаются сначала самые короткие стаки
+        self.unit.remove_status("bleed", 4)
+        self.assertEqual(self.unit.get_status("bleed"), 1)
+        self.assertEqual(self.unit._status_effects["bleed"][0]["duration"], 3)
+
+        for _ in range(3):
+            StatusManager.process_turn_end(self.unit)
+        self.assertEqual(self.unit.statuses, {"smoke": 5})
+
+    def test_view_is_read_only_and_live(self):
+        view = self.unit.statuses
+        with self.assertRaises(TypeError):
+            view["bleed"] = 1
+
+        self.unit.add_status("bleed", 2, duration=1)
+        self.assertEqual(view.get("bleed"), 2)
+
+    def test_legacy_dict_format(self):
+        store = StatusStore({"burn": [{"amount": 2, "duration": 1}, {"amount": 3, "duration": 2}]})
+        self.assertEqual(store.total("burn"), 5)
+
+        store["burn"] = [{"amount": 0, "duration": 1}]
+        self.assertNotIn("burn", store.view)
+
+        # Старый формат, присвоенный напрямую, приводится при первом обращении
+        self.unit._status_effects = {"haste": [{"amount": 1, "duration": 2}]}
+        self.assertEqual(self.unit.get_status("haste"), 1)
+
+    def test_state_roundtrip(self):
+        self.unit.add_status("strength", 2, duration=3)
+        state = self.unit.get_dynamic_state()
+        self.assertEqual(state["_status_effects"], {"strength": [{"amount": 2, "duration": 3}]})
+
+        clone = copy.deepcopy(self.unit)
+        clone.add_status("strength", 1, duration=1)
+        self.assertEqual(self.unit.get_status("strength"), 2)
+
+        self.unit.apply_dynamic_state(state)
+        self.assertEqual(self.unit.statuses, {"strength": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.append(os.getcwd())
+
+from core.unit.unit import Unit
+from logic.state.snapshot_maker import SnapshotMaker
+from logic.state.undo_history import UndoHistory
+
+
+class TestUndoHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.left = [Unit(name="Left")]
+        self.right = [Unit(name="Right")]
+        for u in self.left + self.right:
+            u.recalculate_stats()
+        self.state = {"team_left": self.left, "team_right": self.right, "undo_stack": []}
+
+    def _play_round(self, n):
+        self.left[0].current_hp -= 1
+        self.right[0].memory[f"round_{n}"] = n
+        self.right[0].money_log.append({"round": n})
+        self.state["round_number"] = n
+        UndoHistory.push(self.state)
+        return json.loads(json.dumps(SnapshotMaker.get_dynamic_snapshot(self.state)))
+
+    def test_diffs_hold_only_changed_fields(self):
+        expected = [self._play_round(n) for n in range(1, 14)]
+        stack = self.state["undo_stack"]
+
+        self.assertEqual([e["type"] for e in stack[:3]], ["full", "dynamic", "diff"])
+        self.assertEqual(stack[11]["type"], "dynamic")
+
+        diff = stack[2]
+        self.assertEqual(set(diff["team_left_diff"][0]), {"current_hp"})
+        self.assertEqual(diff["team_right_diff"][0]["money_log"], ["+", [{"round": 3}]])
+        self.assertEqual(diff["team_right_diff"][0]["memory"], ["~", {"round_3": 3}, []])
+
+        for i in range(1, len(stack)):
+            snapshot = UndoHistory.materialize(stack, i)
+            self.assertEqual(snapshot["team_left_dyn"], expected[i]["team_left_dyn"])
+            self.assertEqual(snapshot["team_right_dyn"], expected[i]["team_right_dyn"])
+
+    def test_trim_keeps_chain_valid(self):
+        expected = [self._play_round(n) for n in range(1, UndoHistory.MAX_ENTRIES + 6)]
+        stack = self.state["undo_stack"]
+
+        self.assertEqual(len(stack), UndoHistory.MAX_ENTRIES)
+        self.assertEqual(stack[0]["type"], "full")
+        self.assertEqual(stack[1]["type"], "dynamic")
+        self.assertEqual(UndoHistory.materialize(stack, 1)["team_left_dyn"], expected[6]["team_left_dyn"])
+        self.assertEqual(UndoHistory.materialize(stack, len(stack) - 1)["team_right_dyn"],
+                         expected[-1]["team_right_dyn"])
+
+    def test_restore_round_after_reload(self):
+        for n in range(1, 6):
+            self._play_round(n)
+        hp_at_round_3 = UndoHistory.materialize(self.state["undo_stack"], 2)["team_left_dyn"][0]["current_hp"]
+
+        # История после сохранения в файл и загрузки
+        self.state["undo_stack"] = json.loads(json.dumps(self.state["undo_stack"]))
+        UndoHistory.restore(self.state, 2)
+
+        self.assertEqual(len(self.state["undo_stack"]), 3)
+        self.assertEqual(self.state["team_left"][0].current_hp, hp_at_round_3)
+        self.assertEqual(self.state["team_right"][0].memory, {"round_1": 1, "round_2": 2, "round_3": 3})
+
+        self._play_round(4)
+        self.assertEqual(self.state["undo_stack"][-1]["type"], "diff")
+
+
+if __name__ == '__main__':
+    unittest.main()
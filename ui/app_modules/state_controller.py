@@ -1,11 +1,21 @@
 import streamlit as st
 
 from core.library import Library
+from core.logging import LogStorage
 from core.unit.unit import Unit
 from core.unit.unit_library import UnitLibrary
 from logic.state.state_manager import StateManager
 
 
+def session_log_storage() -> LogStorage:
+    """Буфер логов текущей сессии пользователя (для logger.set_storage_provider)."""
+    storage = st.session_state.get('battle_log_storage')
+    if not isinstance(storage, LogStorage):
+        storage = LogStorage()
+        st.session_state['battle_log_storage'] = storage
+    return storage
+
+
 def update_and_save_state():
     """
     Callback: Сохраняет полное состояние сессии в текущий файл.
@@ -82,7 +92,8 @@ def load_initial_state():
     # 3. Восстановление данных (Restore)
     if 'teams_loaded' not in st.session_state or not st.session_state['teams_loaded']:
         current_file = st.session_state.get("current_state_file", "default")
-        saved_data = StateManager.load_state(filename=current_file)
+        # История ходов здесь не нужна -> секцию "history" не распаковываем
+        saved_data = StateManager.load_state(filename=current_file, sections=("teams", "logs"))
 
         # Восстановление команд
         l_data = saved_data.get("team_left_data", [])
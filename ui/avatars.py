@@ -0,0 +1,116 @@
+import hashlib
+import io
+import os
+from functools import lru_cache
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # Pillow не установлен: показываем и сохраняем исходные файлы
+    Image = ImageOps = features = None
+
+from core.logging import logger, LogLevel
+
+AVATARS_DIR = "data/avatars"
+THUMBS_DIR = "data/.cache/avatars"
+
+# Ширины (px), в которых UI показывает портреты:
+# small — колонка карточки в командах и список связей, large — профиль и выбранный персонаж
+THUMB_SIZES = {"small": 192, "large": 384}
+# Загруженные арты храним не шире этого
+UPLOAD_MAX_WIDTH = 1024
+
+THUMB_FORMAT, THUMB_EXT = ("WEBP", "webp") if features is not None and features.check("webp") else ("JPEG", "jpg")
+THUMB_QUALITY = 82
+
+_content_hashes = {}  # {(путь, mtime, размер): хэш содержимого}
+
+
+def safe_file_name(unit_name: str) -> str:
+    return "".join(c for c in unit_name if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
+
+
+def content_hash(path: str) -> str:
+    """Хэш содержимого файла (файл перечитывается, только если поменялись mtime или размер)."""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    digest = _content_hashes.get(key)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:20]
+        _content_hashes[key] = digest
+    return digest
+
+
+def _encode(img: "Image.Image", max_width: int) -> bytes:
+    """Поворот по EXIF, уменьшение до max_width (с сохранением пропорций) и кодирование в THUMB_FORMAT."""
+    img = ImageOps.exif_transpose(img)
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    img = img.convert("RGBA" if has_alpha and THUMB_FORMAT == "WEBP" else "RGB")
+    if img.width > max_width:
+        img = img.resize((max_width, max(1, round(img.height * max_width / img.width))), Image.LANCZOS)
+
+    buf = io.BytesIO()
+    img.save(buf, THUMB_FORMAT, quality=THUMB_QUALITY)
+    return buf.getvalue()
+
+
+def _write_atomic(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=256)
+def _thumbnail_bytes(digest: str, src_path: str, width: int) -> bytes:
+    thumb_path = os.path.join(THUMBS_DIR, f"{digest}_{width}.{THUMB_EXT}")
+    if os.path.exists(thumb_path):
+        with open(thumb_path, "rb") as f:
+            return f.read()
+
+    with Image.open(src_path) as img:
+        data = _encode(img, width)
+    _write_atomic(thumb_path, data)
+    return data
+
+
+def avatar_thumbnail(path, size: str = "small"):
+    """
+    Уменьшенный аватар для st.image: байты из памяти, с диска (data/.cache/avatars) или только что собранные.
+    Кэш по хэшу содержимого, так что замена файла под тем же именем дает новую миниатюру.
+    None — если файла нет; исходный путь — если картинку не удалось прочитать или Pillow не установлен.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    if Image is None:
+        return path
+    try:
+        return _thumbnail_bytes(content_hash(path), path, THUMB_SIZES[size])
+    except Exception as e:
+        logger.log(f"⚠️ Avatar thumbnail failed for {path}: {e}", LogLevel.VERBOSE, "System")
+        return path
+
+
+def save_avatar_file(uploaded, unit_name: str) -> str:
+    """
+    Сохраняет загруженный аватар в data/avatars.
+    Картинка сразу перекодируется в THUMB_FORMAT не шире UPLOAD_MAX_WIDTH, и для нее готовятся миниатюры;
+    если Pillow не установлен или файл не прочитал, он сохраняется как есть.
+    """
+    os.makedirs(AVATARS_DIR, exist_ok=True)
+    raw = bytes(uploaded.getbuffer())
+    data, ext = raw, uploaded.name.split('.')[-1]
+    if Image is not None:
+        try:
+            with Image.open(io.BytesIO(raw)) as img:
+                data, ext = _encode(img, UPLOAD_MAX_WIDTH), THUMB_EXT
+        except Exception as e:
+            logger.log(f"⚠️ Avatar upload kept as is ({uploaded.name}): {e}", LogLevel.VERBOSE, "System")
+
+    path = f"{AVATARS_DIR}/{safe_file_name(unit_name)}.{ext}"
+    _write_atomic(path, data)
+
+    for size in THUMB_SIZES:
+        avatar_thumbnail(path, size)
+    return path
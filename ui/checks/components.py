@@ -120,7 +120,7 @@ def draw_luck_interface(unit):
             # [FIX] Добавлен уникальный key
             if st.button("✅ Применить и сохранить", type="secondary", key=f"btn_luck_apply_{unit.name}"):
                 if hasattr(unit, "trigger_hooks"):
-                    unit.trigger_hooks("on_luck_check", result=choice)
+                    unit.trigger_hooks("on_luck_check", result=choice, notify=st.toast)
                 unit.resources["luck"] = new_luck
                 UnitLibrary.save_unit(unit)
                 del st.session_state[roll_key]
@@ -205,7 +205,7 @@ def draw_roll_interface(unit, selected_key, selected_label, formula="skill"):
     # === ОБЫЧНАЯ КНОПКА БРОСКА ===
     # [FIX] Добавлен уникальный key с именем юнита
     if st.button("🎲 Бросить", type="primary", use_container_width=True, key=f"btn_roll_{unit.name}_{selected_key}"):
-        res = perform_check_logic(unit, selected_key, val, difficulty, bonus)
+        res = perform_check_logic(unit, selected_key, val, difficulty, bonus, notify=st.toast)
         res["golden_recovered"] = False
         st.session_state[chk_key] = res
         st.rerun()
@@ -138,7 +138,7 @@ def calculate_pre_roll_stats(unit, stat_key: str, stat_value: int, difficulty: i
     return chance, expected_total, difficulty
 
 
-def perform_check_logic(unit, stat_key: str, stat_value: int, difficulty: int, bonus: int) -> dict:
+def perform_check_logic(unit, stat_key: str, stat_value: int, difficulty: int, bonus: int, notify=None) -> dict:
     """
     Выполняет проверку навыка/характеристики.
     
@@ -150,6 +150,8 @@ def perform_check_logic(unit, stat_key: str, stat_value: int, difficulty: int, b
     5. Определение успеха/провала
     6. on_skill_check → триггеры после проверки
     
+    notify: колбэк интерфейса для уведомлений механик (например, st.toast).
+
     Returns:
         dict: результат проверки с полями roll, die, stat_bonus, total, is_success и т.д.
     """
@@ -319,6 +321,6 @@ def perform_check_logic(unit, stat_key: str, stat_value: int, difficulty: int, b
 
     # ===== ТОЧКА 3: on_skill_check =====
     if hasattr(unit, "trigger_mechanics"):
-        unit.trigger_mechanics("on_skill_check", unit, check_result=result["total"], stat_key=stat_key)
+        unit.trigger_mechanics("on_skill_check", unit, check_result=result["total"], stat_key=stat_key, notify=notify)
 
     return result
\ No newline at end of file
@@ -1,12 +1,26 @@
 import base64
+import io
 import mimetypes
 import os
+import re
+from functools import lru_cache
 
-import streamlit as st
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow не установлен: иконки встраиваются как есть
+    Image = features = None
 
 # Путь к папке с иконками
 ICON_DIR = "data/icons"
 
+# Иконки показываются не крупнее 30px; в таблице храним с запасом под HiDPI
+ICON_TABLE_SIZE = 64
+ICON_FORMAT = "WEBP" if features is not None and features.check("webp") else "PNG"
+ICON_CLASS = "lor-icon"
+
+_icon_table = None
+_icon_css = None
+
 # Маппинг ключей (в коде) на имена файлов
 # Ключи должны быть в нижнем регистре
 ICON_FILES = {
@@ -206,43 +220,88 @@ FALLBACK_EMOJIS = {
 }
 
 
-@st.cache_data
+def _encode_icon(path: str):
+    """
+    Уменьшает иконку до ICON_TABLE_SIZE и кодирует в WebP.
+    Возвращает (MIME, байты, высота/ширина); если Pillow нет или он файл не читает — исходные байты.
+    """
+    if Image is not None:
+        try:
+            with Image.open(path) as img:
+                img = img.convert("RGBA")
+                img.thumbnail((ICON_TABLE_SIZE, ICON_TABLE_SIZE), Image.LANCZOS)
+                buf = io.BytesIO()
+                img.save(buf, ICON_FORMAT)
+                return f"image/{ICON_FORMAT.lower()}", buf.getvalue(), img.height / img.width
+        except Exception:
+            pass
+
+    try:
+        mime_type, _ = mimetypes.guess_type(path)
+        if not mime_type:
+            # Фолбек для webp, если mimetypes его не знает
+            mime_type = "image/webp" if path.endswith(".webp") else "image/png"
+        with open(path, "rb") as f:
+            return mime_type, f.read(), 1.0
+    except OSError:
+        return None
+
+
+def get_icon_table() -> dict:
+    """
+    Таблица иконок {имя файла: (css-класс, высота/ширина, data URI)}.
+    Собирается один раз на процесс; одинаковые файлы под разными ключами попадают в нее один раз.
+    """
+    global _icon_table
+    if _icon_table is None:
+        table = {}
+        used_classes = set()
+        for filename in dict.fromkeys(ICON_FILES.values()):
+            path = os.path.join(ICON_DIR, filename)
+            if not os.path.exists(path):
+                continue
+            encoded = _encode_icon(path)
+            if encoded is None:
+                continue
+            mime_type, data, ratio = encoded
+
+            css_class = f"{ICON_CLASS}-" + re.sub(r"[^a-z0-9]+", "-", os.path.splitext(filename)[0].lower()).strip("-")
+            while css_class in used_classes:
+                css_class += "-x"
+            used_classes.add(css_class)
+
+            table[filename] = (css_class, ratio, f"data:{mime_type};base64,{base64.b64encode(data).decode()}")
+        _icon_table = table
+    return _icon_table
+
+
+def icon_stylesheet() -> str:
+    """
+    <style> со всеми иконками. Вставляется один раз на страницу (см. ui/styles.apply_styles),
+    а get_icon_html ссылается на класс вместо того, чтобы тащить data URI в каждый бейдж.
+    """
+    global _icon_css
+    if _icon_css is None:
+        rules = [f".{ICON_CLASS} {{ display: inline-block; vertical-align: middle; margin-bottom: 2px; "
+                 f"background: no-repeat center / contain; }}"]
+        for css_class, _, uri in get_icon_table().values():
+            rules.append(f".{css_class} {{ background-image: url({uri}); }}")
+        _icon_css = "<style>\n" + "\n".join(rules) + "\n</style>"
+    return _icon_css
+
+
+@lru_cache(maxsize=None)
 def get_icon_html(key: str, width: int = 20) -> str:
     """
-    Возвращает HTML-тег <img>. Автоматически определяет MIME-тип (png/webp/jpeg).
+    Возвращает HTML иконки: <span> с классом из icon_stylesheet() и размером в px.
+    Если картинки нет — эмодзи из FALLBACK_EMOJIS.
     """
     key = key.lower()
 
-    # Пытаемся найти прямое совпадение
-    filename = ICON_FILES.get(key)
-
-    # Если не нашли, пробуем эвристику для типов атак (Counter Slash -> contrslash)
-    if not filename:
-        if "counter" in key:
-            # Пример: "counter_slash" -> ищем "contrslash" (но у нас ключи маппинга есть)
-            pass
+    entry = get_icon_table().get(ICON_FILES.get(key))
+    if entry:
+        css_class, ratio, _ = entry
+        return (f'<span class="{ICON_CLASS} {css_class}" role="img" aria-label="{key}" '
+                f'style="width: {width}px; height: {round(width * ratio)}px;"></span>')
 
-    if filename:
-        path = os.path.join(ICON_DIR, filename)
-        if os.path.exists(path):
-            try:
-                # 1. Определяем MIME-тип
-                mime_type, _ = mimetypes.guess_type(path)
-                if not mime_type:
-                    # Фолбек для webp, если mimetypes его не знает
-                    if filename.endswith(".webp"):
-                        mime_type = "image/webp"
-                    else:
-                        mime_type = "image/png"
-
-                # 2. Читаем и кодируем
-                with open(path, "rb") as f:
-                    data = f.read()
-                    encoded = base64.b64encode(data).decode()
-
-                # 3. Вставляем
-                return f'<img src="data:{mime_type};base64,{encoded}" width="{width}" style="vertical-align: middle; margin-bottom: 2px;">'
-            except Exception:
-                pass
-
-    return FALLBACK_EMOJIS.get(key, "❓")
\ No newline at end of file
+    return FALLBACK_EMOJIS.get(key, "❓")
@@ -1,4 +1,3 @@
-import os
 import streamlit as st
 
 from core.enums import UnitType
@@ -6,14 +5,7 @@ from core.game_templates import CHARACTER_TEMPLATES
 from core.ranks import RANK_THRESHOLDS
 from core.unit.unit import Unit
 from core.unit.unit_library import UnitLibrary
-
-
-def save_avatar_file(uploaded, unit_name):
-    os.makedirs("data/avatars", exist_ok=True)
-    safe = "".join(c for c in unit_name if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
-    path = f"data/avatars/{safe}.{uploaded.name.split('.')[-1]}"
-    with open(path, "wb") as f: f.write(uploaded.getbuffer())
-    return path
+from ui.avatars import avatar_thumbnail, save_avatar_file
 
 
 def create_character_from_template(template, roster):
@@ -162,7 +154,9 @@ def render_header(roster):
         if selected_filter == "ALL":
             filtered_keys = all_keys
         else:
-            filtered_keys = [k for k in all_keys if getattr(roster[k], "unit_type", "fixer") == selected_filter]
+            # Тип берем из индекса ростера, не собирая каждого персонажа
+            peek = getattr(roster, "peek", roster.__getitem__)
+            filtered_keys = [k for k in all_keys if getattr(peek(k), "unit_type", "fixer") == selected_filter]
 
         if not filtered_keys:
             st.warning(f"В категории '{filter_labels[filter_opts.index(selected_filter)]}' никого нет.")
@@ -205,8 +199,7 @@ def render_header(roster):
 
 def render_basic_info(unit, u_key):
     # Avatar
-    img = unit.avatar if unit.avatar and os.path.exists(
-        unit.avatar) else "https://placehold.co/150x150/png?text=No+Image"
+    img = avatar_thumbnail(unit.avatar, "large") or "https://placehold.co/150x150/png?text=No+Image"
     st.image(img, width='stretch')
     upl = st.file_uploader("Загрузить арт", type=['png', 'jpg'], label_visibility="collapsed", key=f"upl_{u_key}")
     if upl:
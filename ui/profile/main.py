@@ -2,7 +2,7 @@ import streamlit as st
 import io
 import os
 
-from core.logging import logger
+from core.logging import logger, LogLevel
 from core.unit.unit import Unit
 from core.unit.unit_library import UnitLibrary
 from ui.profile.abilities import render_abilities
@@ -22,7 +22,8 @@ def render_profile_page():
         return
 
     logger.clear()
-    unit.recalculate_stats()
+    with logger.capturing(LogLevel.VERBOSE):
+        unit.recalculate_stats(explain=True)
     calculation_logs = logger.get_logs()
 
     col_l, col_r = st.columns([1, 2.5], gap="medium")
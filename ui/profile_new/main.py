@@ -4,7 +4,7 @@ from core.unit.unit import Unit
 from ui.profile.header import render_header
 
 # Импорт логгера для управления очисткой
-from core.logging import logger
+from core.logging import logger, LogLevel
 
 # === ИМПОРТЫ ТАБОВ ===
 from ui.profile_new.sidebar import render_sidebar
@@ -39,8 +39,9 @@ def render_profile_page_v2():
     elif hasattr(logger, 'logs') and isinstance(logger.logs, list):
         logger.logs.clear()  # Fallback если нет метода clear()
 
-    # 2. Пересчитываем статы (теперь в лог попадет только этот расчет)
-    unit.recalculate_stats()
+    # 2. Пересчитываем статы без кэша (теперь в лог попадет весь этот расчет)
+    with logger.capturing(LogLevel.VERBOSE):
+        unit.recalculate_stats(explain=True)
 
     # 3. "Фотографируем" логи именно для этого юнита и сохраняем во временное свойство
     # Это нужно, чтобы вкладка Visuals знала, что именно показывать
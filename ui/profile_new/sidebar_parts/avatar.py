@@ -1,23 +1,7 @@
 import streamlit as st
 import os
 from core.unit.unit_library import UnitLibrary
-
-AVATARS_DIR = "data/avatars"
-
-
-def save_avatar_file(uploaded, unit_name):
-    """
-    Сохраняет загруженный файл в папку data/avatars.
-    """
-    os.makedirs(AVATARS_DIR, exist_ok=True)
-    safe_name = "".join(c for c in unit_name if c.isalnum() or c in (' ', '_', '-')).strip().replace(" ", "_")
-    ext = uploaded.name.split('.')[-1]
-    path = f"{AVATARS_DIR}/{safe_name}.{ext}"
-
-    with open(path, "wb") as f:
-        f.write(uploaded.getbuffer())
-
-    return path
+from ui.avatars import AVATARS_DIR, avatar_thumbnail, save_avatar_file
 
 
 def get_available_avatars():
@@ -32,10 +16,10 @@ def render_avatar_section(unit, is_edit_mode: bool):
     """Отображает аватар и панель управления им"""
 
     # --- Отображение ---
-    avatar_path = unit.avatar if unit.avatar and os.path.exists(unit.avatar) else None
+    avatar_img = avatar_thumbnail(unit.avatar, "large")
 
-    if avatar_path:
-        st.image(avatar_path, width='stretch')
+    if avatar_img:
+        st.image(avatar_img, width='stretch')
     else:
         st.markdown(
             f"""<div style="background-color: #222; height: 200px; display: flex; 
@@ -1,18 +1,16 @@
 import streamlit as st
-import os
 
 # Импортируем библиотеку для сохранения файлов напрямую
 from core.unit.unit_library import UnitLibrary
 from ui.app_modules.state_controller import update_and_save_state
+from ui.avatars import avatar_thumbnail
 # Импортируем Enum для красивых названий типов
 from core.enums import UnitType
 
 
-def get_avatar_path(unit):
+def get_avatar_path(unit, size="small"):
     path = getattr(unit, 'avatar', None) or getattr(unit, 'icon_path', None)
-    if path and os.path.exists(path):
-        return path
-    return "https://placehold.co/200x300?text=No+Image"
+    return avatar_thumbnail(path, size) or "https://placehold.co/200x300?text=No+Image"
 
 
 def save_unit_data(unit):
@@ -60,7 +58,7 @@ def render_relationships_page():
         st.caption(subject.biography[:100] + "..." if getattr(subject, 'biography', '') else "...")
 
     with col_header_img:
-        st.image(get_avatar_path(subject), width='stretch')
+        st.image(get_avatar_path(subject, "large"), width='stretch')
 
     st.divider()
 
@@ -1,6 +1,19 @@
+from logic.battle_flow.clash.clash_odds import estimate_clash
 from logic.clash import ClashSystem
 
 
+def _odds_label(me, my_slot, enemy, enemy_slot) -> str:
+    """Точный шанс выиграть стычку для подписи слота (пусто, если считать нечего)."""
+    if not enemy_slot or not my_slot.get('card') or not enemy_slot.get('card'):
+        return ""
+    odds = estimate_clash(
+        me, enemy, my_slot['card'], enemy_slot['card'],
+        my_slot['speed'], enemy_slot['speed'],
+        my_slot.get('destroy_on_speed', True), enemy_slot.get('destroy_on_speed', True)
+    )
+    return f" | Win {odds.win:.0%} / Draw {odds.draw:.0%}"
+
+
 def precalculate_interactions(team_left: list, team_right: list):
     """
     Финальная версия с визуализацией сломанных кубиков (Speed Break).
@@ -68,7 +81,8 @@ def precalculate_interactions(team_left: list, team_right: list):
                         }
                     else:
                         my_slot['ui_status'] = {
-                            "text": f"CLASH vs {enemy.name} [S{e_s_idx + 1}] | Перехвачен ({my_slot['speed']} < {e_slot['speed']})",
+                            "text": f"CLASH vs {enemy.name} [S{e_s_idx + 1}] | Перехвачен ({my_slot['speed']} < {e_slot['speed']})"
+                                    f"{_odds_label(me, my_slot, enemy, e_slot)}",
                             "icon": "⚠️",
                             "color": "orange"
                         }
@@ -165,7 +179,8 @@ def precalculate_interactions(team_left: list, team_right: list):
                 elif my_slot.get('force_clash'):
                     # Я кого-то перехватил
                     my_slot['ui_status'] = {
-                        "text": f"CLASH vs {target_unit.name} [{tgt_slot_label}] | Перехват!",
+                        "text": f"CLASH vs {target_unit.name} [{tgt_slot_label}] | Перехват!"
+                                f"{_odds_label(me, my_slot, target_unit, target_slot)}",
                         "icon": "⚡",
                         "color": "red"
                     }
@@ -173,7 +188,8 @@ def precalculate_interactions(team_left: list, team_right: list):
                 elif is_mutual:
                     # Взаимная атака (без перехвата, просто совпали слоты)
                     my_slot['ui_status'] = {
-                        "text": f"CLASH vs {target_unit.name} [{tgt_slot_label}] | Взаимно",
+                        "text": f"CLASH vs {target_unit.name} [{tgt_slot_label}] | Взаимно"
+                                f"{_odds_label(me, my_slot, target_unit, target_slot)}",
                         "icon": "⚔️",
                         "color": "red"
                     }
@@ -5,8 +5,8 @@ from io import StringIO
 import streamlit as st
 
 from core.card import Card
-from core.enums import CardType
-from core.library import Library
+from logic.battle_flow.session import BattleSession
+from logic.simulation.recording import BattleRecorder
 
 
 @contextmanager
@@ -20,56 +20,66 @@ def capture_output():
         sys.stdout = old_out
 
 
-def get_teams():
-    """Вспомогательная функция для получения команд из сессии."""
-    return st.session_state.get('team_left', []), st.session_state.get('team_right', [])
-
-
-def set_cooldowns(u):
-    if not u.memory.get("battle_initialized"):
-        u.memory["battle_initialized"] = True
-
-        if not hasattr(u, "card_cooldowns") or u.card_cooldowns is None:
-            u.card_cooldowns = {}
-
-        if getattr(u, 'deck', None):
-            # Считаем, сколько копий каждой карты
-            from collections import Counter
-            deck_counts = Counter(u.deck)
-
-            for card_id, count in deck_counts.items():
-                card = Library.get_card(card_id)
-                if card:
-                    # Пропускаем предметы
-                    if card.card_type.upper() == CardType.ITEM.name:
-                        continue
-
-                    # Начальный кулдаун (Tier - 1)
-                    initial_cd = max(0, card.tier - 1)
-
-                    if initial_cd > 0:
-                        # Если есть "разогрев", он накладывается на ВСЕ копии карты в начале боя
-                        # Создаем список длиной равной количеству копий
-                        u.card_cooldowns[card_id] = [initial_cd] * count
-
-        # === ВЫЗОВ ON_COMBAT_START ===
-        l_team, r_team = get_teams()
-        opponents = r_team if u in l_team else l_team
-        my_allies = l_team if u in l_team else r_team
-
-        def log_start(msg):
-            if 'battle_logs' not in st.session_state:
-                st.session_state['battle_logs'] = []
-
-            st.session_state['battle_logs'].append({
-                "round": "Start",
-                "rolls": "Event",
-                "details": f"🚩 **{u.name}**: {msg}"
-            })
-
-        if hasattr(u, "trigger_mechanics"):
-            u.trigger_mechanics("on_combat_start", u, log_start,
-                                enemies=opponents, allies=my_allies)
+def get_battle_session() -> BattleSession:
+    """
+    Адаптер UI: сессия боя, работающая с теми же списками, что и session_state.
+    Создается один раз и перепривязывается при каждом вызове (списки могут быть заменены при загрузке).
+    """
+    session = st.session_state.get('battle_session')
+    if session is None:
+        session = BattleSession()
+        st.session_state['battle_session'] = session
+
+    if 'battle_logs' not in st.session_state:
+        st.session_state['battle_logs'] = []
+    if 'executed_slots' not in st.session_state:
+        st.session_state['executed_slots'] = set()
+
+    session.bind(
+        team_left=st.session_state.setdefault('team_left', []),
+        team_right=st.session_state.setdefault('team_right', []),
+        round_number=st.session_state.get('round_number', 1),
+        roster=st.session_state.get('roster', {}),
+        executed_slots=st.session_state['executed_slots'],
+        battle_logs=st.session_state['battle_logs'],
+    )
+
+    # Позиция RNG из загруженного слепка
+    pending_rng = st.session_state.pop('rng_state', None)
+    if pending_rng:
+        session.set_rng_state(pending_rng)
+
+    return session.activate()
+
+
+def get_battle_recorder() -> BattleRecorder:
+    """Запись текущего боя (решения планирования по раундам, см. logic/simulation/recording.py)."""
+    recorder = st.session_state.get('battle_recorder')
+    if recorder is None:
+        recorder = BattleRecorder()
+        st.session_state['battle_recorder'] = recorder
+    return recorder
+
+
+def sync_session_to_state(session: BattleSession):
+    """Переносит состояние сессии обратно в session_state (после смены раунда/сброса)."""
+    st.session_state['round_number'] = session.round_number
+    st.session_state['executed_slots'] = session.executed_slots
+    st.session_state['battle_logs'] = session.battle_logs
+    flush_session_notifications(session)
+
+
+def flush_session_notifications(session: BattleSession = None):
+    """Показывает уведомления движка тостами и переносит UI-флаги в session_state."""
+    session = session or st.session_state.get('battle_session')
+    if session is None:
+        return
+
+    for note in session.drain_notifications():
+        url = note.get("azino_jackpot_url")
+        if url:
+            st.session_state["azino_jackpot_url"] = url
+        st.toast(note["message"], icon=note.get("icon"))
 
 
 def sync_state_from_widgets(team_left: list, team_right: list):
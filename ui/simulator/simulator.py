@@ -1,5 +1,6 @@
 import streamlit as st
 
+from ui.simulator.logic.simulator_logic import get_battle_session, flush_session_notifications
 from ui.simulator.views.controls import render_top_controls
 from ui.simulator.views.gm_panel import render_gm_panel
 from ui.simulator.views.logs import render_logs
@@ -15,6 +16,10 @@ def render_simulator_page():
     if 'round_number' not in st.session_state: st.session_state['round_number'] = 1
     if 'undo_stack' not in st.session_state: st.session_state['undo_stack'] = []
 
+    # Сессия боя (headless-движок) поверх session_state
+    get_battle_session()
+    flush_session_notifications()
+
     # 1. CSS
     inject_simulator_styles()
 
@@ -1,7 +1,7 @@
 import streamlit as st
 
 from ui.simulator.logic.precalculate_speed_rolls import precalculate_interactions
-from ui.simulator.logic.simulator_logic import sync_state_from_widgets
+from ui.simulator.logic.simulator_logic import sync_state_from_widgets, get_battle_session
 from ui.simulator.logic.step_func import roll_phase, execute_combat_auto
 
 
@@ -45,7 +45,7 @@ def render_top_controls(team_left, team_right):
                     # Пересчитываем статы перед броском кубиков
                     for u in team_left + team_right:
                         u.recalculate_stats()
-                    roll_phase()
+                    roll_phase(get_battle_session())
                     st.rerun()
             else:
                 st.success("⚔️ Фаза: **Столкновение**. Настройте карты и начните бой.")
@@ -56,5 +56,5 @@ def render_top_controls(team_left, team_right):
                     # Пересчитываем статы перед началом боя
                     for u in team_left + team_right:
                         u.recalculate_stats()
-                    execute_combat_auto()
+                    execute_combat_auto(get_battle_session())
                     st.rerun()
\ No newline at end of file
@@ -31,7 +31,8 @@ def _render_add_units_tab(team_left, team_right, all_units):
     
     # Получаем список доступных юнитов (исключая уже добавленных)
     current_unit_names = [u.name for u in all_units]
-    available_units = {name: unit for name, unit in roster.items() if name not in current_unit_names}
+    # Только имена: персонаж собирается из ростера, когда его выбрали
+    available_units = [name for name in roster.keys() if name not in current_unit_names]
     
     if not available_units:
         st.info("ℹ️ Все персонажи из библиотеки уже добавлены в бой.")
@@ -44,7 +45,7 @@ def _render_add_units_tab(team_left, team_right, all_units):
         with col1:
             selected_unit_to_add = st.selectbox(
                 "Выберите персонажа для добавления:",
-                options=sorted(available_units.keys()),
+                options=sorted(available_units),
                 key="gm_unit_to_add"
             )
         
@@ -58,7 +59,7 @@ def _render_add_units_tab(team_left, team_right, all_units):
         
         # Показываем информацию о выбранном юните
         if selected_unit_to_add:
-            unit_to_add = available_units[selected_unit_to_add]
+            unit_to_add = roster[selected_unit_to_add]
             
             with st.expander("📋 Информация о персонаже", expanded=True):
                 col1, col2, col3 = st.columns(3)
@@ -362,7 +363,7 @@ def render_gm_panel():
             
             # Отображение текущих эффектов
             st.markdown("### 📋 Активные эффекты")
-            current_statuses = selected_unit.statuses
+            current_statuses = dict(selected_unit.statuses)
             
             if current_statuses:
                 for status_name, status_value in current_statuses.items():
@@ -374,6 +375,7 @@ def render_gm_panel():
                             # Удаляем эффект
                             if hasattr(selected_unit, '_status_effects') and status_name in selected_unit._status_effects:
                                 del selected_unit._status_effects[status_name]
+                                selected_unit._bump_status_version()
                                 st.toast(f"✅ Эффект {status_name} удален")
                                 st.rerun()
             else:
@@ -385,6 +387,7 @@ def render_gm_panel():
                 if st.button("🧹 Очистить все эффекты", type="secondary", use_container_width=True):
                     if hasattr(selected_unit, '_status_effects'):
                         selected_unit._status_effects.clear()
+                        selected_unit._bump_status_version()
                     if hasattr(selected_unit, 'delayed_queue'):
                         selected_unit.delayed_queue.clear()
                     st.toast("✅ Все эффекты очищены!")
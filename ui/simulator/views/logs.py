@@ -2,6 +2,9 @@ import streamlit as st
 
 from core.logging import logger, LogLevel
 
+# Записей системного лога на одной странице
+LOG_PAGE_SIZE = 200
+
 
 def render_logs(current_log_level, log_mode_label):
     st.divider()
@@ -32,32 +35,43 @@ def render_logs(current_log_level, log_mode_label):
 
     # 2. SYSTEM LOG
     with tab_system:
-        system_logs = logger.get_logs_for_ui(current_log_level)
+        storage = logger.get_storage()
+        all_cats = storage.categories(current_log_level)
 
-        if system_logs:
-            all_cats = sorted(list(set(l['category'] for l in system_logs)))
+        if all_cats:
             selected_cats = st.multiselect("Фильтр категорий", all_cats, default=all_cats, key="log_cat_filter")
         else:
             selected_cats = []
 
-        log_html = '<div class="log-container">'
+        # Все категории выбраны -> фильтр по категориям не нужен
+        cat_filter = None if set(selected_cats) >= set(all_cats) else selected_cats
+        total = storage.count(current_log_level, cat_filter)
+        pages = max(1, -(-total // LOG_PAGE_SIZE))
+
+        page = 1
+        if pages > 1:
+            page = st.number_input(f"Страница (1 = новые, всего {pages})", min_value=1, max_value=pages,
+                                   value=1, step=1, key="log_page")
+
+        # Страница берется с конца буфера, внутри страницы — хронологический порядок
+        system_logs = storage.query(current_log_level, cat_filter, offset=(page - 1) * LOG_PAGE_SIZE,
+                                    limit=LOG_PAGE_SIZE, newest_first=True)
+        system_logs.reverse()
+
+        rows = ['<div class="log-container">']
         if not system_logs:
-            log_html += '<div class="log-entry">Нет логов для отображения.</div>'
+            rows.append('<div class="log-entry">Нет логов для отображения.</div>')
 
         for entry in system_logs:
-            if entry['category'] in selected_cats:
-                lvl_class = f"lvl-{entry['level'].name}"
-                cat_class = f"cat-{entry['category']}"
-                row = (
-                    f'<div class="log-entry {lvl_class}">'
-                    f'<span class="log-time">[{entry["time"]}]</span>'
-                    f'<span class="log-cat {cat_class}">[{entry["category"]}]</span>'
-                    f'<span class="log-msg">{entry["message"]}</span>'
-                    f'</div>'
-                )
-                log_html += row
-        log_html += '</div>'
-        st.markdown(log_html, unsafe_allow_html=True)
+            rows.append(
+                f'<div class="log-entry lvl-{entry["level"].name}">'
+                f'<span class="log-time">[{entry["time"]}]</span>'
+                f'<span class="log-cat cat-{entry["category"]}">[{entry["category"]}]</span>'
+                f'<span class="log-msg">{entry["message"]}</span>'
+                f'</div>'
+            )
+        rows.append('</div>')
+        st.markdown("".join(rows), unsafe_allow_html=True)
 
 
 def _render_clash_card(log):
@@ -1,7 +1,10 @@
+import json
+
 import streamlit as st
 
 from core.logging import logger, LogLevel
 from logic.state.state_manager import StateManager
+from ui.simulator.logic.simulator_logic import get_battle_session, get_battle_recorder
 from ui.simulator.logic.step_func import reset_game
 
 
@@ -12,7 +15,7 @@ def render_sidebar():
 
         # 1. СБРОС
         if st.button("🔄 Сброс боя (Reset)", type="secondary", width='stretch', help="Полный сброс к началу"):
-            reset_game()
+            reset_game(get_battle_session())
             logger.clear()
             st.rerun()
 
@@ -32,29 +35,36 @@ def render_sidebar():
                 if st.button("⏪ Загрузить состояние", type="primary", width='stretch'):
                     stack_index = target_round - 1
                     if 0 <= stack_index < len(undo_stack):
-                        snapshot = undo_stack[stack_index]
-                        if snapshot.get("type") == "dynamic":
-                            base_snapshot = undo_stack[0]
-                            if base_snapshot.get("type") != "full":
-                                st.error("❌ Ошибка истории: Базовый снимок поврежден!")
-                            else:
-                                StateManager.restore_from_dynamic_snapshot(st.session_state, snapshot, base_snapshot)
-                                st.toast(f"Раунд {target_round} восстановлен (Delta)! 🕰️")
+                        try:
+                            StateManager.restore_round(st.session_state, stack_index)
+                        except ValueError:
+                            st.error("❌ Ошибка истории: Базовый снимок поврежден!")
                         else:
-                            StateManager.restore_state_from_snapshot(st.session_state, snapshot)
-                            st.toast(f"Раунд {target_round} восстановлен (Full)! 🕰️")
-
-                        st.session_state['undo_stack'] = undo_stack[:stack_index + 1]
-                        st.rerun()
+                            st.toast(f"Раунд {target_round} восстановлен! 🕰️")
+                            st.rerun()
         else:
             st.caption("История ходов пуста (Раунд 1)")
 
+        # Запись боя: составы, сид и решения по раундам (переигрывается logic/simulation/recording.py)
+        recording = get_battle_recorder().data
+        if recording and recording["rounds"]:
+            st.download_button(
+                "🎞️ Скачать запись боя",
+                data=json.dumps(recording, ensure_ascii=False, separators=(",", ":")),
+                file_name=f"battle_{recording['seed']}.json",
+                mime="application/json",
+                width='stretch',
+            )
+
         st.divider()
 
         # 3. ЛОГИРОВАНИЕ
         st.markdown("**📜 Уровень Логирования**")
         log_mode = st.radio(
-            "Детализация:", ["Минимальный", "Обычный", "Подробный"], index=1, key="sim_log_mode"
+            "Детализация:", ["Минимальный", "Обычный", "Подробный"], index=1, key="sim_log_mode",
+            help="Сообщения подробнее выбранного уровня не записываются вовсе (и в файл лога тоже): "
+                 "бой идет быстрее, но после переключения на более подробный уровень "
+                 "новые детали появятся только со следующих действий."
         )
 
         log_level_map = {
@@ -62,4 +72,6 @@ def render_sidebar():
             "Обычный": LogLevel.NORMAL,
             "Подробный": LogLevel.VERBOSE
         }
+        # Записываем ровно то, что лог покажет; уровень хранится в буфере лога этой сессии
+        logger.set_level(log_level_map[log_mode])
         return log_level_map[log_mode], log_mode
\ No newline at end of file
@@ -1,6 +1,7 @@
 import streamlit as st
 
-from logic.revival import render_death_overlay
+from ui.avatars import avatar_thumbnail
+from ui.simulator.components.death_overlay import render_death_overlay
 from ui.components import render_unit_stats
 from ui.simulator.components.abilities import render_active_abilities
 from ui.simulator.components.inventory import render_inventory
@@ -21,7 +22,7 @@ def render_team_column(team, label, key_prefix, opposing_team):
             with c_stats:
                 render_unit_stats(unit)
             with c_img:
-                img = unit.avatar if unit.avatar else "https://placehold.co/150?text=Unit"
+                img = avatar_thumbnail(unit.avatar) or "https://placehold.co/150?text=Unit"
                 st.image(img, width='stretch')
 
             # Способности
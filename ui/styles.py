@@ -1,6 +1,7 @@
 import streamlit as st
 
 from core.enums import DiceType
+from ui.icons import icon_stylesheet
 
 # --- CONSTANTS ---
 TYPE_ICONS = {
@@ -22,4 +23,6 @@ def apply_styles():
         /* Стиль для логов скриптов */
         .script-log { font-family: monospace; color: #00ff41; background-color: #0d1117; padding: 5px; border-radius: 5px; margin-bottom: 5px; font-size: 0.8em; }
     </style>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    """, unsafe_allow_html=True)
+    # Таблица иконок: data URI один раз на страницу, бейджи ссылаются на классы
+    st.markdown(icon_stylesheet(), unsafe_allow_html=True)